@@ -118,6 +118,31 @@ def run_scenario(
     )
 
 
+@app.command(
+    "scenario-worker",
+    help="Start a warm worker that runs the scenarios sent by the lab in forked processes",
+    hidden=True,
+)
+def scenario_worker(
+    ctx: typer.Context,
+    socket_path: Annotated[
+        str, typer.Option("--socket-path", help="Path of the unix socket to listen to.")
+    ],
+    parent_pid: Annotated[
+        int, typer.Option("--parent-pid", help="Pid of the lab process, the worker stops with it.")
+    ],
+    main_setting_file_path: MainSettingFilePathAnnotation = CLIUtils.MAIN_SETTINGS_FILE_DEFAULT_PATH,
+    is_test: IsTestAnnotation = False,
+):
+    AppManager.run_scenario_worker(
+        main_setting_file_path=main_setting_file_path,
+        socket_path=socket_path,
+        parent_pid=parent_pid,
+        log_level=CLIUtils.get_global_option_log_level(ctx),
+        is_test=is_test,
+    )
+
+
 @app.command("run-process", help="Execute a specific process within a scenario")
 def run_process(
     ctx: typer.Context,
@@ -297,6 +297,7 @@ from .impl.shell.shell_proxy_factory import ShellProxyFactory as ShellProxyFacto
 
 # Impl > Table
 from .impl.table.data_frame_r_field import DataFrameRField as DataFrameRField
+from .impl.table.data_frame_r_field import DataFrameStorageFormat as DataFrameStorageFormat
 from .impl.table.helper.dataframe_aggregator_helper import (
     DataframeAggregatorHelper as DataframeAggregatorHelper,
 )
@@ -424,6 +425,7 @@ from .io.port import Port as Port
 from .lab.api_registry import ApiRegistry as ApiRegistry
 from .lab.lab_model.lab_model_param import LabModelParam as LabModelParam
 from .lab.monitor.monitor import Monitor as Monitor
+from .lab.monitor.monitor_rollup import MonitorRollup as MonitorRollup
 from .lab.monitor.monitor_service import MonitorService as MonitorService
 
 # Model
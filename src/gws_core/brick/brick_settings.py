@@ -2,7 +2,7 @@
 
 import json
 import os
-from typing import Any, ClassVar
+from typing import Any, ClassVar, Literal
 
 from gws_core.core.model.model_dto import BaseModelDTO
 
@@ -107,6 +107,17 @@ class BrickSettingsEnvironment(BaseModelDTO):
         self.bricks.append(BrickSettingsBrickDependency(name=brick_name, version=brick_version))
 
 
+class BrickSettingsVirtualEnv(BaseModelDTO):
+    """DTO representing a virtual env used by the brick, declared in the virtual_envs section
+    of settings.json. The env is installed on lab start when the prebuild is enabled
+    (see Settings.is_virtual_env_prebuild_enabled)"""
+
+    type: Literal["conda", "mamba", "pip"]
+    # path of the env file relative to the brick folder
+    env_file_path: str
+    env_name: str | None = None
+
+
 class BrickSettings:
     """DTO representing the content of a brick's settings.json file"""
 
@@ -116,6 +127,7 @@ class BrickSettings:
     variables: dict[str, str] | None = None
     technical_info: dict[str, str] | None = None
     environment: BrickSettingsEnvironment | None = None
+    virtual_envs: list[BrickSettingsVirtualEnv] | None = None
 
     FILE_NAME: str = "settings.json"
 
@@ -127,6 +139,7 @@ class BrickSettings:
         variables: dict[str, str] | None = None,
         technical_info: dict[str, str] | None = None,
         environment: BrickSettingsEnvironment | None = None,
+        virtual_envs: list[BrickSettingsVirtualEnv] | None = None,
     ):
         self.name = name
         self.author = author
@@ -134,6 +147,7 @@ class BrickSettings:
         self.variables = variables
         self.technical_info = technical_info
         self.environment = environment
+        self.virtual_envs = virtual_envs
 
     def count_pip_packages(self) -> int:
         """Count the total number of pip packages defined in the settings.
@@ -178,7 +192,7 @@ class BrickSettings:
         :return: JSON string representation of the BrickSettings
         :rtype: str
         """
-        return {
+        json_dict = {
             "name": self.name,
             "author": self.author,
             "version": self.version,
@@ -186,6 +200,9 @@ class BrickSettings:
             "technical_info": self.technical_info,
             "environment": self.environment.to_json_dict() if self.environment else {},
         }
+        if self.virtual_envs is not None:
+            json_dict["virtual_envs"] = BrickSettingsVirtualEnv.to_json_list(self.virtual_envs)
+        return json_dict
 
     @staticmethod
     def from_json_dict(settings_data: dict[str, Any]) -> "BrickSettings":
@@ -221,6 +238,9 @@ class BrickSettings:
             variables=settings_data.get("variables"),
             technical_info=settings_data.get("technical_info"),
             environment=environment,
+            virtual_envs=BrickSettingsVirtualEnv.from_json_list(settings_data["virtual_envs"])
+            if "virtual_envs" in settings_data
+            else None,
         )
 
     @staticmethod
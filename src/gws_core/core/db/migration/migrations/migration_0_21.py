@@ -3,6 +3,7 @@ from peewee import CharField, IntegerField
 from gws_core.core.db.migration.sql_migrator import SqlMigrator
 from gws_core.lab.lab_model.lab_model import LabModel
 from gws_core.process.process_model import ProcessModel
+from gws_core.progress_bar.progress_bar_message import ProgressBarMessage
 from gws_core.protocol.protocol_model import ProtocolModel
 from gws_core.scenario.queue.queue import Job
 from gws_core.scenario.scenario import Scenario
@@ -199,3 +200,27 @@ class Migration0210(BrickMigration):
         Logger.info(f"Migration 0.21.0: Adding foreign key constraints on {table_name}")
         shared_model.create_foreign_key_if_not_exist(shared_model.lab)
         shared_model.create_foreign_key_if_not_exist(shared_model.user)
+
+
+@brick_migration(
+    "0.21.1",
+    short_description="Add queue job priority and unique progress bar message positions",
+)
+class Migration0211(BrickMigration):
+    @classmethod
+    def migrate(cls, sql_migrator: SqlMigrator, from_version: Version, to_version: Version) -> None:
+        Logger.info("Migration 0.21.1: Adding priority column to Job table")
+        sql_migrator.add_column_if_not_exists(Job, Job.priority)
+        sql_migrator.migrate()
+
+        # the index of the message positions was created without unique
+        index_name = "gws_process_progress_bar_message_progress_bar_id_position"
+        indexes = ProgressBarMessage.get_db().get_indexes(ProgressBarMessage.get_table_name())
+        if any(index.name == index_name and not index.unique for index in indexes):
+            Logger.info("Migration 0.21.1: Making the progress bar message positions unique")
+            sql_migrator.drop_index_if_exists(ProgressBarMessage, index_name)
+            sql_migrator.migrate()
+            sql_migrator.add_index_if_not_exists(
+                ProgressBarMessage, index_name, ["progress_bar_id", "position"], True
+            )
+            sql_migrator.migrate()
@@ -1,7 +1,7 @@
 import uuid
 from typing import TypeVar
 
-from peewee import CharField, DoesNotExist
+from peewee import CharField, DoesNotExist, chunked
 from peewee import Model as PeeweeModel
 
 from gws_core.core.db.gws_core_db_manager import GwsCoreDbManager
@@ -174,6 +174,72 @@ class Model(BaseModel, PeeweeModel):
 
         return model_list
 
+    @classmethod
+    @GwsCoreDbManager.transaction()
+    def insert_all(
+        cls: type[ModelType], model_list: list[ModelType], batch_size: int = 500
+    ) -> list[ModelType]:
+        """
+        Insert a list of new models in the database using multi-row inserts (one query per batch)
+        instead of one query per model. The before insert hook is called for each model.
+        If an error occurs during the operation, the whole transaction is rolled back.
+
+        :param model_list: List of new models (not saved) of the class
+        :type model_list: list
+        :param batch_size: Max number of rows inserted per query, defaults to 500
+        :type batch_size: int, optional
+        :return: the inserted models
+        :rtype: list
+        """
+        if not model_list:
+            return model_list
+
+        for model in model_list:
+            model._before_insert()
+
+        fields = cls._meta.sorted_fields
+        rows = [tuple(model.__data__.get(field.name) for field in fields) for model in model_list]
+        for batch in chunked(rows, batch_size):
+            cls.insert_many(batch, fields=fields).execute()
+
+        for model in model_list:
+            model._is_saved = True
+
+        return model_list
+
+    @classmethod
+    @GwsCoreDbManager.transaction()
+    def upsert_all(
+        cls: type[ModelType], model_list: list[ModelType], batch_size: int = 500
+    ) -> list[ModelType]:
+        """
+        Insert or update a list of models using multi-row INSERT ... ON DUPLICATE KEY UPDATE
+        queries (one query per batch). A row is updated when its id or a unique index already
+        exists, the id and created_at of the existing row are kept.
+        The before insert and before update hooks are not called.
+        If an error occurs during the operation, the whole transaction is rolled back.
+
+        :param model_list: List of models of the class
+        :type model_list: list
+        :param batch_size: Max number of rows written per query, defaults to 500
+        :type batch_size: int, optional
+        :return: the saved models
+        :rtype: list
+        """
+        if not model_list:
+            return model_list
+
+        fields = cls._meta.sorted_fields
+        preserve = [field for field in fields if field.name not in ("id", "created_at")]
+        rows = [tuple(model.__data__.get(field.name) for field in fields) for model in model_list]
+        for batch in chunked(rows, batch_size):
+            cls.insert_many(batch, fields=fields).on_conflict(preserve=preserve).execute()
+
+        for model in model_list:
+            model._is_saved = True
+
+        return model_list
+
     def to_dto(self) -> BaseModelDTO:
         return ModelDTO(
             id=self.id,
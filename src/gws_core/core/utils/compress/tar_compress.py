@@ -1,5 +1,8 @@
-from tarfile import TarFile
+from io import BytesIO
+from tarfile import TarFile, TarInfo
 from tarfile import open as tar_open
+from time import time
+from typing import BinaryIO
 
 from .compress import Compress
 
@@ -15,9 +18,19 @@ class TarCompress(Compress):
 
     compress_option: str = ""
 
-    def __init__(self, destination_file_path: str):
+    def __init__(self, destination_file_path: str | None = None, fileobj: BinaryIO | None = None):
+        """
+        :param destination_file_path: path of the tar file to create
+        :type destination_file_path: str | None
+        :param fileobj: if provided, the tar is written as a stream to this file object instead of
+                        the destination file (the file object doesn't need to be seekable), defaults to None
+        :type fileobj: BinaryIO | None, optional
+        """
         super().__init__(destination_file_path)
-        self.tar_file = tar_open(destination_file_path, "w" + self.compress_option)
+        if fileobj is not None:
+            self.tar_file = tar_open(fileobj=fileobj, mode="w|" + self.compress_option)
+        else:
+            self.tar_file = tar_open(destination_file_path, "w" + self.compress_option)
 
     def add_dir(self, dir_path: str, dir_name: str | None = None) -> None:
         dir_name = self._generate_node_name(dir_path, dir_name)
@@ -28,6 +41,14 @@ class TarCompress(Compress):
         file_name = self._generate_node_name(file_path, file_name)
         self.tar_file.add(file_path, arcname=file_name)
 
+    def add_bytes(self, data: bytes, file_name: str) -> None:
+        """Add a file with the provided content, without creating the file on disk"""
+        file_name = self._generate_node_name(file_name, file_name)
+        tar_info = TarInfo(file_name)
+        tar_info.size = len(data)
+        tar_info.mtime = int(time())
+        self.tar_file.addfile(tar_info, BytesIO(data))
+
     def close(self) -> str:
         self.tar_file.close()
         return self.destination_file_path
@@ -0,0 +1,74 @@
+import fcntl
+import os
+from typing import IO
+
+
+class FileLock:
+    """Exclusive lock on a file shared between the processes of the machine (flock).
+
+    The lock is released on release, at the end of the with block or when the process
+    holding it dies, so a crashed process never keeps the lock.
+    Each acquire opens its own file descriptor so the lock is also exclusive between the
+    threads of a process.
+
+    Usage:
+    ```python
+    with FileLock("/path/to/file.lock"):
+        # only one process at a time runs this code
+        ...
+    ```
+    """
+
+    file_path: str
+    _file: IO | None
+
+    def __init__(self, file_path: str) -> None:
+        self.file_path = file_path
+        self._file = None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """Acquire the lock. The folder of the lock file is created if needed.
+
+        :param blocking: if True, wait until the lock is released by the other process,
+                         otherwise return False if the lock is held, defaults to True
+        :type blocking: bool, optional
+        :return: True if the lock was acquired
+        :rtype: bool
+        """
+        if self._file is not None:
+            raise Exception(f"The lock '{self.file_path}' is already acquired")
+
+        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+        file = open(self.file_path, "a", encoding="utf-8")
+        try:
+            flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+            fcntl.flock(file.fileno(), flags)
+        except BlockingIOError:
+            file.close()
+            return False
+        except BaseException:
+            file.close()
+            raise
+
+        self._file = file
+        return True
+
+    def release(self) -> None:
+        if self._file is None:
+            return
+
+        try:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._file.close()
+            self._file = None
+
+    def is_acquired(self) -> bool:
+        return self._file is not None
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
@@ -1,5 +1,6 @@
 from typing import Any
 
+import numpy as np
 from numpy import inf, isnan
 
 
@@ -103,3 +104,55 @@ class NumericHelper:
             return True
         except:
             return False
+
+    @staticmethod
+    def lttb_downsample_indexes(x: Any, y: Any, threshold: int) -> np.ndarray:
+        """Return the indexes of the points to keep to downsample a series to threshold points
+        with the Largest-Triangle-Three-Buckets algorithm. The points that shape the series
+        (peaks, drops) are kept. The first and last points are always kept.
+
+        :param x: x values of the series, sorted
+        :type x: array-like
+        :param y: y values of the series, NaN are considered as 0
+        :type y: array-like
+        :param threshold: max number of points to keep
+        :type threshold: int
+        :return: the sorted indexes of the points to keep
+        :rtype: np.ndarray
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.nan_to_num(np.asarray(y, dtype=float))
+        count = len(x)
+
+        if threshold >= count:
+            return np.arange(count)
+        if threshold < 3:
+            return np.unique([0, count - 1])[:max(threshold, 0)]
+
+        # threshold - 2 buckets for the points between the first and the last point
+        edges = np.linspace(1, count - 1, threshold - 1).astype(int)
+        indexes = np.empty(threshold, dtype=int)
+        indexes[0] = 0
+        indexes[-1] = count - 1
+
+        selected = 0
+        for i in range(threshold - 2):
+            start, end = edges[i], edges[i + 1]
+            # the third point of the triangle is the average of the next bucket
+            if i + 2 < len(edges):
+                next_start, next_end = edges[i + 1], edges[i + 2]
+            else:
+                # last bucket, the third point is the last point
+                next_start, next_end = count - 1, count
+            next_x = x[next_start:next_end].mean()
+            next_y = y[next_start:next_end].mean()
+
+            # keep the point of the bucket that forms the largest triangle
+            areas = np.abs(
+                (x[selected] - next_x) * (y[start:end] - y[selected])
+                - (x[selected] - x[start:end]) * (next_y - y[selected])
+            )
+            selected = start + int(np.argmax(areas))
+            indexes[i + 1] = selected
+
+        return indexes
@@ -261,6 +261,96 @@ class Settings:
         """return true if the gpu is available"""
         return os.environ.get("GPU", "") != ""
 
+    @classmethod
+    def get_protocol_max_parallel_processes(cls) -> int:
+        """Return the max number of tasks of a protocol that can run at the same time.
+        By default 1, the tasks are run one after the other.
+        Set the PROTOCOL_MAX_PARALLEL_PROCESSES env variable to run the independent tasks in parallel.
+        """
+        value = os.environ.get("PROTOCOL_MAX_PARALLEL_PROCESSES", "")
+        if not value.isdigit():
+            return 1
+        return max(int(value), 1)
+
+    @classmethod
+    def get_queue_max_running_scenarios(cls) -> int:
+        """Return the max number of scenarios that can run at the same time, the queued
+        scenarios wait for a free slot. By default 1, the scenarios are run one after the other.
+        Set the GWS_QUEUE_MAX_RUNNING_SCENARIOS env variable to run more scenarios at once.
+        """
+        value = os.environ.get("GWS_QUEUE_MAX_RUNNING_SCENARIOS", "")
+        if not value.isdigit():
+            return 1
+        return max(int(value), 1)
+
+    @classmethod
+    def get_queue_max_cpu_percent(cls) -> float:
+        """Return the cpu usage (percent of the machine) above which no other queued scenario is
+        started while a scenario is running. Set with the GWS_QUEUE_MAX_CPU_PERCENT env variable.
+        """
+        return float(os.environ.get("GWS_QUEUE_MAX_CPU_PERCENT", 90))
+
+    @classmethod
+    def get_queue_max_ram_percent(cls) -> float:
+        """Return the ram usage (percent of the machine) above which no other queued scenario is
+        started while a scenario is running. Set with the GWS_QUEUE_MAX_RAM_PERCENT env variable.
+        """
+        return float(os.environ.get("GWS_QUEUE_MAX_RAM_PERCENT", 90))
+
+    @classmethod
+    def is_scenario_worker_pool_enabled(cls) -> bool:
+        """Return true if the scenarios are run in processes forked by warm workers (bricks
+        already imported) instead of a new CLI process for each run.
+        Set the GWS_SCENARIO_WORKER_POOL env variable to 'true' to enable it.
+        """
+        return os.environ.get("GWS_SCENARIO_WORKER_POOL", "").lower() in ("true", "1")
+
+    @classmethod
+    def get_scenario_worker_pool_size(cls) -> int:
+        """Return the number of warm scenario workers, 2 by default so a worker is ready while
+        another one is replaced. Set with the GWS_SCENARIO_WORKER_POOL_SIZE env variable.
+        """
+        value = os.environ.get("GWS_SCENARIO_WORKER_POOL_SIZE", "")
+        if not value.isdigit():
+            return 2
+        return max(int(value), 1)
+
+    @classmethod
+    def get_scenario_worker_max_runs(cls) -> int:
+        """Return the number of runs after which a scenario worker is replaced.
+        Set with the GWS_SCENARIO_WORKER_MAX_RUNS env variable.
+        """
+        value = os.environ.get("GWS_SCENARIO_WORKER_MAX_RUNS", "")
+        if not value.isdigit():
+            return 100
+        return max(int(value), 1)
+
+    @classmethod
+    def get_scenario_worker_max_memory(cls) -> int:
+        """Return the memory in bytes above which a scenario worker is replaced.
+        Set with the GWS_SCENARIO_WORKER_MAX_MEMORY_MB env variable (1024 MB by default).
+        """
+        value = os.environ.get("GWS_SCENARIO_WORKER_MAX_MEMORY_MB", "")
+        if not value.isdigit():
+            return 1024 * 1024 * 1024
+        return int(value) * 1024 * 1024
+
+    @classmethod
+    def is_process_resource_profiling_enabled(cls) -> bool:
+        """Return true if the resources used by the task runs are measured (peak memory, cpu time,
+        io, duration of the steps) and stored with the process run stats.
+        Set the GWS_PROCESS_RESOURCE_PROFILING env variable to 'true' to enable it.
+        """
+        return os.environ.get("GWS_PROCESS_RESOURCE_PROFILING", "").lower() in ("true", "1")
+
+    @classmethod
+    def is_virtual_env_prebuild_enabled(cls) -> bool:
+        """Return true if the virtual envs declared by the bricks (virtual_envs in settings.json)
+        are installed in background on lab start.
+        Set the GWS_PREBUILD_VIRTUAL_ENVS env variable to 'true' to enable it.
+        """
+        return os.environ.get("GWS_PREBUILD_VIRTUAL_ENVS", "").lower() in ("true", "1")
+
     @classmethod
     def get_gws_core_brick_name(cls) -> str:
         return "gws_core"
@@ -366,6 +456,16 @@ class Settings:
     def get_global_env_dir(cls) -> str:
         return os.path.join(cls.get_system_folder(), ".env")
 
+    @classmethod
+    def get_global_env_cache_dir(cls) -> str:
+        """Folder of the package caches (conda, pip) shared by all the virtual envs"""
+        return os.path.join(cls.get_system_folder(), ".env_cache")
+
+    @classmethod
+    def get_global_env_lock_dir(cls) -> str:
+        """Folder of the lock files used to install the virtual envs"""
+        return os.path.join(cls.get_system_folder(), ".env_lock")
+
     @classmethod
     def get_sys_bricks_folder(cls) -> str:
         return os.path.join(cls.get_system_folder(), "bricks")
@@ -584,6 +684,10 @@ class Settings:
     def get_kv_store_base_dir(self) -> str:
         return os.path.join(self.get_data_dir(), "kvstore")
 
+    def get_s3_index_dir(self) -> str:
+        """Folder of the indexes of the objects of the local S3 buckets"""
+        return os.path.join(self.get_data_dir(), "s3_index")
+
     def get_modules(self) -> dict[str, ModuleInfo]:
         return self.data.get("modules", {})
 
@@ -0,0 +1,60 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from threading import Lock
+from time import perf_counter
+
+from gws_core.core.model.model_dto import BaseModelDTO
+from gws_core.core.utils.logger import Logger
+
+
+class StartupStepDTO(BaseModelDTO):
+    name: str
+    duration_ms: float
+
+
+class StartupProfiler:
+    """Measure the duration of the steps of the start of the process (lab or CLI) to report
+    where the start time goes.
+
+    Usage:
+    ```python
+    with StartupProfiler.step("Load bricks"):
+        ...
+    StartupProfiler.log_summary()
+    ```
+    """
+
+    _steps: list[StartupStepDTO] = []
+    _lock: Lock = Lock()
+
+    @classmethod
+    @contextmanager
+    def step(cls, name: str) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            duration_ms = (perf_counter() - start) * 1000
+            with cls._lock:
+                cls._steps.append(StartupStepDTO(name=name, duration_ms=round(duration_ms, 1)))
+
+    @classmethod
+    def get_steps(cls) -> list[StartupStepDTO]:
+        with cls._lock:
+            return list(cls._steps)
+
+    @classmethod
+    def log_summary(cls) -> None:
+        """Log the duration of each step, the longest first"""
+        steps = sorted(cls.get_steps(), key=lambda step: step.duration_ms, reverse=True)
+        if not steps:
+            return
+
+        total_ms = sum(step.duration_ms for step in steps)
+        summary = ", ".join(f"{step.name}: {step.duration_ms:.0f} ms" for step in steps)
+        Logger.info(f"Start time {total_ms:.0f} ms ({summary})")
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._steps = []
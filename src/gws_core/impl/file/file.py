@@ -1,3 +1,4 @@
+import io
 import json
 import os
 from typing import Any, AnyStr
@@ -13,6 +14,7 @@ from gws_core.model.typing_style import TypingStyle
 from ...config.config_params import ConfigParams
 from ...core.exception.exceptions import BadRequestException
 from ...impl.file.file_helper import FileHelper
+from ...impl.file.file_metadata_cache import FileMetadataCache
 from ...impl.json.json_view import JSONView
 from ...resource.resource_decorator import resource_decorator
 from ...resource.view.any_view import AnyView
@@ -169,15 +171,37 @@ class File(FSNode):
         :return: _description_
         :rtype: str
         """
-        text = ""
+        if encoding is None:
+            encoding = self.detect_file_encoding()
+
+        if "r" in mode and "b" not in mode and self.exists() and self._is_line_indexable(encoding):
+            # start reading from the closest indexed line instead of the beginning of the file
+            metadata = FileMetadataCache.get_metadata(self.path)
+            offset, first_line = metadata.get_line_offset(self.path, from_line)
+            with open(self.path, "rb") as binary_file:
+                binary_file.seek(offset)
+                with io.TextIOWrapper(binary_file, encoding=encoding) as file:
+                    return self._read_lines(file, from_line - first_line, to_line - first_line)
+
         with self.open(mode, encoding=encoding) as file:
-            for index, line in enumerate(file):
-                if index >= from_line and index < to_line:
-                    text += line
-                if index >= to_line:
-                    break
+            return self._read_lines(file, from_line, to_line)
+
+    def _read_lines(self, file: Any, from_line: int, to_line: int) -> str:
+        text = ""
+        for index, line in enumerate(file):
+            if index >= from_line and index < to_line:
+                text += line
+            if index >= to_line:
+                break
         return text
 
+    def _is_line_indexable(self, encoding: str) -> bool:
+        """Check if the line breaks of the encoding are the ascii bytes, so the lines can be found in the bytes"""
+        try:
+            return b"\n\r".decode(encoding) == "\n\r"
+        except (LookupError, UnicodeDecodeError):
+            return False
+
     def read(self, size: int = -1, encoding: str | None = None, mode: str = "r+t") -> AnyStr:
         """
         Read the file
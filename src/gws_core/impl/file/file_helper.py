@@ -5,9 +5,11 @@ from pathlib import Path
 from re import sub
 from typing import Any, Literal
 
-from charset_normalizer import from_path
+from charset_normalizer import from_bytes
 from fastapi.responses import FileResponse
 
+from .file_metadata_cache import FileMetadataCache
+
 PathType = str | Path
 
 
@@ -16,6 +18,9 @@ class FileHelper:
     Class containing only classmethod to simplify file management
     """
 
+    # Max number of bytes read from a file to detect its encoding
+    ENCODING_DETECTION_SAMPLE_SIZE = 1024 * 1024
+
     @classmethod
     def get_dir(cls, path: PathType) -> Path:
         """
@@ -505,7 +510,9 @@ class FileHelper:
     @classmethod
     def detect_file_encoding(cls, file_path: PathType, default_encoding: str = "utf-8") -> str:
         """
-        Detect the encoding of a file using charset-normalizer.
+        Detect the encoding of a file using charset-normalizer. Only the first
+        ENCODING_DETECTION_SAMPLE_SIZE bytes of the file are analyzed and the result is cached
+        until the file is modified.
 
         :param file_path: path to the file
         :type file_path: PathType
@@ -514,16 +521,36 @@ class FileHelper:
         :return: detected encoding
         :rtype: str
         """
-
-        if not cls.exists_on_os(file_path):
+        metadata = FileMetadataCache.get_metadata(file_path)
+        if metadata is None or cls.is_dir(file_path):
             return default_encoding
 
-        encoding_result = from_path(file_path)
-        best_encoding = encoding_result.best()
-        if best_encoding:
-            return best_encoding.encoding
-        else:
-            return default_encoding
+        if not metadata.encoding_detected:
+            metadata.encoding = cls._detect_sample_encoding(file_path)
+            metadata.encoding_detected = True
+
+        return metadata.encoding or default_encoding
+
+    @classmethod
+    def _detect_sample_encoding(cls, file_path: PathType) -> str | None:
+        with open(file_path, "rb") as file:
+            sample = file.read(cls.ENCODING_DETECTION_SAMPLE_SIZE)
+            is_partial = len(file.read(1)) > 0
+
+        if is_partial:
+            # don't cut a character at the end of the sample
+            last_newline = sample.rfind(b"\n")
+            if last_newline > 0:
+                sample = sample[: last_newline + 1]
+
+        best_encoding = from_bytes(sample).best()
+        if best_encoding is None:
+            return None
+
+        # the rest of the file may contain non ascii characters
+        if is_partial and best_encoding.encoding == "ascii":
+            return "utf_8"
+        return best_encoding.encoding
 
     @classmethod
     def copy_file(cls, source_path: PathType, destination_path: PathType) -> None:
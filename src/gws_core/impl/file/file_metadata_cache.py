@@ -0,0 +1,151 @@
+import os
+from collections import OrderedDict
+from threading import Lock
+
+import numpy as np
+
+
+class FileMetadata:
+    """Metadata of the content of a file kept by the FileMetadataCache: the detected encoding
+    and a sparse index of the byte offset of the lines.
+
+    The index contains the offset of one line every LINE_INDEX_STEP lines. It is built lazily,
+    the file is scanned only up to the requested line and the scan continues from there for the next requests.
+    """
+
+    # Number of lines between two indexed lines
+    LINE_INDEX_STEP = 1000
+    # Size of the chunks read to build the line index
+    READ_CHUNK_SIZE = 1024 * 1024
+
+    size: int
+    mtime_ns: int
+
+    # detected encoding, None if not detected (see encoding_detected)
+    encoding: str | None = None
+    encoding_detected: bool = False
+
+    # byte offset of the lines 0, LINE_INDEX_STEP, 2 * LINE_INDEX_STEP...
+    _line_offsets: list[int]
+    # number of lines and bytes already scanned
+    _scanned_lines: int = 0
+    _scanned_offset: int = 0
+    _scan_complete: bool = False
+    # the index is disabled when the file contains lines ending with '\r' only
+    # (the text mode splits the lines on '\r' too, the byte index would not match)
+    _line_index_disabled: bool = False
+
+    _lock: Lock
+
+    def __init__(self, size: int, mtime_ns: int) -> None:
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self._line_offsets = [0]
+        self._lock = Lock()
+
+    def get_line_offset(self, file_path: str, line: int) -> tuple[int, int]:
+        """Return the byte offset of the closest indexed line before the line (included).
+        Reading the file in text mode from this offset gives the lines from the indexed line.
+
+        :param file_path: path of the file
+        :type file_path: str
+        :param line: the line to reach (0-based)
+        :type line: int
+        :return: the byte offset and the number of the indexed line
+        :rtype: tuple[int, int]
+        """
+        with self._lock:
+            target_index = line // self.LINE_INDEX_STEP
+            if target_index >= len(self._line_offsets) and not self._scan_complete:
+                self._scan_lines(file_path, target_index)
+
+            if self._line_index_disabled:
+                return 0, 0
+
+            index = min(target_index, len(self._line_offsets) - 1)
+            return self._line_offsets[index], index * self.LINE_INDEX_STEP
+
+    def _scan_lines(self, file_path: str, target_index: int) -> None:
+        """Scan the file from the last scanned position until the line offset at target_index is indexed"""
+        with open(file_path, "rb") as file:
+            file.seek(self._scanned_offset)
+            while len(self._line_offsets) <= target_index:
+                chunk = file.read(self.READ_CHUNK_SIZE)
+                if not chunk:
+                    self._scan_complete = True
+                    return
+
+                # don't split a '\r\n' between two chunks
+                if chunk.endswith(b"\r"):
+                    chunk += file.read(1)
+
+                if chunk.count(b"\r") != chunk.count(b"\r\n"):
+                    self._line_index_disabled = True
+                    self._scan_complete = True
+                    return
+
+                newline_positions = np.flatnonzero(np.frombuffer(chunk, dtype=np.uint8) == 10)
+                # the line n starts after the newline n - 1
+                next_line = len(self._line_offsets) * self.LINE_INDEX_STEP
+                while next_line <= self._scanned_lines + len(newline_positions):
+                    position = newline_positions[next_line - self._scanned_lines - 1]
+                    self._line_offsets.append(self._scanned_offset + int(position) + 1)
+                    next_line += self.LINE_INDEX_STEP
+
+                self._scanned_lines += len(newline_positions)
+                self._scanned_offset += len(chunk)
+
+
+class FileMetadataCache:
+    """In memory LRU cache of the metadata of the files read by the lab (detected encoding, line index).
+
+    The entries are stored by path with the size and the modification time of the file,
+    an entry is rebuilt when the file was modified.
+    """
+
+    # Max number of files in the cache
+    MAX_ENTRIES: int = 1000
+
+    _entries: OrderedDict[str, FileMetadata] = OrderedDict()
+
+    _lock: Lock = Lock()
+
+    @classmethod
+    def get_metadata(cls, file_path: str) -> FileMetadata | None:
+        """Return the metadata of the file, a new empty metadata if the file is not in the cache
+        or was modified. Return None if the file doesn't exist.
+
+        :param file_path: path of the file
+        :type file_path: str
+        :return: the metadata of the file
+        :rtype: FileMetadata | None
+        """
+        file_path = str(file_path)
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+
+        with cls._lock:
+            metadata = cls._entries.get(file_path)
+            if (
+                metadata is not None
+                and metadata.size == stat.st_size
+                and metadata.mtime_ns == stat.st_mtime_ns
+            ):
+                # mark the entry as recently used
+                cls._entries.move_to_end(file_path)
+                return metadata
+
+            metadata = FileMetadata(stat.st_size, stat.st_mtime_ns)
+            cls._entries[file_path] = metadata
+            cls._entries.move_to_end(file_path)
+
+            while len(cls._entries) > cls.MAX_ENTRIES:
+                cls._entries.popitem(last=False)
+            return metadata
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._entries.clear()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from collections.abc import ByteString
+from collections.abc import AsyncIterable
 
 from fastapi.responses import FileResponse
 from mypy_boto3_s3.type_defs import ListObjectsV2OutputTypeDef
@@ -30,10 +30,14 @@ class AbstractS3Service(ABC):
         """List objects in a bucket"""
 
     @abstractmethod
-    def upload_object(
-        self, key: str, data: ByteString, tags: dict[str, str] | None = None, last_modified: float | None = None
+    async def upload_object(
+        self,
+        key: str,
+        data: AsyncIterable[bytes],
+        tags: dict[str, str] | None = None,
+        last_modified: float | None = None,
     ) -> dict:
-        """Upload an object to the bucket"""
+        """Upload an object to the bucket, the data is streamed to disk in chunks"""
 
     @abstractmethod
     def get_object(self, key: str) -> FileResponse:
@@ -64,15 +68,20 @@ class AbstractS3Service(ABC):
         """Update the tags of an object with a dictionary"""
 
     @abstractmethod
-    def initiate_multipart_upload(self, key: str, last_modified: float | None = None) -> str:
+    def initiate_multipart_upload(
+        self, key: str, last_modified: float | None = None, tags: dict[str, str] | None = None
+    ) -> str:
         """Initiate a multipart upload and return upload ID"""
 
     @abstractmethod
-    def upload_part(self, key: str, upload_id: str, part_number: int, data: ByteString) -> None:
-        """Upload a part for multipart upload and return ETag"""
+    async def upload_part(
+        self, key: str, upload_id: str, part_number: int, data: AsyncIterable[bytes]
+    ) -> str:
+        """Upload a part for multipart upload and return ETag,
+        the data is streamed to disk in chunks"""
 
     @abstractmethod
-    def complete_multipart_upload(self, key: str, upload_id: str, parts: list[dict]) -> None:
+    def complete_multipart_upload(self, key: str, upload_id: str, parts: list[dict]) -> str:
         """Complete multipart upload and return ETag"""
 
     @abstractmethod
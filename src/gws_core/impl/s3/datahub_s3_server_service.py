@@ -1,4 +1,6 @@
-from collections.abc import ByteString
+import os
+import tempfile
+from collections.abc import AsyncIterable
 from os import path
 
 from fastapi.responses import FileResponse
@@ -8,16 +10,18 @@ from gws_core.core.classes.search_builder import SearchOperator
 from gws_core.core.db.gws_core_db_manager import GwsCoreDbManager
 from gws_core.core.utils.date_helper import DateHelper
 from gws_core.core.utils.logger import Logger
-from gws_core.core.utils.settings import Settings
 from gws_core.entity_navigator.entity_navigator_service import EntityNavigatorService
 from gws_core.folder.space_folder import SpaceFolder
 from gws_core.folder.space_folder_service import SpaceFolderService
 from gws_core.impl.file.file import File
 from gws_core.impl.file.file_helper import FileHelper
+from gws_core.impl.file.local_file_store import LocalFileStore
 from gws_core.impl.s3.abstract_s3_service import AbstractS3Service
+from gws_core.impl.s3.s3_multipart_upload_store import S3MultipartUploadStore
 from gws_core.impl.s3.s3_server_context import S3ServerContext
 from gws_core.impl.s3.s3_server_dto import S3GetTagResponse, S3UpdateTagRequest
 from gws_core.impl.s3.s3_server_exception import S3ServerException, S3ServerNoSuchKey
+from gws_core.impl.s3.s3_stream_helper import S3StreamHelper
 from gws_core.resource.resource_dto import ResourceOrigin
 from gws_core.resource.resource_model import ResourceModel
 from gws_core.resource.resource_search_builder import ResourceSearchBuilder
@@ -99,33 +103,51 @@ class DataHubS3ServerService(AbstractS3Service):
                 },
             }
 
+    async def upload_object(
+        self,
+        key: str,
+        data: AsyncIterable[bytes],
+        tags: dict[str, str] | None = None,
+        last_modified: float | None = None,
+    ) -> dict:
+        """Upload an object to the bucket. The data is streamed to a temp file
+        that is then moved to the file store"""
+
+        temp_dir = self._make_upload_temp_dir()
+        try:
+            file_path = path.join(temp_dir, FileHelper.get_node_name(key))
+            written_object = await S3StreamHelper.write_stream_to_file(data, file_path)
+
+            self._save_uploaded_object(key, file_path, written_object.size, tags)
+        finally:
+            FileHelper.delete_dir(temp_dir)
+
+        return {"ETag": f'"{written_object.etag}"'}
+
+    def _make_upload_temp_dir(self) -> str:
+        """Create the temp dir of an upload next to the file stores (on the same disk), so
+        the uploaded file is moved (renamed) to the file store without a copy"""
+        upload_dir = path.join(LocalFileStore.get_base_dir(), ".s3_uploads")
+        os.makedirs(upload_dir, exist_ok=True)
+        return tempfile.mkdtemp(dir=upload_dir)
+
     @GwsCoreDbManager.transaction()
-    def upload_object(
-        self, key: str, data: ByteString, tags: dict[str, str] | None = None, last_modified: float | None = None
+    def _save_uploaded_object(
+        self, key: str, file_path: str, size: int, tags: dict[str, str] | None = None
     ) -> None:
-        """Upload an object to the bucket"""
-
         # check if it already exists
         resource_model = self._get_object(key)
 
         if resource_model:
-            self._update_object(key, data, resource_model, tags)
+            self._update_object(key, file_path if size else None, resource_model, tags)
         else:
-            self._create_object(key, data, tags)
+            self._create_object(key, file_path, tags)
 
-    def _create_object(self, key: str, data: ByteString, tags: dict[str, str] | None = None) -> None:
+    def _create_object(self, key: str, file_path: str, tags: dict[str, str] | None = None) -> None:
         with S3ServerContext(self.bucket_name, key):
             self._get_and_check_folder_bucket(tags.get(self.FOLDER_TAG_NAME) if tags else None)
 
-            # create a file in a temp folder
-            temp_folder = Settings.make_temp_dir()
-
-            filename = FileHelper.get_node_name(key)
-            file_path = path.join(temp_folder, filename)
-            with open(file_path, "wb") as write_file:
-                write_file.write(data)
-
-            # make a resource from the file
+            # make a resource from the uploaded file, the file is moved to the file store
             file = File(file_path)
 
             resource_model = ResourceModel.from_resource(file, ResourceOrigin.S3_FOLDER_STORAGE)
@@ -178,7 +200,11 @@ class DataHubS3ServerService(AbstractS3Service):
                     )
 
     def _update_object(
-        self, key: str, data: ByteString, resource_model: ResourceModel, tags: dict[str, str] | None = None
+        self,
+        key: str,
+        file_path: str | None,
+        resource_model: ResourceModel,
+        tags: dict[str, str] | None = None,
     ) -> None:
         with S3ServerContext(self.bucket_name, key):
             if not resource_model.fs_node_model:
@@ -192,14 +218,13 @@ class DataHubS3ServerService(AbstractS3Service):
 
             ResourceService.check_if_resource_is_used(resource_model)
 
-            if data:
-                # override the file
-                file_path = resource_model.fs_node_model.path
-                with open(file_path, "wb") as write_file:
-                    write_file.write(data)
+            if file_path:
+                # override the file with the uploaded file
+                resource_file_path = resource_model.fs_node_model.path
+                FileHelper.move_file_or_dir(file_path, resource_file_path)
 
                 # refresh the size of the file
-                resource_model.fs_node_model.size = FileHelper.get_size(file_path)
+                resource_model.fs_node_model.size = FileHelper.get_size(resource_file_path)
                 resource_model.fs_node_model.save()
 
             # update the last modified date
@@ -477,21 +502,64 @@ class DataHubS3ServerService(AbstractS3Service):
 
     ##################################################### MULTIPART UPLOAD METHODS #####################################################
 
-    def initiate_multipart_upload(self, key: str, last_modified: float | None = None) -> str:
-        """Initiate a multipart upload and return upload ID"""
-        raise NotImplementedError("Multipart upload is not supported in DataHub S3 service")
+    @property
+    def _multipart_store(self) -> S3MultipartUploadStore:
+        """Store of the multipart uploads, stored next to the file stores (on the same disk)
+        so the completed object is moved to the file store without a copy"""
+        return S3MultipartUploadStore(
+            path.join(LocalFileStore.get_base_dir(), ".s3_multipart", self.bucket_name)
+        )
 
-    def upload_part(self, key: str, upload_id: str, part_number: int, data: ByteString) -> str:
+    def initiate_multipart_upload(
+        self, key: str, last_modified: float | None = None, tags: dict[str, str] | None = None
+    ) -> str:
+        """Initiate a multipart upload and return upload ID.
+        The tags are stored with the upload and applied when the resource is created on completion.
+        """
+        # check the folder before the upload of the parts
+        if self._get_object(key) is None:
+            with S3ServerContext(self.bucket_name, key):
+                self._get_and_check_folder_bucket(
+                    tags.get(self.FOLDER_TAG_NAME) if tags else None
+                )
+
+        multipart_store = self._multipart_store
+        multipart_store.cleanup_abandoned_uploads()
+        return multipart_store.initiate_upload(key, {"tags": tags or {}})
+
+    async def upload_part(
+        self, key: str, upload_id: str, part_number: int, data: AsyncIterable[bytes]
+    ) -> str:
         """Upload a part for multipart upload and return ETag"""
-        raise NotImplementedError("Multipart upload is not supported in DataHub S3 service")
+        etag = await self._multipart_store.write_part(key, upload_id, part_number, data)
+        return f'"{etag}"'
 
     def complete_multipart_upload(self, key: str, upload_id: str, parts: list[dict]) -> str:
-        """Complete multipart upload and return ETag"""
-        raise NotImplementedError("Multipart upload is not supported in DataHub S3 service")
+        """Complete multipart upload, create or update the resource and return ETag"""
+        multipart_store = self._multipart_store
+        upload_info = multipart_store.get_upload_info(key, upload_id)
+
+        object_dir = path.join(multipart_store.get_upload_dir(upload_id), "object")
+        os.makedirs(object_dir, exist_ok=True)
+        try:
+            file_path = path.join(object_dir, FileHelper.get_node_name(key))
+            etag = multipart_store.concatenate_parts(key, upload_id, parts, file_path)
+
+            self._save_uploaded_object(
+                key, file_path, FileHelper.get_size(file_path), upload_info["metadata"]["tags"]
+            )
+        finally:
+            # the parts are kept if the completion failed, so it can be retried
+            FileHelper.delete_dir(object_dir)
+
+        multipart_store.delete_upload(upload_id)
+        return f'"{etag}"'
 
     def abort_multipart_upload(self, key: str, upload_id: str) -> None:
         """Abort a multipart upload and clean up temp files"""
-        raise NotImplementedError("Multipart upload is not supported in DataHub S3 service")
+        multipart_store = self._multipart_store
+        multipart_store.get_upload_info(key, upload_id)
+        multipart_store.delete_upload(upload_id)
 
     ##################################################### OTHER METHODS #####################################################
 
@@ -0,0 +1,396 @@
+import hashlib
+import os
+import sqlite3
+import tempfile
+import time
+from contextlib import closing
+from dataclasses import dataclass
+from os import path
+from threading import Lock, Thread
+
+from gws_core.core.utils.file_lock import FileLock
+from gws_core.core.utils.logger import Logger
+from gws_core.core.utils.settings import Settings
+
+
+@dataclass
+class LocalS3IndexedObject:
+    """Object of a local S3 bucket stored in the LocalS3ObjectIndex"""
+
+    key: str
+    size: int
+    # modification time of the file (timestamp in seconds)
+    mtime: float
+    # md5 of the content of the file (hex)
+    etag: str
+
+
+class LocalS3ObjectIndex:
+    """Persistent index of the objects of a local S3 bucket (key, size, modification time and md5).
+
+    The index is a sqlite database stored in the data dir with the keys as primary key, so a page
+    of ListObjectsV2 is a range scan on the keys instead of a walk of the bucket directory.
+
+    The index is maintained by the LocalS3ServerService on upload, delete and multipart completion.
+    It is rebuilt from the bucket directory when the index file doesn't exist. The files added,
+    modified or deleted in the bucket directory without the S3 server are reconciled in a
+    background thread started by the listing, at most every RECONCILE_INTERVAL_SECONDS. The
+    listing doesn't wait for the reconciliation. Call reconcile after writing files in the
+    bucket directory to index them directly.
+
+    The rebuild and the reconciliation hold a file lock on the index so they run once at a time
+    between the threads and the processes.
+    """
+
+    # Size of the chunks read to compute the md5 of the files
+    READ_CHUNK_SIZE = 1024 * 1024
+    # Max time to wait for the lock of the database (another request writing in the index)
+    LOCK_TIMEOUT_SECONDS = 30
+    # Min seconds between two reconciliations of an index with its bucket directory
+    RECONCILE_INTERVAL_SECONDS = 60
+    # Prefix of the temp files written in the bucket directory during the uploads,
+    # they are not objects of the bucket
+    TEMP_FILE_PREFIX = ".s3_upload_"
+
+    # Time (monotonic) of the last rebuild or reconciliation of each index, by index path
+    _last_reconcile_times: dict[str, float] = {}
+    # Path of the indexes reconciled by a background thread of this process
+    _reconciling_index_paths: set[str] = set()
+    _reconciling_lock = Lock()
+
+    bucket_name: str
+    bucket_path: str
+
+    def __init__(self, bucket_name: str, bucket_path: str):
+        self.bucket_name = bucket_name
+        self.bucket_path = bucket_path
+
+    @property
+    def index_path(self) -> str:
+        """Path of the index file. The bucket path is hashed in the name because
+        two buckets with the same name can be stored in different directories"""
+        path_hash = hashlib.md5(path.abspath(self.bucket_path).encode("utf-8")).hexdigest()
+        return path.join(
+            Settings.get_instance().get_s3_index_dir(), f"{self.bucket_name}_{path_hash}.sqlite"
+        )
+
+    def put_object(self, key: str, size: int, mtime: float, etag: str) -> None:
+        """Add or replace an object in the index"""
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO objects (key, size, mtime, etag) VALUES (?, ?, ?, ?)",
+                (key, size, mtime, etag),
+            )
+
+    def put_file(self, key: str, file_path: str, etag: str | None = None) -> LocalS3IndexedObject:
+        """Add or replace an object in the index from the file stored in the bucket.
+        The md5 of the file is computed if etag is not provided.
+        """
+        stat = os.stat(file_path)
+        if etag is None:
+            etag = self.compute_file_md5(file_path)
+        self.put_object(key, stat.st_size, stat.st_mtime, etag)
+        return LocalS3IndexedObject(key=key, size=stat.st_size, mtime=stat.st_mtime, etag=etag)
+
+    def delete_objects(self, keys: list[str]) -> None:
+        """Remove objects from the index, the keys that are not in the index are ignored"""
+        with closing(self._connect()) as connection, connection:
+            connection.executemany("DELETE FROM objects WHERE key = ?", [(key,) for key in keys])
+
+    def get_object(self, key: str) -> LocalS3IndexedObject | None:
+        """Get an object from the index, None if the key is not indexed"""
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT key, size, mtime, etag FROM objects WHERE key = ?", (key,)
+            ).fetchone()
+        return LocalS3IndexedObject(*row) if row else None
+
+    def list_page(
+        self,
+        prefix: str | None = None,
+        delimiter: str | None = None,
+        start_after: str | None = None,
+        max_keys: int = 1000,
+    ) -> tuple[list[LocalS3IndexedObject], list[str], bool]:
+        """List a page of objects in key order.
+
+        When a delimiter is provided, the keys containing the delimiter after the prefix are grouped
+        in a common prefix, the keys of a common prefix are skipped with a single range seek.
+        Like S3, the objects and the common prefixes count in max_keys. The next page starts
+        after the last object key or common prefix of the page.
+
+        :param prefix: only list the keys starting with the prefix, defaults to None
+        :type prefix: str | None, optional
+        :param delimiter: delimiter to group the keys in common prefixes, defaults to None
+        :type delimiter: str | None, optional
+        :param start_after: list the keys after this key or common prefix, defaults to None
+        :type start_after: str | None, optional
+        :param max_keys: max number of objects and common prefixes in the page, defaults to 1000
+        :type max_keys: int, optional
+        :return: the objects, the common prefixes and whether the listing is truncated
+        :rtype: tuple[list[LocalS3IndexedObject], list[str], bool]
+        """
+        prefix = prefix or ""
+        # keys are >= lower_bound and > after_key and < upper_bound
+        lower_bound = prefix
+        after_key = start_after or ""
+        upper_bound = self._get_prefix_upper_bound(prefix)
+
+        # the previous page ended with a common prefix, skip all its keys. The start key is a
+        # common prefix only if it ends with the first delimiter after the prefix, so the prefix
+        # itself (like 'dir/') is not skipped
+        if delimiter and after_key.startswith(prefix):
+            delimiter_pos = after_key.find(delimiter, len(prefix))
+            if delimiter_pos != -1 and delimiter_pos + len(delimiter) == len(after_key):
+                lower_bound = max(lower_bound, self._get_prefix_upper_bound(after_key))
+
+        objects: list[LocalS3IndexedObject] = []
+        common_prefixes: list[str] = []
+
+        with closing(self._connect()) as connection:
+            while True:
+                remaining = max_keys + 1 - len(objects) - len(common_prefixes)
+                if remaining <= 0:
+                    break
+
+                rows = self._select_range(
+                    connection, lower_bound, after_key, upper_bound, remaining
+                )
+                common_prefix = None
+                for row in rows:
+                    key: str = row[0]
+                    if delimiter:
+                        delimiter_pos = key.find(delimiter, len(prefix))
+                        if delimiter_pos != -1:
+                            common_prefix = key[: delimiter_pos + len(delimiter)]
+                            break
+                    objects.append(LocalS3IndexedObject(*row))
+
+                if common_prefix is None:
+                    # the range is exhausted or the page is full
+                    break
+
+                # add the common prefix and seek after all the keys of the common prefix
+                common_prefixes.append(common_prefix)
+                lower_bound = self._get_prefix_upper_bound(common_prefix)
+
+        is_truncated = len(objects) + len(common_prefixes) > max_keys
+        if is_truncated:
+            # remove the extra item used to detect the truncation (the last in key order)
+            if common_prefixes and (not objects or common_prefixes[-1] > objects[-1].key):
+                common_prefixes.pop()
+            else:
+                objects.pop()
+
+        self.reconcile_in_background()
+        return objects, common_prefixes, is_truncated
+
+    def rebuild(self) -> int:
+        """Rebuild the index from the files of the bucket directory. The new index is written
+        in a temp file and replaces the current index at the end.
+
+        :return: the number of indexed objects
+        :rtype: int
+        """
+        with self._get_lock():
+            return self._rebuild()
+
+    def reconcile(self) -> int:
+        """Update the index with the files added, modified or deleted in the bucket directory
+        without the S3 server. Only the md5 of the new files and of the files with a different
+        size or modification time is computed.
+
+        :return: the number of added, updated or removed objects
+        :rtype: int
+        """
+        with self._get_lock():
+            return self._reconcile()
+
+    def reconcile_if_needed(self) -> None:
+        """Reconcile the index if it was not rebuilt or reconciled by this process during the
+        last RECONCILE_INTERVAL_SECONDS. Skipped if another request is already reconciling it.
+        """
+        if not self._reconcile_is_due():
+            return
+
+        lock = self._get_lock()
+        if not lock.acquire(blocking=False):
+            return
+        try:
+            self._reconcile()
+        finally:
+            lock.release()
+
+    def reconcile_in_background(self) -> None:
+        """Run reconcile_if_needed in a background thread, if the reconciliation is due and
+        is not already running in this process
+        """
+        index_path = self.index_path
+        if not self._reconcile_is_due():
+            return
+
+        with self._reconciling_lock:
+            if index_path in self._reconciling_index_paths:
+                return
+            self._reconciling_index_paths.add(index_path)
+
+        Thread(target=self._reconcile_in_thread, daemon=True).start()
+
+    def _reconcile_in_thread(self) -> None:
+        try:
+            self.reconcile_if_needed()
+        except Exception as err:
+            Logger.error(f"Error while reconciling the index of bucket '{self.bucket_name}': {err}")
+        finally:
+            with self._reconciling_lock:
+                self._reconciling_index_paths.discard(self.index_path)
+
+    def _reconcile_is_due(self) -> bool:
+        last_reconcile_time = self._last_reconcile_times.get(self.index_path)
+        return (
+            last_reconcile_time is None
+            or time.monotonic() - last_reconcile_time >= self.RECONCILE_INTERVAL_SECONDS
+        )
+
+    def _rebuild(self) -> int:
+        index_path = self.index_path
+        index_dir = path.dirname(index_path)
+        os.makedirs(index_dir, exist_ok=True)
+        file_descriptor, temp_index_path = tempfile.mkstemp(
+            dir=index_dir, prefix=f"{path.basename(index_path)}.", suffix=".tmp"
+        )
+        os.close(file_descriptor)
+
+        count = 0
+        try:
+            with closing(sqlite3.connect(temp_index_path)) as connection, connection:
+                self._create_table(connection)
+                for key, file_path in self._walk_bucket():
+                    try:
+                        self._insert_file(connection, key, file_path)
+                    except FileNotFoundError:
+                        # the file was deleted during the rebuild
+                        continue
+                    count += 1
+
+            os.replace(temp_index_path, index_path)
+        except BaseException:
+            if path.exists(temp_index_path):
+                os.remove(temp_index_path)
+            raise
+
+        self._last_reconcile_times[index_path] = time.monotonic()
+        return count
+
+    def _reconcile(self) -> int:
+        if not path.exists(self.index_path):
+            return self._rebuild()
+
+        count = 0
+        with closing(self._open()) as connection, connection:
+            indexed_files: dict[str, tuple[int, float]] = {
+                row[0]: (row[1], row[2])
+                for row in connection.execute("SELECT key, size, mtime FROM objects")
+            }
+            for key, file_path in self._walk_bucket():
+                try:
+                    stat = os.stat(file_path)
+                    if indexed_files.pop(key, None) == (stat.st_size, stat.st_mtime):
+                        continue
+                    self._insert_file(connection, key, file_path)
+                except FileNotFoundError:
+                    # the file was deleted during the reconciliation
+                    continue
+                count += 1
+
+            # the remaining keys have no file anymore
+            connection.executemany(
+                "DELETE FROM objects WHERE key = ?", [(key,) for key in indexed_files]
+            )
+            count += len(indexed_files)
+
+        self._last_reconcile_times[self.index_path] = time.monotonic()
+        return count
+
+    def _insert_file(self, connection: sqlite3.Connection, key: str, file_path: str) -> None:
+        stat = os.stat(file_path)
+        connection.execute(
+            "INSERT OR REPLACE INTO objects (key, size, mtime, etag) VALUES (?, ?, ?, ?)",
+            (key, stat.st_size, stat.st_mtime, self.compute_file_md5(file_path)),
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the index, the index is built from the bucket directory if it doesn't exist"""
+        if not path.exists(self.index_path):
+            with self._get_lock():
+                # the index may have been built by another request while waiting for the lock
+                if not path.exists(self.index_path):
+                    self._rebuild()
+        return self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.index_path, timeout=self.LOCK_TIMEOUT_SECONDS)
+
+    def _get_lock(self) -> FileLock:
+        """Lock held while the index is rebuilt or reconciled"""
+        return FileLock(f"{self.index_path}.lock")
+
+    def _create_table(self, connection: sqlite3.Connection) -> None:
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS objects ("
+            "key TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime REAL NOT NULL, etag TEXT NOT NULL"
+            ") WITHOUT ROWID"
+        )
+
+    def _select_range(
+        self,
+        connection: sqlite3.Connection,
+        lower_bound: str,
+        after_key: str,
+        upper_bound: str | None,
+        limit: int,
+    ) -> list[tuple]:
+        # a single lower bound so the scan starts at the bound in the primary key
+        if after_key >= lower_bound:
+            query = "SELECT key, size, mtime, etag FROM objects WHERE key > ?"
+            params: list = [after_key]
+        else:
+            query = "SELECT key, size, mtime, etag FROM objects WHERE key >= ?"
+            params = [lower_bound]
+        if upper_bound is not None:
+            query += " AND key < ?"
+            params.append(upper_bound)
+        query += " ORDER BY key LIMIT ?"
+        params.append(limit)
+        return connection.execute(query, params).fetchall()
+
+    def _walk_bucket(self) -> list[tuple[str, str]]:
+        """Return the key and the path of all the files of the bucket"""
+        files: list[tuple[str, str]] = []
+        if not path.isdir(self.bucket_path):
+            return files
+
+        for root, _, file_names in os.walk(self.bucket_path):
+            for file_name in file_names:
+                if file_name.startswith(self.TEMP_FILE_PREFIX):
+                    continue
+                file_path = path.join(root, file_name)
+                key = path.relpath(file_path, self.bucket_path).replace(os.sep, "/")
+                files.append((key, file_path))
+        return files
+
+    @staticmethod
+    def _get_prefix_upper_bound(prefix: str) -> str | None:
+        """Return the smallest string greater than all the strings starting with the prefix,
+        None if there is no bound (empty prefix)"""
+        if not prefix:
+            return None
+        return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+    @classmethod
+    def compute_file_md5(cls, file_path: str) -> str:
+        md5 = hashlib.md5()
+        with open(file_path, "rb") as file:
+            while chunk := file.read(cls.READ_CHUNK_SIZE):
+                md5.update(chunk)
+        return md5.hexdigest()
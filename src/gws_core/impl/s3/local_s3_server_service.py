@@ -1,8 +1,7 @@
-import json
 import os
 import time
-import uuid
-from collections.abc import ByteString
+from collections.abc import AsyncIterable, Iterator
+from contextlib import contextmanager
 from os import path
 from typing import Any
 
@@ -11,25 +10,36 @@ from mypy_boto3_s3.type_defs import ListObjectsV2OutputTypeDef
 
 from gws_core.core.utils.date_helper import DateHelper
 from gws_core.core.utils.settings import Settings
+from gws_core.core.utils.string_helper import StringHelper
 from gws_core.impl.file.file_helper import FileHelper
 from gws_core.impl.s3.abstract_s3_service import AbstractS3Service
+from gws_core.impl.s3.local_s3_object_index import LocalS3ObjectIndex
+from gws_core.impl.s3.s3_multipart_upload_store import S3MultipartUploadStore
 from gws_core.impl.s3.s3_server_dto import S3GetTagResponse, S3UpdateTagRequest
 from gws_core.impl.s3.s3_server_exception import S3ServerNoSuchKey
+from gws_core.impl.s3.s3_stream_helper import S3StreamHelper
 
 
 class LocalS3ServerService(AbstractS3Service):
-    """Local S3 service that stores files in a local directory"""
+    """Local S3 service that stores files in a local directory.
+
+    The objects of the bucket are indexed in a LocalS3ObjectIndex (sorted keys, size,
+    modification time and md5) maintained on upload, delete and multipart completion,
+    the listing is a range scan on this index.
+    """
 
     _CLEANUP_INTERVAL_SECONDS = 60
 
     bucket_path: str
     _bucket_ensured: bool
+    _object_index: LocalS3ObjectIndex
 
     def __init__(self, bucket_name: str, bucket_path: str):
         """Initialize the service with a bucket name"""
         super().__init__(bucket_name)
         self.bucket_path = bucket_path
         self._bucket_ensured = False
+        self._object_index = LocalS3ObjectIndex(bucket_name, bucket_path)
 
     def create_bucket(self) -> None:
         """Create a bucket (directory) in the local filesystem"""
@@ -38,49 +48,11 @@ class LocalS3ServerService(AbstractS3Service):
             self._bucket_ensured = True
 
     @property
-    def _multipart_dir(self) -> str:
-        """Path to multipart upload temp directory, stored in system temp to avoid permission issues"""
-        return path.join(Settings.get_root_temp_dir(), ".s3_multipart", self.bucket_name)
-
-    @property
-    def _multipart_state_file(self) -> str:
-        """Path to multipart upload state file"""
-        return path.join(self._multipart_dir, "state.json")
-
-    def _load_multipart_state(self) -> dict[str, Any]:
-        """Load multipart upload state from disk"""
-        if not path.exists(self._multipart_state_file):
-            return {}
-        try:
-            with open(self._multipart_state_file) as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return {}
-
-    def _save_multipart_state(self, state: dict[str, Any]) -> None:
-        """Save multipart upload state to disk"""
-        multipart_dir = path.dirname(self._multipart_state_file)
-
-        if state:
-            # Save state if not empty
-            os.makedirs(multipart_dir, exist_ok=True)
-            with open(self._multipart_state_file, "w") as f:
-                json.dump(state, f)
-        else:
-            # Clean up when state is empty
-            # Remove state file if it exists
-            if path.exists(self._multipart_state_file):
-                os.remove(self._multipart_state_file)
-
-            # Remove .multipart directory if it's empty
-            if path.exists(multipart_dir):
-                try:
-                    # Check if directory is empty (no files, no subdirectories)
-                    if not any(os.scandir(multipart_dir)):
-                        os.rmdir(multipart_dir)
-                except OSError:
-                    # Directory not empty or other error, leave it
-                    pass
+    def _multipart_store(self) -> S3MultipartUploadStore:
+        """Store of the multipart uploads, stored in system temp to avoid permission issues"""
+        return S3MultipartUploadStore(
+            path.join(Settings.get_root_temp_dir(), ".s3_multipart", self.bucket_name)
+        )
 
     def list_objects(
         self,
@@ -114,72 +86,43 @@ class LocalS3ServerService(AbstractS3Service):
                 },
             }
 
-        common_prefixes = set()
-
-        # When delimiter is used (e.g. rclone with "/"), only scan the prefix directory
-        # instead of walking the entire bucket tree
-        if delimiter and delimiter == "/":
-            all_keys = self._list_objects_shallow(prefix)
-        else:
-            all_keys = self._list_objects_deep(prefix)
-
-        # Sort keys for consistent pagination
-        all_keys.sort(key=lambda x: x[0])
-
-        # Apply start_after filter
-        skip_after = continuation_token or start_after
-        if skip_after:
-            all_keys = [(key, fp) for key, fp in all_keys if key > skip_after]
-
-        # Process keys based on delimiter and collect results
-        processed_objects = []
-        for key, file_path in all_keys:
-            if delimiter:
-                # Find the next delimiter after the prefix
-                search_start = len(prefix) if prefix else 0
-                delimiter_pos = key.find(delimiter, search_start)
-
-                if delimiter_pos != -1:
-                    # This is in a subdirectory, add to common prefixes
-                    common_prefix = key[: delimiter_pos + 1]
-                    common_prefixes.add(common_prefix)
-                    continue
-
-            # Only stat files we will actually return (up to max_keys + 1 for truncation check)
-            if len(processed_objects) > max_keys:
-                break
-
-            stat = os.stat(file_path)
-            last_modified = DateHelper.from_utc_milliseconds(int(stat.st_mtime * 1000))
-            processed_objects.append(
-                {
-                    "Key": key,
-                    "LastModified": DateHelper.to_iso_str(last_modified),
-                    "ETag": "",
-                    "Size": stat.st_size,
-                    "Owner": {"ID": "", "DisplayName": "lab"},
-                    "StorageClass": "STANDARD",
-                }
-            )
-
-        # Apply pagination to processed objects
-        is_truncated = len(processed_objects) > max_keys
-        objects = processed_objects[:max_keys]
-        next_continuation_token = ""
+        objects, common_prefixes, is_truncated = self._object_index.list_page(
+            prefix=prefix,
+            delimiter=delimiter,
+            start_after=continuation_token or start_after,
+            max_keys=max_keys,
+        )
+
+        contents: list[Any] = [
+            {
+                "Key": indexed_object.key,
+                "LastModified": DateHelper.to_iso_str(
+                    DateHelper.from_utc_milliseconds(int(indexed_object.mtime * 1000))
+                ),
+                "ETag": self._format_etag(indexed_object.etag),
+                "Size": indexed_object.size,
+                "Owner": {"ID": "", "DisplayName": "lab"},
+                "StorageClass": "STANDARD",
+            }
+            for indexed_object in objects
+        ]
 
-        if is_truncated and objects:
-            next_continuation_token = objects[-1]["Key"]
+        # The next page starts after the last object or common prefix of the page
+        next_continuation_token = ""
+        if is_truncated:
+            last_keys = [indexed_object.key for indexed_object in objects[-1:]]
+            next_continuation_token = max(last_keys + common_prefixes[-1:])
 
         # Convert common prefixes to the expected format
-        common_prefixes_list: list[Any] = [{"Prefix": cp} for cp in sorted(common_prefixes)]
+        common_prefixes_list: list[Any] = [{"Prefix": cp} for cp in common_prefixes]
 
         return {
             "Name": self.bucket_name,
             "Prefix": prefix or "",
             "MaxKeys": max_keys,
             "IsTruncated": is_truncated,
-            "Contents": objects,
-            "KeyCount": len(objects),
+            "Contents": contents,
+            "KeyCount": len(contents) + len(common_prefixes_list),
             "ContinuationToken": continuation_token or "",
             "NextContinuationToken": next_continuation_token,
             "StartAfter": start_after or "",
@@ -195,69 +138,19 @@ class LocalS3ServerService(AbstractS3Service):
             },
         }
 
-    def _list_objects_shallow(self, prefix: str | None) -> list[tuple[str, str]]:
-        """List objects using scandir for a single directory level (optimized for delimiter='/').
-
-        Instead of walking the entire bucket tree, only scans the directory
-        corresponding to the prefix. Much faster for buckets with many nested files.
-        """
-        if prefix:
-            scan_dir = path.join(self.bucket_path, prefix.replace("/", os.sep))
-        else:
-            scan_dir = self.bucket_path
-
-        if not path.isdir(scan_dir):
-            return []
+    @staticmethod
+    def _format_etag(etag: str) -> str:
+        """Format the md5 of an object as an S3 ETag (quoted)"""
+        return f'"{etag}"' if etag else ""
 
-        all_keys: list[tuple[str, str]] = []
-        try:
-            with os.scandir(scan_dir) as entries:
-                for entry in entries:
-                    if entry.is_file(follow_symlinks=False):
-                        relative_path = path.relpath(entry.path, self.bucket_path)
-                        key = relative_path.replace(os.sep, "/")
-                        all_keys.append((key, entry.path))
-                    elif entry.is_dir(follow_symlinks=False):
-                        # Directories become common prefixes, handled by the caller
-                        relative_path = path.relpath(entry.path, self.bucket_path)
-                        key = relative_path.replace(os.sep, "/") + "/"
-                        # Add a placeholder so the caller can detect common prefixes
-                        all_keys.append((key, entry.path))
-        except OSError:
-            pass
-
-        return all_keys
-
-    def _list_objects_deep(self, prefix: str | None) -> list[tuple[str, str]]:
-        """List all objects recursively using os.walk (full tree scan)."""
-        all_keys: list[tuple[str, str]] = []
-
-        # Narrow the walk to the prefix directory when possible
-        if prefix:
-            # The prefix may be a partial filename, so walk from its parent directory
-            prefix_path = prefix.replace("/", os.sep)
-            walk_root = path.join(self.bucket_path, path.dirname(prefix_path))
-        else:
-            walk_root = self.bucket_path
-
-        if not path.isdir(walk_root):
-            return []
-
-        for root, _, files in os.walk(walk_root):
-            for file in files:
-                file_path = path.join(root, file)
-                relative_path = path.relpath(file_path, self.bucket_path)
-                key = relative_path.replace(os.sep, "/")
-                if prefix and not key.startswith(prefix):
-                    continue
-                all_keys.append((key, file_path))
-
-        return all_keys
-
-    def upload_object(
-        self, key: str, data: ByteString, tags: dict[str, str] | None = None, last_modified: float | None = None
+    async def upload_object(
+        self,
+        key: str,
+        data: AsyncIterable[bytes],
+        tags: dict[str, str] | None = None,
+        last_modified: float | None = None,
     ) -> dict:
-        """Upload an object to the bucket"""
+        """Upload an object to the bucket, the data is streamed to the file in chunks"""
         del tags  # Unused parameter
         self.create_bucket()
 
@@ -268,16 +161,36 @@ class LocalS3ServerService(AbstractS3Service):
         if not path.isdir(parent_dir):
             os.makedirs(parent_dir, exist_ok=True)
 
-        with open(file_path, "wb") as f:
-            f.write(data)
+        with self._write_object_file(file_path) as temp_file_path:
+            written_object = await S3StreamHelper.write_stream_to_file(data, temp_file_path)
+
+            if last_modified:
+                os.utime(temp_file_path, (last_modified, last_modified))
 
-        if last_modified:
-            os.utime(file_path, (last_modified, last_modified))
+        self._object_index.put_file(key, file_path, written_object.etag)
 
         return {
-            "ETag": "",
+            "ETag": self._format_etag(written_object.etag),
         }
 
+    @contextmanager
+    def _write_object_file(self, file_path: str) -> Iterator[str]:
+        """Provide a temp file in the folder of the object. At the end of the block the temp file
+        replaces the object file, so an upload that fails never truncates the existing object.
+        The temp file is deleted if an error occurs.
+        """
+        temp_file_path = path.join(
+            path.dirname(file_path),
+            f"{LocalS3ObjectIndex.TEMP_FILE_PREFIX}{StringHelper.generate_uuid()}",
+        )
+        try:
+            yield temp_file_path
+            os.replace(temp_file_path, file_path)
+        except BaseException:
+            if path.exists(temp_file_path):
+                os.remove(temp_file_path)
+            raise
+
     def get_object(self, key: str) -> FileResponse:
         """Get an object from the bucket"""
         file_path = path.join(self.bucket_path, key)
@@ -294,13 +207,16 @@ class LocalS3ServerService(AbstractS3Service):
         if path.exists(file_path):
             os.remove(file_path)
 
+        self._object_index.delete_objects([key])
+
     def delete_objects(self, keys: list[str]) -> None:
         """Delete multiple objects"""
         for key in keys:
-            try:
-                self.delete_object(key)
-            except S3ServerNoSuchKey:
-                pass
+            file_path = path.join(self.bucket_path, key)
+            if path.exists(file_path):
+                os.remove(file_path)
+
+        self._object_index.delete_objects(keys)
 
     def head_object(self, key: str) -> dict:
         """Head an object from the bucket"""
@@ -312,13 +228,24 @@ class LocalS3ServerService(AbstractS3Service):
         stat = os.stat(file_path)
         last_modified = DateHelper.from_utc_milliseconds(int(stat.st_mtime * 1000))
 
-        return {
+        headers = {
             "Content-Length": "0" if FileHelper.is_dir(file_path) else str(stat.st_size),
             "Content-Type": FileHelper.get_mime(file_path),
             "Last-Modified": DateHelper.to_rfc7231_str(last_modified),
             "x-amz-meta-mtime": str(stat.st_mtime),  # rclone compatibility
         }
 
+        # the indexed md5 is only valid if the file was not modified outside the S3 server
+        indexed_object = self._object_index.get_object(key)
+        if (
+            indexed_object is not None
+            and indexed_object.size == stat.st_size
+            and indexed_object.mtime == stat.st_mtime
+        ):
+            headers["ETag"] = self._format_etag(indexed_object.etag)
+
+        return headers
+
     def get_object_tags(self, key: str) -> S3GetTagResponse:
         """Get the tags of an object"""
         del key  # Unused parameter
@@ -334,64 +261,33 @@ class LocalS3ServerService(AbstractS3Service):
         del key, tags  # Unused parameters
         raise NotImplementedError("Tagging is not supported in basic S3 service")
 
-    def initiate_multipart_upload(self, key: str, last_modified: float | None = None) -> str:
+    def initiate_multipart_upload(
+        self, key: str, last_modified: float | None = None, tags: dict[str, str] | None = None
+    ) -> str:
         """Initiate a multipart upload and return upload ID"""
+        del tags  # Unused parameter
+        multipart_store = self._multipart_store
+
         # Throttle cleanup: only run every 60 seconds
         current_time = time.time()
         if not hasattr(self, '_last_cleanup_time') or current_time - self._last_cleanup_time > self._CLEANUP_INTERVAL_SECONDS:
-            self._cleanup_abandoned_uploads()
+            multipart_store.cleanup_abandoned_uploads()
             self._last_cleanup_time = current_time
 
-        upload_id = str(uuid.uuid4())
-
-        # Create temp directory for parts
-        temp_dir = path.join(self._multipart_dir, upload_id)
-        os.makedirs(temp_dir, exist_ok=True)
-
-        # Load current state and add new upload
-        state = self._load_multipart_state()
-        state[upload_id] = {
-            "key": key,
-            "parts": {},
-            "temp_dir": temp_dir,
-            "last_modified": last_modified,
-            "created_at": current_time,
-        }
-        self._save_multipart_state(state)
-
-        return upload_id
-
-    def upload_part(self, key: str, upload_id: str, part_number: int, data: ByteString) -> None:
-        """Upload a part for multipart upload and return ETag"""
-        state = self._load_multipart_state()
-        if upload_id not in state:
-            raise ValueError(f"Upload ID {upload_id} not found")
-
-        upload_info = state[upload_id]
-        if upload_info["key"] != key:
-            raise ValueError(f"Key mismatch for upload ID {upload_id}")
-
-        # Save part to temp file — this is the critical I/O, state update is secondary
-        part_file = path.join(upload_info["temp_dir"], f"part_{part_number:05d}")
-        with open(part_file, "wb") as f:
-            f.write(data)
+        return multipart_store.initiate_upload(key, {"last_modified": last_modified})
 
-        # Store part info and save state
-        upload_info["parts"][str(part_number)] = {"etag": "", "file": part_file, "size": len(data)}
-        self._save_multipart_state(state)
+    async def upload_part(
+        self, key: str, upload_id: str, part_number: int, data: AsyncIterable[bytes]
+    ) -> str:
+        """Upload a part for multipart upload and return ETag,
+        the data is streamed to the part file in chunks"""
+        etag = await self._multipart_store.write_part(key, upload_id, part_number, data)
+        return self._format_etag(etag)
 
-    def complete_multipart_upload(self, key: str, upload_id: str, parts: list[dict]) -> None:
+    def complete_multipart_upload(self, key: str, upload_id: str, parts: list[dict]) -> str:
         """Complete multipart upload and return ETag"""
-        state = self._load_multipart_state()
-        if upload_id not in state:
-            raise ValueError(f"Upload ID {upload_id} not found")
-
-        upload_info = state[upload_id]
-        if upload_info["key"] != key:
-            raise ValueError(f"Key mismatch for upload ID {upload_id}")
-
-        # Sort parts by part number
-        sorted_parts = sorted(parts, key=lambda p: int(p["PartNumber"]))
+        multipart_store = self._multipart_store
+        upload_info = multipart_store.get_upload_info(key, upload_id)
 
         # Create final file
         self.create_bucket()
@@ -400,99 +296,23 @@ class LocalS3ServerService(AbstractS3Service):
         if not path.isdir(parent_dir):
             os.makedirs(parent_dir, exist_ok=True)
 
-        # Combine all parts with larger buffer for better throughput
-        with open(file_path, "wb") as final_file:
-            for part in sorted_parts:
-                part_number = str(part["PartNumber"])
-                if part_number not in upload_info["parts"]:
-                    raise ValueError(f"Part {part_number} not found")
-
-                part_file = upload_info["parts"][part_number]["file"]
-                with open(part_file, "rb") as pf:
-                    while True:
-                        chunk = pf.read(65536)  # 64KB chunks for better throughput
-                        if not chunk:
-                            break
-                        final_file.write(chunk)
-
-        # Apply modification time if provided
-        if upload_info.get("last_modified"):
-            os.utime(file_path, (upload_info["last_modified"], upload_info["last_modified"]))
-
-        # Clean up temp files using helper method
-        self._cleanup_upload_files(upload_info)
-
-        # Remove from active uploads
-        del state[upload_id]
-        self._save_multipart_state(state)
-
-    def _cleanup_abandoned_uploads(self, max_age_hours: int = 24) -> None:
-        """Clean up abandoned multipart uploads older than max_age_hours"""
-        try:
-            state = self._load_multipart_state()
-            current_time = time.time()
-            max_age_seconds = max_age_hours * 3600
-
-            uploads_to_remove = []
-
-            for upload_id, upload_info in state.items():
-                # Check if temp directory exists and get its age
-                temp_dir = upload_info.get("temp_dir")
-                if temp_dir and path.exists(temp_dir):
-                    dir_age = current_time - path.getctime(temp_dir)
-                    if dir_age > max_age_seconds:
-                        uploads_to_remove.append(upload_id)
-                        # Clean up temp files
-                        self._cleanup_upload_files(upload_info)
-                elif temp_dir:
-                    # Temp directory doesn't exist, remove from state
-                    uploads_to_remove.append(upload_id)
-
-            # Remove abandoned uploads from state
-            for upload_id in uploads_to_remove:
-                del state[upload_id]
-
-            if uploads_to_remove:
-                self._save_multipart_state(state)
-
-        except Exception:
-            # Don't let cleanup errors break normal operations
-            pass
-
-    def _cleanup_upload_files(self, upload_info: dict[str, Any]) -> None:
-        """Clean up files for a specific upload"""
-        try:
-            # Clean up individual part files
-            for part_info in upload_info.get("parts", {}).values():
-                part_file = part_info.get("file")
-                if part_file and path.exists(part_file):
-                    os.remove(part_file)
-
-            # Remove temp directory if empty
-            temp_dir = upload_info.get("temp_dir")
-            if temp_dir and path.exists(temp_dir):
-                try:
-                    os.rmdir(temp_dir)
-                except OSError:
-                    # Directory not empty, leave it
-                    pass
-        except Exception:
-            # Don't let cleanup errors break normal operations
-            pass
+        with self._write_object_file(file_path) as temp_file_path:
+            etag = multipart_store.concatenate_parts(key, upload_id, parts, temp_file_path)
 
-    def abort_multipart_upload(self, key: str, upload_id: str) -> None:
-        """Abort a multipart upload and clean up temp files"""
-        state = self._load_multipart_state()
-        if upload_id not in state:
-            raise ValueError(f"Upload ID {upload_id} not found")
+            # Apply modification time if provided
+            last_modified = upload_info["metadata"].get("last_modified")
+            if last_modified:
+                os.utime(temp_file_path, (last_modified, last_modified))
 
-        upload_info = state[upload_id]
-        if upload_info["key"] != key:
-            raise ValueError(f"Key mismatch for upload ID {upload_id}")
+        self._object_index.put_file(key, file_path, etag)
 
         # Clean up temp files
-        self._cleanup_upload_files(upload_info)
+        multipart_store.delete_upload(upload_id)
+
+        return self._format_etag(etag)
 
-        # Remove from state
-        del state[upload_id]
-        self._save_multipart_state(state)
+    def abort_multipart_upload(self, key: str, upload_id: str) -> None:
+        """Abort a multipart upload and clean up temp files"""
+        multipart_store = self._multipart_store
+        multipart_store.get_upload_info(key, upload_id)
+        multipart_store.delete_upload(upload_id)
@@ -2,7 +2,6 @@ from gws_core.config.param.param_spec import BoolParam, StrParam
 from gws_core.core.utils.string_helper import StringHelper
 from gws_core.credentials.credentials_param import CredentialsParam
 from gws_core.credentials.credentials_type import CredentialsDataS3, CredentialsType
-from gws_core.impl.file.file_helper import FileHelper
 from gws_core.impl.s3.s3_bucket import S3Bucket
 from gws_core.io.io_spec import InputSpec
 from gws_core.model.typing_style import TypingStyle
@@ -29,7 +28,7 @@ class ResourceUploaderS3(Task):
     """
     Task to upload a resource to an S3 bucket.
 
-    The resource will be converted to a zip resource before being uploaded.
+    The resource will be converted to a zip resource while being uploaded (the zip is not stored on disk).
     The zip resource format is made to be downloaded by a data lab.
     In this case the resource will be imported in the correct format in the data lab.
 
@@ -49,16 +48,13 @@ class ResourceUploaderS3(Task):
         }
     )
 
-    zip_file_path: str | None = None
-
     def run(self, params: ConfigParams, inputs: TaskInputs) -> TaskOutputs:
         bucket_name = params.get_value("s3_bucket")
 
-        self.log_info_message("Zipping resource")
+        self.log_info_message("Retrieving resource information")
         resource: Resource = inputs["resource"]
         resource_zipper = ResourceZipper(CurrentUserService.get_current_user())
         resource_zipper.add_resource(resource)
-        self.zip_file_path = resource_zipper.close_zip()
 
         credentials: CredentialsDataS3 = params.get_value("credentials")
         bucket_name = credentials.bucket or params.get_value("s3_bucket")
@@ -85,8 +81,14 @@ class ResourceUploaderS3(Task):
                 prefix += "/"
             file_name = prefix + file_name
 
-        # upload file
-        s3_bucket.upload_file(self.zip_file_path, file_name)
+        # the tar is streamed to the bucket, it is not stored on disk
+        with resource_zipper.open_tar_stream() as tar_stream:
+            s3_bucket.upload_fileobj(
+                tar_stream,
+                file_name,
+                content_type="application/x-tar",
+                estimated_size=resource_zipper.get_estimated_size(),
+            )
 
         if params.get_value("send_me_an_email"):
             self.send_email(bucket_name, file_name)
@@ -103,7 +105,3 @@ class ResourceUploaderS3(Task):
 <p>It was zipped into the following file: <strong>{file_name}</strong></p>""",
             "Resource uploaded to S3",
         )
-
-    def run_after_task(self) -> None:
-        if self.zip_file_path is not None:
-            FileHelper.delete_file(self.zip_file_path)
@@ -1,5 +1,5 @@
 import time
-from typing import TypedDict
+from typing import BinaryIO, TypedDict
 
 import boto3
 from mypy_boto3_s3.client import S3Client
@@ -100,6 +100,54 @@ class S3Bucket:
             f"File '{object_key}' uploaded to bucket '{self.bucket_name}' in {duration}"
         )
 
+    def upload_fileobj(
+        self,
+        fileobj: BinaryIO,
+        object_key: str,
+        content_type: str = "application/octet-stream",
+        estimated_size: int | None = None,
+    ) -> None:
+        """Upload the content of a readable binary stream. The stream is read by chunks and sent
+        with a multipart upload, so the content doesn't need to be stored on disk.
+
+        :param fileobj: readable binary stream, read until the end
+        :type fileobj: BinaryIO
+        :param object_key: key of the S3 object
+        :type object_key: str
+        :param content_type: content type of the object, defaults to "application/octet-stream"
+        :type content_type: str, optional
+        :param estimated_size: estimated size of the content to notify the progress, defaults to None
+        :type estimated_size: int | None, optional
+        """
+        upload_progress: S3BucketActionProgress = {"transfered_bytes": 0, "last_progress": 0}
+
+        start_time = time.time()
+
+        s3_client = self._get_s3_bucket()
+
+        self.message_dispatcher.notify_info_message(
+            f"Uploading stream to S3 bucket '{self.bucket_name}', object key '{object_key}'"
+        )
+
+        def progress_callback(progress: int) -> None:
+            if estimated_size:
+                self._upload_progress_callback(
+                    progress, estimated_size, start_time, upload_progress, "Uploaded"
+                )
+
+        s3_client.upload_fileobj(
+            fileobj,
+            self.bucket_name,
+            object_key,
+            ExtraArgs={"ContentType": content_type},
+            Callback=progress_callback,
+        )
+
+        duration = DateHelper.get_duration_pretty_text(time.time() - start_time)
+        self.message_dispatcher.notify_success_message(
+            f"File '{object_key}' uploaded to bucket '{self.bucket_name}' in {duration}"
+        )
+
     def get_object(self, object_key: str, local_file_path: str | None = None) -> str:
         bucket = self._get_s3_bucket()
 
@@ -145,7 +193,8 @@ class S3Bucket:
         action_name: str,
     ) -> None:
         action_progress["transfered_bytes"] += transfered_bytes
-        progress = int(action_progress["transfered_bytes"] / total_size * 100)
+        # the total size can be an estimation, the progress is capped
+        progress = min(int(action_progress["transfered_bytes"] / total_size * 100), 100)
 
         # log progress every 3%
         if progress - action_progress["last_progress"] > 3:
@@ -0,0 +1,198 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from collections.abc import AsyncIterable
+from os import path
+from typing import Any
+
+from gws_core.impl.file.file_helper import FileHelper
+from gws_core.impl.s3.s3_stream_helper import S3StreamHelper
+
+
+class S3MultipartUploadStore:
+    """Store of the multipart uploads of an S3 bucket on disk.
+
+    Each upload has its own directory containing an upload.json file (key and metadata)
+    and for each part a data file and a small json file (md5 and size). The part files are written
+    in a temp file then renamed, so the parts of an upload can be uploaded in parallel without lock
+    and without a shared state file to rewrite.
+
+    On completion, the parts are concatenated with os.copy_file_range (or os.sendfile) so the data
+    is copied by the kernel. Like S3, the ETag of a multipart object is the md5 of the md5 of the
+    parts followed by the number of parts.
+    """
+
+    UPLOAD_INFO_FILE_NAME = "upload.json"
+
+    # Size of the ranges copied by copy_file_range / sendfile
+    COPY_RANGE_SIZE = 64 * 1024 * 1024
+
+    base_dir: str
+
+    def __init__(self, base_dir: str):
+        self.base_dir = base_dir
+
+    def initiate_upload(self, key: str, metadata: dict[str, Any] | None = None) -> str:
+        """Create a new upload and return its id
+
+        :param key: key of the object
+        :type key: str
+        :param metadata: json serializable data stored with the upload, defaults to None
+        :type metadata: dict[str, Any] | None, optional
+        :return: the upload id
+        :rtype: str
+        """
+        upload_id = str(uuid.uuid4())
+        upload_dir = self.get_upload_dir(upload_id)
+        os.makedirs(upload_dir)
+
+        upload_info = {"key": key, "created_at": time.time(), "metadata": metadata or {}}
+        self._write_json_atomic(path.join(upload_dir, self.UPLOAD_INFO_FILE_NAME), upload_info)
+        return upload_id
+
+    def get_upload_info(self, key: str, upload_id: str) -> dict[str, Any]:
+        """Return the info of an upload (key, created_at, metadata) and check the key"""
+        info_path = path.join(self.get_upload_dir(upload_id), self.UPLOAD_INFO_FILE_NAME)
+        try:
+            with open(info_path, encoding="utf-8") as file:
+                upload_info = json.load(file)
+        except (json.JSONDecodeError, FileNotFoundError):
+            raise ValueError(f"Upload ID {upload_id} not found")
+
+        if upload_info["key"] != key:
+            raise ValueError(f"Key mismatch for upload ID {upload_id}")
+        return upload_info
+
+    async def write_part(
+        self, key: str, upload_id: str, part_number: int, data: AsyncIterable[bytes]
+    ) -> str:
+        """Stream the data of a part to disk and return the md5 of the part (hex).
+        Uploading a part number again replaces the previous part."""
+        self.get_upload_info(key, upload_id)
+
+        part_path = self._get_part_path(upload_id, part_number)
+        # unique temp file so the same part can be sent twice at the same time (retry)
+        temp_part_path = f"{part_path}.{uuid.uuid4().hex}.tmp"
+        try:
+            written_object = await S3StreamHelper.write_stream_to_file(data, temp_part_path)
+            os.replace(temp_part_path, part_path)
+        finally:
+            if path.exists(temp_part_path):
+                os.remove(temp_part_path)
+
+        # the part info is written after the data, the part exists when its info exists
+        self._write_json_atomic(
+            f"{part_path}.json", {"etag": written_object.etag, "size": written_object.size}
+        )
+        return written_object.etag
+
+    def concatenate_parts(
+        self, key: str, upload_id: str, parts: list[dict], destination_path: str
+    ) -> str:
+        """Concatenate the parts in the destination file (overwritten if it exists)
+        and return the ETag of the object (without quotes).
+
+        :param parts: the parts of the CompleteMultipartUpload request (with PartNumber)
+        :type parts: list[dict]
+        """
+        self.get_upload_info(key, upload_id)
+
+        part_numbers = sorted(int(part["PartNumber"]) for part in parts)
+
+        part_md5s: list[bytes] = []
+        part_paths: list[str] = []
+        for part_number in part_numbers:
+            part_path = self._get_part_path(upload_id, part_number)
+            try:
+                with open(f"{part_path}.json", encoding="utf-8") as file:
+                    part_info = json.load(file)
+            except (json.JSONDecodeError, FileNotFoundError):
+                raise ValueError(f"Part {part_number} not found")
+            part_md5s.append(bytes.fromhex(part_info["etag"]))
+            part_paths.append(part_path)
+
+        with open(destination_path, "wb") as destination_file:
+            for part_path in part_paths:
+                with open(part_path, "rb") as part_file:
+                    self._copy_file_content(part_file, destination_file)
+
+        return f"{hashlib.md5(b''.join(part_md5s)).hexdigest()}-{len(part_md5s)}"
+
+    def delete_upload(self, upload_id: str) -> None:
+        """Delete the directory of an upload with its parts"""
+        FileHelper.delete_dir(self.get_upload_dir(upload_id))
+
+    def cleanup_abandoned_uploads(self, max_age_hours: int = 24) -> None:
+        """Delete the uploads older than max_age_hours"""
+        if not path.isdir(self.base_dir):
+            return
+
+        max_age_seconds = max_age_hours * 3600
+        current_time = time.time()
+        try:
+            with os.scandir(self.base_dir) as entries:
+                for entry in entries:
+                    if (
+                        entry.is_dir(follow_symlinks=False)
+                        and current_time - entry.stat().st_ctime > max_age_seconds
+                    ):
+                        FileHelper.delete_dir(entry.path)
+        except OSError:
+            # Don't let cleanup errors break normal operations
+            pass
+
+    def get_upload_dir(self, upload_id: str) -> str:
+        """Return the directory of an upload, it is deleted with the upload"""
+        # the upload id is provided by the client, prevent path traversal
+        if not upload_id or path.basename(upload_id) != upload_id or upload_id in (".", ".."):
+            raise ValueError(f"Upload ID {upload_id} not found")
+        return path.join(self.base_dir, upload_id)
+
+    def _get_part_path(self, upload_id: str, part_number: int) -> str:
+        return path.join(self.get_upload_dir(upload_id), f"part_{int(part_number):05d}")
+
+    def _write_json_atomic(self, file_path: str, content: dict[str, Any]) -> None:
+        temp_file_path = f"{file_path}.{uuid.uuid4().hex}.tmp"
+        with open(temp_file_path, "w", encoding="utf-8") as file:
+            json.dump(content, file)
+        os.replace(temp_file_path, file_path)
+
+    @classmethod
+    def _copy_file_content(cls, source_file, destination_file) -> None:
+        """Append the content of the source file to the destination file. The copy is done
+        in the kernel with copy_file_range, or sendfile, when available."""
+        size = os.fstat(source_file.fileno()).st_size
+        copy_function = getattr(os, "copy_file_range", None) or getattr(os, "sendfile", None)
+
+        copied = 0
+        if copy_function is not None:
+            try:
+                while copied < size:
+                    count = cls._copy_range(
+                        copy_function, source_file, destination_file, copied, size
+                    )
+                    if count == 0:
+                        break
+                    copied += count
+            except OSError:
+                # not supported for these files (like some file systems), use a buffered copy
+                pass
+
+        if copied < size:
+            source_file.seek(copied)
+            destination_file.seek(0, os.SEEK_END)
+            shutil.copyfileobj(source_file, destination_file)
+
+    @classmethod
+    def _copy_range(
+        cls, copy_function, source_file, destination_file, copied: int, size: int
+    ) -> int:
+        count = min(cls.COPY_RANGE_SIZE, size - copied)
+        if copy_function is os.sendfile:
+            # sendfile writes at the current position of the destination
+            return os.sendfile(destination_file.fileno(), source_file.fileno(), copied, count)
+        # copy_file_range reads at the offset, writes at the current position of the destination
+        return copy_function(source_file.fileno(), destination_file.fileno(), count, copied)
@@ -140,9 +140,10 @@ async def initiate_multipart_upload(
 
 
 def _initiate_multipart_upload(key: str, request: Request, service: AbstractS3Service) -> Response:
-    # Initiate a multipart upload
+    # Initiate a multipart upload, the tags are applied to the object on completion
     mtime_timestamp = _extract_x_amz_meta_mtime(request)
-    upload_id = service.initiate_multipart_upload(key, mtime_timestamp)
+    tags = service.convert_query_param_string_to_dict(request.headers.get(TAG_HEADER))
+    upload_id = service.initiate_multipart_upload(key, mtime_timestamp, tags)
 
     return ResponseHelper.create_xml_response_from_json(
         {
@@ -167,7 +168,7 @@ async def _complete_multipart_upload(
     if not isinstance(parts, list):
         parts = [parts]
 
-    service.complete_multipart_upload(key, upload_id, parts)
+    etag = service.complete_multipart_upload(key, upload_id, parts)
 
     return ResponseHelper.create_xml_response_from_json(
         {
@@ -175,7 +176,7 @@ async def _complete_multipart_upload(
                 "Location": f"http://localhost/{service.bucket_name}/{key}",
                 "Bucket": service.bucket_name,
                 "Key": key,
-                "ETag": "",
+                "ETag": etag or "",
             }
         }
     )
@@ -227,10 +228,9 @@ async def upload_part_or_object(
 async def _upload_part(
     request: Request, key: str, upload_id: str, part_number: int, service: AbstractS3Service
 ) -> Response:
-    # Upload part for multipart upload
-    file_bytes = await request.body()
-    service.upload_part(key, upload_id, part_number, file_bytes)
-    return Response(status_code=200, headers={"ETag": ""})
+    # Upload part for multipart upload, the body is streamed to disk
+    etag = await service.upload_part(key, upload_id, part_number, request.stream())
+    return Response(status_code=200, headers={"ETag": etag or ""})
 
 
 async def _update_object_tags(request: Request, key: str, service: AbstractS3Service) -> Response:
@@ -242,13 +242,14 @@ async def _update_object_tags(request: Request, key: str, service: AbstractS3Ser
 
 
 async def _upload_object(request: Request, key: str, service: AbstractS3Service) -> Response:
-    # Upload an object to the bucket
-    file_bytes = await request.body()
+    # Upload an object to the bucket, the body is streamed to disk
     tags = service.convert_query_param_string_to_dict(request.headers.get(TAG_HEADER))
 
     # Extract modification time from headers (rclone sends this)
     mtime_timestamp = _extract_x_amz_meta_mtime(request)
-    response_headers = service.upload_object(key, file_bytes, tags, last_modified=mtime_timestamp)
+    response_headers = await service.upload_object(
+        key, request.stream(), tags, last_modified=mtime_timestamp
+    )
 
     return Response(status_code=200, headers=response_headers)
 
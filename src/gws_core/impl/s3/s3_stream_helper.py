@@ -0,0 +1,49 @@
+import hashlib
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass
+
+
+@dataclass
+class S3WrittenObject:
+    """Result of the write of an S3 request body to a file"""
+
+    # number of bytes written
+    size: int
+    # md5 of the written content (hex), used as ETag
+    etag: str
+
+
+class S3StreamHelper:
+    """Helper to write the body of the S3 upload requests to disk in chunks, so an object
+    or a part is never fully loaded in memory.
+    """
+
+    @classmethod
+    async def write_stream_to_file(
+        cls, stream: AsyncIterable[bytes], file_path: str
+    ) -> S3WrittenObject:
+        """Write a stream of bytes to a file (overwritten if it exists),
+        the md5 of the content is computed while the chunks are written.
+
+        :param stream: the chunks of the content (like the starlette Request.stream())
+        :type stream: AsyncIterable[bytes]
+        :param file_path: path of the file to write
+        :type file_path: str
+        :return: the size and the md5 of the written content
+        :rtype: S3WrittenObject
+        """
+        md5 = hashlib.md5()
+        size = 0
+        with open(file_path, "wb") as file:
+            async for chunk in stream:
+                if not chunk:
+                    continue
+                file.write(chunk)
+                md5.update(chunk)
+                size += len(chunk)
+        return S3WrittenObject(size=size, etag=md5.hexdigest())
+
+    @staticmethod
+    async def bytes_to_stream(data: bytes) -> AsyncIterator[bytes]:
+        """Convert bytes to a stream of one chunk, to call the upload methods with content in memory"""
+        yield data
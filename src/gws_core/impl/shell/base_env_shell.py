@@ -9,6 +9,7 @@ from typing import Any, Literal, TypeVar, final
 from gws_core.core.classes.observer.message_dispatcher import MessageDispatcher
 from gws_core.core.model.sys_proc import SysProc
 from gws_core.core.utils.date_helper import DateHelper
+from gws_core.core.utils.file_lock import FileLock
 from gws_core.core.utils.logger import Logger
 from gws_core.core.utils.settings import Settings
 from gws_core.impl.file.file_helper import FileHelper
@@ -240,6 +241,10 @@ class BaseEnvShell(ShellProxy):
         """
         Install the virtual env.
         Return True if the env was installed, False if it was already installed, or an error occured.
+
+        The installation is locked by env hash between the processes of the lab, if the env is
+        being installed by another process (another task using the same env), this method
+        waits for the end of the installation and uses the installed env.
         """
 
         if self.env_is_installed():
@@ -249,6 +254,32 @@ class BaseEnvShell(ShellProxy):
             )
             return False
 
+        lock = self._get_install_lock()
+        if not lock.acquire(blocking=False):
+            self._message_dispatcher.notify_info_message(
+                f"Virtual environment '{self.env_name}' is being installed by another process, "
+                "waiting for the end of the installation."
+            )
+            lock.acquire()
+
+        try:
+            # the env may have been installed by the process that held the lock
+            if self.env_is_installed():
+                self._message_dispatcher.notify_info_message(
+                    f"Virtual environment '{self.env_name}' installed by another process."
+                )
+                return False
+
+            return self._install_env_with_lock()
+        finally:
+            lock.release()
+
+    def _install_env_with_lock(self) -> bool:
+        """Install the env, the install lock must be held"""
+        # the env dir without creation file is the remain of an interrupted installation
+        if FileHelper.exists_on_os(self.get_env_dir_path()):
+            FileHelper.delete_dir(self.get_env_dir_path())
+
         self.create_env_dir()
 
         self._message_dispatcher.notify_info_message(
@@ -291,6 +322,9 @@ class BaseEnvShell(ShellProxy):
         # from the main environment.
         install_env = os.environ.copy()
         install_env["PYTHONNOUSERSITE"] = "1"
+        # use the package cache shared by the envs unless a cache is configured
+        for key, value in self.get_package_cache_env_variables().items():
+            install_env.setdefault(key, value)
         if env:
             install_env.update(env)
 
@@ -308,6 +342,22 @@ class BaseEnvShell(ShellProxy):
             self._message_dispatcher.notify_error_message(error_message)
             raise Exception(f"Cannot install the virtual environment. Error: {error_message}")
 
+    def get_package_cache_env_variables(self) -> dict[str, str]:
+        """Get the environment variables that set the package cache used to install the env.
+        The cache is shared by all the envs (see Settings.get_global_env_cache_dir) so the
+        packages downloaded for an env are reused by the next ones.
+
+        Override by subclasses to set the cache of their package manager.
+
+        :return: Dictionary of environment variables
+        :rtype: dict[str, str]
+        """
+        return {}
+
+    def _get_install_lock(self) -> FileLock:
+        """Get the lock of the installation of the env, shared by the envs with the same hash"""
+        return FileLock(os.path.join(Settings.get_global_env_lock_dir(), f"{self.env_hash}.lock"))
+
     @abstractmethod
     def _install_env(self) -> bool:
         """Install the virtual environment.
@@ -332,7 +382,9 @@ class BaseEnvShell(ShellProxy):
         )
         is_uninstall: bool = False
         try:
-            is_uninstall = self._uninstall_env()
+            # prevent uninstalling the env while it is being installed
+            with self._get_install_lock():
+                is_uninstall = self._uninstall_env()
         except Exception as err:
             Logger.log_exception_stack_trace(err)
             raise Exception(f"Cannot uninstall the virtual environment. Error {err}") from err
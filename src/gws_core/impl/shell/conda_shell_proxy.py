@@ -2,6 +2,7 @@ import json
 import os
 from typing import Literal
 
+from gws_core.core.utils.settings import Settings
 from gws_core.impl.file.file_helper import FileHelper
 from gws_core.impl.shell.virtual_env.venv_dto import VEnvCreationInfo
 from gws_core.model.typing_register_decorator import typing_registrator
@@ -124,6 +125,16 @@ class CondaShellProxy(BaseEnvShell):
         # (this needs to be with conda activate to be log in real time)
         return {"PYTHONUNBUFFERED": "1"}
 
+    def get_package_cache_env_variables(self) -> dict[str, str]:
+        """Get the environment variables that set the shared package cache of conda.
+        The cache is in the same file system as the envs so conda hard links the
+        packages instead of copying them.
+
+        :return: Dictionary of environment variables
+        :rtype: dict[str, str]
+        """
+        return {"CONDA_PKGS_DIRS": os.path.join(Settings.get_global_env_cache_dir(), "conda_pkgs")}
+
     def get_config_file_path(self) -> str:
         """Get the path to the environment.yml configuration file.
 
@@ -2,6 +2,7 @@ import json
 import os
 from typing import Literal
 
+from gws_core.core.utils.settings import Settings
 from gws_core.impl.file.file_helper import FileHelper
 from gws_core.model.typing_register_decorator import typing_registrator
 
@@ -103,6 +104,18 @@ class PipShellProxy(BaseEnvShell):
             "PIPENV_VENV_IN_PROJECT": "enabled",
         }
 
+    def get_package_cache_env_variables(self) -> dict[str, str]:
+        """Get the environment variables that set the shared package cache of pip and pipenv.
+
+        :return: Dictionary of environment variables
+        :rtype: dict[str, str]
+        """
+        cache_dir = Settings.get_global_env_cache_dir()
+        return {
+            "PIP_CACHE_DIR": os.path.join(cache_dir, "pip"),
+            "PIPENV_CACHE_DIR": os.path.join(cache_dir, "pipenv"),
+        }
+
     def get_pip_file_path(self) -> str:
         """Get the path to the Pipfile.
 
@@ -1,11 +1,15 @@
 import os
 
+from gws_core.brick.brick_helper import BrickHelper
+from gws_core.brick.brick_service import BrickService
+from gws_core.brick.brick_settings import BrickSettingsVirtualEnv
 from gws_core.core.exception.exceptions.bad_request_exception import BadRequestException
 from gws_core.core.utils.logger import Logger
 from gws_core.core.utils.settings import Settings
 from gws_core.impl.file.file_helper import FileHelper
 from gws_core.impl.shell.base_env_shell import BaseEnvShell
 from gws_core.impl.shell.conda_shell_proxy import CondaShellProxy
+from gws_core.impl.shell.mamba_shell_proxy import MambaShellProxy
 from gws_core.impl.shell.pip_shell_proxy import PipShellProxy
 from gws_core.impl.shell.virtual_env.venv_dto import (
     VEnsStatusDTO,
@@ -185,3 +189,50 @@ class VEnvService:
         packages = shell_proxy.list_packages()
 
         return VEnvPackagesDTO(packages=packages)
+
+    @classmethod
+    def prebuild_brick_venvs(cls) -> None:
+        """Install the virtual environments declared by the bricks (virtual_envs section of
+        settings.json) so the first run of the tasks does not wait for the installation.
+
+        The envs already installed are skipped. If a task uses the env during the
+        installation, it waits for the end of the installation (see BaseEnvShell.install_env).
+        The errors are logged and do not stop the installation of the other envs.
+        """
+        for brick_info in BrickHelper.get_all_bricks().values():
+            try:
+                brick_settings = BrickService.read_brick_settings(brick_info.path)
+            except Exception as err:
+                Logger.error(
+                    f"[VEnvService] Error while reading the settings of brick "
+                    f"'{brick_info.name}': {err}"
+                )
+                continue
+
+            for virtual_env in brick_settings.virtual_envs or []:
+                try:
+                    shell_proxy = cls._build_brick_venv_shell(brick_info.path, virtual_env)
+                    if shell_proxy.install_env():
+                        Logger.info(
+                            f"[VEnvService] Virtual environment '{shell_proxy.env_name}' "
+                            f"of brick '{brick_info.name}' installed"
+                        )
+                except Exception as err:
+                    Logger.error(
+                        f"[VEnvService] Error while installing the virtual environment "
+                        f"'{virtual_env.env_file_path}' of brick '{brick_info.name}': {err}"
+                    )
+
+    @classmethod
+    def _build_brick_venv_shell(
+        cls, brick_path: str, virtual_env: BrickSettingsVirtualEnv
+    ) -> BaseEnvShell:
+        env_types: dict[str, type[BaseEnvShell]] = {
+            "conda": CondaShellProxy,
+            "mamba": MambaShellProxy,
+            "pip": PipShellProxy,
+        }
+        env_file_path = os.path.join(brick_path, virtual_env.env_file_path)
+        return env_types[virtual_env.type](
+            env_file_path=env_file_path, env_name=virtual_env.env_name
+        )
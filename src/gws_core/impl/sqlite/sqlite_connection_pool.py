@@ -0,0 +1,128 @@
+import os
+import sqlite3
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from threading import Lock
+
+
+class _SqliteFilePool:
+    """Idle read-only connections of a sqlite file"""
+
+    file_stat: tuple[int, int]
+    connections: list[sqlite3.Connection]
+
+    def __init__(self, file_stat: tuple[int, int]) -> None:
+        self.file_stat = file_stat
+        self.connections = []
+
+    def close(self) -> None:
+        for connection in self.connections:
+            connection.close()
+        self.connections = []
+
+
+class SqliteConnectionPool:
+    """Pool of read-only connections to the sqlite files, used to read the sqlite resources.
+    The connections of a file are reused by the next reads instead of opening
+    the file (and reading its schema) on each read.
+
+    The connections of a file are closed when the file is replaced or modified.
+    """
+
+    # Max number of idle connections kept per file
+    MAX_CONNECTIONS_PER_FILE: int = 4
+
+    # Max number of files with idle connections
+    MAX_FILES: int = 20
+
+    _pools: OrderedDict[str, _SqliteFilePool] = OrderedDict()
+
+    _lock: Lock = Lock()
+
+    @classmethod
+    @contextmanager
+    def connection(cls, file_path: str) -> Iterator[sqlite3.Connection]:
+        """Get a read-only connection to the sqlite file, the connection is returned
+        to the pool at the end of the with block
+
+        :param file_path: path of the sqlite file
+        :type file_path: str
+        :yield: the read-only connection
+        :rtype: Iterator[sqlite3.Connection]
+        """
+        file_stat = cls._get_file_stat(file_path)
+        connection = cls._take_connection(file_path, file_stat)
+        if connection is None:
+            connection = sqlite3.connect(
+                f"file:{file_path}?mode=ro", uri=True, check_same_thread=False
+            )
+
+        try:
+            yield connection
+        except BaseException:
+            # the connection may be in an unknown state
+            connection.close()
+            raise
+
+        cls._release_connection(file_path, file_stat, connection)
+
+    @classmethod
+    def _take_connection(
+        cls, file_path: str, file_stat: tuple[int, int]
+    ) -> sqlite3.Connection | None:
+        with cls._lock:
+            pool = cls._pools.get(file_path)
+            if pool is None:
+                return None
+
+            if pool.file_stat != file_stat:
+                # the file was modified, the connections are discarded
+                pool.close()
+                del cls._pools[file_path]
+                return None
+
+            cls._pools.move_to_end(file_path)
+            return pool.connections.pop() if pool.connections else None
+
+    @classmethod
+    def _release_connection(
+        cls, file_path: str, file_stat: tuple[int, int], connection: sqlite3.Connection
+    ) -> None:
+        with cls._lock:
+            pool = cls._pools.get(file_path)
+            if pool is None or pool.file_stat != file_stat:
+                if pool is not None:
+                    pool.close()
+                pool = _SqliteFilePool(file_stat)
+                cls._pools[file_path] = pool
+
+            if len(pool.connections) >= cls.MAX_CONNECTIONS_PER_FILE:
+                connection.close()
+            else:
+                pool.connections.append(connection)
+            cls._pools.move_to_end(file_path)
+
+            while len(cls._pools) > cls.MAX_FILES:
+                _, oldest_pool = cls._pools.popitem(last=False)
+                oldest_pool.close()
+
+    @classmethod
+    def close_file_connections(cls, file_path: str) -> None:
+        """Close the idle connections of the file (before deleting or writing the file)"""
+        with cls._lock:
+            pool = cls._pools.pop(file_path, None)
+            if pool is not None:
+                pool.close()
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            for pool in cls._pools.values():
+                pool.close()
+            cls._pools.clear()
+
+    @classmethod
+    def _get_file_stat(cls, file_path: str) -> tuple[int, int]:
+        stat = os.stat(file_path)
+        return stat.st_ino, stat.st_mtime_ns
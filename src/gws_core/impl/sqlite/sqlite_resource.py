@@ -1,11 +1,11 @@
-import sqlite3
-
 from pandas import read_sql_query
 
 from gws_core.config.config_params import ConfigParams
 from gws_core.config.config_specs import ConfigSpecs
 from gws_core.config.param.param_spec import StrParam
 from gws_core.impl.file.file import File
+from gws_core.impl.sqlite.sqlite_connection_pool import SqliteConnectionPool
+from gws_core.impl.sqlite.sqlite_table_view import SqliteTableView
 from gws_core.impl.table.table import Table
 from gws_core.impl.table.view.table_view import TableView
 from gws_core.resource.resource_decorator import resource_decorator
@@ -15,38 +15,43 @@ from gws_core.resource.view.view_decorator import view
 
 @resource_decorator("SqliteResource")
 class SqliteResource(File):
+    """Sqlite database file. The views only read the rows and columns of the requested page
+    (see SqliteTableView), the select methods load the whole result in a Table.
+    """
+
     __default_extensions__: list[str] = ["db", "sqlite", "sqlite3"]
 
+    TABLE_NAMES_QUERY = "SELECT name FROM sqlite_master WHERE type='table'"
+
     def get_table_names(self) -> list[str]:
-        table = self.execute_select("SELECT name FROM sqlite_master WHERE type='table';")
+        table = self.execute_select(self.TABLE_NAMES_QUERY)
         return table.get_column_data("name")
 
     def select_table(self, table_name: str) -> Table:
         return self.execute_select("SELECT * FROM " + table_name + ";")
 
     def execute_select(self, query: str) -> Table:
-        sqlite_path = self.path
-        if not self.exists():
-            raise Exception("The sqlite file does not exist")
-
-        conn = sqlite3.connect(sqlite_path)
+        self._check_exists()
 
-        # Create a pandas DataFrame by fetching the entire table from the database
-        df = read_sql_query(query, conn)
+        with SqliteConnectionPool.connection(self.path) as conn:
+            # Create a pandas DataFrame by fetching the entire result from the database
+            df = read_sql_query(query, conn)
 
-        # Close the database connection
-        conn.close()
         return Table(df)
 
-    def _get_table_names_view(self) -> TableView:
-        # Extract the table names from the fetched data
-        table_names = self.get_table_names()
-        table_view = TableView(Table(table_names))
+    def _check_exists(self) -> None:
+        if not self.exists():
+            raise Exception("The sqlite file does not exist")
+
+    def _get_table_names_view(self) -> SqliteTableView:
+        self._check_exists()
+        table_view = SqliteTableView(self.path, query=self.TABLE_NAMES_QUERY)
         table_view.set_title("Tables names")
         return table_view
 
-    def _get_select_table_view(self, table_name: str) -> TableView:
-        table_view = TableView(self.select_table(table_name))
+    def _get_select_table_view(self, table_name: str) -> SqliteTableView:
+        self._check_exists()
+        table_view = SqliteTableView(self.path, table_name=table_name)
         table_view.set_title("Table - " + table_name)
         return table_view
 
@@ -59,12 +64,12 @@ class SqliteResource(File):
         pass
 
     @view(
-        view_type=TableView,
+        view_type=SqliteTableView,
         human_name="View content",
         short_description="Show content of the database",
         default_view=True,
     )
-    def default_view(self, params: ConfigParams) -> TableView:
+    def default_view(self, params: ConfigParams) -> SqliteTableView:
         """If there is only one table in the database, show it by default
         Otherwise show the list of tables
         """
@@ -80,16 +85,16 @@ class SqliteResource(File):
         return self._get_table_names_view()
 
     @view(
-        view_type=TableView,
+        view_type=SqliteTableView,
         human_name="Table names",
         short_description="List the tables of the database",
         default_view=False,
     )
-    def get_table_names_view(self, params: ConfigParams) -> TableView:
+    def get_table_names_view(self, params: ConfigParams) -> SqliteTableView:
         return self._get_table_names_view()
 
     @view(
-        view_type=TableView,
+        view_type=SqliteTableView,
         human_name="View table",
         short_description="Show the content of a table",
         default_view=False,
@@ -101,11 +106,11 @@ class SqliteResource(File):
             }
         ),
     )
-    def select_table_view(self, params: ConfigParams) -> TableView:
+    def select_table_view(self, params: ConfigParams) -> SqliteTableView:
         return self._get_select_table_view(params["table_name"])
 
     @view(
-        view_type=TableView,
+        view_type=SqliteTableView,
         human_name="Execute query",
         short_description="Show the result of a select query",
         default_view=False,
@@ -113,8 +118,13 @@ class SqliteResource(File):
             {"query": StrParam(human_name="Query", short_description="Query to execute")}
         ),
     )
-    def execute_select_view(self, params: ConfigParams) -> TableView:
+    def execute_select_view(self, params: ConfigParams) -> SqliteTableView | TableView:
+        self._check_exists()
         query = params["query"]
-        table_view = TableView(self.execute_select(query))
+        if SqliteTableView.is_select_query(query):
+            table_view = SqliteTableView(self.path, query=query)
+        else:
+            # the other statements (like PRAGMA) can't be used as sub query, load the whole result
+            table_view = TableView(self.execute_select(query))
         table_view.set_title(query)
         return table_view
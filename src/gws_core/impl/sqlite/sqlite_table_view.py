@@ -0,0 +1,206 @@
+import re
+import sqlite3
+
+from pandas import DataFrame, read_sql_query
+
+from gws_core.config.config_params import ConfigParams
+from gws_core.core.exception.exceptions.bad_request_exception import BadRequestException
+from gws_core.impl.sqlite.sqlite_connection_pool import SqliteConnectionPool
+from gws_core.impl.table.helper.dataframe_helper import DataframeHelper
+from gws_core.impl.table.table import Table
+from gws_core.impl.table.table_types import TableHeaderInfo
+from gws_core.impl.table.view.table_view import TableView
+from gws_core.impl.view.tabular_view import TabularView
+from gws_core.resource.view.view import View
+from gws_core.resource.view.view_types import ViewType
+
+
+class SqliteTableView(View):
+    """
+    View of a table or of the result of a select query of a sqlite file. It has the same
+    config and the same view model as the TableView but the pagination, the sort and the
+    column selection are done by the sqlite query (LIMIT/OFFSET, ORDER BY and the columns
+    of the SELECT), only the rows and columns of the page are loaded.
+
+    The rows are named by their position in the result (sorted or not).
+    """
+
+    _type: ViewType = ViewType.TABLE
+    _specs = TableView._specs
+
+    # comments and spaces at the start of a query
+    _QUERY_PREFIX_PATTERN = re.compile(r"^(\s+|--[^\n]*(\n|$)|/\*.*?\*/)*", re.DOTALL)
+    # first keywords of the queries that can be used as sub query
+    _SELECT_KEYWORDS = ("SELECT", "WITH", "VALUES")
+
+    _sqlite_path: str
+    _table_name: str | None
+    # table or sub query to select from
+    _from_sql: str
+
+    def __init__(
+        self, sqlite_path: str, table_name: str | None = None, query: str | None = None
+    ):
+        """
+        :param sqlite_path: path of the sqlite file
+        :type sqlite_path: str
+        :param table_name: name of the table to show, defaults to None
+        :type table_name: str | None, optional
+        :param query: select query to show the result of, used if table_name is not provided.
+                      Check it with is_select_query, defaults to None
+        :type query: str | None, optional
+        """
+        super().__init__()
+
+        self._table_name = table_name
+        if table_name is not None:
+            self._from_sql = self._quote_identifier(table_name)
+        elif query is not None:
+            # new line before the parenthesis in case the query ends with a -- comment
+            self._from_sql = f"({query.strip().rstrip(';')}\n)"
+        else:
+            raise ValueError("The table name or the query must be provided")
+
+        self._sqlite_path = sqlite_path
+
+    def data_to_dict(self, params: ConfigParams) -> dict:
+        sort_column: str | None = params.get("sort_column")
+        sort_direction: str = params.get("sort_direction") or "Ascending"
+
+        with SqliteConnectionPool.connection(self._sqlite_path) as connection:
+            column_names = self._get_column_names(connection)
+            nb_rows = self._count_rows(connection)
+            nb_columns = len(column_names)
+
+            nb_of_rows_per_page = min(
+                params["number_of_rows_per_page"], TabularView.MAX_NUMBER_OF_ROWS_PER_PAGE
+            )
+            nb_of_columns_per_page = min(
+                params["number_of_columns_per_page"], TabularView.MAX_NUMBER_OF_COLUMNS_PER_PAGE
+            )
+            # - 1 because communication uses 1-based indexing
+            from_row = max(min(params["from_row"] - 1, nb_rows - 1), 0)
+            from_column = max(min(params["from_column"] - 1, nb_columns - 1), 0)
+            to_column = min(from_column + nb_of_columns_per_page, nb_columns)
+
+            if sort_column is not None and sort_column not in column_names:
+                raise BadRequestException(f"The column '{sort_column}' does not exist")
+
+            page_data = self._select_page(
+                connection,
+                column_names,
+                from_column,
+                to_column,
+                from_row,
+                nb_of_rows_per_page,
+                sort_column,
+                sort_direction == "Ascending",
+            )
+
+        # the page is small, use a Table to get the columns info (type)
+        page_table = Table(page_data)
+        rows_info: list[TableHeaderInfo] = [
+            {"name": str(from_row + i), "tags": {}} for i in range(page_table.nb_rows)
+        ]
+
+        replace_nan_by: str = params["replace_nan_by"]
+        if replace_nan_by == "empty" or replace_nan_by is None:
+            replace_nan_by = ""
+        data = DataframeHelper.prepare_to_json(page_data, replace_nan_by)
+
+        total_number_of_rows = nb_rows
+        total_number_of_columns = nb_columns
+        if self._disable_pagination:
+            total_number_of_rows = min(nb_of_rows_per_page, nb_rows)
+            total_number_of_columns = min(nb_of_columns_per_page, nb_columns)
+
+        return {
+            "table": data.to_dict("split")["data"],
+            "rows": rows_info,
+            "columns": page_table.get_columns_info(),
+            "from_row": from_row + 1,  # return 1-based index
+            "number_of_rows_per_page": nb_of_rows_per_page,
+            "from_column": from_column + 1,  # return 1-based index
+            "number_of_columns_per_page": nb_of_columns_per_page,
+            "total_number_of_rows": total_number_of_rows,
+            "total_number_of_columns": total_number_of_columns,
+            "sort": {"column": sort_column, "direction": sort_direction}
+            if sort_column is not None
+            else None,
+        }
+
+    def _get_column_names(self, connection: sqlite3.Connection) -> list[str]:
+        cursor = connection.execute(f"SELECT * FROM {self._from_sql} LIMIT 0")
+        return [description[0] for description in cursor.description]
+
+    def _count_rows(self, connection: sqlite3.Connection) -> int:
+        return connection.execute(f"SELECT COUNT(*) FROM {self._from_sql}").fetchone()[0]
+
+    def _select_page(
+        self,
+        connection: sqlite3.Connection,
+        column_names: list[str],
+        from_column: int,
+        to_column: int,
+        from_row: int,
+        nb_of_rows: int,
+        sort_column: str | None,
+        ascending: bool,
+    ) -> DataFrame:
+        page_column_names = column_names[from_column:to_column]
+
+        # the columns are selected by name, not possible if 2 columns have the same name
+        # (join in a query), in this case all the columns are loaded for the rows of the page
+        select_by_name = len(set(column_names)) == len(column_names)
+        if select_by_name:
+            columns_sql = ", ".join(self._quote_identifier(name) for name in page_column_names)
+        else:
+            columns_sql = "*"
+
+        sql = f"SELECT {columns_sql} FROM {self._from_sql}"
+        if sort_column is not None:
+            quoted_sort_column = self._quote_identifier(sort_column)
+            direction = "ASC" if ascending else "DESC"
+            # NULL values last like the sort of the tables
+            # the tiebreaker keeps the same order between the pages for the rows with the same value
+            tiebreaker_sql = self._get_tiebreaker_sql(connection, column_names)
+            sql += (
+                f" ORDER BY {quoted_sort_column} IS NULL, {quoted_sort_column} {direction},"
+                f" {tiebreaker_sql}"
+            )
+        sql += " LIMIT ? OFFSET ?"
+
+        page_data = read_sql_query(sql, connection, params=(nb_of_rows, from_row))
+        if not select_by_name:
+            page_data = page_data.iloc[:, from_column:to_column]
+        return page_data
+
+    def _get_tiebreaker_sql(self, connection: sqlite3.Connection, column_names: list[str]) -> str:
+        """Return the secondary sort key: the rowid for a table, all the columns for a query,
+        a view or a table without rowid"""
+        if self._table_name is not None:
+            row = connection.execute(
+                "SELECT type FROM sqlite_master WHERE name = ? COLLATE NOCASE", (self._table_name,)
+            ).fetchone()
+            if row is not None and row[0] == "table":
+                try:
+                    connection.execute(f"SELECT rowid FROM {self._from_sql} LIMIT 0")
+                    return "rowid"
+                except sqlite3.OperationalError:
+                    # table created WITHOUT ROWID
+                    pass
+
+        return ", ".join(self._quote_identifier(name) for name in dict.fromkeys(column_names))
+
+    @classmethod
+    def is_select_query(cls, query: str) -> bool:
+        """Return True if the query can be used as sub query by the view (SELECT, WITH or VALUES).
+        The other statements (like PRAGMA) must be executed directly.
+        """
+        query = cls._QUERY_PREFIX_PATTERN.sub("", query, count=1)
+        first_word = re.match(r"\w*", query).group(0)
+        return first_word.upper() in cls._SELECT_KEYWORDS
+
+    @staticmethod
+    def _quote_identifier(name: str) -> str:
+        return '"' + name.replace('"', '""') + '"'
@@ -1,24 +1,318 @@
-from pandas import read_pickle
+from enum import Enum
+
+from numpy import nan
+from pandas import Series, isna, read_pickle
+from pandas.api.types import infer_dtype, is_object_dtype
 from pandas.core.frame import DataFrame
 
+from ...core.utils.logger import Logger
 from ...impl.file.file_r_field import FileRField
 
 
+class DataFrameStorageFormat(Enum):
+    """Format used to store the DataFrame of a DataFrameRField on disk
+
+    PICKLE: pandas pickle, supports any DataFrame but loads the full frame and is unsafe to load
+    FEATHER: Arrow IPC file, columnar and fast to load, supports column projection (requires pyarrow)
+    PARQUET: compressed columnar file, smaller on disk, supports column projection (requires pyarrow)
+    """
+
+    PICKLE = "PICKLE"
+    FEATHER = "FEATHER"
+    PARQUET = "PARQUET"
+
+
+# Magic bytes at the start of the file, used to detect the format of a stored file
+_ARROW_MAGIC = b"ARROW1"
+_PARQUET_MAGIC = b"PAR1"
+
+# Types of object columns that can be stored in a columnar format without loosing data
+_COLUMNAR_OBJECT_TYPES = {"string", "empty"}
+
+
 class DataFrameRField(FileRField):
     """Specific RField for Dataframe, these are loaded and dumped into a file
 
-    WARNING, this uses the pick function, only load file that you trust, otherwise it could
+    The DataFrame is stored in a columnar format (Feather by default) when pyarrow is available
+    and when the DataFrame is supported by the format. Otherwise it falls back to pickle.
+    The format of the file is detected on load so existing pickle files are still readable.
+
+    WARNING, when the file is a pickle, only load file that you trust, otherwise it could
     execute malicious code
 
-    :param FileRField: [description]
-    :type FileRField: [type]
+    :param storage_format: format used to dump the DataFrame, defaults to DEFAULT_STORAGE_FORMAT
+    :type storage_format: DataFrameStorageFormat, optional
     """
 
-    def __init__(self) -> None:
+    DEFAULT_STORAGE_FORMAT = DataFrameStorageFormat.FEATHER
+
+    storage_format: DataFrameStorageFormat
+
+    _pyarrow_available: bool | None = None
+
+    def __init__(self, storage_format: DataFrameStorageFormat | None = None) -> None:
         super().__init__(default_value=DataFrame)
+        self.storage_format = storage_format or self.DEFAULT_STORAGE_FORMAT
 
     def load_from_file(self, file_path: str) -> DataFrame:
-        return read_pickle(file_path)
+        return self.load_columns_from_file(file_path)
+
+    def load_columns_from_file(
+        self,
+        file_path: str,
+        columns: list[str] | None = None,
+        from_row: int | None = None,
+        to_row: int | None = None,
+    ) -> DataFrame:
+        """Load the DataFrame from the file, only the provided columns and rows are read
+        from disk when the file is stored in a columnar format.
+
+        :param file_path: path of the file
+        :type file_path: str
+        :param columns: name of the columns to load, if None all the columns are loaded, defaults to None
+        :type columns: list[str] | None, optional
+        :param from_row: index of the first row to load, defaults to None
+        :type from_row: int | None, optional
+        :param to_row: index of the last row to load (excluded), defaults to None
+        :type to_row: int | None, optional
+        :return: the loaded DataFrame
+        :rtype: DataFrame
+        """
+        file_format = self.detect_file_format(file_path)
+
+        if file_format == DataFrameStorageFormat.PICKLE:
+            dataframe: DataFrame = read_pickle(file_path)
+            if columns is not None:
+                dataframe = dataframe[columns]
+            if from_row is not None or to_row is not None:
+                dataframe = dataframe.iloc[from_row:to_row]
+            return dataframe
+
+        arrow_table = self._read_arrow_table(file_path, file_format, columns)
+
+        if from_row is not None or to_row is not None:
+            start, stop, _ = slice(from_row, to_row).indices(arrow_table.num_rows)
+            arrow_table = arrow_table.slice(start, max(stop - start, 0))
+        return self._arrow_table_to_pandas(arrow_table)
+
+    def load_rows_from_file(
+        self, file_path: str, row_indexes: list[int], columns: list[str] | None = None
+    ) -> DataFrame:
+        """Load the rows at the given positions of the DataFrame stored in the file, in the order of the positions.
+        Only the provided columns are read from disk when the file is stored in a columnar format.
+
+        :param file_path: path of the file
+        :type file_path: str
+        :param row_indexes: positions of the rows to load
+        :type row_indexes: list[int]
+        :param columns: name of the columns to load, if None all the columns are loaded, defaults to None
+        :type columns: list[str] | None, optional
+        :return: the loaded DataFrame
+        :rtype: DataFrame
+        """
+        file_format = self.detect_file_format(file_path)
+
+        if file_format == DataFrameStorageFormat.PICKLE:
+            dataframe: DataFrame = read_pickle(file_path)
+            if columns is not None:
+                dataframe = dataframe[columns]
+            return dataframe.iloc[row_indexes]
+
+        arrow_table = self._read_arrow_table(file_path, file_format, columns)
+        return self._arrow_table_to_pandas(arrow_table.take(row_indexes))
+
+    def load_column_from_file(self, file_path: str, column_name: str) -> Series:
+        """Load the values of a column of the DataFrame stored in the file, without the index
+        of the DataFrame (the returned Series has a default index). When the file is stored in a
+        columnar format, only the column is read from disk.
+
+        :param file_path: path of the file
+        :type file_path: str
+        :param column_name: name of the column to load
+        :type column_name: str
+        :return: the values of the column
+        :rtype: Series
+        """
+        file_format = self.detect_file_format(file_path)
+
+        if file_format == DataFrameStorageFormat.PICKLE:
+            dataframe: DataFrame = read_pickle(file_path)
+            return dataframe[column_name].reset_index(drop=True)
+
+        arrow_table = self._read_arrow_table(file_path, file_format, [column_name])
+        arrow_column = arrow_table.column(column_name)
+        column: Series = arrow_column.to_pandas()
+        if arrow_column.null_count > 0:
+            column = self._restore_object_nan(column)
+        return column
+
+    def load_header_from_file(self, file_path: str) -> tuple[DataFrame, int]:
+        """Read the header of the DataFrame stored in the file: an empty DataFrame with the columns
+        and their types, and the number of rows. When the file is stored in a columnar format,
+        the data is not loaded in memory.
+
+        :param file_path: path of the file
+        :type file_path: str
+        :return: the empty DataFrame with the columns and the number of rows
+        :rtype: tuple[DataFrame, int]
+        """
+        file_format = self.detect_file_format(file_path)
+
+        if file_format == DataFrameStorageFormat.PICKLE:
+            dataframe: DataFrame = read_pickle(file_path)
+            return dataframe.iloc[0:0], dataframe.shape[0]
+
+        # pylint: disable=import-outside-toplevel
+        if file_format == DataFrameStorageFormat.PARQUET:
+            from pyarrow.parquet import ParquetFile
+
+            parquet_file = ParquetFile(file_path)
+            return parquet_file.schema_arrow.empty_table().to_pandas(), parquet_file.metadata.num_rows
+
+        from pyarrow import memory_map
+        from pyarrow.ipc import open_file
+
+        # only the schema and the record batches one by one are read. The batches are not
+        # copied when the file is uncompressed, compressed files (like the lz4 files written by
+        # older versions) are decompressed one batch at a time to count the rows
+        with memory_map(file_path) as source, open_file(source) as reader:
+            nb_rows = sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+            return reader.schema.empty_table().to_pandas(), nb_rows
 
     def dump_to_file(self, r_field_value: DataFrame, file_path: str) -> None:
+        if self.storage_format != DataFrameStorageFormat.PICKLE and self.is_columnar_compatible(
+            r_field_value
+        ):
+            # pylint: disable=import-outside-toplevel
+            from pyarrow import ArrowException, Table
+
+            try:
+                arrow_table = Table.from_pandas(r_field_value, preserve_index=True)
+                if self.storage_format == DataFrameStorageFormat.PARQUET:
+                    from pyarrow.parquet import write_table
+
+                    write_table(arrow_table, file_path)
+                else:
+                    from pyarrow.feather import write_feather
+
+                    # uncompressed so the file can be memory mapped and partially read without copy
+                    write_feather(arrow_table, file_path, compression="uncompressed")
+                return
+            except (ArrowException, TypeError, ValueError) as err:
+                Logger.warning(
+                    f"Could not store the DataFrame in {self.storage_format.value} format, using pickle instead. Error: {err}"
+                )
+
         r_field_value.to_pickle(file_path)
+
+    @classmethod
+    def is_columnar_compatible(cls, dataframe: DataFrame) -> bool:
+        """Check if the DataFrame can be stored in a columnar format and loaded back
+        without modification. This requires pyarrow, unique string column names and
+        object columns that only contain strings.
+        """
+        if not cls.is_pyarrow_available():
+            return False
+
+        if not dataframe.columns.is_unique or dataframe.columns.nlevels > 1:
+            return False
+        if dataframe.index.nlevels > 1:
+            return False
+        if dataframe.index.name is not None and not isinstance(dataframe.index.name, str):
+            return False
+        if any(not isinstance(name, str) for name in dataframe.columns):
+            return False
+
+        if is_object_dtype(dataframe.index.dtype) and (
+            infer_dtype(dataframe.index, skipna=True) not in _COLUMNAR_OBJECT_TYPES
+        ):
+            return False
+
+        for _, column in dataframe.items():
+            if is_object_dtype(column.dtype) and (
+                infer_dtype(column, skipna=True) not in _COLUMNAR_OBJECT_TYPES
+            ):
+                return False
+        return True
+
+    @classmethod
+    def detect_file_format(cls, file_path: str) -> DataFrameStorageFormat:
+        with open(file_path, "rb") as file:
+            header = file.read(len(_ARROW_MAGIC))
+
+        if header.startswith(_ARROW_MAGIC):
+            return DataFrameStorageFormat.FEATHER
+        if header.startswith(_PARQUET_MAGIC):
+            return DataFrameStorageFormat.PARQUET
+        return DataFrameStorageFormat.PICKLE
+
+    @classmethod
+    def is_pyarrow_available(cls) -> bool:
+        if cls._pyarrow_available is None:
+            try:
+                # pylint: disable=import-outside-toplevel,unused-import
+                import pyarrow  # noqa: F401
+
+                cls._pyarrow_available = True
+            except ImportError:
+                cls._pyarrow_available = False
+        return cls._pyarrow_available
+
+    def _read_arrow_table(
+        self, file_path: str, file_format: DataFrameStorageFormat, columns: list[str] | None
+    ):
+        """Read the columns of a file stored in a columnar format, the index columns are always read"""
+        # pylint: disable=import-outside-toplevel
+        if file_format == DataFrameStorageFormat.PARQUET:
+            from pyarrow.parquet import read_table
+
+            return read_table(file_path, columns=columns, use_pandas_metadata=True)
+
+        from pyarrow.feather import read_table
+
+        # the file is memory mapped so only the selected columns and rows are read
+        return read_table(
+            file_path, columns=self._add_index_columns(file_path, columns), memory_map=True
+        )
+
+    def _arrow_table_to_pandas(self, arrow_table) -> DataFrame:
+        """Convert the arrow table to a DataFrame, the missing values of the object columns
+        are NaN like in the DataFrame stored with pickle"""
+        dataframe: DataFrame = arrow_table.to_pandas()
+
+        for column_index, column_name in enumerate(dataframe.columns):
+            if (
+                column_name in arrow_table.column_names
+                and arrow_table.column(column_name).null_count > 0
+            ):
+                dataframe.isetitem(
+                    column_index, self._restore_object_nan(dataframe.iloc[:, column_index])
+                )
+        return dataframe
+
+    @staticmethod
+    def _restore_object_nan(column: Series) -> Series:
+        """The missing values of the object columns are stored as null and loaded as None by
+        pyarrow, replace them by NaN (the missing values of the csv files are NaN)"""
+        if not is_object_dtype(column.dtype):
+            return column
+
+        values = column.to_numpy(dtype=object, copy=True)
+        values[isna(values)] = nan
+        return Series(values, index=column.index, name=column.name, dtype=object)
+
+    def _add_index_columns(self, file_path: str, columns: list[str] | None) -> list[str] | None:
+        """Add the columns storing the DataFrame index to the list of columns to read"""
+        if columns is None:
+            return None
+
+        # pylint: disable=import-outside-toplevel
+        from pyarrow.ipc import open_file
+
+        with open_file(file_path) as reader:
+            pandas_metadata = reader.schema.pandas_metadata or {}
+
+        index_columns = [
+            column for column in pandas_metadata.get("index_columns", []) if isinstance(column, str)
+        ]
+        return [*columns, *[column for column in index_columns if column not in columns]]
@@ -1,9 +1,9 @@
 from re import sub
 from typing import Any
 
-from numpy import NaN, inf
+from numpy import NaN, dtype, inf
 from numpy.ma import masked
-from pandas import DataFrame
+from pandas import DataFrame, get_option
 
 from gws_core.core.utils.numeric_helper import NumericHelper
 from gws_core.core.utils.string_helper import StringHelper
@@ -184,3 +184,37 @@ class DataframeHelper:
             str_name = StringHelper.replace_accent_with_letter(str_name)
             str_name = sub("[^A-Za-z0-9_]+", "", str_name)
         return str_name
+
+    @classmethod
+    def get_read_only_view(cls, data: DataFrame) -> DataFrame:
+        """Return a view of the dataframe (no copy of the values) that can't be modified.
+        The numpy arrays of the columns are marked as read-only, so setting a value raises an error.
+        The columns with an extension type (nullable integers, categories...) are shared as is.
+        The view shares the values of the dataframe, it reflects the modifications of the dataframe.
+        With the pandas copy-on-write mode, a shallow copy is returned (modifications are not propagated).
+        """
+        if get_option("mode.copy_on_write") is True:
+            return data.copy(deep=False)
+
+        columns: dict[int, Any] = {}
+        for position, (_, column) in enumerate(data.items()):
+            if isinstance(column.dtype, dtype):
+                values = column.to_numpy(copy=False).view()
+                values.setflags(write=False)
+                columns[position] = values
+            else:
+                columns[position] = column.array
+
+        view = DataFrame(columns, index=data.index, copy=False)
+        view.columns = data.columns
+        return view
+
+    @classmethod
+    def is_read_only(cls, data: DataFrame) -> bool:
+        """Return True if the dataframe contains read-only values (like a view
+        returned by get_read_only_view or a part of it)
+        """
+        return any(
+            isinstance(column.dtype, dtype) and not column.to_numpy(copy=False).flags.writeable
+            for _, column in data.items()
+        )
@@ -51,7 +51,7 @@ class TableConcatHelper:
 
         for table in tables:
             if concat_df is None:
-                concat_df = table.get_data()
+                concat_df = table.get_data_view()
                 row_tags = table.get_row_tags()
 
                 if (
@@ -60,7 +60,7 @@ class TableConcatHelper:
                 ):
                     column_tags = cls._get_column_tags(concat_df, table)
             else:
-                temp_df = concat([concat_df, table.get_data()])
+                temp_df = concat([concat_df, table.get_data_view()])
                 row_tags = row_tags + table.get_row_tags()
 
                 if column_tags_option == "merge from first table":
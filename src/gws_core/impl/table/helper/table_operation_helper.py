@@ -49,7 +49,7 @@ class TableOperationHelper:
         # convert the operations to str
         str_operation: str = TableOperationHelper.OPERATION_SEPARATOR.join(clean_operations)
 
-        dataframe = source.get_data()
+        dataframe = source.get_data_view()
 
         eval_dataframe: DataFrame = dataframe.eval(str_operation, engine="python")
         eval_dataframe = eval_dataframe.replace(TableOperationHelper._NaN_str, NaN)
@@ -9,7 +9,7 @@ from gws_core.impl.table.table import Table
 class TableScalerHelper:
     @classmethod
     def scale(cls, table: Table, func: DfScaleFunction) -> Table:
-        dataframe = DataframeScalerHelper.scale(table.get_data(), func)
+        dataframe = DataframeScalerHelper.scale(table.get_data_view(), func)
 
         # keep the table types, and tags
         return table.create_sub_table(
@@ -18,7 +18,7 @@ class TableScalerHelper:
 
     @classmethod
     def scale_by_columns(cls, table: Table, func: DfAxisScaleFunction) -> Table:
-        dataframe = DataframeScalerHelper.scale_by_columns(table.get_data(), func)
+        dataframe = DataframeScalerHelper.scale_by_columns(table.get_data_view(), func)
 
         # keep the table types, and tags
         return table.create_sub_table(
@@ -27,7 +27,7 @@ class TableScalerHelper:
 
     @classmethod
     def scale_by_rows(cls, table: Table, func: DfAxisScaleFunction) -> Table:
-        dataframe = DataframeScalerHelper.scale_by_rows(table.get_data(), func)
+        dataframe = DataframeScalerHelper.scale_by_rows(table.get_data_view(), func)
 
         # keep the table types, and tags
         return table.create_sub_table(
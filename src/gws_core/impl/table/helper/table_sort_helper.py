@@ -0,0 +1,95 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+from pandas import Series
+
+from gws_core.impl.table.table_sort_cache import TableSortCache
+
+if TYPE_CHECKING:
+    from gws_core.impl.table.table import Table
+
+
+class TableSortHelper:
+    """Compute the positions of the rows of a table sorted by a column. The order is the one of
+    a stable pandas sort with the NaN values at the end.
+    """
+
+    # When the requested rows are in the first TOP_K_MAX_ROWS rows, only the first rows
+    # are sorted (partial sort) instead of the whole column
+    TOP_K_MAX_ROWS = 1000
+
+    @classmethod
+    def get_sorted_row_indexes(
+        cls, table: "Table", column_name: str, ascending: bool, from_row: int, to_row: int
+    ) -> np.ndarray:
+        """Return the positions of the rows from from_row to to_row (excluded) of the table sorted by the column.
+        When the table is saved, the complete sort is cached in the TableSortCache for the next calls.
+
+        :param table: table to sort
+        :type table: Table
+        :param column_name: name of the column to sort by
+        :type column_name: str
+        :param ascending: sort direction
+        :type ascending: bool
+        :param from_row: position of the first row in the sorted table
+        :type from_row: int
+        :param to_row: position of the last row in the sorted table (excluded)
+        :type to_row: int
+        :return: the positions of the rows in the table
+        :rtype: np.ndarray
+        """
+        resource_model_id = table.get_model_id()
+        cache_key = (resource_model_id, column_name, ascending) if resource_model_id else None
+        if cache_key is not None:
+            positions = TableSortCache.get(cache_key)
+            if positions is not None and len(positions) == table.nb_rows:
+                return positions[from_row:to_row]
+
+        column = table.get_column_values(column_name)
+
+        if to_row <= cls.TOP_K_MAX_ROWS:
+            positions = cls.get_top_k_positions(column, ascending, to_row)
+            if positions is not None:
+                return positions[from_row:to_row]
+
+        positions = cls.get_sort_positions(column, ascending)
+        if cache_key is not None:
+            TableSortCache.set(cache_key, positions)
+        return positions[from_row:to_row]
+
+    @classmethod
+    def get_sort_positions(cls, column: Series, ascending: bool) -> np.ndarray:
+        """Return the positions of all the values of the column in sorted order"""
+        sorted_column = column.reset_index(drop=True).sort_values(
+            ascending=ascending, kind="stable", na_position="last"
+        )
+        return sorted_column.index.to_numpy()
+
+    @classmethod
+    def get_top_k_positions(cls, column: Series, ascending: bool, k: int) -> np.ndarray | None:
+        """Return the positions of the first k values of the column in sorted order (same order as get_sort_positions).
+        The k first values are selected with a partition, only them are sorted.
+
+        Return None when the partial sort is not supported: non numeric column or less than k non NaN values.
+        """
+        values = column.to_numpy()
+        if values.dtype.kind not in "biuf" or k <= 0 or k >= len(values):
+            return None
+
+        if values.dtype.kind == "b":
+            values = values.astype(np.int8)
+        if not ascending:
+            # reverse the order of the values, ~ reverses the order of the integers without overflow
+            values = -values if values.dtype.kind == "f" else ~values
+
+        partition = np.argpartition(values, k - 1)[:k]
+        kth_value = values[partition].max()
+        if np.isnan(kth_value):
+            # the NaN are placed at the end of the partition, there are less than k values
+            return None
+
+        # keep the equal values in the order of the rows like a stable sort
+        lower_positions = np.flatnonzero(values < kth_value)
+        equal_positions = np.flatnonzero(values == kth_value)[: k - len(lower_positions)]
+        positions = np.concatenate([lower_positions, equal_positions])
+        return positions[np.argsort(values[positions], kind="stable")]
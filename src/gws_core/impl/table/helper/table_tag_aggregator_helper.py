@@ -45,16 +45,16 @@ class TableTagAggregatorHelper:
     def sort_by_row_tags(cls, table: Table, keys: list[str]) -> Table:
         row_tags = table.get_row_tags()
 
-        tag_dataframe = DataFrame(row_tags, index=table.get_data().index)
+        tag_dataframe = DataFrame(row_tags, index=table.get_data_view().index)
         tag_keys = tag_dataframe.columns
         row_positions = DataFrame(
             range(0, tag_dataframe.shape[0]),
-            index=table.get_data().index,
+            index=table.get_data_view().index,
             columns=["row_positions"],
         )
 
         df = concat(
-            [row_positions, tag_dataframe, table.get_data()], axis=1
+            [row_positions, tag_dataframe, table.get_data_view()], axis=1
         )  # add ne columns for multi-row sort
 
         df.sort_values(by=keys, inplace=True)
@@ -101,17 +101,17 @@ class TableTagAggregatorHelper:
     def sort_by_column_tags(cls, table: Table, keys: list[str]) -> Table:
         column_tags = table.get_column_tags()
 
-        tag_dataframe = DataFrame(column_tags, index=table.get_data().columns)
+        tag_dataframe = DataFrame(column_tags, index=table.get_data_view().columns)
         tag_keys = tag_dataframe.columns
 
         column_positions = DataFrame(
             range(0, tag_dataframe.shape[1]),
-            columns=table.get_data().columns,
+            columns=table.get_data_view().columns,
             index=["column_positions"],
         )
 
         df = concat(
-            [column_positions, tag_dataframe, table.get_data()], axis=0
+            [column_positions, tag_dataframe, table.get_data_view()], axis=0
         )  # add new rows for multi-column sort
 
         df.sort_values(by=keys, inplace=True, axis=1)
@@ -147,14 +147,15 @@ class TableTagAggregatorHelper:
         df_list = {}
         for val in all_tag_values:
             filtered_table = table.select_by_tags(axis, [{key: val}])
+            filtered_data = filtered_table.get_data_view()
             aggregate_df: DataFrame
 
             if func == "mean":
-                aggregate_df = filtered_table.get_data().mean(axis=axis, skipna=True).to_frame()
+                aggregate_df = filtered_data.mean(axis=axis, skipna=True).to_frame()
             elif func == "median":
-                aggregate_df = filtered_table.get_data().median(axis=axis, skipna=True).to_frame()
+                aggregate_df = filtered_data.median(axis=axis, skipna=True).to_frame()
             elif func == "sum":
-                aggregate_df = filtered_table.get_data().sum(axis=axis, skipna=True).to_frame()
+                aggregate_df = filtered_data.sum(axis=axis, skipna=True).to_frame()
             df_list[val] = aggregate_df.T if is_row_axis(axis) else aggregate_df
 
         df: DataFrame = concat(list(df_list.values()), axis=axis)
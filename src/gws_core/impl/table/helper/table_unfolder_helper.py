@@ -65,7 +65,7 @@ class TableUnfolderHelper:
 
         for tags in all_tag_combinations:
             sub_table = table.select_by_column_tags([tags])
-            df = sub_table.get_data()
+            df = sub_table.get_data_view()
 
             if df.empty:
                 continue
@@ -123,7 +123,7 @@ class TableUnfolderHelper:
         """
 
         for row in rows:
-            if row not in table.get_data().index:
+            if row not in table.get_data_view().index:
                 raise Exception(f"Row {row} not found in table.")
 
             table.extract_row_values_to_column_tags(row, delete_row=True)
@@ -150,7 +150,7 @@ class TableUnfolderHelper:
         """
 
         for column in columns:
-            if column not in table.get_data().columns:
+            if column not in table.get_data_view().columns:
                 raise Exception(f"Column {column} not found in table.")
 
             table.extract_column_values_to_row_tags(column, delete_column=True)
@@ -153,7 +153,7 @@ class TableAnnotatorHelper:
         dataframe: DataFrame
         if use_index_as_ref:
             # use the index
-            dataframe = metadata_table.get_data()
+            dataframe = metadata_table.get_data_view()
 
         elif ref_column:
             if not metadata_table.column_exists(ref_column):
@@ -161,10 +161,10 @@ class TableAnnotatorHelper:
                     f"The column '{ref_column}' does not exist in metadata table"
                 )
             # set the ref column as index name for the dataframe
-            dataframe = metadata_table.get_data().set_index(ref_column)
+            dataframe = metadata_table.get_data_view().set_index(ref_column)
         else:
             # set the first column as the index name for the dataframe
-            dataframe = metadata_table.get_data().set_index(metadata_table.get_column_names()[0])
+            dataframe = metadata_table.get_data_view().set_index(metadata_table.get_column_names()[0])
 
         # dataframe as dict of tags where key = id and value = tags for the id
         dict = dataframe.to_dict("index")
@@ -20,8 +20,9 @@ from ...resource.r_field.primitive_r_field import StrRField
 from ...resource.r_field.serializable_r_field import SerializableRField
 from ...resource.resource import Resource
 from ...resource.resource_decorator import resource_decorator
+from ...resource.resource_handoff_cache import ResourceHandoffCache
 from ...resource.view.view_decorator import view
-from .data_frame_r_field import DataFrameRField
+from .data_frame_r_field import DataFrameRField, DataFrameStorageFormat
 from .helper.dataframe_filter_helper import DataframeFilterHelper, DataframeFilterName
 from .table_types import AxisType, TableColumnInfo, TableColumnType, TableHeaderInfo, is_row_axis
 from .view.table_barplot_view import TableBarPlotView
@@ -48,6 +49,7 @@ ALLOWED_FILE_FORMATS = [*ALLOWED_XLS_FILE_FORMATS, *ALLOWED_TXT_FILE_FORMATS]
 class Table(Resource):
     """
     Main 2d table with named columns and rows. It is a wrapper of the pandas Dataframe, to access it use the get_data() method.
+    To only read the data without copying it, use the get_data_view() method.
 
     ## Tags
     In additions, a Table has tags (metadata) for each column and row.
@@ -77,6 +79,13 @@ class Table(Resource):
     _column_tags: TableAxisTags = SerializableRField(TableAxisTags)
     comments: str = StrRField()
 
+    # When the table is loaded from the database, the data is loaded on first access.
+    # Before that, the header (empty DataFrame with the columns) and the number of rows are read
+    # from the data file so metadata and parts of the data can be retrieved without a full load
+    _lazy_data_file_path: str | None = None
+    _lazy_data_header: DataFrame | None = None
+    _lazy_data_nb_rows: int = 0
+
     def __init__(
         self,
         data: DataFrame | np.ndarray | list | None = None,
@@ -153,6 +162,10 @@ class Table(Resource):
             if row_names:
                 data.index = row_names
 
+            # the data comes from a read-only view of a table, copy it so this table can modify its data
+            if DataframeHelper.is_read_only(data):
+                data = data.copy()
+
         # format the row and column names
         # prevent having duplicate column and row names
         self._data = DataframeHelper.format_column_and_row_names(
@@ -171,8 +184,138 @@ class Table(Resource):
         self.comments = comments
 
     def get_data(self) -> DataFrame:
+        """
+        Get a copy of the data of the table. The copy can be modified without modifying the table.
+        Use get_data_view if the data is only read.
+
+        :return: a copy of the data
+        :rtype: DataFrame
+        """
         return self._data.copy()
 
+    def get_data_view(self) -> DataFrame:
+        """
+        Get the data of the table without copy, for read only use. The values of the returned dataframe
+        can't be modified (an error is raised), use get_data to get a copy that can be modified.
+        The view shares the values of the table, don't keep it after modifying the table.
+
+        :return: a read-only view of the data
+        :rtype: DataFrame
+        """
+        return DataframeHelper.get_read_only_view(self._data)
+
+    def get_sub_data(
+        self,
+        column_names: list[str] | None = None,
+        from_row: int | None = None,
+        to_row: int | None = None,
+    ) -> DataFrame:
+        """
+        Get a part of the data. If the data of the table was not loaded yet (table loaded from the database),
+        only the requested columns and rows are read from disk. Use it when only a small part of
+        a big table is needed (like in views).
+
+        :param column_names: names of the columns to retrieve, if None all the columns are retrieved, defaults to None
+        :type column_names: list[str] | None, optional
+        :param from_row: index of the first row to retrieve, defaults to None
+        :type from_row: int | None, optional
+        :param to_row: index of the last row to retrieve (excluded), defaults to None
+        :type to_row: int | None, optional
+        :return: a copy of the requested part of the data
+        :rtype: DataFrame
+        """
+        self._check_column_names_exist(column_names)
+
+        if self._load_lazy_data_header():
+            r_field: DataFrameRField = self._get_data_r_field()
+            return r_field.load_columns_from_file(
+                self._lazy_data_file_path, column_names, from_row, to_row
+            )
+
+        # select the rows and the columns together so only the requested part is copied
+        return self._data.iloc[from_row:to_row, self._get_column_positions(column_names)].copy()
+
+    def get_sub_data_by_row_indexes(
+        self, row_indexes: list[int], column_names: list[str] | None = None
+    ) -> DataFrame:
+        """
+        Get the rows at the given positions, in the order of the positions. Like get_sub_data,
+        if the data of the table was not loaded yet, only the requested rows and columns are read from disk.
+
+        :param row_indexes: positions of the rows to retrieve
+        :type row_indexes: list[int]
+        :param column_names: names of the columns to retrieve, if None all the columns are retrieved, defaults to None
+        :type column_names: list[str] | None, optional
+        :return: a copy of the requested rows
+        :rtype: DataFrame
+        """
+        self._check_column_names_exist(column_names)
+
+        if self._load_lazy_data_header():
+            r_field: DataFrameRField = self._get_data_r_field()
+            return r_field.load_rows_from_file(self._lazy_data_file_path, row_indexes, column_names)
+
+        return self._data.iloc[row_indexes, self._get_column_positions(column_names)].copy()
+
+    def _check_column_names_exist(self, column_names: list[str] | None) -> None:
+        if column_names is None:
+            return
+
+        existing_column_names = set(self.column_names)
+        for column_name in column_names:
+            if column_name not in existing_column_names:
+                raise Exception(f"The column '{column_name}' doesn't exist")
+
+    def _get_column_positions(self, column_names: list[str] | None) -> slice | list[int]:
+        if column_names is None:
+            return slice(None)
+        return self._data.columns.get_indexer(column_names).tolist()
+
+    def _get_data_or_header(self) -> DataFrame:
+        """Return the header of the data if the data is not loaded yet (to retrieve columns info
+        without loading the data), otherwise return the data
+        """
+        if self._load_lazy_data_header():
+            return self._lazy_data_header
+        return self._data
+
+    def _load_lazy_data_header(self) -> bool:
+        """Load the header of the data file if the data was not loaded yet.
+        If the data file does not support partial loading, the full data is loaded.
+
+        :return: True if the data is not loaded and the header is available
+        :rtype: bool
+        """
+        # the data is set (new table or data already loaded)
+        if "_data" in self.__dict__:
+            return False
+
+        # the data is in memory (generated by a previous task of the run), use it directly
+        if ResourceHandoffCache.has_field(self.get_model_id(), "_data"):
+            return False
+
+        if self._lazy_data_header is not None:
+            return True
+
+        kv_store = self.__kv_store__
+        if kv_store is None or "_data" not in kv_store:
+            return False
+
+        file_path = kv_store.get_key_file_path("_data")
+        if DataFrameRField.detect_file_format(file_path) == DataFrameStorageFormat.PICKLE:
+            # partial loading is not supported, trigger the full load of the data
+            self._data  # pylint: disable=pointless-statement
+            return False
+
+        r_field: DataFrameRField = self._get_data_r_field()
+        self._lazy_data_header, self._lazy_data_nb_rows = r_field.load_header_from_file(file_path)
+        self._lazy_data_file_path = file_path
+        return True
+
+    @classmethod
+    def _get_data_r_field(cls) -> DataFrameRField:
+        return cls.__get_resource_r_fields__()["_data"]
+
     ########################################## COLUMN ##########################################
 
     def column_exists(self, name: str, case_sensitive: bool = True) -> bool:
@@ -217,12 +360,30 @@ class Table(Resource):
         :return: The data of the column.
         :rtype: List[Any]
         """
-        self.check_column_exists(column_name)
+        column = self.get_column_values(column_name)
 
         if skip_nan:
-            return self._data[column_name].dropna().tolist()
+            return column.dropna().tolist()
         else:
-            return self._data[column_name].tolist()
+            return column.tolist()
+
+    def get_column_values(self, column_name: str) -> Series:
+        """
+        Returns the values of a column without the row names, the index of the returned Series
+        is the position of the rows. If the data of the table was not loaded yet, only the column is read from disk.
+
+        :param column_name: The name of the column.
+        :type column_name: str
+        :return: a copy of the values of the column
+        :rtype: Series
+        """
+        self._check_column_names_exist([column_name])
+
+        if self._load_lazy_data_header():
+            r_field: DataFrameRField = self._get_data_r_field()
+            return r_field.load_column_from_file(self._lazy_data_file_path, column_name)
+
+        return self._data[column_name].reset_index(drop=True)
 
     def get_column_as_dataframe(self, column_name: str, skip_nan=False) -> DataFrame:
         """
@@ -235,9 +396,7 @@ class Table(Resource):
         :return: The column as a DataFrame.
         :rtype: DataFrame
         """
-        self.check_column_exists(column_name)
-
-        dataframe = self._data[[column_name]]
+        dataframe = self.get_sub_data([column_name])
         if skip_nan:
             dataframe.dropna(inplace=True)
         return dataframe
@@ -345,7 +504,7 @@ class Table(Resource):
         :rtype: int
         """
 
-        return self._data.shape[1]
+        return self._get_data_or_header().shape[1]
 
     @property
     def column_names(self) -> list[str] | None:
@@ -357,7 +516,7 @@ class Table(Resource):
         """
 
         try:
-            return self._data.columns.values.tolist()
+            return self._get_data_or_header().columns.values.tolist()
         except:
             return None
 
@@ -374,7 +533,7 @@ class Table(Resource):
         :rtype: List[str]
         """
 
-        return self._data.columns.tolist()[from_index:to_index]
+        return self._get_data_or_header().columns.tolist()[from_index:to_index]
 
     def get_column_type(self, column_name) -> TableColumnType:
         """
@@ -388,7 +547,7 @@ class Table(Resource):
 
         self.check_column_exists(column_name)
         # get the type of the column
-        column = self._data[column_name]
+        column = self._get_data_or_header()[column_name]
         if is_integer_dtype(column):
             return TableColumnType.INTEGER
         elif is_float_dtype(column):
@@ -415,7 +574,7 @@ class Table(Resource):
         if not all(isinstance(x, int) for x in indexes):
             raise BadRequestException("The indexes must be a list of integers")
         # get the row names of the row indexes
-        return list(self._data.iloc[:, indexes].columns)
+        return list(self._get_data_or_header().iloc[:, indexes].columns)
 
     def get_column_index_from_name(self, column_name: str) -> int:
         """
@@ -428,7 +587,7 @@ class Table(Resource):
         """
 
         self.check_column_exists(column_name)
-        return self._data.columns.get_loc(column_name)
+        return self._get_data_or_header().columns.get_loc(column_name)
 
     def generate_new_column_name(self, name: str) -> str:
         """
@@ -600,7 +759,11 @@ class Table(Resource):
         :rtype: List[str]
         """
 
-        return self._data.index.tolist()[from_index:to_index]
+        if self._load_lazy_data_header():
+            # only read the index of the requested rows
+            return self.get_sub_data([], from_index, to_index).index.tolist()
+
+        return self._data.index[from_index:to_index].tolist()
 
     def get_row_names_by_indexes(self, indexes: list[int]) -> list[str]:
         """
@@ -639,6 +802,9 @@ class Table(Resource):
         :rtype: int
         """
 
+        if self._load_lazy_data_header():
+            return self._lazy_data_nb_rows
+
         return self._data.shape[0]
 
     @property
@@ -711,24 +877,8 @@ class Table(Resource):
         if not isinstance(tags, list):
             raise BadRequestException("A list of tags is required")
 
-        header_tags = self.get_tags(axis)
-        index_union: list[int] = []
-        for tag in tags:
-            index_instersect: list[int] = []
-            for key, value in tag.items():
-                if not index_instersect:
-                    index_instersect = [i for i, t in enumerate(header_tags) if t.get(key) == value]
-                else:
-                    pos = [i for i, t in enumerate(header_tags) if t.get(key) == value]
-                    index_instersect = list(set(pos) & set(index_instersect))
-
-                if len(index_instersect) == 0:
-                    break
-
-            index_union.extend(index_instersect)
-
-        index_union = sorted(list(set(index_union)))
-        return index_union
+        axis_tags = self._row_tags if is_row_axis(axis) else self._column_tags
+        return axis_tags.get_indexes_by_tags(tags)
 
     ######################################## COLUMN TAGS ########################################
 
@@ -861,11 +1011,9 @@ class Table(Resource):
         """
 
         # reduce the number of columns to retrieve
-        data: DataFrame | None = None
+        data: DataFrame = self._get_data_or_header()
         if from_index is not None or to_index is not None:
-            data = self._data.iloc[:, from_index:to_index]
-        else:
-            data = self._data
+            data = data.iloc[:, from_index:to_index]
 
         column_infos: list[TableColumnInfo] = []
         for column in data:
@@ -1099,19 +1247,32 @@ class Table(Resource):
         :rtype: List[TableHeaderInfo]
         """
 
-        # reduce the data to the requested rows
-        data: DataFrame | None = None
-        if from_index is not None or to_index is not None:
-            data = self._data.iloc[from_index:to_index, :]
-        else:
-            data = self._data
+        row_names = self.get_row_names(from_index, to_index)
+        # position of the first requested row
+        start_index = slice(from_index, to_index).indices(self.nb_rows)[0]
 
         rows_info: list[TableHeaderInfo] = []
-        for _, row in data.iterrows():
-            rows_info.append(self.get_row_info(row.name))
+        for i, row_name in enumerate(row_names):
+            rows_info.append(
+                {"name": row_name, "tags": self._row_tags.get_tags_at(start_index + i)}
+            )
 
         return rows_info
 
+    def get_rows_info_by_indexes(self, indexes: list[int]) -> list[TableHeaderInfo]:
+        """
+        Get the info of the rows at the given positions, in the order of the positions
+
+        :param indexes: positions of the rows
+        :type indexes: list[int]
+        :return: The list of row info
+        :rtype: List[TableHeaderInfo]
+        """
+        row_names = self.get_sub_data_by_row_indexes(indexes, []).index.tolist()
+        row_tags = self._row_tags.get_tags_at_indexes(indexes)
+
+        return [{"name": name, "tags": tags} for name, tags in zip(row_names, row_tags)]
+
     def get_row_info(self, row_name: str) -> TableHeaderInfo:
         """
         Get the info of a row by name
@@ -1372,7 +1533,8 @@ class Table(Resource):
         )
 
         # get the indexes to keep by removing the selected ones from all index
-        indexes_to_keep = [index for index in all_indexes if index not in indexes]
+        indexes_set = set(indexes)
+        indexes_to_keep = [index for index in all_indexes if index not in indexes_set]
 
         return (
             self.select_by_row_indexes(indexes_to_keep)
@@ -1511,7 +1673,7 @@ class Table(Resource):
         :rtype: pandas.DataFrame
         """
 
-        return self._data.head(nrows)
+        return self.get_sub_data(from_row=0, to_row=nrows)
 
     def tail(self, nrows=5) -> DataFrame:
         """
@@ -1534,7 +1696,7 @@ class Table(Resource):
         :rtype: Tuple[int]
         """
 
-        return self._data.shape
+        return (self.nb_rows, self.nb_columns)
 
     def __str__(self):
         return super().__str__() + "\n" + "Table:\n" + self._data.__str__()
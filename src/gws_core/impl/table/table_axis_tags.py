@@ -1,18 +1,38 @@
-from copy import deepcopy
+from array import array
+
+import numpy as np
 
 from gws_core.core.utils.utils import Utils
 from gws_core.resource.r_field.serializable_r_field import SerializableObjectJson
-from gws_core.tag.tag_helper import TagHelper
 
 
 class TableAxisTags(SerializableObjectJson):
-    _tags: list[dict[str, str]] | None = None
+    """Tags of the rows (or the columns) of a Table, each row has a dict of tags (key -> value).
+
+    The tags are stored by key: for each key, the code of the value of each row (position of the
+    value in the distinct values of the key, -1 if the row doesn't have the key). The masks of the rows
+    having a tag (inverted index (key, value) -> rows) are built on demand and kept until the key is modified,
+    so the selection by tags is a combination of boolean masks.
+
+    The getters build new dicts from this storage, the returned tags can be modified
+    without impacting the TableAxisTags.
+    """
+
+    _size: int
+    # for each key, the code of the value of each row, -1 if the row doesn't have the key
+    _codes: dict[str, array]
+    # for each key, the distinct values, the code of a value is its position in the list
+    _values: dict[str, list[str]]
+    # for each key, the code of each value
+    _value_codes: dict[str, dict[str, int]]
+    # inverted index, for each key and value, the mask of the rows having the tag
+    _masks: dict[str, dict[str, np.ndarray]]
 
     def __init__(self, tags: list[dict[str, str]] | None = None):
         super().__init__()
 
         if tags is None:
-            self._tags = []
+            self._init_storage(0)
         else:
             self.set_all_tags(tags)
 
@@ -24,35 +44,54 @@ class TableAxisTags(SerializableObjectJson):
         if index is None:
             index = self.size
 
-        for _ in range(count):
-            self._tags.insert(index, {})
-            index += 1
+        for codes in self._codes.values():
+            codes[index:index] = array("i", [-1]) * count
+        self._size += count
+
+        # the rows moved, clear the masks
+        self._masks = {}
 
     def add_tag_at(self, index: int, key: str, value: str) -> None:
         self._check_tag_index(index)
         self._check_tag(key, value)
 
-        self._tags[index][key] = value
+        self._set_tag(index, key, value)
 
     def set_tags_at(self, index: int, tags: dict[str, str]) -> None:
         """Set the tags at the given index (override previous tags)"""
         self._check_tag_index(index)
         self._check_tags(tags)
 
-        self._tags[index] = tags
+        for key, codes in self._codes.items():
+            if key not in tags and codes[index] >= 0:
+                codes[index] = -1
+                self._masks.pop(key, None)
+
+        for key, value in tags.items():
+            self._set_tag(index, key, value)
 
     def set_all_tags(self, tags: list[dict[str, str]]) -> None:
         if not isinstance(tags, list):
             raise Exception("The tags must be a list")
 
+        self._init_storage(len(tags))
         try:
-            self._tags = [{str(k): str(v) for k, v in t.items()} for t in tags]
+            for index, row_tags in enumerate(tags):
+                for key, value in row_tags.items():
+                    self._set_tag(index, str(key), str(value))
         except Exception as err:
+            self._init_storage(0)
             raise Exception(f"The tags are not valid. Please check. Error message: {err}")
 
     def remove_tags_at(self, index: int) -> None:
         self._check_tag_index(index)
-        del self._tags[index]
+
+        for codes in self._codes.values():
+            del codes[index]
+        self._size -= 1
+
+        # the rows moved, clear the masks
+        self._masks = {}
 
     def get_tags_between(
         self, from_index: int | None = None, to_index: int | None = None, none_if_empty: bool = False
@@ -64,30 +103,136 @@ class TableAxisTags(SerializableObjectJson):
         if from_index is not None and to_index is not None:
             self._check_tag_index(from_index)
             self._check_tag_index(to_index)
-            return deepcopy(self._tags[from_index : to_index + 1])
+            return self.get_tags_at_indexes(range(from_index, to_index + 1))
 
         return self.get_all_tags()
 
     def get_tags_at(self, index: int) -> dict[str, str]:
         self._check_tag_index(index)
-        return deepcopy(self._tags[index])
+        return self._build_tags_at(index)
 
     def get_tags_at_indexes(self, indexes: list[int]) -> list[dict[str, str]]:
-        return deepcopy([self._tags[i] for i in indexes])
+        return [self._build_tags_at(index) for index in indexes]
 
     def get_all_tags(self) -> list[dict[str, str]]:
-        return deepcopy(self._tags)
+        all_tags: list[dict[str, str]] = [{} for _ in range(self._size)]
+        for key, codes in self._codes.items():
+            values = self._values[key]
+            for index, code in enumerate(codes):
+                if code >= 0:
+                    all_tags[index][key] = values[code]
+        return all_tags
 
     def all_tag_are_empty(self) -> bool:
-        return all(len(t) == 0 for t in self._tags)
+        return not any((self._get_codes_array(key) >= 0).any() for key in self._codes)
 
     @property
     def size(self) -> int:
-        return len(self._tags)
+        return self._size
 
     def get_available_tags(self) -> dict[str, list[str]]:
-        """Get the complete list of tags with list of values for each"""
-        return TagHelper.get_distinct_values(self._tags)
+        """Get the complete list of tags with list of values for each.
+        The keys and the values are in order of first appearance in the rows.
+        """
+        keys_first_index: list[tuple[int, str]] = []
+        available_tags: dict[str, list[str]] = {}
+        for key in self._codes:
+            codes = self._get_codes_array(key)
+            # distinct codes and the index of their first appearance
+            distinct_codes, first_indexes = np.unique(codes, return_index=True)
+            used = distinct_codes >= 0
+            if not used.any():
+                continue
+
+            distinct_codes = distinct_codes[used]
+            first_indexes = first_indexes[used]
+            order = np.argsort(first_indexes, kind="stable")
+            values = self._values[key]
+            available_tags[key] = [values[code] for code in distinct_codes[order].tolist()]
+            keys_first_index.append((int(first_indexes.min()), key))
+
+        keys_first_index.sort(key=lambda item: item[0])
+        return {key: available_tags[key] for _, key in keys_first_index}
+
+    def get_indexes_by_tags(self, tags: list[dict]) -> list[int]:
+        """Return the sorted indexes of the rows matching the tags.
+        The keys of a dict are combined with AND, the dicts of the list are combined with OR.
+
+        :param tags: list of tags to search
+        :type tags: list[dict]
+        :return: the sorted indexes of the matching rows
+        :rtype: list[int]
+        """
+        mask = np.zeros(self._size, dtype=bool)
+        for tag in tags:
+            tag_mask: np.ndarray | None = None
+            for key, value in tag.items():
+                key_mask = self._get_tag_mask(key, value)
+                tag_mask = key_mask if tag_mask is None else tag_mask & key_mask
+
+                if not tag_mask.any():
+                    break
+
+            if tag_mask is not None:
+                mask |= tag_mask
+
+        return np.flatnonzero(mask).tolist()
+
+    def _init_storage(self, size: int) -> None:
+        self._size = size
+        self._codes = {}
+        self._values = {}
+        self._value_codes = {}
+        self._masks = {}
+
+    def _set_tag(self, index: int, key: str, value: str) -> None:
+        codes = self._codes.get(key)
+        if codes is None:
+            codes = array("i", [-1]) * self._size
+            self._codes[key] = codes
+            self._values[key] = []
+            self._value_codes[key] = {}
+
+        value_codes = self._value_codes[key]
+        code = value_codes.get(value)
+        if code is None:
+            code = len(self._values[key])
+            self._values[key].append(value)
+            value_codes[value] = code
+
+        if codes[index] != code:
+            codes[index] = code
+            self._masks.pop(key, None)
+
+    def _build_tags_at(self, index: int) -> dict[str, str]:
+        return {
+            key: self._values[key][codes[index]]
+            for key, codes in self._codes.items()
+            if codes[index] >= 0
+        }
+
+    def _get_codes_array(self, key: str) -> np.ndarray:
+        # copy the codes so the array can still be resized
+        return np.array(self._codes[key], dtype=np.int32)
+
+    def _get_tag_mask(self, key: str, value: str) -> np.ndarray:
+        """Return the mask of the rows having the tag. The mask is cached, it must not be modified"""
+        if not isinstance(value, str):
+            # tag values are strings, other values never match
+            return np.zeros(self._size, dtype=bool)
+
+        key_masks = self._masks.setdefault(key, {})
+        if value in key_masks:
+            return key_masks[value]
+
+        code = self._value_codes[key].get(value) if key in self._codes else None
+        if code is None:
+            mask = np.zeros(self._size, dtype=bool)
+        else:
+            mask = self._get_codes_array(key) == code
+
+        key_masks[value] = mask
+        return mask
 
     def _check_tag_index(self, index: int) -> None:
         if not isinstance(index, int):
@@ -109,7 +254,7 @@ class TableAxisTags(SerializableObjectJson):
             raise Exception("The tag value must be a string")
 
     def serialize(self) -> dict:
-        return {"tags": self._tags}
+        return {"tags": self.get_all_tags()}
 
     @classmethod
     def deserialize(cls, data: dict) -> "TableAxisTags":
@@ -122,4 +267,4 @@ class TableAxisTags(SerializableObjectJson):
         if not isinstance(__o, TableAxisTags):
             return False
 
-        return Utils.json_equals(self._tags, __o._tags)
+        return Utils.json_equals(self.get_all_tags(), __o.get_all_tags())
@@ -0,0 +1,73 @@
+from collections import OrderedDict
+from threading import Lock
+
+from numpy import ndarray
+
+# Key of a cached sort: resource model id, column name, ascending
+TableSortCacheKey = tuple[str, str, bool]
+
+
+class TableSortCache:
+    """In memory LRU cache of the sort of the saved tables.
+
+    When a saved table is viewed sorted by a column, the positions of the rows in the sorted order
+    (sort permutation) are computed once and kept with the resource model id, the column and the direction as key.
+    The next pages of the view only take the positions of the page from the permutation.
+    The entries of a resource are removed when its content is deleted or when it is archived.
+
+    The cache is bounded by a size budget, the size of an entry is the size of the permutation.
+    """
+
+    # Max total size of the cached permutations in bytes
+    MAX_SIZE: int = 256 * 1024 * 1024
+
+    _entries: OrderedDict[TableSortCacheKey, ndarray] = OrderedDict()
+    _current_size: int = 0
+
+    _lock: Lock = Lock()
+
+    @classmethod
+    def get(cls, key: TableSortCacheKey) -> ndarray | None:
+        """Return the cached permutation, it is shared between the calls and must not be modified"""
+        with cls._lock:
+            positions = cls._entries.get(key)
+            if positions is not None:
+                # mark the entry as recently used
+                cls._entries.move_to_end(key)
+            return positions
+
+    @classmethod
+    def set(cls, key: TableSortCacheKey, positions: ndarray) -> None:
+        if positions.nbytes > cls.MAX_SIZE:
+            return
+
+        with cls._lock:
+            cls._remove_entry(key)
+            cls._entries[key] = positions
+            cls._current_size += positions.nbytes
+
+            # evict the least recently used entries
+            while cls._current_size > cls.MAX_SIZE and cls._entries:
+                cls._remove_entry(next(iter(cls._entries)))
+
+    @classmethod
+    def invalidate_resource(cls, resource_model_id: str) -> None:
+        with cls._lock:
+            for key in [key for key in cls._entries if key[0] == resource_model_id]:
+                cls._remove_entry(key)
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._entries.clear()
+            cls._current_size = 0
+
+    @classmethod
+    def get_current_size(cls) -> int:
+        return cls._current_size
+
+    @classmethod
+    def _remove_entry(cls, key: TableSortCacheKey) -> None:
+        positions = cls._entries.pop(key, None)
+        if positions is not None:
+            cls._current_size -= positions.nbytes
@@ -65,9 +65,9 @@ class TableExporter(ResourceExporter):
             sep = ","
 
         if file_format in Table.ALLOWED_XLS_FILE_FORMATS:
-            source.get_data().to_excel(file_path)
+            source.get_data_view().to_excel(file_path)
         elif file_format in Table.ALLOWED_TXT_FILE_FORMATS:
-            source.get_data().to_csv(
+            source.get_data_view().to_csv(
                 file_path,
                 sep=sep,
                 header=params.get_value("write_header"),
@@ -35,7 +35,7 @@ class TableColumnAggregator(Transformer):
 
     def transform(self, source: Table, params: ConfigParams) -> Table:
         data = DataframeAggregatorHelper.aggregate(
-            data=source.get_data(),
+            data=source.get_data_view(),
             direction="vertical",
             func=params["function"],
             skip_nan=params["skip_nan"],
@@ -74,7 +74,7 @@ class TableRowAggregator(Transformer):
 
     def transform(self, source: Table, params: ConfigParams) -> Table:
         data = DataframeAggregatorHelper.aggregate(
-            data=source.get_data(),
+            data=source.get_data_view(),
             direction="horizontal",
             func=params["function"],
             skip_nan=params["skip_nan"],
@@ -69,7 +69,7 @@ class TableColumnAggregatorFilter(Transformer):
     )
 
     def transform(self, source: Table, params: ConfigParams) -> Table:
-        data: DataFrame = source.get_data()
+        data: DataFrame = source.get_data_view()
 
         for _filter in params["aggregation_filter"]:
             data = DataframeDataFilterHelper.filter_columns_by_aggregated_values(
@@ -120,7 +120,7 @@ class TableRowAggregatorFilter(Transformer):
     )
 
     def transform(self, source: Table, params: ConfigParams) -> Table:
-        data: DataFrame = source.get_data()
+        data: DataFrame = source.get_data_view()
 
         for _filter in params["aggregation_filter"]:
             data = DataframeDataFilterHelper.filter_rows_by_aggregated_values(
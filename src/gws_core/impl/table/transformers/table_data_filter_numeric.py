@@ -61,7 +61,7 @@ class TableColumnDataNumericFilter(Transformer):
     )
 
     def transform(self, source: Table, params: ConfigParams) -> Table:
-        data: DataFrame = source.get_data()
+        data: DataFrame = source.get_data_view()
 
         for numeric_params in params.get("numeric_filter"):
             data = DataframeDataFilterHelper.filter_columns_numeric(
@@ -114,7 +114,7 @@ class TableRowDataNumericFilter(Transformer):
     )
 
     def transform(self, source: Table, params: ConfigParams) -> Table:
-        data: DataFrame = source.get_data()
+        data: DataFrame = source.get_data_view()
 
         for numeric_params in params.get("numeric_filter"):
             data = DataframeDataFilterHelper.filter_rows_numeric(
@@ -62,7 +62,7 @@ class TableColumnDataTextFilter(Transformer):
     )
 
     def transform(self, source: Table, params: ConfigParams) -> Table:
-        data: DataFrame = source.get_data()
+        data: DataFrame = source.get_data_view()
 
         for text_params in params.get("text_filter"):
             data = DataframeDataFilterHelper.filter_columns_text(
@@ -120,7 +120,7 @@ class TableRowDataTextFilter(Transformer):
     )
 
     def transform(self, source: Table, params: ConfigParams) -> Table:
-        data: DataFrame = source.get_data()
+        data: DataFrame = source.get_data_view()
 
         if params.get("stringify_table"):
             data = DataframeHelper.stringify(data)
@@ -125,7 +125,7 @@ class TableColumnMassOperations(Task):
 
         result = TableOperationHelper.column_mass_operations(
             table,
-            operation_table.get_data(),
+            operation_table.get_data_view(),
             operation_name_column=params.get("name_column"),
             operation_calculations_column=params.get("calculations_column"),
             replace_unknown_column=option,
@@ -10,7 +10,7 @@ class TableNumberValidator(IOValidator):
     resource_type: type[Resource] = Table
 
     def validate(self, resource: Table) -> None:
-        dataframe: DataFrame = resource.get_data()
+        dataframe: DataFrame = resource.get_data_view()
 
         # check that all columns are numeric and if not raise an exception
         # with all columns that are not numeric
@@ -53,8 +53,9 @@ class BaseTableView(View):
         return self._table
 
     def check_column_names(self, column_names):
+        table_column_names = set(self._table.column_names)
         for name in column_names:
-            if name is not None and name not in self._table.get_data().columns:
+            if name is not None and name not in table_column_names:
                 raise BadRequestException(f"The column name '{name}' is not valid")
 
     def get_values_from_columns(self, column_names: list[str]) -> list[Any]:
@@ -65,7 +66,8 @@ class BaseTableView(View):
     def get_dataframe_from_columns(self, column_names: list[str]) -> DataFrame:
         """Extract a new dataframe"""
         self.check_column_names(column_names)
-        return self._table.get_data()[column_names]
+        # only load the selected columns
+        return self._table.get_sub_data(column_names)
 
     def get_values_from_coords(self, ranges: list[CellRange]) -> list[Any]:
         """Get flattened values from a list of ranges"""
@@ -81,12 +83,13 @@ class BaseTableView(View):
 
     def get_dataframe_from_coords(self, range: CellRange) -> DataFrame:
         """Get a dataframe from a single range"""
-        df = self._table.get_data()
-
-        return df.iloc[
-            range.get_from().row : range.get_to().row + 1,
-            range.get_from().column : range.get_to().column + 1,
-        ]
+        # only load the selected columns and rows
+        column_names = self._table.get_column_names(
+            range.get_from().column, range.get_to().column + 1
+        )
+        return self._table.get_sub_data(
+            column_names, range.get_from().row, range.get_to().row + 1
+        )
 
     def get_values_from_selection_range(self, selection_range: TableSelection) -> list[Any]:
         """Get table flattened value form a SelectionRange"""
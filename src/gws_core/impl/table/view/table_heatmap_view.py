@@ -82,7 +82,7 @@ class TableHeatmapView(BaseTableView):
         view.y_label = params.get_value("y_axis_label")
 
         view.set_data(
-            data=table.get_data(),
+            data=table.get_data_view(),
             rows_info=table.get_rows_info(),
             columns_info=table.get_columns_info(),
         )
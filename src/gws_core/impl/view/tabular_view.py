@@ -5,6 +5,8 @@ from typing import TYPE_CHECKING, Literal
 from pandas import DataFrame
 
 from gws_core.impl.table.helper.dataframe_helper import DataframeHelper
+from gws_core.impl.table.helper.table_sort_helper import TableSortHelper
+from gws_core.impl.table.table_types import TableHeaderInfo
 from gws_core.resource.view.view_types import ViewType
 
 from ...config.config_params import ConfigParams
@@ -115,19 +117,25 @@ class TabularView(View):
         safe_to_row = self._get_safe_to_row()
         safe_to_column = self._get_safe_to_column()
 
-        dataframe: DataFrame = self._table.get_data()
+        # only load the columns of the page
+        column_names = self._table.get_column_names(safe_from_column, safe_to_column)
 
-        # sort the dataframe if needed
+        sub_dataframe: DataFrame
+        rows_info: list[TableHeaderInfo]
         if self.sort_column is not None:
-            dataframe = dataframe.sort_values(
-                by=self.sort_column, ascending=self.sort_direction == "Ascending"
-            )
-
-        # get the sub dataframe
-        sub_dataframe = dataframe.iloc[
-            safe_from_row:safe_to_row,
-            safe_from_column:safe_to_column,
-        ]
+            # only the sort column is fully loaded, then only the rows of the page are loaded
+            row_indexes = TableSortHelper.get_sorted_row_indexes(
+                self._table,
+                self.sort_column,
+                self.sort_direction == "Ascending",
+                safe_from_row,
+                safe_to_row,
+            ).tolist()
+            sub_dataframe = self._table.get_sub_data_by_row_indexes(row_indexes, column_names)
+            rows_info = self._table.get_rows_info_by_indexes(row_indexes)
+        else:
+            sub_dataframe = self._table.get_sub_data(column_names, safe_from_row, safe_to_row)
+            rows_info = self._table.get_rows_info(safe_from_row, safe_to_row)
 
         # Remove NaN and inf values to convert to json
         replace_nan_by: str = self.replace_nan_by
@@ -155,7 +163,7 @@ class TabularView(View):
 
         return {
             "table": data.to_dict("split")["data"],
-            "rows": self._table.get_rows_info(safe_from_row, safe_to_row),
+            "rows": rows_info,
             "columns": self._table.get_columns_info(safe_from_column, safe_to_column),
             "from_row": safe_from_row + 1,  # return 1-based index
             "number_of_rows_per_page": self._get_safe_nb_of_rows_per_page(),
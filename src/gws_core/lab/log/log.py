@@ -1,3 +1,4 @@
+from collections.abc import Iterable, Iterator
 from datetime import date, datetime, timedelta
 from json import loads
 from typing import cast
@@ -6,6 +7,7 @@ from gws_core.core.model.model_dto import BaseModelDTO
 from gws_core.core.utils.date_helper import DateHelper
 from gws_core.core.utils.logger import LogContext, LogFileLine, Logger, MessageType
 from gws_core.lab.log.log_dto import LogCompleteInfoDTO, LogDTO, LogInfo, LogsBetweenDatesDTO
+from gws_core.lab.log.log_file_index import LogFileIndexCache
 
 
 class OldLogFileLine(BaseModelDTO):
@@ -145,15 +147,28 @@ class LogLine:
 
 
 class LogCompleteInfo:
+    """Log file, the lines are read lazily from the file. The lines of a time range or of
+    a request are located with the LogFileIndex of the file so only these lines are parsed.
+    """
+
     log_info: LogInfo
-    content: str
+    file_path: str
+    _content: str | None = None
     _all_lines: list[LogLine] | None = None
 
-    def __init__(self, log_info: LogInfo, content: str) -> None:
+    def __init__(self, log_info: LogInfo, file_path: str) -> None:
         self.log_info = log_info
-        self.content = content
+        self.file_path = file_path
+        self._content = None
         self._all_lines = None
 
+    @property
+    def content(self) -> str:
+        if self._content is None:
+            with open(self.file_path, encoding="UTF-8") as f:
+                self._content = f.read()
+        return self._content
+
     def get_log_file_date(self) -> date:
         name = self.log_info.name
         return Logger.file_name_to_date(name).date()
@@ -184,14 +199,13 @@ class LogCompleteInfo:
         log_lines: list[LogLine] = []
         stop_date: datetime | None = None
 
-        for line in self.content.splitlines():
-            if len(line) == 0:
-                continue
-            log_line = LogLine(line)
-
-            if not log_line.is_valid():
-                continue
+        index = LogFileIndexCache.get_index(self.file_path)
+        offsets = index.get_time_range_offsets(start_time, end_time)
+        # no line in the time range
+        if offsets is None:
+            return log_lines
 
+        for log_line in self._parse_lines(index.iter_lines(*offsets)):
             # if the page date is provided, stop the loop when the nb is reached
             # if the next line is the exact same date ignoring the microseconds add it to the list
             if stop_date is not None and log_line.get_datetime_without_microseconds() != stop_date:
@@ -217,8 +231,12 @@ class LogCompleteInfo:
         if self._all_lines is not None:
             return self._all_lines
 
-        log_lines: list[LogLine] = []
-        for line in self.content.splitlines():
+        self._all_lines = list(self._parse_lines(self.content.splitlines()))
+        return self._all_lines
+
+    def _parse_lines(self, lines: Iterable[str]) -> Iterator[LogLine]:
+        """Parse the lines, the empty and invalid lines are skipped"""
+        for line in lines:
             if len(line) == 0:
                 continue
             log_line = LogLine(line)
@@ -226,10 +244,7 @@ class LogCompleteInfo:
             if not log_line.is_valid():
                 continue
 
-            log_lines.append(log_line)
-
-        self._all_lines = log_lines
-        return log_lines
+            yield log_line
 
     def get_content_as_dto(self) -> list[LogDTO]:
         lines = self._get_all_lines()
@@ -251,7 +266,7 @@ class LogCompleteInfo:
         :return: True if the log contains at least one line with the given request ID
         :rtype: bool
         """
-        return any(log_line.request_id == request_id for log_line in self._get_all_lines())
+        return len(self.get_log_lines_by_request_id(request_id)) > 0
 
     def get_log_lines_by_request_id(self, request_id: str) -> list[LogLine]:
         """Return the list of LogLine for a given request ID.
@@ -261,7 +276,11 @@ class LogCompleteInfo:
         :return: list of log lines matching the request ID
         :rtype: list[LogLine]
         """
-        return [log_line for log_line in self._get_all_lines() if log_line.request_id == request_id]
+        # only the lines indexed for the request are read
+        lines = LogFileIndexCache.get_index(self.file_path).get_request_lines(request_id)
+        return [
+            log_line for log_line in self._parse_lines(lines) if log_line.request_id == request_id
+        ]
 
     def to_dto(self) -> LogCompleteInfoDTO:
         return LogCompleteInfoDTO(log_info=self.log_info, content=self.get_content_as_dto())
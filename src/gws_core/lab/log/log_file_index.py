@@ -0,0 +1,335 @@
+import os
+import re
+from collections import OrderedDict
+from collections.abc import Iterator
+from datetime import datetime
+from threading import Lock
+
+from gws_core.core.utils.date_helper import DateHelper
+from gws_core.core.utils.logger import Logger
+
+
+class LogFileIndex:
+    """Index of a log file that maps the time buckets and the request ids to the byte offsets
+    of the lines, so the lines of a time range or of a request are read without parsing
+    the complete file.
+
+    The index is built incrementally: each update only scans the lines appended since the last
+    update. It is persisted in an append-only sidecar file (in the INDEX_DIR_NAME directory of
+    the log dir), so the index is not rebuilt after a restart. The index is reset if the file was replaced
+    (rotation of the log file) or truncated.
+
+    Sidecar format (one record per line, tab separated):
+    H <inode> <head hex>, B <bucket> <start offset> <end offset>, R <request id> <offset>,
+    S <scanned offset>. The records are only applied up to the last S record (complete update).
+    """
+
+    # Duration of a time bucket in seconds
+    BUCKET_SECONDS = 60
+    READ_CHUNK_SIZE = 1024 * 1024
+    # Number of bytes of the beginning of the file used to detect that the file was replaced
+    HEAD_SIZE = 256
+    INDEX_DIR_NAME = ".index"
+
+    # minute and timezone of the timestamp of a json log line,
+    # the seconds are ignored because the bucket is a minute
+    _TIMESTAMP_PATTERN = re.compile(
+        rb'"timestamp":\s*"(\d{4}-\d\d-\d\d[T ]\d\d:\d\d)[0-9:.]*([^"]*)"'
+    )
+    _REQUEST_ID_PATTERN = re.compile(rb'"request_id":\s*"([^"\\\t]*)"')
+
+    file_path: str
+    sidecar_path: str
+
+    _inode: int | None
+    _head: bytes
+    _scanned_offset: int
+    # bucket -> [offset of the first line, end offset of the last line]
+    _buckets: dict[int, list[int]]
+    # request id -> offsets of the lines
+    _request_offsets: dict[str, list[int]]
+    # cache of the bucket of the timestamps (minute, timezone)
+    _bucket_cache: dict[tuple[bytes, bytes], int]
+
+    _lock: Lock
+
+    def __init__(self, file_path: str) -> None:
+        self.file_path = file_path
+        self.sidecar_path = os.path.join(
+            os.path.dirname(file_path), self.INDEX_DIR_NAME, os.path.basename(file_path) + ".idx"
+        )
+        self._bucket_cache = {}
+        self._lock = Lock()
+        self._reset(None, b"")
+        self._load_sidecar()
+
+    def update(self) -> None:
+        """Index the lines appended to the file since the last update"""
+        with self._lock:
+            try:
+                with open(self.file_path, "rb") as file:
+                    stat = os.fstat(file.fileno())
+                    head = file.read(self.HEAD_SIZE)
+
+                    if (
+                        stat.st_ino != self._inode
+                        or stat.st_size < self._scanned_offset
+                        or head[: len(self._head)] != self._head
+                        or not self._is_line_end(file, self._scanned_offset)
+                    ):
+                        # new file (rotated) or truncated file, rebuild the index
+                        self._reset(stat.st_ino, head)
+                        self._write_sidecar_header()
+
+                    if stat.st_size > self._scanned_offset:
+                        self._scan(file)
+            except FileNotFoundError:
+                self._reset(None, b"")
+
+    def get_time_range_offsets(
+        self, start_time: datetime, end_time: datetime
+    ) -> tuple[int, int] | None:
+        """Return the byte range that contains all the lines between start_time and end_time
+        (the range can contain other lines), None if no line is in the time range.
+
+        :return: the start offset and the end offset of the range
+        :rtype: tuple[int, int] | None
+        """
+        start_bucket = int(start_time.timestamp()) // self.BUCKET_SECONDS
+        end_bucket = int(end_time.timestamp()) // self.BUCKET_SECONDS
+
+        with self._lock:
+            offsets = [
+                offsets
+                for bucket, offsets in self._buckets.items()
+                if start_bucket <= bucket <= end_bucket
+            ]
+        if not offsets:
+            return None
+        return min(offset[0] for offset in offsets), max(offset[1] for offset in offsets)
+
+    def get_request_lines(self, request_id: str) -> list[str]:
+        """Return the lines that contain the request id"""
+        with self._lock:
+            offsets = list(dict.fromkeys(self._request_offsets.get(request_id, [])))
+
+        lines: list[str] = []
+        with open(self.file_path, "rb") as file:
+            for offset in sorted(offsets):
+                file.seek(offset)
+                lines.append(file.readline().decode("utf-8", errors="replace").rstrip("\n"))
+        return lines
+
+    def iter_lines(self, start_offset: int = 0, end_offset: int | None = None) -> Iterator[str]:
+        """Read the lines of the file between the offsets, the lines are read lazily"""
+        with open(self.file_path, "rb") as file:
+            file.seek(start_offset)
+            offset = start_offset
+            for line in file:
+                if end_offset is not None and offset >= end_offset:
+                    return
+                offset += len(line)
+                yield line.decode("utf-8", errors="replace").rstrip("\n")
+
+    def _is_line_end(self, file, offset: int) -> bool:
+        """Check that the scanned offset is still the end of a line"""
+        if offset == 0:
+            return True
+        file.seek(offset - 1)
+        return file.read(1) == b"\n"
+
+    def _reset(self, inode: int | None, head: bytes) -> None:
+        self._inode = inode
+        self._head = head
+        self._scanned_offset = 0
+        self._buckets = {}
+        self._request_offsets = {}
+
+    def _scan(self, file) -> None:
+        """Scan the complete lines after the scanned offset and add them to the index"""
+        file.seek(self._scanned_offset)
+        offset = self._scanned_offset
+        new_buckets: dict[int, list[int]] = {}
+        new_requests: list[tuple[str, int]] = []
+
+        remaining = b""
+        while chunk := file.read(self.READ_CHUNK_SIZE):
+            lines = (remaining + chunk).split(b"\n")
+            # the last line is not complete (or empty), it is read with the next chunk
+            remaining = lines.pop()
+            for line in lines:
+                line_end = offset + len(line) + 1
+                bucket, request_id = self._parse_line(line)
+                if bucket is not None:
+                    bucket_offsets = new_buckets.get(bucket)
+                    if bucket_offsets is None:
+                        new_buckets[bucket] = [offset, line_end]
+                    else:
+                        bucket_offsets[1] = line_end
+                if request_id:
+                    new_requests.append((request_id, offset))
+                offset = line_end
+
+        # a line being written is indexed on the next update
+        self._scanned_offset = offset
+        self._merge(new_buckets, new_requests)
+        self._append_sidecar(new_buckets, new_requests)
+
+    def _merge(self, buckets: dict[int, list[int]], requests: list[tuple[str, int]]) -> None:
+        for bucket, (start, end) in buckets.items():
+            offsets = self._buckets.get(bucket)
+            if offsets is None:
+                self._buckets[bucket] = [start, end]
+            else:
+                offsets[0] = min(offsets[0], start)
+                offsets[1] = max(offsets[1], end)
+        for request_id, offset in requests:
+            self._request_offsets.setdefault(request_id, []).append(offset)
+
+    def _parse_line(self, line: bytes) -> tuple[int | None, str | None]:
+        """Return the time bucket and the request id of a line"""
+        if not line.strip():
+            return None, None
+
+        match = self._TIMESTAMP_PATTERN.search(line)
+        if match is None:
+            return self._parse_line_slow(line)
+
+        key = (match.group(1), match.group(2))
+        bucket = self._bucket_cache.get(key)
+        if bucket is None:
+            try:
+                date_time = DateHelper.convert_datetime_to_utc(
+                    DateHelper.from_iso_str((key[0] + b":00" + key[1]).decode())
+                )
+            except ValueError:
+                return self._parse_line_slow(line)
+            bucket = int(date_time.timestamp()) // self.BUCKET_SECONDS
+            self._bucket_cache[key] = bucket
+
+        request_id = None
+        # the request id is the last field of the line
+        request_position = line.rfind(b'"request_id"')
+        if request_position != -1:
+            request_match = self._REQUEST_ID_PATTERN.match(line, request_position)
+            if request_match:
+                request_id = request_match.group(1).decode("utf-8", errors="replace")
+        return bucket, request_id
+
+    def _parse_line_slow(self, line: bytes) -> tuple[int | None, str | None]:
+        """Parse the line with LogLine (old format or unexpected timestamp format)"""
+        # pylint: disable=import-outside-toplevel
+        from gws_core.lab.log.log import LogLine
+
+        try:
+            log_line = LogLine(line.decode("utf-8", errors="replace"))
+            if not log_line.is_valid():
+                return None, None
+        except (ValueError, AttributeError):
+            return None, None
+
+        request_id = log_line.request_id
+        if request_id and ("\t" in request_id or "\n" in request_id):
+            request_id = None
+        return int(log_line.date_time.timestamp()) // self.BUCKET_SECONDS, request_id
+
+    ########################################## SIDECAR ##########################################
+
+    def _load_sidecar(self) -> None:
+        try:
+            with open(self.sidecar_path, encoding="utf-8") as sidecar:
+                records = sidecar.read().split("\n")
+        except OSError:
+            return
+
+        if not records or not records[0].startswith("H\t"):
+            return
+        _, inode, head = records[0].split("\t")
+
+        buckets: dict[int, list[int]] = {}
+        requests: list[tuple[str, int]] = []
+        scanned_offset = 0
+        applied_buckets: dict[int, list[int]] = {}
+        applied_requests: list[tuple[str, int]] = []
+        try:
+            for record in records[1:]:
+                values = record.split("\t")
+                if values[0] == "B":
+                    start, end = int(values[2]), int(values[3])
+                    offsets = buckets.setdefault(int(values[1]), [start, end])
+                    offsets[0], offsets[1] = min(offsets[0], start), max(offsets[1], end)
+                elif values[0] == "R":
+                    requests.append((values[1], int(values[2])))
+                elif values[0] == "S":
+                    # the records are complete up to this record
+                    scanned_offset = int(values[1])
+                    applied_buckets = {bucket: list(offsets) for bucket, offsets in buckets.items()}
+                    applied_requests = list(requests)
+        except (ValueError, IndexError):
+            # last update partially written
+            pass
+
+        self._reset(int(inode), bytes.fromhex(head))
+        self._merge(applied_buckets, applied_requests)
+        self._scanned_offset = scanned_offset
+
+    def _write_sidecar_header(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.sidecar_path), exist_ok=True)
+            with open(self.sidecar_path, "w", encoding="utf-8") as sidecar:
+                sidecar.write(f"H\t{self._inode}\t{self._head.hex()}\n")
+        except OSError as err:
+            Logger.debug(f"Cannot write the log index '{self.sidecar_path}': {err}")
+
+    def _append_sidecar(
+        self, buckets: dict[int, list[int]], requests: list[tuple[str, int]]
+    ) -> None:
+        records = [f"B\t{bucket}\t{start}\t{end}\n" for bucket, (start, end) in buckets.items()]
+        records += [f"R\t{request_id}\t{offset}\n" for request_id, offset in requests]
+        records.append(f"S\t{self._scanned_offset}\n")
+        try:
+            if not os.path.exists(self.sidecar_path):
+                self._write_sidecar_header()
+            # written in a single call so the update is complete or ignored on load
+            with open(self.sidecar_path, "a", encoding="utf-8") as sidecar:
+                sidecar.write("".join(records))
+        except OSError as err:
+            Logger.debug(f"Cannot write the log index '{self.sidecar_path}': {err}")
+
+
+class LogFileIndexCache:
+    """In memory LRU cache of the LogFileIndex of the log files"""
+
+    # Max number of log files in the cache
+    MAX_ENTRIES: int = 50
+
+    _entries: OrderedDict[str, LogFileIndex] = OrderedDict()
+
+    _lock: Lock = Lock()
+
+    @classmethod
+    def get_index(cls, file_path: str) -> LogFileIndex:
+        """Return the index of the log file, updated with the lines appended to the file
+
+        :param file_path: path of the log file
+        :type file_path: str
+        :return: the index of the file
+        :rtype: LogFileIndex
+        """
+        with cls._lock:
+            index = cls._entries.get(file_path)
+            if index is None:
+                index = LogFileIndex(file_path)
+                cls._entries[file_path] = index
+            cls._entries.move_to_end(file_path)
+
+            while len(cls._entries) > cls.MAX_ENTRIES:
+                cls._entries.popitem(last=False)
+
+        index.update()
+        return index
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._entries.clear()
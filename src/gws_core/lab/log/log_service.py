@@ -41,10 +41,7 @@ class LogService:
         log_folder = Settings.get_instance().get_log_dir()
         log_file_path = os.path.join(log_folder, node_name)
 
-        with open(log_file_path, encoding="UTF-8") as f:
-            content = f.read()
-
-        return LogCompleteInfo(log_info, content)
+        return LogCompleteInfo(log_info, log_file_path)
 
     @classmethod
     def get_log_info(cls, node_name: str) -> LogInfo | None:
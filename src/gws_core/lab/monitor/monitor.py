@@ -75,6 +75,10 @@ class Monitor(Model):
     def get_last(cls):
         return Monitor.select().order_by(Monitor.created_at.desc()).get()
 
+    @classmethod
+    def get_last_or_none(cls) -> "Monitor | None":
+        return Monitor.select().order_by(Monitor.created_at.desc()).first()
+
     @classmethod
     def get_current(cls):
         monitor = Monitor()
@@ -5,6 +5,8 @@ from gws_core.lab.monitor.monitor_dto import (
     DiskFolderSizesDTO,
     MonitorBetweenDateGraphicsDTO,
 )
+from gws_core.resource.view.view_dto import ViewResultCacheStatsDTO
+from gws_core.resource.view.view_result_cache import ViewResultCache
 
 from ...core_controller import core_app
 from ...user.authorization_service import AuthorizationService
@@ -44,3 +46,13 @@ def get_folder_sizes(
     Uses parallel 'du -sb' subprocess calls for efficiency on large directories.
     """
     return MonitorService.get_folder_sizes()
+
+
+@core_app.get("/monitor/view-cache", tags=["Lab"], summary="Get view cache stats")
+def get_view_cache_stats(
+    _=Depends(AuthorizationService.check_user_access_token),
+) -> ViewResultCacheStatsDTO:
+    """
+    Get the statistics (hits, misses, size) of the cache of the resource views.
+    """
+    return ViewResultCache.get_stats()
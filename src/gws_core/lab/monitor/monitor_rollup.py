@@ -0,0 +1,38 @@
+from typing import Any
+
+from peewee import FloatField, IntegerField
+
+from gws_core.core.model.db_field import DateTimeUTC, JSONField
+
+from ...core.model.model import Model
+
+
+class MonitorRollup(Model):
+    """
+    Aggregation of the Monitor data over a time bucket (for example 1 minute or 1 hour).
+
+    The values are the mean of the values of the bucket, the data contains the mean
+    of the all_cpu_percent. The rollups are used to display the monitor data of
+    long periods without loading every Monitor.
+    """
+
+    # duration of the bucket in seconds
+    resolution = IntegerField(null=False)
+    bucket_start = DateTimeUTC(null=False)
+    # number of Monitor in the bucket
+    sample_count = IntegerField(null=False)
+
+    cpu_percent = FloatField(default=0)
+    disk_usage_percent = FloatField(default=0)
+    ram_usage_percent = FloatField(default=0)
+    swap_memory_percent = FloatField(default=0)
+    net_io_bytes_sent = FloatField(default=0)
+    net_io_bytes_recv = FloatField(default=0)
+    gpu_temperature = FloatField(default=0)
+
+    data: dict[str, Any] = JSONField(null=True)
+
+    class Meta:
+        table_name = "gws_lab_monitor_rollup"
+        is_table = True
+        indexes = ((("resolution", "bucket_start"), True),)
@@ -1,19 +1,22 @@
 import asyncio
 import os
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from time import sleep
 
+import numpy as np
 import plotly.express as px
-from pandas import DataFrame, Series, Timedelta, concat, to_datetime
+from pandas import DataFrame, Timedelta, concat, to_datetime
 
 from gws_core.core.db.thread_db import ThreadDb
 from gws_core.core.utils.date_helper import DateHelper
 from gws_core.core.utils.logger import Logger
+from gws_core.core.utils.numeric_helper import NumericHelper
 from gws_core.core.utils.settings import Settings
 from gws_core.impl.plotly.plotly_r_field import PlotlyRField
 from gws_core.impl.plotly.plotly_resource import PlotlyResource
 
 from .monitor import Monitor
+from .monitor_rollup import MonitorRollup
 from .monitor_dto import (
     CurrentMonitorDTO,
     DiskFolderSizesDTO,
@@ -33,6 +36,28 @@ class MonitorService:
     DEFAULT_MIN_FREE_DISK_SPACE = 5 * 1024 * 1024 * 1024  # 5GB
     DEFAULT_MAX_FREE_DISK_SPACE = 20 * 1024 * 1024 * 1024  # 20GB
 
+    # Resolutions in seconds of the MonitorRollup, maintained by the monitor tick.
+    # The first resolution is computed from the Monitor, the next ones from the previous one
+    ROLLUP_RESOLUTIONS = [60, 3600]
+    # Number of days the rollups are kept for each resolution
+    ROLLUP_RETENTION_DAYS = {60: 90, 3600: 730}
+
+    # Max number of points loaded to build the graphics, a coarser resolution is used above
+    MAX_LOADED_POINTS = 20000
+    # Max number of points of the graphics, the points are downsampled with LTTB above
+    MAX_GRAPH_POINTS = 1000
+
+    # Columns of the graphics, stored in the Monitor and in the MonitorRollup
+    GRAPH_COLUMNS = [
+        "cpu_percent",
+        "disk_usage_percent",
+        "ram_usage_percent",
+        "swap_memory_percent",
+        "net_io_bytes_sent",
+        "net_io_bytes_recv",
+        "gpu_temperature",
+    ]
+
     @classmethod
     def init(cls):
         if not cls._is_initialized:
@@ -54,6 +79,7 @@ class MonitorService:
         while cls._is_initialized:
             try:
                 MonitorService.save_current_monitor()
+                MonitorService.update_rollups()
             except Exception as err:
                 Logger.error(f"Error while saving current monitor : {str(err)}")
 
@@ -145,31 +171,12 @@ class MonitorService:
         from_date = from_date - timedelta(seconds=seconds_margin)
         to_date = to_date + timedelta(seconds=seconds_margin)
 
-        monitors = list(
-            Monitor.select()
-            .where(Monitor.created_at >= from_date, Monitor.created_at <= to_date)
-            .order_by(Monitor.created_at)
-        )
-
-        if len(monitors) == 0:
-            raise Exception("No monitor data found between the given dates")
-
-        # vars transform the dto object to a dict
-        df = DataFrame([vars(monitor.to_dto()) for monitor in monitors])
+        df = cls.get_monitor_data_frame_between_dates(from_date, to_date)
 
         if df.empty:
-            return MonitorBetweenDateGraphicsDTO(
-                from_date=from_date,
-                to_date=to_date,
-                main_figure={},
-                cpu_figure={},
-                network_figure={},
-                gpu_figure={},
-                gpu_enabled=Settings.gpu_is_available(),
-            )
+            raise Exception("No monitor data found between the given dates")
 
         # Add the utc number to the date if needed for plotly to display the correct date
-        df["created_at"] = to_datetime(df["created_at"], utc=True)
         if utc_number != 0:
             df["created_at"] = df["created_at"] + Timedelta(hours=utc_number)
 
@@ -188,7 +195,10 @@ class MonitorService:
         )
 
         # Create the cpu figure
-        df_cpu = df["data"].apply(lambda x: Series(x["all_cpu_percent"]))
+        df_cpu = DataFrame(
+            [data.get("all_cpu_percent", []) if data else [] for data in df["data"]],
+            index=df.index,
+        )
         df_cpu_columns = [f"CPU {i} (%)" for i in range(len(df_cpu.columns))]
         df_cpu.columns = df_cpu_columns
         df_cpu = concat([df["created_at"], df_cpu], axis=1)
@@ -225,6 +235,204 @@ class MonitorService:
             gpu_enabled=Settings.gpu_is_available(),
         )
 
+    @classmethod
+    def get_monitor_data_frame_between_dates(
+        cls, from_date: datetime, to_date: datetime
+    ) -> DataFrame:
+        """Return the monitor data between the dates with the columns created_at (UTC),
+        the GRAPH_COLUMNS and data. The finest resolution (Monitor or MonitorRollup) that
+        loads at most MAX_LOADED_POINTS is used and the points are downsampled to MAX_GRAPH_POINTS.
+        """
+        range_seconds = (to_date - from_date).total_seconds()
+        resolutions: list[int | None] = [None] + cls.ROLLUP_RESOLUTIONS
+
+        rows: list[tuple] = []
+        for resolution in resolutions:
+            tier_resolution = resolution or Settings.get_monitor_tick_interval_log()
+            if (
+                range_seconds / tier_resolution > cls.MAX_LOADED_POINTS
+                and resolution != resolutions[-1]
+            ):
+                continue
+
+            tier_rows = cls._get_graph_rows(resolution, from_date, to_date)
+            # use the coarser resolution only if it has older data (the Monitor are cleaned
+            # before the rollups), the first bucket must end before the current first point
+            if tier_rows and (
+                not rows or tier_rows[0][0] + timedelta(seconds=tier_resolution) <= rows[0][0]
+            ):
+                rows = tier_rows
+
+            # stop if the resolution contains the beginning of the range
+            if rows and rows[0][0].timestamp() <= from_date.timestamp() + 2 * tier_resolution:
+                break
+
+        df = DataFrame.from_records(rows, columns=["created_at", *cls.GRAPH_COLUMNS, "data"])
+        if df.empty:
+            return df
+
+        df["created_at"] = to_datetime(df["created_at"], utc=True)
+        return cls._downsample_data_frame(df)
+
+    @classmethod
+    def _get_graph_rows(
+        cls, resolution: int | None, from_date: datetime, to_date: datetime
+    ) -> list[tuple]:
+        """Return the rows (date, GRAPH_COLUMNS, data) of the Monitor if resolution is None,
+        otherwise of the MonitorRollup of the resolution followed by the Monitor after
+        the last rollup (bucket not complete).
+        """
+        if resolution is None:
+            return cls._get_monitor_rows(from_date, to_date)
+
+        rollup_columns = [getattr(MonitorRollup, column) for column in cls.GRAPH_COLUMNS]
+        rows: list[tuple] = list(
+            MonitorRollup.select(MonitorRollup.bucket_start, *rollup_columns, MonitorRollup.data)
+            .where(
+                MonitorRollup.resolution == resolution,
+                # include the bucket that contains the from_date
+                MonitorRollup.bucket_start > from_date - timedelta(seconds=resolution),
+                MonitorRollup.bucket_start <= to_date,
+            )
+            .order_by(MonitorRollup.bucket_start)
+            .tuples()
+        )
+
+        if rows:
+            rows += cls._get_monitor_rows(rows[-1][0] + timedelta(seconds=resolution), to_date)
+        return rows
+
+    @classmethod
+    def _get_monitor_rows(cls, from_date: datetime, to_date: datetime) -> list[tuple]:
+        monitor_columns = [getattr(Monitor, column) for column in cls.GRAPH_COLUMNS]
+        return list(
+            Monitor.select(Monitor.created_at, *monitor_columns, Monitor.data)
+            .where(Monitor.created_at >= from_date, Monitor.created_at <= to_date)
+            .order_by(Monitor.created_at)
+            .tuples()
+        )
+
+    @classmethod
+    def _downsample_data_frame(cls, df: DataFrame) -> DataFrame:
+        """Downsample the rows to MAX_GRAPH_POINTS with LTTB. The points are selected for each
+        column so the peaks of every graphic are kept."""
+        if len(df) <= cls.MAX_GRAPH_POINTS:
+            return df
+
+        x = df["created_at"].astype("int64").to_numpy()
+        points_by_column = max(cls.MAX_GRAPH_POINTS // len(cls.GRAPH_COLUMNS), 3)
+        indexes = np.unique(
+            np.concatenate(
+                [
+                    NumericHelper.lttb_downsample_indexes(x, df[column], points_by_column)
+                    for column in cls.GRAPH_COLUMNS
+                ]
+            )
+        )
+        return df.iloc[indexes].reset_index(drop=True)
+
+    ######################################### ROLLUPS #########################################
+
+    @classmethod
+    def update_rollups(cls, now: datetime | None = None) -> None:
+        """Create the MonitorRollup of the complete buckets that are not rolled up yet.
+        The first resolution is computed from the Monitor, the next ones from the rollups
+        of the previous resolution.
+        """
+        now_timestamp = (now or DateHelper.now_utc()).timestamp()
+        source_resolution: int | None = None
+
+        for resolution in cls.ROLLUP_RESOLUTIONS:
+            # the buckets before the end are complete
+            end = cls._timestamp_to_date(now_timestamp // resolution * resolution)
+
+            last_rollup: MonitorRollup | None = (
+                MonitorRollup.select(MonitorRollup.bucket_start)
+                .where(MonitorRollup.resolution == resolution)
+                .order_by(MonitorRollup.bucket_start.desc())
+                .first()
+            )
+            start = (
+                last_rollup.bucket_start + timedelta(seconds=resolution)
+                if last_rollup
+                else None
+            )
+
+            if start is None or start < end:
+                rows = cls._get_rollup_source_rows(source_resolution, start, end)
+                MonitorRollup.insert_all(cls._build_rollups(rows, resolution))
+
+            source_resolution = resolution
+
+    @classmethod
+    def _get_rollup_source_rows(
+        cls, source_resolution: int | None, start: datetime | None, end: datetime
+    ) -> list[tuple]:
+        """Return the rows (date, sample count, GRAPH_COLUMNS, data) of the Monitor
+        if source_resolution is None, otherwise of the MonitorRollup of the resolution
+        """
+        if source_resolution is None:
+            monitor_columns = [getattr(Monitor, column) for column in cls.GRAPH_COLUMNS]
+            query = Monitor.select(Monitor.created_at, *monitor_columns, Monitor.data).where(
+                Monitor.created_at < end
+            )
+            if start is not None:
+                query = query.where(Monitor.created_at >= start)
+            # a Monitor is one sample
+            return [(row[0], 1, *row[1:]) for row in query.order_by(Monitor.created_at).tuples()]
+
+        rollup_columns = [getattr(MonitorRollup, column) for column in cls.GRAPH_COLUMNS]
+        query = MonitorRollup.select(
+            MonitorRollup.bucket_start, MonitorRollup.sample_count, *rollup_columns,
+            MonitorRollup.data,
+        ).where(MonitorRollup.resolution == source_resolution, MonitorRollup.bucket_start < end)
+        if start is not None:
+            query = query.where(MonitorRollup.bucket_start >= start)
+        return list(query.order_by(MonitorRollup.bucket_start).tuples())
+
+    @classmethod
+    def _build_rollups(cls, rows: list[tuple], resolution: int) -> list[MonitorRollup]:
+        """Build the rollups of the rows (sorted by date), the values are the mean of
+        the values of the bucket weighted by the sample count"""
+        if not rows:
+            return []
+
+        buckets = np.array([int(row[0].timestamp()) // resolution for row in rows])
+        weights = np.array([row[1] for row in rows], dtype=float)
+        values = np.nan_to_num(np.array([row[2:-1] for row in rows], dtype=float))
+        # the number of cpu can change, the missing values are NaN
+        all_cpu_percent = DataFrame(
+            [row[-1].get("all_cpu_percent", []) if row[-1] else [] for row in rows]
+        ).to_numpy(dtype=float)
+        cpu_weights = ~np.isnan(all_cpu_percent) * weights[:, None]
+
+        # the rows are sorted so the rows of a bucket are contiguous
+        starts = np.flatnonzero(np.diff(buckets, prepend=buckets[0] - 1))
+        sample_counts = np.add.reduceat(weights, starts)
+        means = np.add.reduceat(values * weights[:, None], starts) / sample_counts[:, None]
+        cpu_sums = np.add.reduceat(np.nan_to_num(all_cpu_percent) * weights[:, None], starts)
+        cpu_counts = np.add.reduceat(cpu_weights, starts)
+
+        rollups: list[MonitorRollup] = []
+        for i, start in enumerate(starts):
+            has_cpu = cpu_counts[i] > 0
+            rollups.append(
+                MonitorRollup(
+                    resolution=resolution,
+                    bucket_start=cls._timestamp_to_date(buckets[start] * resolution),
+                    sample_count=int(sample_counts[i]),
+                    data={
+                        "all_cpu_percent": (cpu_sums[i][has_cpu] / cpu_counts[i][has_cpu]).tolist()
+                    },
+                    **{column: float(mean) for column, mean in zip(cls.GRAPH_COLUMNS, means[i])},
+                )
+            )
+        return rollups
+
+    @staticmethod
+    def _timestamp_to_date(timestamp: float) -> datetime:
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
     @classmethod
     def cleanup_old_monitor_data(cls):
         # Keep only last x records
@@ -235,10 +443,16 @@ class MonitorService:
             .first()
         )
 
-        if monitor is None:
-            return
-        # Delete all record older
-        Monitor.delete().where(Monitor.created_at <= monitor.created_at).execute()
+        if monitor is not None:
+            # Delete all record older
+            Monitor.delete().where(Monitor.created_at <= monitor.created_at).execute()
+
+        # Delete the rollups older than the retention of their resolution
+        for resolution, retention_days in cls.ROLLUP_RETENTION_DAYS.items():
+            MonitorRollup.delete().where(
+                MonitorRollup.resolution == resolution,
+                MonitorRollup.bucket_start < DateHelper.now_utc() - timedelta(days=retention_days),
+            ).execute()
 
     @classmethod
     def get_folder_sizes(cls) -> DiskFolderSizesDTO:
@@ -2,6 +2,7 @@ from fastapi.param_functions import Depends
 
 from gws_core.core.model.model_dto import BaseModelDTO
 from gws_core.core.utils.settings_dto import SettingsDTO
+from gws_core.core.utils.startup_profiler import StartupProfiler, StartupStepDTO
 from gws_core.lab.system_dto import (
     LabStartLogFileObject,
     LabStatusDTO,
@@ -78,3 +79,13 @@ def get_start_logs(
     _=Depends(AuthorizationService.check_user_access_token),
 ) -> LabStartLogFileObject | None:
     return SystemService.get_start_logs()
+
+
+@core_app.get("/system/start-steps", tags=["System"], summary="Get lab start steps duration")
+def get_start_steps(
+    _=Depends(AuthorizationService.check_user_access_token),
+) -> list[StartupStepDTO]:
+    """
+    Get the duration of the steps of the lab start
+    """
+    return StartupProfiler.get_steps()
@@ -8,10 +8,12 @@ from gws_core.core.db.db_manager_service import DbManagerService
 from gws_core.core.exception.exceptions.bad_request_exception import BadRequestException
 from gws_core.core.model.sys_proc import SysProc
 from gws_core.core.utils.logger import Logger
+from gws_core.core.utils.startup_profiler import StartupProfiler
 from gws_core.folder.space_folder_service import SpaceFolderService
 from gws_core.impl.file.file_store import FileStore
 from gws_core.impl.file.fs_node_model import FSNodeModel
 from gws_core.impl.file.local_file_store import LocalFileStore
+from gws_core.impl.shell.virtual_env.venv_service import VEnvService
 from gws_core.lab.lab_config_model import LabConfigModel
 from gws_core.lab.lab_model.lab_model import LabModel
 from gws_core.lab.monitor.monitor_service import MonitorService
@@ -30,6 +32,7 @@ from gws_core.scenario.scenario import Scenario
 from gws_core.scenario.scenario_enums import ScenarioStatus
 from gws_core.scenario.scenario_run_service import ScenarioRunService
 from gws_core.scenario.scenario_service import ScenarioService
+from gws_core.scenario.worker.scenario_worker_pool import ScenarioWorkerPool
 from gws_core.space.space_object_service import SpaceObjectService
 from gws_core.space.space_service import SpaceService
 from gws_core.triggered_job.triggered_job_scheduler import TriggeredJobScheduler
@@ -59,12 +62,15 @@ class SystemService:
          - register the processes and resources
          - create the sysuser if not exists
         """
-        DbManagerService.init_all_db()
-        ModelService.register_all_processes_and_resources()
+        with StartupProfiler.step("Init DB"):
+            DbManagerService.init_all_db()
+        with StartupProfiler.step("Register typings"):
+            ModelService.register_all_processes_and_resources()
         UserService.create_sysuser()
         SystemStatus.app_is_initialized = True
 
-        BrickService.init()
+        with StartupProfiler.step("Init bricks"):
+            BrickService.init()
         LabConfigModel.save_current_config()
 
         # Create or update the current lab entry
@@ -82,9 +88,15 @@ class SystemService:
             # Initialize triggered jobs
             TriggeredJobScheduler.init()
 
+            if Settings.is_virtual_env_prebuild_enabled():
+                # install the virtual envs of the bricks without blocking the start
+                Thread(target=VEnvService.prebuild_brick_venvs, daemon=True).start()
+
         # Init AppsManager
         AppsManager.init()
 
+        StartupProfiler.log_summary()
+
     @classmethod
     def register_start_activity(cls):
         sys_user = User.get_and_check_sysuser()
@@ -108,6 +120,13 @@ class SystemService:
         cls._check_running_scenarios()
         MonitorService.init()
 
+        if Settings.is_scenario_worker_pool_enabled():
+            try:
+                ScenarioWorkerPool.init()
+            except Exception as err:
+                Logger.error(f"[SystemService] Error while starting the scenario workers: {err}")
+                Logger.log_exception_stack_trace(err)
+
         try:
             QueueRunner.init(daemon=True)
         except Exception as err:
@@ -145,6 +164,7 @@ class SystemService:
     def deinit_queue_and_monitor(cls) -> None:
         MonitorService.deinit()
         QueueRunner.deinit()
+        ScenarioWorkerPool.deinit()
         TriggeredJobScheduler.stop()
 
     @classmethod
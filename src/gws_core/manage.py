@@ -7,9 +7,11 @@ import plotly.express as px
 from dotenv import load_dotenv
 
 from gws_core.core.utils.logger import LogContext, Logger
+from gws_core.core.utils.startup_profiler import StartupProfiler
 from gws_core.lab.system_service import SystemService
 from gws_core.model.typing_manager import TypingManager
 from gws_core.scenario.scenario_run_service import ScenarioRunService
+from gws_core.scenario.worker.scenario_worker import ScenarioWorker
 from gws_core.settings_loader import SettingsLoader
 from gws_core.test.test_helper import TestHelper
 from gws_core.user.auth_context_loader import AuthContextLoader, DefaultAuthContextLoader
@@ -49,7 +51,9 @@ class AppManager:
             auth_context_loader=auth_context_loader,
         )
         # Init the db
-        DbManagerService.init_all_db(full_init=False)
+        with StartupProfiler.step("Connect DB"):
+            DbManagerService.init_all_db(full_init=False)
+        StartupProfiler.log_summary()
         return settings
 
     @classmethod
@@ -94,7 +98,8 @@ class AppManager:
         settings_loader.load_settings()
 
         # Init the typings
-        TypingManager.init_typings()
+        with StartupProfiler.step("Init typings"):
+            TypingManager.init_typings()
 
         # Init plotly color, use the default plotly color
         # Force this init because it is overriden when importing streamlit
@@ -222,6 +227,30 @@ class AppManager:
                 scenario_id, protocol_model_id, process_instance_name
             )
 
+    @classmethod
+    def run_scenario_worker(
+        cls,
+        main_setting_file_path: str,
+        socket_path: str,
+        parent_pid: int,
+        log_level: str,
+        is_test: bool,
+    ) -> None:
+        # the DB is not initialized, each forked process connects to the DB
+        cls.init_gws_env(
+            main_setting_file_path=main_setting_file_path,
+            log_level=log_level,
+            is_test=is_test,
+            log_context=LogContext.MAIN,
+        )
+
+        ScenarioWorker(
+            socket_path=socket_path,
+            parent_pid=parent_pid,
+            max_runs=Settings.get_scenario_worker_max_runs(),
+            max_memory=Settings.get_scenario_worker_max_memory(),
+        ).serve()
+
     @classmethod
     def run_notebook(cls, main_settings_path: str, log_level: str) -> None:
         cls.init_gws_env(main_setting_file_path=main_settings_path, log_level=log_level)
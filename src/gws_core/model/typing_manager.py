@@ -103,8 +103,70 @@ class TypingManager:
         # once this method is called, we considere the tables are ready
         cls._tables_are_created = True
 
-        for typing in cls._typings_name_cache.values():
-            cls._save_object_type_in_db(typing)
+        typings = list(cls._typings_name_cache.values())
+        try:
+            cls._save_all_object_types_in_db(typings)
+        except Exception as err:
+            Logger.error(
+                f"Error while saving the typings in bulk, saving them one by one. Error : {err}"
+            )
+            for typing in typings:
+                cls._save_object_type_in_db(typing)
+
+    @classmethod
+    def _save_all_object_types_in_db(cls, typings: list[Typing]) -> None:
+        """Save the typings with one select of all the typings and a bulk upsert of the new or
+        modified typings only, instead of a select and an update per typing
+        """
+        valid_typings: list[Typing] = []
+        for typing in typings:
+            try:
+                cls._init_typing(typing)
+                valid_typings.append(typing)
+            except Exception as err:
+                Logger.error(
+                    f"Error while saving the typing '{typing.typing_name}', skipping the typing. Error : {err}"
+                )
+
+        # the keys are lower case like the unique index of the table (case insensitive collation)
+        typings_db: dict[tuple[str, str, str], Typing] = {
+            cls._get_typing_db_key(typing_db): typing_db for typing_db in Typing.select()
+        }
+
+        typings_to_save: list[Typing] = []
+        for typing in valid_typings:
+            typing_db = typings_db.get(cls._get_typing_db_key(typing))
+            if typing_db is None:
+                typing._before_insert()
+                typings_to_save.append(typing)
+                continue
+
+            # use the same id and keep the creation date
+            typing.id = typing_db.id
+            typing.created_at = typing_db.created_at
+            typing._is_saved = True
+            if cls._typing_has_changed(typing, typing_db):
+                typing._before_update()
+                typings_to_save.append(typing)
+            else:
+                typing.last_modified_at = typing_db.last_modified_at
+
+        Typing.upsert_all(typings_to_save)
+
+    @classmethod
+    def _get_typing_db_key(cls, typing: Typing) -> tuple[str, str, str]:
+        return (typing.object_type.lower(), typing.brick.lower(), typing.unique_name.lower())
+
+    @classmethod
+    def _typing_has_changed(cls, typing: Typing, typing_db: Typing) -> bool:
+        for field in Typing._meta.sorted_fields:
+            if field.name in ("id", "created_at", "last_modified_at"):
+                continue
+            if field.db_value(getattr(typing, field.name)) != field.db_value(
+                getattr(typing_db, field.name)
+            ):
+                return True
+        return False
 
     @classmethod
     def init_typings(cls) -> None:
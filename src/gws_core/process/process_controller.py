@@ -8,6 +8,7 @@ from gws_core.core_controller import core_app
 from gws_core.lab.log.log import LogsBetweenDates
 from gws_core.lab.log.log_dto import LogsBetweenDatesDTO
 from gws_core.lab.monitor.monitor_dto import GetMonitorTimezoneDTO, MonitorBetweenDateGraphicsDTO
+from gws_core.process_run_stat.process_run_stat_dto import ProcessResourceUsageStatsDTO
 from gws_core.progress_bar.progress_bar_dto import ProgressBarMessagesBetweenDatesDTO
 from gws_core.user.authorization_service import AuthorizationService
 
@@ -70,6 +71,21 @@ def get_process_monitors(
     return ProcessService.get_monitor_of_process(process_type, _id, timezone_number)
 
 
+@core_app.get(
+    "/process/run-stat/resource-usage",
+    tags=["Process"],
+    summary="Get the resources used by the process runs aggregated by process type",
+)
+def get_resource_usage_stats(
+    process_typing_name: str | None = None,
+    _=Depends(AuthorizationService.check_user_access_token),
+) -> list[ProcessResourceUsageStatsDTO]:
+    """
+    Retrieve the peak memory, cpu time, io and duration of the steps of the runs by process type.
+    """
+    return ProcessService.get_resource_usage_stats(process_typing_name)
+
+
 ################################################## PROGRESS BAR ##################################################
 
 
@@ -97,11 +113,15 @@ def get_messages(
     process_type: ProcessType,
     _id: str,
     nb_of_messages: int | None = 20,
+    before_position: int | None = None,
     _=Depends(AuthorizationService.check_user_access_token),
 ) -> ProgressBarMessagesBetweenDatesDTO:
-    """Get last progress bar messages"""
+    """Get last progress bar messages. Pass the position of the oldest received message
+    as before_position to get the previous messages"""
 
-    return ProcessService.get_progress_bar_messages(process_type, _id, nb_of_messages=nb_of_messages)
+    return ProcessService.get_progress_bar_messages(
+        process_type, _id, nb_of_messages=nb_of_messages, before_position=before_position
+    )
 
 
 @core_app.get(
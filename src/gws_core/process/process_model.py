@@ -17,6 +17,10 @@ from gws_core.model.typing import Typing
 from gws_core.model.typing_dto import SimpleTypingDTO, TypingStatus
 from gws_core.model.typing_style import TypingStyle
 from gws_core.process.process_dto import ProcessDTO
+from gws_core.process_run_stat.process_run_resource_usage_model import (
+    ProcessRunResourceUsageModel,
+)
+from gws_core.process_run_stat.process_run_stat_dto import ProcessResourceUsageDTO
 from gws_core.process_run_stat.process_run_stat_model import ProcessRunStatModel
 from gws_core.progress_bar.progress_bar_dto import ProgressBarMessageDTO
 from gws_core.protocol.protocol_dto import ProcessConfigDTO
@@ -778,7 +782,7 @@ class ProcessModel(ModelWithUser):
             ):
                 return
 
-            ProcessRunStatModel.create_stat(
+            stat = ProcessRunStatModel.create_stat(
                 process_typing_name=self.process_typing_name,
                 status=self.status.value,
                 started_at=self.started_at,
@@ -792,9 +796,19 @@ class ProcessModel(ModelWithUser):
                 error_info=self.get_error_info().to_json_dict() if self.get_error_info() else None,
                 community_agent_version_id=self.get_community_agent_version_id(),
             )
+
+            resource_usage = self._get_resource_usage()
+            if resource_usage is not None:
+                ProcessRunResourceUsageModel.create_usage(
+                    stat.id, self.process_typing_name, resource_usage
+                )
         except Exception:
             Logger.error(f"Error: cannot save the run stat of the process '{self.instance_name}'")
 
+    def _get_resource_usage(self) -> ProcessResourceUsageDTO | None:
+        """Return the resources used by the last run if they were measured"""
+        return None
+
     ######################################## CLASS METHODS ########################################
     @classmethod
     def get_by_parent_protocol_id(cls, parent_protocol_id: str) -> list[ProcessModel]:
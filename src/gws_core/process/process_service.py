@@ -16,6 +16,10 @@ from gws_core.lab.monitor.monitor_dto import MonitorBetweenDateGraphicsDTO
 from gws_core.lab.monitor.monitor_service import MonitorService
 from gws_core.process.process_model import ProcessModel
 from gws_core.process.process_types import ProcessStatus
+from gws_core.process_run_stat.process_run_resource_usage_model import (
+    ProcessRunResourceUsageModel,
+)
+from gws_core.process_run_stat.process_run_stat_dto import ProcessResourceUsageStatsDTO
 from gws_core.process_run_stat.process_run_stat_model import ProcessRunStatModel
 from gws_core.progress_bar.progress_bar import ProgressBar
 from gws_core.progress_bar.progress_bar_dto import ProgressBarMessagesBetweenDatesDTO
@@ -118,21 +122,34 @@ class ProcessService:
     @classmethod
     def get_progress_bar_messages(
         cls, process_type: ProcessType, process_id: str, nb_of_messages: int,
-        from_datetime: datetime | None = None,
+        from_datetime: datetime | None = None, before_position: int | None = None,
     ) -> ProgressBarMessagesBetweenDatesDTO:
-        """Get progress bar messages with pagination."""
+        """Get progress bar messages with pagination. The messages are paginated with
+        from_datetime or with before_position (position of the oldest message of the
+        previous page)."""
         progress_bar = cls._get_process_progress_bar(process_type, process_id)
 
-        messages = progress_bar.get_messages_paginated(nb_of_messages=20, before_date=from_datetime)
+        messages = progress_bar.get_messages_paginated(
+            nb_of_messages=nb_of_messages, before_date=from_datetime,
+            before_position=before_position,
+        )
 
         return ProgressBarMessagesBetweenDatesDTO(
             from_datatime=messages[-1].datetime if messages else None,
             to_datatime=messages[0].datetime if messages else None,
-            messages=progress_bar.get_messages_paginated(
-                nb_of_messages=nb_of_messages, before_date=from_datetime
-            ),
+            messages=messages,
         )
 
+    @classmethod
+    def get_resource_usage_stats(
+        cls, process_typing_name: str | None = None
+    ) -> list[ProcessResourceUsageStatsDTO]:
+        """Get the resources used by the runs (peak memory, cpu time, io, duration of the steps)
+        aggregated by process type. Only the runs measured with the resource profiling
+        enabled are aggregated.
+        """
+        return ProcessRunResourceUsageModel.get_stats_by_process_typing(process_typing_name)
+
     @classmethod
     def init_cron_thread_run_stats(cls) -> None:
         """
@@ -0,0 +1,154 @@
+import resource
+from collections.abc import Iterator
+from contextlib import contextmanager
+from threading import Event, Thread
+from time import perf_counter
+from typing import Any
+
+import psutil
+
+from gws_core.process_run_stat.process_run_stat_dto import ProcessResourceUsageDTO
+
+
+class ProcessResourceProfiler:
+    """Measure the resources used by a process run: peak memory, cpu time, disk io
+    and the duration of the steps of the run (input loading, run, output saving).
+
+    The cpu and io are the difference of the counters of the lab process between the start
+    and the stop, the counters include the terminated sub processes (shell commands).
+    The memory is sampled in a thread on the lab process and its running sub processes,
+    the peak of the terminated sub processes is retrieved with getrusage.
+
+    The counters are the ones of the lab process, they include the other tasks running
+    at the same time in the same process.
+    """
+
+    # Interval between 2 samples of the memory in seconds
+    SAMPLE_INTERVAL = 0.1
+
+    INPUT_LOADING_STEP = "input_loading"
+    RUN_STEP = "run"
+    OUTPUT_SAVING_STEP = "output_saving"
+
+    _process: psutil.Process
+    _step_durations: dict[str, float]
+    _peak_rss: int
+    _children_peak_rss: int
+
+    _start_cpu_times: Any
+    _start_io: tuple[int, int] | None
+    _start_children_max_rss: int
+
+    _stop_event: Event
+    _sampler: Thread | None
+    _usage: ProcessResourceUsageDTO | None
+
+    def __init__(self) -> None:
+        self._process = psutil.Process()
+        self._step_durations = {}
+        self._peak_rss = 0
+        self._children_peak_rss = 0
+        self._start_cpu_times = None
+        self._start_io = None
+        self._start_children_max_rss = 0
+        self._stop_event = Event()
+        self._sampler = None
+        self._usage = None
+
+    def start(self) -> None:
+        self._start_cpu_times = self._process.cpu_times()
+        self._start_io = self._get_io_counters()
+        self._start_children_max_rss = self._get_children_max_rss()
+        self._sample_memory()
+
+        self._sampler = Thread(target=self._sample_loop, daemon=True)
+        self._sampler.start()
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """Measure the duration of a step of the run, the durations of a step are summed"""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self._step_durations[name] = self._step_durations.get(name, 0) + perf_counter() - start
+
+    def stop(self) -> ProcessResourceUsageDTO:
+        """Stop the measure and return the resources used since the start.
+        Calling stop again returns the same result."""
+        if self._usage is not None:
+            return self._usage
+
+        self._stop_event.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        self._sample_memory()
+
+        cpu_times = self._process.cpu_times()
+        start_cpu_times = self._start_cpu_times or cpu_times
+
+        # peak of the sub processes terminated during the run, only known if it is
+        # higher than the peak of the sub processes terminated before
+        children_max_rss = self._get_children_max_rss()
+        if children_max_rss > self._start_children_max_rss:
+            self._children_peak_rss = max(self._children_peak_rss, children_max_rss)
+
+        read_bytes: int | None = None
+        write_bytes: int | None = None
+        io = self._get_io_counters()
+        if io is not None and self._start_io is not None:
+            read_bytes = io[0] - self._start_io[0]
+            write_bytes = io[1] - self._start_io[1]
+
+        self._usage = ProcessResourceUsageDTO(
+            peak_rss=self._peak_rss,
+            children_peak_rss=self._children_peak_rss,
+            cpu_user_time=cpu_times.user - start_cpu_times.user,
+            cpu_system_time=cpu_times.system - start_cpu_times.system,
+            children_cpu_user_time=cpu_times.children_user - start_cpu_times.children_user,
+            children_cpu_system_time=cpu_times.children_system - start_cpu_times.children_system,
+            read_bytes=read_bytes,
+            write_bytes=write_bytes,
+            input_loading_time=self._step_durations.get(self.INPUT_LOADING_STEP, 0),
+            run_time=self._step_durations.get(self.RUN_STEP, 0),
+            output_saving_time=self._step_durations.get(self.OUTPUT_SAVING_STEP, 0),
+        )
+        return self._usage
+
+    def _sample_loop(self) -> None:
+        while not self._stop_event.wait(self.SAMPLE_INTERVAL):
+            self._sample_memory()
+
+    def _sample_memory(self) -> None:
+        try:
+            rss = self._process.memory_info().rss
+        except psutil.Error:
+            return
+
+        children_rss = 0
+        try:
+            for child in self._process.children(recursive=True):
+                try:
+                    child_rss = child.memory_info().rss
+                except psutil.Error:
+                    # the sub process terminated
+                    continue
+                children_rss += child_rss
+                self._children_peak_rss = max(self._children_peak_rss, child_rss)
+        except psutil.Error:
+            pass
+
+        self._peak_rss = max(self._peak_rss, rss + children_rss)
+
+    def _get_io_counters(self) -> tuple[int, int] | None:
+        """Return the bytes read and written, None if not supported"""
+        try:
+            io = self._process.io_counters()
+        except (psutil.Error, AttributeError, NotImplementedError):
+            return None
+        return io.read_bytes, io.write_bytes
+
+    def _get_children_max_rss(self) -> int:
+        """Return the max RSS in bytes of the terminated sub processes"""
+        # ru_maxrss is in kilobytes on linux
+        return resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * 1024
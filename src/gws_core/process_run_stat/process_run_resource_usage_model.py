@@ -0,0 +1,82 @@
+from peewee import BigIntegerField, CharField, FloatField, fn
+
+from gws_core.core.model.model import Model
+from gws_core.process_run_stat.process_run_stat_dto import (
+    ProcessResourceUsageDTO,
+    ProcessResourceUsageStatsDTO,
+)
+
+
+class ProcessRunResourceUsageModel(Model):
+    """Resources used by a process run, stored alongside the ProcessRunStatModel of the run
+    when the profiling is enabled (see Settings.is_process_resource_profiling_enabled)
+    """
+
+    run_stat_id: str = CharField(max_length=36, index=True)
+    process_typing_name: str = CharField(index=True)
+
+    peak_rss: int = BigIntegerField()
+    children_peak_rss: int = BigIntegerField()
+    cpu_user_time: float = FloatField()
+    cpu_system_time: float = FloatField()
+    children_cpu_user_time: float = FloatField()
+    children_cpu_system_time: float = FloatField()
+    read_bytes: int | None = BigIntegerField(null=True)
+    write_bytes: int | None = BigIntegerField(null=True)
+    input_loading_time: float = FloatField()
+    run_time: float = FloatField()
+    output_saving_time: float = FloatField()
+
+    @classmethod
+    def create_usage(
+        cls, run_stat_id: str, process_typing_name: str, usage: ProcessResourceUsageDTO
+    ) -> "ProcessRunResourceUsageModel":
+        usage_model = ProcessRunResourceUsageModel(
+            run_stat_id=run_stat_id,
+            process_typing_name=process_typing_name,
+            **usage.to_json_dict(),
+        )
+        return usage_model.save()
+
+    @classmethod
+    def get_stats_by_process_typing(
+        cls, process_typing_name: str | None = None
+    ) -> list[ProcessResourceUsageStatsDTO]:
+        """Aggregate the resources used by the runs of each process type
+
+        :param process_typing_name: if provided, only aggregate this process type
+        :type process_typing_name: str | None, optional
+        :return: the stats of each process type, sorted by max peak memory
+        :rtype: list[ProcessResourceUsageStatsDTO]
+        """
+        cpu_time = (
+            cls.cpu_user_time
+            + cls.cpu_system_time
+            + cls.children_cpu_user_time
+            + cls.children_cpu_system_time
+        )
+        query = cls.select(
+            cls.process_typing_name,
+            fn.COUNT(cls.id).alias("run_count"),
+            fn.AVG(cls.peak_rss).alias("avg_peak_rss"),
+            fn.MAX(cls.peak_rss).alias("max_peak_rss"),
+            fn.AVG(cpu_time).alias("avg_cpu_time"),
+            fn.MAX(cpu_time).alias("max_cpu_time"),
+            fn.AVG(cls.read_bytes).alias("avg_read_bytes"),
+            fn.AVG(cls.write_bytes).alias("avg_write_bytes"),
+            fn.AVG(cls.input_loading_time).alias("avg_input_loading_time"),
+            fn.AVG(cls.run_time).alias("avg_run_time"),
+            fn.MAX(cls.run_time).alias("max_run_time"),
+            fn.AVG(cls.output_saving_time).alias("avg_output_saving_time"),
+        ).group_by(cls.process_typing_name)
+
+        if process_typing_name is not None:
+            query = query.where(cls.process_typing_name == process_typing_name)
+
+        stats = [ProcessResourceUsageStatsDTO(**row) for row in query.dicts()]
+        stats.sort(key=lambda stat: stat.max_peak_rss, reverse=True)
+        return stats
+
+    class Meta:
+        table_name = "gws_process_run_resource_usage"
+        is_table = True
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Literal
 
-from gws_core.core.model.model_dto import ModelDTO
+from gws_core.core.model.model_dto import BaseModelDTO, ModelDTO
 
 ProcessRunStatLabEnv = Literal["PROD", "DEV"]
 ProcessRunStatStatus = Literal[
@@ -23,3 +23,43 @@ class ProcessRunStatDTO(ModelDTO):
     lab_env: ProcessRunStatLabEnv
     executed_by: str
     sync_with_community: bool
+
+
+class ProcessResourceUsageDTO(BaseModelDTO):
+    """Resources used by a process run. The memory, cpu and io are measured on the lab process
+    (and its sub processes like shell commands) during the run.
+    """
+
+    # max memory (RSS in bytes) of the lab process and of its running sub processes
+    peak_rss: int
+    # max memory (RSS in bytes) of a sub process (shell command)
+    children_peak_rss: int
+    # cpu time in seconds
+    cpu_user_time: float
+    cpu_system_time: float
+    children_cpu_user_time: float
+    children_cpu_system_time: float
+    # bytes read from and written to the disk, None if not supported by the system
+    read_bytes: int | None
+    write_bytes: int | None
+    # duration of the steps of the run in seconds
+    input_loading_time: float
+    run_time: float
+    output_saving_time: float
+
+
+class ProcessResourceUsageStatsDTO(BaseModelDTO):
+    """Aggregation of the resources used by the runs of a process type"""
+
+    process_typing_name: str
+    run_count: int
+    avg_peak_rss: float
+    max_peak_rss: int
+    avg_cpu_time: float
+    max_cpu_time: float
+    avg_read_bytes: float | None
+    avg_write_bytes: float | None
+    avg_input_loading_time: float
+    avg_run_time: float
+    max_run_time: float
+    avg_output_saving_time: float
@@ -40,7 +40,7 @@ class ProcessRunStatModel(Model):
         executed_by: str,
         error_info: dict | None = None,
         community_agent_version_id: str | None = None,
-    ) -> None:
+    ) -> "ProcessRunStatModel":
         stat: ProcessRunStatModel = ProcessRunStatModel()
         stat.process_typing_name = process_typing_name
         stat.community_agent_version_id = community_agent_version_id
@@ -56,7 +56,7 @@ class ProcessRunStatModel(Model):
         stat.executed_by = executed_by
         stat.sync_with_community = False
 
-        stat.save()
+        return stat.save()
 
     def to_dto(self) -> ProcessRunStatDTO:
         return ProcessRunStatDTO(
@@ -1,10 +1,12 @@
+import threading
+import time
 from datetime import datetime
 from typing import Any, final
 
-from fastapi.encoders import jsonable_encoder
 from peewee import CharField, FloatField
 
 from gws_core.core.classes.observer.message_level import MessageLevel
+from gws_core.core.db.gws_core_db_manager import GwsCoreDbManager
 from gws_core.core.model.db_field import DateTimeUTC, JSONField
 from gws_core.core.utils.date_helper import DateHelper
 from gws_core.progress_bar.progress_bar_dto import (
@@ -13,6 +15,8 @@ from gws_core.progress_bar.progress_bar_dto import (
     ProgressBarMessageDTO,
     ProgressBarMessageWithTypeDTO,
 )
+from gws_core.progress_bar.progress_bar_flusher import ProgressBarFlusher
+from gws_core.progress_bar.progress_bar_message import ProgressBarMessage
 
 from ..core.exception.exceptions import BadRequestException
 from ..core.model.model import Model
@@ -22,6 +26,11 @@ from ..core.model.model import Model
 class ProgressBar(Model):
     """
     ProgressBar class
+
+    The messages are stored in the ProgressBarMessage table, the data only keeps the
+    last messages (tail) for a quick status. Progress bars saved before keep all their
+    messages in the data (no message_count), they are moved to the table on the
+    first new message.
     """
 
     process_id = CharField(null=False, index=True, unique=True)
@@ -39,9 +48,22 @@ class ProgressBar(Model):
     _MAX_VALUE = 100.0
     _MIN_VALUE = 0.0
     _MAX_MESSAGE_LENGTH = 10000
+    # number of last messages kept in the data
+    _TAIL_SIZE = 20
+    # min interval in seconds between 2 saves of the progress bar when adding messages
+    _SAVE_INTERVAL = 1.0
+
+    # position of the next message, set when messages are inserted
+    _next_position: int | None = None
+    _last_save_time: float | None = None
+    # true when a save was skipped and the flusher saves the progress bar at the end of the interval
+    _flush_scheduled: bool = False
+    # lock between the updates of the progress bar and the save of the flusher
+    _save_lock: threading.RLock
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._save_lock = threading.RLock()
 
         if not self.is_saved():
             self._init_data()
@@ -61,7 +83,9 @@ class ProgressBar(Model):
     def _init_data(self) -> None:
         self.data = {
             "messages": [],
+            "message_count": 0,
         }
+        self._next_position = 0
         self.started_at = None
         self.ended_at = None
         self.elapsed_time = None
@@ -75,10 +99,61 @@ class ProgressBar(Model):
         :return: Returns True if is progress bar is successfully reset;  False otherwise
         :rtype: `bool`
         """
+        ProgressBarMessage.delete_by_progress_bar(self.id)
         self._init_data()
 
         return self.save()
 
+    def save(self, *args, **kwargs) -> "ProgressBar":
+        with self._save_lock:
+            self._cancel_flush()
+            result = super().save(*args, **kwargs)
+            self._last_save_time = time.monotonic()
+            return result
+
+    def _save_coalesced(self) -> None:
+        """Save the progress bar at most once every _SAVE_INTERVAL seconds. It is used
+        when adding messages as the messages are already saved in their table,
+        only the tail and the value are saved late. If the save is skipped, the flusher saves
+        them at the end of the interval, so they are not stale when the task then runs
+        without reporting anything.
+        """
+        with self._save_lock:
+            if (
+                not self.is_saved()
+                or self._last_save_time is None
+                or time.monotonic() - self._last_save_time >= self._SAVE_INTERVAL
+            ):
+                self.save()
+                return
+
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                ProgressBarFlusher.get_instance().schedule(
+                    self, self._last_save_time + self._SAVE_INTERVAL
+                )
+
+    def _flush(self) -> None:
+        """Save the progress bar from the flusher"""
+        with self._save_lock:
+            if not self._flush_scheduled:
+                # the progress bar was saved or deleted in the meantime
+                return
+            self._flush_scheduled = False
+            self.save()
+
+    def _cancel_flush(self) -> None:
+        if self._flush_scheduled:
+            ProgressBarFlusher.get_instance().cancel(self)
+            self._flush_scheduled = False
+
+    def delete_instance(self, *args, **kwargs):
+        with self._save_lock:
+            self._cancel_flush()
+        result = super().delete_instance(*args, **kwargs)
+        ProgressBarMessage.delete_by_progress_bar(self.id)
+        return result
+
     def get_elapsed_time(self) -> float:
         """
         Calculate the elapsed time in milliseconds
@@ -135,21 +210,29 @@ class ProgressBar(Model):
         self.add_message(message, MessageLevel.WARNING)
 
     def add_message(self, message: str, type_: MessageLevel = MessageLevel.INFO):
-        self._add_message(message, type_)
+        with self._save_lock:
+            self._insert_messages([self._create_message(message, type_)])
 
-        self.save()
+            self._save_coalesced()
 
     def add_messages(self, messages: list[ProgressBarMessageWithTypeDTO]) -> None:
-        for message in messages:
-            message_content = self._check_message_length(message.message)
-
-            if message.type == MessageLevel.PROGRESS:
-                self._update_progress(value=message.progress, message=message_content)
-            else:
-                self._add_message(message_content, message.type)
-
-        # save only once at the end
-        self.save()
+        with self._save_lock:
+            new_messages: list[ProgressBarMessage] = []
+            for message in messages:
+                message_content = self._check_message_length(message.message)
+
+                if message.type == MessageLevel.PROGRESS:
+                    progress_message = self._update_progress(
+                        value=message.progress, message=message_content
+                    )
+                    if progress_message is not None:
+                        new_messages.append(progress_message)
+                else:
+                    new_messages.append(self._create_message(message_content, message.type))
+
+            # insert and save only once at the end
+            self._insert_messages(new_messages)
+            self._save_coalesced()
 
     def _check_message_length(self, message: str) -> str:
         if len(message) > self._MAX_MESSAGE_LENGTH:
@@ -158,18 +241,72 @@ class ProgressBar(Model):
 
         return message
 
-    def _add_message(
+    def _create_message(
         self,
         message: str,
         type_: MessageLevel = MessageLevel.INFO,
         progress: float | None = None,
-    ) -> None:
-        dtime = jsonable_encoder(DateHelper.now_utc())
+    ) -> ProgressBarMessage:
+        now = DateHelper.now_utc()
+        # the date is stored with milliseconds, truncate it so the tail and the table match
+        now = now.replace(microsecond=now.microsecond // 1000 * 1000)
 
-        progress_bar_message = ProgressBarMessageDTO(
-            type=type_, text=message, datetime=dtime, progress=progress
+        return ProgressBarMessage(
+            progress_bar_id=self.id, type=type_.value, text=message, sent_at=now, progress=progress
         )
-        self.data["messages"].append(progress_bar_message.to_json_dict())
+
+    def _insert_messages(self, messages: list[ProgressBarMessage]) -> None:
+        """Append the messages to the message table and update the tail"""
+        if not messages:
+            return
+
+        if self._has_messages_in_data():
+            self._move_data_messages_to_table()
+
+        self._append_messages(messages)
+        new_messages = [message.to_dto().to_json_dict() for message in messages]
+        self._set_tail(self.data["messages"] + new_messages)
+
+    @GwsCoreDbManager.transaction()
+    def _append_messages(self, messages: list[ProgressBarMessage]) -> None:
+        """Insert the messages after the last message of the table. The row of the progress bar
+        is locked during the transaction so the writers of the same progress bar (other instances
+        or processes) get consecutive positions.
+        """
+        ProgressBar.select(ProgressBar.id).where(ProgressBar.id == self.id).for_update().execute()
+
+        last_position = ProgressBarMessage.get_last_position(self.id)
+        position = 0 if last_position is None else last_position + 1
+        for message in messages:
+            message.position = position
+            position += 1
+
+        ProgressBarMessage.insert_all(messages)
+        self._next_position = position
+
+    def _set_tail(self, messages: list[dict]) -> None:
+        self.data["messages"] = messages[-self._TAIL_SIZE :]
+        self.data["message_count"] = self._next_position
+
+    def _has_messages_in_data(self) -> bool:
+        """Return True if the progress bar was saved before the message table and
+        all its messages are in the data"""
+        return "message_count" not in self.data
+
+    def _move_data_messages_to_table(self) -> None:
+        data_messages = self.get_messages()
+        messages = [
+            ProgressBarMessage(
+                progress_bar_id=self.id,
+                type=message.type.value,
+                text=message.text,
+                sent_at=message.get_datetime(),
+                progress=message.progress,
+            )
+            for message in data_messages
+        ]
+        self._append_messages(messages)
+        self._set_tail([message.to_dto().to_json_dict() for message in messages])
 
     def start(self):
         if self.is_started:
@@ -185,12 +322,16 @@ class ProgressBar(Model):
         self.save()
 
     def stop_success(self, success_message: str, elapsed_time: float) -> None:
-        self._stop(elapsed_time)
-        self.add_success_message(success_message)
+        with self._save_lock:
+            self._stop(elapsed_time)
+            self._insert_messages([self._create_message(success_message, MessageLevel.SUCCESS)])
+            self.save()
 
     def stop_error(self, error_message: str, elapsed_time: float) -> None:
-        self._stop(elapsed_time)
-        self.add_error_message(error_message)
+        with self._save_lock:
+            self._stop(elapsed_time)
+            self._insert_messages([self._create_message(error_message, MessageLevel.ERROR)])
+            self.save()
 
     def _stop(self, elapsed_time: float) -> None:
         self.current_value = self._MAX_VALUE
@@ -201,40 +342,58 @@ class ProgressBar(Model):
         """
         Increment the progress-bar value and log a progress message
         """
-        self._update_progress(value, message)
-        self.save()
+        with self._save_lock:
+            progress_message = self._update_progress(value, message)
+            if progress_message is not None:
+                self._insert_messages([progress_message])
+            self._save_coalesced()
 
-    def _update_progress(self, value: float, message: str) -> None:
+    def _update_progress(self, value: float, message: str) -> ProgressBarMessage | None:
         """
-        Increment the progress-bar value and log a progress message
+        Increment the progress-bar value and return the progress message to log
         """
 
         if self.current_value == value:
-            return
+            return None
 
         # check if we update the progres
         value = self._update_progress_value(value)
         if message:
-            self._add_message(message, MessageLevel.PROGRESS, value)
+            return self._create_message(message, MessageLevel.PROGRESS, value)
+        return None
 
     def get_messages(self) -> list[ProgressBarMessageDTO]:
-        return ProgressBarMessageDTO.from_json_list(self.data["messages"])
+        if self._has_messages_in_data():
+            return ProgressBarMessageDTO.from_json_list(self.data["messages"])
+
+        return [message.to_dto() for message in ProgressBarMessage.get_messages(self.id)]
 
     def get_last_message(self) -> ProgressBarMessageDTO | None:
-        messages = self.get_messages()
+        messages = self.data["messages"]
         if not messages:
             return None
-        return messages[-1]
+        return ProgressBarMessageDTO.from_json(messages[-1])
 
     def get_messages_paginated(
-        self, nb_of_messages: int, before_date: datetime | None = None
+        self,
+        nb_of_messages: int,
+        before_date: datetime | None = None,
+        before_position: int | None = None,
     ) -> list[ProgressBarMessageDTO]:
         """
-        Get the last nb_of_messages messages
+        Get the last nb_of_messages messages, newest first
         :param nb_of_messages: number of messages to get
-        :param from_datatime: if provided, get the last nb_of_messages messages before this date
+        :param before_date: if provided, get the last nb_of_messages messages before this date
+        :param before_position: if provided, get the last nb_of_messages messages before
+                                this position (cursor of the previous page)
         :return:
         """
+        if not self._has_messages_in_data():
+            messages = ProgressBarMessage.get_last_messages(
+                self.id, nb_of_messages, before_date=before_date, before_position=before_position
+            )
+            return [message.to_dto() for message in messages]
+
         messages = self.get_messages()
         if not messages:
             return []
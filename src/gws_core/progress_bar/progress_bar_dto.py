@@ -15,6 +15,8 @@ class ProgressBarMessageDTO(BaseModelDTO):
     text: str
     datetime: str
     progress: float | None = None
+    # index of the message in the progress bar, used as pagination cursor
+    position: int | None = None
 
     def __str__(self) -> str:
         return f"{self.type} - {self.datetime} - {self.text}"
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import os
+import time
+from threading import Condition, Lock
+from typing import TYPE_CHECKING
+
+from gws_core.core.db.thread_db import ThreadDb
+from gws_core.core.utils.logger import Logger
+
+if TYPE_CHECKING:
+    from .progress_bar import ProgressBar
+
+
+class ProgressBarFlusher:
+    """Save the progress bars whose save was skipped, at the end of their save interval.
+
+    A single worker thread per process saves all the progress bars, so the same db
+    connection is reused instead of opening one per deferred save.
+
+    Usage:
+        ProgressBarFlusher.get_instance().schedule(progress_bar, time.monotonic() + 1)
+    """
+
+    _instance: ProgressBarFlusher | None = None
+    # pid of the process that created the instance, the worker thread is not copied on fork
+    _instance_pid: int | None = None
+    _lock = Lock()
+
+    # progress bars to save by object id, with the time (monotonic) of the save
+    _pending: dict[int, tuple[float, ProgressBar]]
+    _condition: Condition
+    _worker_thread: ThreadDb
+
+    def __init__(self):
+        self._pending = {}
+        self._condition = Condition()
+
+        self._worker_thread = ThreadDb(target=self._worker_loop, daemon=True)
+        self._worker_thread.start()
+
+    @classmethod
+    def get_instance(cls) -> ProgressBarFlusher:
+        pid = os.getpid()
+        if cls._instance is None or cls._instance_pid != pid:
+            with cls._lock:
+                if cls._instance is None or cls._instance_pid != pid:
+                    cls._instance = cls()
+                    cls._instance_pid = pid
+        return cls._instance
+
+    def schedule(self, progress_bar: ProgressBar, save_time: float) -> None:
+        """Save the progress bar at the given time (time.monotonic) if it is not scheduled yet"""
+        with self._condition:
+            if id(progress_bar) not in self._pending:
+                self._pending[id(progress_bar)] = (save_time, progress_bar)
+                self._condition.notify()
+
+    def cancel(self, progress_bar: ProgressBar) -> None:
+        with self._condition:
+            self._pending.pop(id(progress_bar), None)
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+
+                now = time.monotonic()
+                next_save_time = min(save_time for save_time, _ in self._pending.values())
+                if next_save_time > now:
+                    self._condition.wait(next_save_time - now)
+                    continue
+
+                progress_bars = [
+                    progress_bar
+                    for save_time, progress_bar in self._pending.values()
+                    if save_time <= now
+                ]
+                for progress_bar in progress_bars:
+                    del self._pending[id(progress_bar)]
+
+            # save outside of the condition, the progress bar lock is held during the save
+            for progress_bar in progress_bars:
+                try:
+                    progress_bar._flush()
+                except Exception as err:
+                    Logger.error(f"Error while saving the progress bar '{progress_bar.id}': {err}")
@@ -0,0 +1,98 @@
+from datetime import datetime
+
+from fastapi.encoders import jsonable_encoder
+from peewee import CharField, FloatField, IntegerField, TextField
+
+from gws_core.core.classes.observer.message_level import MessageLevel
+from gws_core.core.model.db_field import DateTimeUTC
+from gws_core.core.model.model import Model
+from gws_core.progress_bar.progress_bar_dto import ProgressBarMessageDTO
+
+
+class ProgressBarMessage(Model):
+    """Message of a progress bar. The messages are only appended to this table, so adding
+    a message does not rewrite the previous messages. The position is the index of the
+    message in its progress bar (unique) and is used as pagination cursor.
+    """
+
+    progress_bar_id: str = CharField(max_length=36, null=False)
+    position: int = IntegerField(null=False)
+    type: str = CharField(max_length=20, null=False)
+    text: str = TextField(null=False)
+    sent_at: datetime = DateTimeUTC(null=False, with_milliseconds=True)
+    progress: float | None = FloatField(null=True)
+
+    def to_dto(self) -> ProgressBarMessageDTO:
+        return ProgressBarMessageDTO(
+            type=MessageLevel(self.type),
+            text=self.text,
+            datetime=jsonable_encoder(self.sent_at),
+            progress=self.progress,
+            position=self.position,
+        )
+
+    @classmethod
+    def get_last_position(cls, progress_bar_id: str) -> int | None:
+        """Return the position of the last message of the progress bar, None if no message"""
+        last_message = (
+            cls.select(cls.position)
+            .where(cls.progress_bar_id == progress_bar_id)
+            .order_by(cls.position.desc())
+            .first()
+        )
+        return last_message.position if last_message else None
+
+    @classmethod
+    def get_messages(cls, progress_bar_id: str) -> list["ProgressBarMessage"]:
+        """Return all the messages of the progress bar, from the oldest to the newest"""
+        return list(
+            cls.select()
+            .where(cls.progress_bar_id == progress_bar_id)
+            .order_by(cls.position)
+        )
+
+    @classmethod
+    def get_last_messages(
+        cls,
+        progress_bar_id: str,
+        nb_of_messages: int,
+        before_date: datetime | None = None,
+        before_position: int | None = None,
+    ) -> list["ProgressBarMessage"]:
+        """Return the last messages of the progress bar, from the newest to the oldest
+
+        :param progress_bar_id: id of the progress bar
+        :type progress_bar_id: str
+        :param nb_of_messages: max number of messages to return
+        :type nb_of_messages: int
+        :param before_date: if provided, only return the messages sent before this date
+        :type before_date: datetime | None, optional
+        :param before_position: if provided, only return the messages before this position
+        :type before_position: int | None, optional
+        :return: the messages, newest first
+        :rtype: list[ProgressBarMessage]
+        """
+        query = cls.select().where(cls.progress_bar_id == progress_bar_id)
+
+        if before_position is not None:
+            query = query.where(cls.position < before_position)
+            query = query.order_by(cls.position.desc())
+        elif before_date is not None:
+            query = query.where(cls.sent_at < before_date)
+            query = query.order_by(cls.sent_at.desc(), cls.position.desc())
+        else:
+            query = query.order_by(cls.position.desc())
+
+        return list(query.limit(nb_of_messages))
+
+    @classmethod
+    def delete_by_progress_bar(cls, progress_bar_id: str) -> None:
+        cls.delete().where(cls.progress_bar_id == progress_bar_id).execute()
+
+    class Meta:
+        table_name = "gws_process_progress_bar_message"
+        is_table = True
+        indexes = (
+            (("progress_bar_id", "position"), True),
+            (("progress_bar_id", "sent_at"), False),
+        )
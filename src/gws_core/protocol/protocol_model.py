@@ -1,10 +1,16 @@
 import re
+from collections import deque
+from queue import Queue
 from typing import Literal
 
+from gws_core.core.db.abstract_db_manager import AbstractDbManager
 from gws_core.core.db.gws_core_db_manager import GwsCoreDbManager
+from gws_core.core.db.pool_db import PoolDb
 from gws_core.core.utils.date_helper import DateHelper
 from gws_core.core.utils.logger import Logger
+from gws_core.core.utils.settings import Settings
 from gws_core.process.process import Process
+from gws_core.process.process_exception import ProcessRunException
 from gws_core.progress_bar.progress_bar_dto import ProgressBarMessageDTO
 from gws_core.protocol.protocol_dto import (
     ConnectorDTO,
@@ -17,6 +23,7 @@ from gws_core.protocol.protocol_dto import (
 )
 from gws_core.protocol.protocol_exception import IOFaceConnectedToTheParentDeleteException
 from gws_core.protocol.protocol_spec import ConnectorSpec, InterfaceSpec
+from gws_core.resource.resource_handoff_cache import ResourceHandoffCache
 from gws_core.resource.resource_model import ResourceModel
 from gws_core.scenario.scenario_dto import ScenarioProgressDTO
 from gws_core.task.plug.input_task import InputTask
@@ -41,6 +48,9 @@ class ProtocolModel(ProcessModel):
 
     _processes: dict[str, ProcessModel] = {}
     _connectors: list[Connector] | None = None
+    # Index of the connectors by left and right process instance name, kept in sync with _connectors
+    _connectors_by_left: dict[str, list[Connector]] = {}
+    _connectors_by_right: dict[str, list[Connector]] = {}
     _interfaces: dict[str, IOface] = {}
     _outerfaces: dict[str, IOface] = {}
 
@@ -48,6 +58,8 @@ class ProtocolModel(ProcessModel):
         super().__init__(*args, **kwargs)
         self._is_loaded = not self.is_saved() or not self.data or "graph" not in self.data
         self._processes = {}
+        self._connectors_by_left = {}
+        self._connectors_by_right = {}
         self._interfaces = {}
         self._outerfaces = {}
 
@@ -116,7 +128,7 @@ class ProtocolModel(ProcessModel):
 
     def copy_graph_from_and_save(self, other: "ProtocolModel") -> None:
         """Copy the graph structure (connectors, interfaces, outerfaces, layout) from another protocol and save."""
-        self._connectors = list(other.connectors)
+        self._set_connectors(list(other.connectors))
         self._interfaces = dict(other.interfaces)
         self._outerfaces = dict(other.outerfaces)
         self.layout = other.layout
@@ -236,44 +248,189 @@ class ProtocolModel(ProcessModel):
         Runs the process and save its state in the database.
         Override mother class method.
         """
-        # create a dictionaly of runned processes with the instance name as key
-        runned_processes = {
-            key: process for key, process in self.processes.items() if process.is_finished
-        }
+        max_parallel_processes = Settings.get_protocol_max_parallel_processes()
+        if max_parallel_processes > 1:
+            self._run_protocol_in_parallel(max_parallel_processes)
+            return
 
         count_processes = len(self.processes)
+        count_runned_processes = sum(1 for process in self.processes.values() if process.is_finished)
+        remaining_previous, ready_processes = self._init_run_queue()
+
+        while ready_processes:
+            process = self.processes[ready_processes.popleft()]
+            if not process.is_runnable:
+                continue
+
+            self._run_process(process)
+
+            count_runned_processes += 1
+            self._update_run_progress(process, count_runned_processes, count_processes)
+            self._add_next_ready_processes(process, remaining_previous, ready_processes)
+
+        if count_runned_processes < count_processes:
+            self.progress_bar.add_warning_message("Some processes are not ready to be runned")
 
-        while len(runned_processes) < count_processes:
-            has_runned = False
-            for process in self.processes.values():
-                if process.instance_name not in runned_processes and self.process_is_ready(process):
-                    has_runned = True
-                    self._run_process(process)
-
-                    runned_processes[process.instance_name] = process
-                    self.progress_bar.update_progress(
-                        round(len(runned_processes) / count_processes * 100),
-                        f"Process finished {process.get_name()}",
+    def _run_protocol_in_parallel(self, max_parallel_processes: int) -> None:
+        """Run the processes of the protocol, the independent tasks are run at the same time
+        in a pool of processes. The sub protocols are run in the current process
+        (their tasks are run in their own pool).
+
+        If a process fails, no new process is started, the running tasks are waited and
+        the error is raised.
+
+        :param max_parallel_processes: max number of tasks running at the same time
+        :type max_parallel_processes: int
+        """
+        count_processes = len(self.processes)
+        count_runned_processes = sum(1 for process in self.processes.values() if process.is_finished)
+        remaining_previous, ready_processes = self._init_run_queue()
+
+        running_tasks: set[str] = set()
+        # queue filled with the instance name of the tasks when they are finished
+        finished_tasks: Queue[str] = Queue()
+        run_error: ProcessRunException | None = None
+
+        with PoolDb(
+            processes=max_parallel_processes, initializer=_init_pool_process
+        ) as pool:
+            while True:
+                while ready_processes and run_error is None:
+                    process = self.processes[ready_processes.popleft()]
+                    if not process.is_runnable:
+                        continue
+
+                    if process.is_protocol():
+                        try:
+                            self._run_process(process)
+                        except ProcessRunException as err:
+                            run_error = err
+                            break
+                        count_runned_processes += 1
+                        self._update_run_progress(process, count_runned_processes, count_processes)
+                        self._add_next_ready_processes(process, remaining_previous, ready_processes)
+                        continue
+
+                    instance_name = process.instance_name
+                    self.progress_bar.add_info_message(f"Run process {process.get_name()}")
+                    # save the inputs (set by interfaces) so the task loaded in the pool has them
+                    process.save()
+                    running_tasks.add(instance_name)
+                    pool.apply_async(
+                        _run_task_model_in_process,
+                        (process.id,),
+                        callback=lambda _, name=instance_name: finished_tasks.put(name),
+                        error_callback=lambda _, name=instance_name: finished_tasks.put(name),
                     )
 
-            # if no process has been runned, it means that the protocol is finished
-            if not has_runned:
-                break
+                if not running_tasks:
+                    break
+
+                instance_name = finished_tasks.get()
+                running_tasks.remove(instance_name)
+
+                try:
+                    process = self._reload_process_after_run(instance_name)
+                except ProcessRunException as err:
+                    run_error = run_error or err
+                    continue
+
+                self._propagate_process_outputs(process)
+                count_runned_processes += 1
+                self._update_run_progress(process, count_runned_processes, count_processes)
+                self._add_next_ready_processes(process, remaining_previous, ready_processes)
 
-        if len(runned_processes) < count_processes:
+        if run_error is not None:
+            raise run_error
+
+        if count_runned_processes < count_processes:
             self.progress_bar.add_warning_message("Some processes are not ready to be runned")
 
+    def _init_run_queue(self) -> tuple[dict[str, int], deque[str]]:
+        """Init the scheduling of the run (Kahn's algorithm). For each process to run, count the
+        previous processes that are not successful. The processes without such previous process
+        are ready.
+
+        :return: the count of remaining previous processes by process name and the queue of ready processes
+        :rtype: tuple[dict[str, int], deque[str]]
+        """
+        remaining_previous: dict[str, int] = {}
+        ready_processes: deque[str] = deque()
+
+        for instance_name, process in self.processes.items():
+            if process.is_finished:
+                continue
+
+            count = sum(
+                1
+                for previous_name in self._get_direct_previous_names(instance_name)
+                if not self.processes[previous_name].is_success
+            )
+            remaining_previous[instance_name] = count
+            if count == 0:
+                ready_processes.append(instance_name)
+
+        return remaining_previous, ready_processes
+
+    def _add_next_ready_processes(
+        self, process: ProcessModel, remaining_previous: dict[str, int], ready_processes: deque[str]
+    ) -> None:
+        """Called when a process is run, add to the ready queue the next processes that have
+        all their previous processes successful"""
+        if not process.is_success:
+            return
+
+        for next_name in self._get_direct_next_names(process.instance_name):
+            if next_name not in remaining_previous:
+                continue
+            remaining_previous[next_name] -= 1
+            if remaining_previous[next_name] == 0:
+                ready_processes.append(next_name)
+
+    def _reload_process_after_run(self, instance_name: str) -> ProcessModel:
+        """Reload a process run in another process from the DB and replace it in the protocol
+        and in the connectors. Raise a ProcessRunException if the process failed.
+        """
+        process = self._processes[instance_name].refresh()
+        self._processes[instance_name] = process
+
+        for connector in self._get_connectors_from_left_process(instance_name):
+            connector.left_process = process
+        for connector in self._get_connectors_from_right_process(instance_name):
+            connector.right_process = process
+
+        if not process.is_success:
+            error_info = process.get_error_info()
+            raise ProcessRunException(
+                process_model=process,
+                exception_detail=error_info.detail if error_info else "Unknown error",
+                unique_code=error_info.unique_code if error_info else None,
+                error_prefix="Error during parallel run",
+            )
+
+        return process
+
+    def _update_run_progress(
+        self, process: ProcessModel, count_runned_processes: int, count_processes: int
+    ) -> None:
+        self.progress_bar.update_progress(
+            round(count_runned_processes / count_processes * 100),
+            f"Process finished {process.get_name()}",
+        )
+
     def _run_process(self, process: ProcessModel) -> None:
         self.progress_bar.add_info_message(f"Run process {process.get_name()}")
         process.run()
 
-        # propagate the outputs of the process to all the connected inputs
+        self._propagate_process_outputs(process)
+
+    def _propagate_process_outputs(self, process: ProcessModel) -> None:
+        """Propagate the outputs of the process to all the connected inputs"""
         next_processes: dict[str, ProcessModel] = {}
-        for connector in self.connectors:
-            if connector.left_process.instance_name == process.instance_name:
-                connector.propagate_resource()
-                next_process = connector.right_process
-                next_processes[next_process.instance_name] = next_process
+        for connector in self._get_connectors_from_left_process(process.instance_name):
+            connector.propagate_resource()
+            next_process = connector.right_process
+            next_processes[next_process.instance_name] = next_process
 
         # save inputs of the next processes
         for next_process in next_processes.values():
@@ -492,8 +649,7 @@ class ProtocolModel(ProcessModel):
         self._check_instance_name(process_name)
         return {
             connector.left_process
-            for connector in self.connectors
-            if connector.right_process.instance_name == process_name
+            for connector in self._get_connectors_from_right_process(process_name)
         }
 
     def get_direct_next_processes(self, process_name: str) -> set[ProcessModel]:
@@ -508,8 +664,19 @@ class ProtocolModel(ProcessModel):
         self._check_instance_name(process_name)
         return {
             connector.right_process
-            for connector in self.connectors
-            if connector.left_process.instance_name == process_name
+            for connector in self._get_connectors_from_left_process(process_name)
+        }
+
+    def _get_direct_previous_names(self, process_name: str) -> set[str]:
+        return {
+            connector.left_process.instance_name
+            for connector in self._get_connectors_from_right_process(process_name)
+        }
+
+    def _get_direct_next_names(self, process_name: str) -> set[str]:
+        return {
+            connector.right_process.instance_name
+            for connector in self._get_connectors_from_left_process(process_name)
         }
 
     def get_all_next_processes(
@@ -720,9 +887,22 @@ class ProtocolModel(ProcessModel):
 
         return self._connectors
 
+    def _get_connectors_from_left_process(self, process_name: str) -> list[Connector]:
+        """Return the connectors which left side is the process, using the connectors index"""
+        # load the connectors and their index
+        self._load_from_graph()
+        self._load_connectors()
+        return self._connectors_by_left.get(process_name, [])
+
+    def _get_connectors_from_right_process(self, process_name: str) -> list[Connector]:
+        """Return the connectors which right side is the process, using the connectors index"""
+        self._load_from_graph()
+        self._load_connectors()
+        return self._connectors_by_right.get(process_name, [])
+
     def _load_connectors(self) -> None:
         if self._connectors is None:
-            self._connectors = []
+            self._set_connectors([])
 
             if "graph" in self.data:
                 graph = self.get_graph()
@@ -793,13 +973,30 @@ class ProtocolModel(ProcessModel):
             check_compatiblity=check_compatiblity,
         )
 
-        if connector in self._connectors:
+        if connector in self._connectors_by_left.get(from_process_name, []):
             raise BadRequestException("Duplicated connector")
         # use _connector because this is used in the init
         self._connectors.append(connector)
+        self._index_connector(connector)
 
         return connector
 
+    def _set_connectors(self, connectors: list[Connector]) -> None:
+        """Set the connectors of the protocol and rebuild the connectors index"""
+        self._connectors = connectors
+        self._connectors_by_left = {}
+        self._connectors_by_right = {}
+        for connector in connectors:
+            self._index_connector(connector)
+
+    def _index_connector(self, connector: Connector) -> None:
+        self._connectors_by_left.setdefault(connector.left_process.instance_name, []).append(
+            connector
+        )
+        self._connectors_by_right.setdefault(connector.right_process.instance_name, []).append(
+            connector
+        )
+
     def _check_port(
         self, process_name: str, port_name: str, port_type: Literal["IN", "OUT"]
     ) -> None:
@@ -815,7 +1012,7 @@ class ProtocolModel(ProcessModel):
     def init_connectors_from_graph(
         self, links: list[ConnectorDTO], check_compatiblity: bool = True
     ) -> None:
-        self._connectors = []
+        self._set_connectors([])
         # create links
         for link in links:
             self._add_connector(
@@ -876,7 +1073,9 @@ class ProtocolModel(ProcessModel):
         """remove all the connectors in the list"""
         for connector in connectors_to_delete:
             connector.reset_right_port()
-        self._connectors = [item for item in self.connectors if item not in connectors_to_delete]
+        self._set_connectors(
+            [item for item in self.connectors if item not in connectors_to_delete]
+        )
 
     def get_connector_from_right(
         self, right_process_name: str, right_process_port_name: str
@@ -885,7 +1084,7 @@ class ProtocolModel(ProcessModel):
         Returns a connector by the destination process and port
         """
 
-        for connector in self.connectors:
+        for connector in self._get_connectors_from_right_process(right_process_name):
             if connector.is_right_connected_to(right_process_name, right_process_port_name):
                 return connector
 
@@ -899,7 +1098,7 @@ class ProtocolModel(ProcessModel):
         """
         return [
             item
-            for item in self.connectors
+            for item in self._get_connectors_from_left_process(left_process_name)
             if item.is_left_connected_to(left_process_name, left_process_port_name)
         ]
 
@@ -1415,3 +1614,24 @@ class ProtocolModel(ProcessModel):
     class Meta:
         table_name = "gws_protocol"
         is_table = True
+
+
+def _init_pool_process() -> None:
+    """Initialize a process of the pool running the tasks in parallel"""
+    AbstractDbManager.reconnect_dbs()
+    # the outputs of the tasks are read by other processes, don't keep them in memory
+    ResourceHandoffCache.disable()
+
+
+def _run_task_model_in_process(task_model_id: str) -> None:
+    """Run a task model in a process of the pool. The task is loaded from the DB and its result
+    (status, outputs, error) is saved in the DB by the run. The caller reloads the task after the run.
+    """
+    from gws_core.task.task_model import TaskModel
+
+    task_model: TaskModel = TaskModel.get_by_id_and_check(task_model_id)
+    try:
+        task_model.run()
+    except ProcessRunException:
+        # the error is saved in the task model, it is read by the caller
+        pass
@@ -1,5 +1,7 @@
 import os
 import shutil
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from shelve import DbfilenameShelf
 from shelve import open as shelve_open
@@ -13,6 +15,9 @@ from ..core.exception.exceptions import BadRequestException
 from ..core.utils.settings import Settings
 from ..impl.file.file_helper import FileHelper
 
+# Marker of a key deleted during a session
+_DELETED_VALUE = object()
+
 # ####################################################################
 #
 # KVStore class
@@ -36,8 +41,13 @@ class KVStore(dict[str, Any]):
 
     _full_file_path: str
 
-    # For iterable, store the current index
-    _iterable_index = 0
+    # Shelve handle kept open during a session (see session method)
+    _session_shelf: DbfilenameShelf | None = None
+    # Number of nested session currently opened on this KVStore
+    _session_depth: int = 0
+    # Writes and deletes done during a session, they are flushed to the file
+    # when the outermost session is closed. _DELETED_VALUE marks a deleted key
+    _session_pending: dict[str, Any]
 
     # class level
     _base_dir: str | None = None
@@ -45,10 +55,16 @@ class KVStore(dict[str, Any]):
     def __init__(self, full_file_path: str):
         super().__init__()
         self._full_file_path = full_file_path
+        self._session_pending = {}
 
     def __contains__(self, key) -> bool:
+        if self._is_in_session() and key in self._session_pending:
+            return self._session_pending[key] is not _DELETED_VALUE
+
         kv_data = self._open_shelve()
-        return kv_data.__contains__(key)
+        result = kv_data.__contains__(key)
+        self._close_shelve(kv_data)
+        return result
 
     @property
     def full_file_dir(self) -> str:
@@ -107,17 +123,29 @@ class KVStore(dict[str, Any]):
     def get(self, key, default=None):
         self._check_key(key)
 
+        if self._is_in_session() and key in self._session_pending:
+            val = self._session_pending[key]
+            return default if val is _DELETED_VALUE else val
+
         kv_data = self._open_shelve()
         val = kv_data.get(key, default=default)
-        kv_data.close()
+        self._close_shelve(kv_data)
         return val
 
     def __getitem__(self, key):
         self._check_key(key)
 
+        if self._is_in_session() and key in self._session_pending:
+            val = self._session_pending[key]
+            if val is _DELETED_VALUE:
+                raise KeyError(key)
+            return val
+
         kv_data = self._open_shelve()
-        val = kv_data[key]
-        kv_data.close()
+        try:
+            val = kv_data[key]
+        finally:
+            self._close_shelve(kv_data)
         return val
 
     def remove(self):
@@ -140,49 +168,138 @@ class KVStore(dict[str, Any]):
         """
         self.check_before_write(key)
 
+        # during a session, the write is buffered and flushed at the end of the session
+        if self._is_in_session():
+            self._session_pending[key] = value
+            return
+
         kv_data = self._open_shelve()
         kv_data[key] = value
-        kv_data.close()
+        self._close_shelve(kv_data)
 
     def __delitem__(self, key):
+        """Delete a key"""
         self.check_before_write(key)
 
-        """ Delete a key """
+        val = self.get(key)
+        if self._is_in_session():
+            self._session_pending[key] = _DELETED_VALUE
+            return val
+
         kv_data = self._open_shelve()
         if key in kv_data:
-            val = kv_data[key]
             del kv_data[key]
 
-        kv_data.close()
+        self._close_shelve(kv_data)
         return val
 
-    def __next__(self):
-        kv_data = self._open_shelve()
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
 
-        if self._iterable_index < len(kv_data):
-            value = list(kv_data.keys())[self._iterable_index]
-            self._iterable_index += 1
-            kv_data.close()
-            return value
-        else:
-            kv_data.close()
-            raise StopIteration
+    def __len__(self) -> int:
+        return len(self.keys())
 
-    def __iter__(self):
-        self._iterable_index = 0
-        return self
+    def keys(self) -> list[str]:
+        """Return the keys of the store, the keys are read once from the file
 
-    def __len__(self) -> int:
+        :return: list of keys
+        :rtype: list[str]
+        """
         kv_data = self._open_shelve()
-        length = len(kv_data)
-        kv_data.close()
-        return length
+        keys = list(kv_data.keys())
+        self._close_shelve(kv_data)
+
+        if self._is_in_session():
+            for key, value in self._session_pending.items():
+                if value is _DELETED_VALUE:
+                    if key in keys:
+                        keys.remove(key)
+                elif key not in keys:
+                    keys.append(key)
+        return keys
+
+    def values(self) -> list[Any]:
+        return [value for _, value in self.items()]
+
+    def items(self) -> list[tuple[str, Any]]:
+        with self.session():
+            return [(key, self[key]) for key in self.keys()]
+
+    @contextmanager
+    def session(self) -> Generator["KVStore", None, None]:
+        """Open a session on the store. During the session, the underlying file is opened
+        only once and the writes are buffered then flushed together at the end of the session.
+        Sessions can be nested, the flush happens when the outermost session is closed.
+
+        Use it when multiple keys are read or written at once:
+        with kv_store.session():
+            kv_store['key_1'] = value_1
+            kv_store['key_2'] = value_2
+
+        :return: the KVStore itself
+        :rtype: KVStore
+        """
+        self._session_depth += 1
+        try:
+            yield self
+        finally:
+            try:
+                if self._session_depth == 1:
+                    self._end_session()
+            finally:
+                self._session_depth -= 1
+
+    def flush(self) -> None:
+        """Write the buffered writes of the current session to the file.
+        Does nothing if there is no session opened.
+        """
+        if not self._session_pending:
+            return
+
+        pending = self._session_pending
+        self._session_pending = {}
+
+        kv_data = self._open_shelve()
+        for key, value in pending.items():
+            if value is _DELETED_VALUE:
+                if key in kv_data:
+                    del kv_data[key]
+            else:
+                kv_data[key] = value
+        self._close_shelve(kv_data)
+
+    def _end_session(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._close_session_shelf()
+
+    def _close_session_shelf(self) -> None:
+        if self._session_shelf is not None:
+            self._session_shelf.close()
+            self._session_shelf = None
+
+    def _is_in_session(self) -> bool:
+        return self._session_depth > 0
 
     def _open_shelve(self) -> DbfilenameShelf:
+        if self._is_in_session():
+            # reuse the handle of the session
+            if self._session_shelf is None:
+                self._create_dir()
+                self._session_shelf = shelve_open(self.get_full_path_without_extension())
+            return self._session_shelf
+
         self._create_dir()
 
         return shelve_open(self.get_full_path_without_extension())
 
+    def _close_shelve(self, kv_data: DbfilenameShelf) -> None:
+        # the handle of a session is closed at the end of the session
+        if kv_data is self._session_shelf:
+            return
+        kv_data.close()
+
     def _create_dir(self) -> None:
         if not FileHelper.exists_on_os(self.full_file_dir):
             os.makedirs(self.full_file_dir)
@@ -190,11 +307,14 @@ class KVStore(dict[str, Any]):
     def check_before_write(self, key: str) -> None:
         self._check_key(key=key)
         if self._lock:
+            # the session handle points to the locked file, close it before switching file
+            self._close_session_shelf()
             self._copy_file(self._lock_copy_full_file_path)
             self._unlock()
 
     def check_before_read(self) -> None:
         if not self.file_exists():
+            self._close_session_shelf()
             self._copy_file(self._lock_copy_full_file_path)
             self._unlock()
 
@@ -6,6 +6,7 @@ from gws_core.impl.file.file_r_field import FileRField
 from gws_core.model.typing_manager import TypingManager
 from gws_core.model.typing_style import TypingIconColor, TypingIconType, TypingStyle
 from gws_core.resource.kv_store import KVStore
+from gws_core.resource.resource_handoff_cache import ResourceHandoffCache
 from gws_core.resource.resource_dto import ResourceOrigin
 from gws_core.resource.technical_info import TechnicalInfo, TechnicalInfoDict
 from gws_core.tag.tag_list import TagList
@@ -229,18 +230,33 @@ class Resource(BaseTyping):
         attr = super().__getattribute__(name)
 
         if isinstance(attr, BaseRField):
-            if self.__kv_store__ and name in self.__kv_store__:
-                if isinstance(attr, FileRField):
-                    value = attr.deserialize(self.__kv_store__.get_key_file_path(name))
-                else:
-                    value = attr.deserialize(self.__kv_store__.get(name))
+            # the resource was generated by a previous task of the run, take the value from memory
+            model_id = self.__model_id__
+            if ResourceHandoffCache.has_field(model_id, name):
+                value = ResourceHandoffCache.get_field_value(model_id, name)
+                if not isinstance(attr, FileRField):
+                    value = attr.deserialize(value)
                 setattr(self, name, value)
                 return value
-            else:
-                # if the key is not in the kv_store return the default
-                # this can happend when the RField is new
+
+            kv_store: KVStore | None = self.__kv_store__
+            if kv_store is None:
                 return attr.get_default_value()
 
+            # use a session so the kvstore file is opened once for the check and the read
+            with kv_store.session():
+                if name in kv_store:
+                    if isinstance(attr, FileRField):
+                        value = attr.deserialize(kv_store.get_key_file_path(name))
+                    else:
+                        value = attr.deserialize(kv_store.get(name))
+                    setattr(self, name, value)
+                    return value
+
+            # if the key is not in the kv_store return the default
+            # this can happend when the RField is new
+            return attr.get_default_value()
+
         # lazy load the tags
         elif isinstance(attr, TagListField):
             tag_list = attr.load_tags(self.get_model_id())
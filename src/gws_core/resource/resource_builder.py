@@ -240,8 +240,7 @@ class ResourceZipBuilder(ResourceBuilder):
         )
 
         # Set parent on owned children
-        for child_model in children_resource_models:
-            child_model.set_parent_and_save(resource_model.id)
+        ResourceModel.set_parent_of_resources(children_resource_models, resource_model.id)
 
         return resource_model
 
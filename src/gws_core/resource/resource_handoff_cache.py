@@ -0,0 +1,178 @@
+import pickle
+from collections import OrderedDict
+from copy import deepcopy
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from numpy import ndarray
+from pandas import DataFrame, Series
+
+from gws_core.impl.file.file_r_field import FileRField
+from gws_core.resource.r_field.r_field import RFieldStorage
+
+if TYPE_CHECKING:
+    from gws_core.resource.resource import Resource
+
+
+class ResourceHandoffEntry:
+    """KV_STORE fields of a saved resource kept in memory by the ResourceHandoffCache.
+
+    The values are stored like in the kv store: the python value for the FileRField and
+    the serialized value for the other RFields.
+    """
+
+    values: dict[str, Any]
+    size: int
+
+    def __init__(self, values: dict[str, Any], size: int) -> None:
+        self.values = values
+        self.size = size
+
+
+class ResourceHandoffCache:
+    """In memory LRU cache of the resources generated during a scenario run.
+
+    When a task output is saved, the values of its KV_STORE fields are kept in memory with
+    the resource model id as key. When the next task loads this resource as input, the fields
+    are taken from the cache instead of being read and deserialized from the kv store.
+
+    The cached values are copied when the resource is added and when a field is accessed, so
+    a task modifying its output or its input can't corrupt the saved version.
+
+    The cache is bounded by a size budget, the least recently used resources are evicted
+    and loaded from the kv store again. The cache is cleared at the end of each run.
+    It is disabled in the processes of the pool running the tasks in parallel, their outputs
+    are read by other processes.
+    """
+
+    # Max total size of the cached resources in bytes
+    MAX_SIZE: int = 1024 * 1024 * 1024
+    # Max size of a single resource in bytes, bigger resources are not cached
+    MAX_ENTRY_SIZE: int = 256 * 1024 * 1024
+
+    _entries: OrderedDict[str, ResourceHandoffEntry] = OrderedDict()
+    _current_size: int = 0
+
+    _lock: Lock = Lock()
+    _enabled: bool = True
+
+    @classmethod
+    def add_resource(cls, resource_model_id: str, resource: "Resource") -> None:
+        """Keep the KV_STORE fields of a saved resource in memory. Only the fields already loaded
+        in the resource are kept, if a field is missing the resource is not cached.
+
+        :param resource_model_id: id of the saved resource model
+        :type resource_model_id: str
+        :param resource: resource that was saved
+        :type resource: Resource
+        """
+        if not cls._enabled:
+            return
+
+        values: dict[str, Any] = {}
+        size = 0
+        for key, r_field in resource.__get_resource_r_fields__().items():
+            if r_field.storage != RFieldStorage.KV_STORE:
+                continue
+
+            # the field was not loaded (lazy loaded), the resource is not cached
+            if key not in resource.__dict__:
+                return
+
+            value = resource.__dict__[key]
+            if not isinstance(r_field, FileRField):
+                value = r_field.serialize(value)
+
+            values[key] = value
+            size += cls._get_value_size(value)
+
+            if size > cls.MAX_ENTRY_SIZE:
+                return
+
+        if not values:
+            return
+
+        # snapshot the values, the resource can still be modified after its save
+        values = deepcopy(values)
+
+        with cls._lock:
+            cls._remove_entry(resource_model_id)
+            cls._entries[resource_model_id] = ResourceHandoffEntry(values, size)
+            cls._current_size += size
+
+            # evict the least recently used entries, they will be loaded from the kv store
+            while cls._current_size > cls.MAX_SIZE and cls._entries:
+                cls._remove_entry(next(iter(cls._entries)))
+
+    @classmethod
+    def has_field(cls, resource_model_id: str | None, field_name: str) -> bool:
+        if resource_model_id is None:
+            return False
+        with cls._lock:
+            entry = cls._entries.get(resource_model_id)
+            return entry is not None and field_name in entry.values
+
+    @classmethod
+    def get_field_value(cls, resource_model_id: str, field_name: str) -> Any:
+        """Return a copy of the cached value of a field, as stored in the kv store
+        (serialized value except for FileRField). Call has_field before.
+
+        :param resource_model_id: id of the resource model
+        :type resource_model_id: str
+        :param field_name: name of the RField
+        :type field_name: str
+        :return: a copy of the stored value
+        :rtype: Any
+        """
+        with cls._lock:
+            entry = cls._entries[resource_model_id]
+            # mark the entry as recently used
+            cls._entries.move_to_end(resource_model_id)
+            value = entry.values[field_name]
+
+        return deepcopy(value)
+
+    @classmethod
+    def invalidate_resource(cls, resource_model_id: str) -> None:
+        with cls._lock:
+            cls._remove_entry(resource_model_id)
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._entries.clear()
+            cls._current_size = 0
+
+    @classmethod
+    def disable(cls) -> None:
+        """Clear the cache and stop caching the resources in this process"""
+        cls._enabled = False
+        cls.clear()
+
+    @classmethod
+    def get_current_size(cls) -> int:
+        return cls._current_size
+
+    @classmethod
+    def _remove_entry(cls, resource_model_id: str) -> None:
+        entry = cls._entries.pop(resource_model_id, None)
+        if entry is not None:
+            cls._current_size -= entry.size
+
+    @classmethod
+    def _get_value_size(cls, value: Any) -> int:
+        """Estimate the memory size of a value"""
+        if isinstance(value, DataFrame):
+            return int(value.memory_usage(index=True, deep=True).sum())
+        if isinstance(value, Series):
+            return int(value.memory_usage(index=True, deep=True))
+        if isinstance(value, ndarray):
+            return value.nbytes
+        if isinstance(value, (bytes, str)):
+            return len(value)
+
+        try:
+            return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            # the value can't be pickled, consider it too big to be cached
+            return cls.MAX_ENTRY_SIZE + 1
@@ -10,11 +10,13 @@ from peewee import (
     ForeignKeyField,
     ModelDelete,
     ModelSelect,
+    chunked,
 )
 
 from gws_core.core.db.gws_core_db_manager import GwsCoreDbManager
 from gws_core.core.exception.gws_exceptions import GWSException
 from gws_core.core.model.db_field import BaseDTOField, JSONField
+from gws_core.core.utils.date_helper import DateHelper
 from gws_core.core.utils.utils import Utils
 from gws_core.entity_navigator.entity_navigator_type import NavigableEntity, NavigableEntityType
 from gws_core.folder.model_with_folder import ModelWithFolder
@@ -31,7 +33,7 @@ from gws_core.resource.resource_dto import (
 from gws_core.resource.resource_set.resource_list_base import ResourceListBase
 from gws_core.resource.technical_info import TechnicalInfoDict
 from gws_core.tag.entity_tag_list import EntityTagList
-from gws_core.tag.tag import TagOrigin
+from gws_core.tag.tag import Tag, TagOrigin
 from gws_core.tag.tag_entity_type import TagEntityType
 from gws_core.tag.tag_list import TagList
 
@@ -44,12 +46,16 @@ from ..impl.file.file_r_field import FileRField
 from ..impl.file.fs_node import FSNode
 from ..impl.file.fs_node_model import FSNodeModel
 from ..impl.file.local_file_store import LocalFileStore
+from ..impl.table.table_sort_cache import TableSortCache
 from ..model.typing import Typing
 from ..model.typing_manager import TypingManager
 from ..resource.kv_store import KVStore
 from ..resource.resource import Resource
+from ..user.current_user_service import CurrentUserService
 from .r_field.r_field import BaseRField, RFieldStorage
 from .resource_factory import ResourceFactory
+from .resource_handoff_cache import ResourceHandoffCache
+from .view.view_result_cache import ViewResultCache
 
 if TYPE_CHECKING:
     from ..scenario.scenario import Scenario
@@ -114,6 +120,9 @@ class ResourceModel(ModelWithUser, ModelWithFolder, NavigableEntity):
         # fs_node_model: FSNodeModel = self.fs_node_model
         result = super().delete_instance(*args, **kwargs)
         EntityTagList.delete_by_entity(TagEntityType.RESOURCE, self.id)
+        ViewResultCache.invalidate_resource(self.id)
+        TableSortCache.invalidate_resource(self.id)
+        ResourceHandoffCache.invalidate_resource(self.id)
 
         if self.fs_node_model:
             self.fs_node_model.delete_instance()
@@ -128,6 +137,9 @@ class ResourceModel(ModelWithUser, ModelWithFolder, NavigableEntity):
         """
         fs_node_model = self.fs_node_model
 
+        ViewResultCache.invalidate_resource(self.id)
+        TableSortCache.invalidate_resource(self.id)
+        ResourceHandoffCache.invalidate_resource(self.id)
         self.content_is_deleted = True
         self.fs_node_model = None
         self.data = {}
@@ -149,6 +161,9 @@ class ResourceModel(ModelWithUser, ModelWithFolder, NavigableEntity):
         if self.is_archived == archive:
             return self
 
+        ViewResultCache.invalidate_resource(self.id)
+        TableSortCache.invalidate_resource(self.id)
+        ResourceHandoffCache.invalidate_resource(self.id)
         self.is_archived = archive
         return self.save()
 
@@ -293,6 +308,18 @@ class ResourceModel(ModelWithUser, ModelWithFolder, NavigableEntity):
         Returns the resource created from the data and resource_typing_name
         if new_instance, it forces to rebuild the resource
         """
+        self.check_content_is_available()
+
+        if new_instance:
+            return self._instantiate_resource()
+
+        if self._resource is None:
+            self._resource = self._instantiate_resource()
+
+        return self._resource
+
+    def check_content_is_available(self) -> None:
+        """Raise an exception if the content of the resource was deleted"""
         if self.content_is_deleted:
             if self.origin == ResourceOrigin.IMPORTED_FROM_LAB:
                 raise BadRequestException(
@@ -307,14 +334,6 @@ class ResourceModel(ModelWithUser, ModelWithFolder, NavigableEntity):
                     {"resource_name": self.name},
                 )
 
-        if new_instance:
-            return self._instantiate_resource()
-
-        if self._resource is None:
-            self._resource = self._instantiate_resource()
-
-        return self._resource
-
     def _instantiate_resource(self) -> Resource:
         """
         Create the Resource object from the resource_typing_name
@@ -521,8 +540,7 @@ class ResourceModel(ModelWithUser, ModelWithFolder, NavigableEntity):
 
         # Update the parent of the children resources to this resource
         if isinstance(resource, ResourceListBase):
-            for child_resource in new_children_resources:
-                child_resource.set_parent_and_save(resource_model.id)
+            cls.set_parent_of_resources(new_children_resources, resource_model.id)
 
         if resource.tags and isinstance(resource.tags, TagList):
             # Add tags, use current user origin as default origin
@@ -534,6 +552,71 @@ class ResourceModel(ModelWithUser, ModelWithFolder, NavigableEntity):
             entity_tags.add_tags(resource.tags.get_tags())
         return resource_model
 
+    @classmethod
+    @GwsCoreDbManager.transaction()
+    def save_all_from_resources(
+        cls,
+        resources: list[Resource],
+        origin: ResourceOrigin = ResourceOrigin.GENERATED,
+        scenario: Scenario | None = None,
+        task_model: TaskModel | None = None,
+        port_name: str | None = None,
+    ) -> list[ResourceModel]:
+        """Create the ResourceModels from a list of resources and save them with multi-row inserts
+        (resource models, fs nodes and tags) instead of one query per model.
+        Used to save the children of a ResourceSet. The resources with children are
+        saved one by one with save_from_resource.
+
+        :return: the saved resource models, in the same order as the resources
+        :rtype: list[ResourceModel]
+        """
+        resource_models: list[ResourceModel] = []
+        new_resource_models: list[ResourceModel] = []
+        tags_by_resource: dict[str, list[Tag]] = {}
+        for resource in resources:
+            if isinstance(resource, ResourceListBase):
+                resource_models.append(
+                    cls.save_from_resource(
+                        resource,
+                        origin=origin,
+                        scenario=scenario,
+                        task_model=task_model,
+                        port_name=port_name,
+                    )
+                )
+                continue
+
+            resource_model = cls.from_resource(
+                resource,
+                origin=origin,
+                scenario=scenario,
+                task_model=task_model,
+                port_name=port_name,
+            )
+            resource_models.append(resource_model)
+            new_resource_models.append(resource_model)
+
+            if resource.tags and isinstance(resource.tags, TagList):
+                tags_by_resource[resource_model.id] = resource.tags.get_tags()
+
+        FSNodeModel.insert_all(
+            [
+                resource_model.fs_node_model
+                for resource_model in new_resource_models
+                if resource_model.fs_node_model
+            ]
+        )
+        ResourceModel.insert_all(new_resource_models)
+
+        if tags_by_resource:
+            # Add tags, use current user origin as default origin
+            EntityTagList.add_tags_to_new_entities(
+                TagEntityType.RESOURCE,
+                tags_by_resource,
+                default_origin=TagOrigin.current_user_origin(),
+            )
+        return resource_models
+
     @GwsCoreDbManager.transaction()
     def fill_content_from_resource(
         self,
@@ -576,23 +659,25 @@ class ResourceModel(ModelWithUser, ModelWithFolder, NavigableEntity):
         # get the r_fields of the resource
         r_fields: dict[str, BaseRField] = resource.__get_resource_r_fields__()
 
-        for key, r_field in r_fields.items():
-            # get the attribute value corresponding to the r_field
-            r_field_value: Any = getattr(resource, key)
+        # use a session so the kvstore file is opened once and all the fields are written together
+        with kv_store.session():
+            for key, r_field in r_fields.items():
+                # get the attribute value corresponding to the r_field
+                r_field_value: Any = getattr(resource, key)
 
-            # specific case for the FileRField
-            if isinstance(r_field, FileRField):
-                kv_store.set_file(key, r_field, r_field_value)
-                continue
+                # specific case for the FileRField
+                if isinstance(r_field, FileRField):
+                    kv_store.set_file(key, r_field, r_field_value)
+                    continue
 
-            value: Any = r_field.serialize(r_field_value)
-            # Store the property in the correct place
-            if r_field.storage == RFieldStorage.DATABASE:
-                self.data[key] = value
+                value: Any = r_field.serialize(r_field_value)
+                # Store the property in the correct place
+                if r_field.storage == RFieldStorage.DATABASE:
+                    self.data[key] = value
 
-            # Otherwise, store it in the kvstore
-            elif r_field.storage == RFieldStorage.KV_STORE:
-                kv_store[key] = value
+                # Otherwise, store it in the kvstore
+                elif r_field.storage == RFieldStorage.KV_STORE:
+                    kv_store[key] = value
 
     def _get_resource_r_fields(self, resource_type: type[Resource]) -> dict[str, BaseRField]:
         """Get the list of resource's r_fields,
@@ -610,6 +695,29 @@ class ResourceModel(ModelWithUser, ModelWithFolder, NavigableEntity):
         self.parent_resource_id = parent_resource_id
         return self.save()
 
+    @classmethod
+    def set_parent_of_resources(
+        cls, resource_models: list[ResourceModel], parent_resource_id: str, batch_size: int = 500
+    ) -> None:
+        """Set the parent of a list of saved resource models with one update query per batch"""
+        if not resource_models:
+            return
+
+        last_modified_at = DateHelper.now_utc()
+        last_modified_by = CurrentUserService.get_and_check_current_user()
+        for resource_model in resource_models:
+            resource_model.parent_resource_id = parent_resource_id
+            resource_model.last_modified_at = last_modified_at
+            resource_model.last_modified_by = last_modified_by
+
+        resource_model_ids = [resource_model.id for resource_model in resource_models]
+        for batch in chunked(resource_model_ids, batch_size):
+            ResourceModel.update(
+                parent_resource_id=parent_resource_id,
+                last_modified_at=last_modified_at,
+                last_modified_by=last_modified_by,
+            ).where(ResourceModel.id.in_(batch)).execute()
+
     ########################################## KV STORE ######################################
 
     @final
@@ -621,9 +729,10 @@ class ResourceModel(ModelWithUser, ModelWithFolder, NavigableEntity):
         kv_store: KVStore = KVStore(str(self.kv_store_path))
 
         if self.fs_node_model:
-            kv_store["path"] = self.fs_node_model.path
-            kv_store["file_store_id"] = self.fs_node_model.file_store_id
-            kv_store["is_symbolic_link"] = self.fs_node_model.is_symbolic_link
+            with kv_store.session():
+                kv_store["path"] = self.fs_node_model.path
+                kv_store["file_store_id"] = self.fs_node_model.file_store_id
+                kv_store["is_symbolic_link"] = self.fs_node_model.is_symbolic_link
 
         # Lock the kvstore so the file can't be updated
         kv_store.lock(KVStore.get_full_file_path(file_name=self.id, with_extension=False))
@@ -12,6 +12,7 @@ from gws_core.resource.resource_dto import ResourceOrigin
 from gws_core.resource.resource_set.resource_list_base import ResourceListBase
 from gws_core.resource.view.view_dto import ResourceViewMetadatalDTO, ViewDTO
 from gws_core.resource.view.view_result import CallViewResult
+from gws_core.resource.view.view_result_cache import CachedViewResult, ViewResultCache
 from gws_core.resource.view.view_runner import ViewRunner
 from gws_core.resource.view.view_types import exluded_views_in_note
 from gws_core.resource.view_config.view_config import ViewConfig
@@ -242,26 +243,23 @@ class ResourceService:
         config_values: ConfigParamsDict,
         save_view_config: bool = False,
     ) -> CallViewResult:
-        resource: Resource = resource_model.get_resource()
-
-        view_runner: ViewRunner = ViewRunner(resource, view_name, config_values)
-
-        view = view_runner.generate_view()
-
-        # call the view to dict
-        view_dto = view_runner.call_view_to_dto()
+        view_runner, cached_view = cls._call_view_with_cache(
+            resource_model, view_name, config_values
+        )
 
-        view_title = view.get_title() or resource.name
+        view_title = cached_view.title or view_runner.resource.name
 
-        style = view.get_style() or view_runner.get_metadata_style()
+        style = cached_view.style or view_runner.get_metadata_style()
         # Save the view config
         view_config: ViewConfig | None = None
         if save_view_config and CurrentUserService.get_current_user():
-            view_config = ViewConfigService.save_view_config(
+            view_config = ViewConfigService.save_view_config_from_info(
                 resource_model=resource_model,
-                view=view,
                 view_name=view_name,
                 config=view_runner.get_config(),
+                title=cached_view.title,
+                view_type=cached_view.view_type,
+                is_favorite=cached_view.is_favorite,
                 view_style=style,
             )
 
@@ -270,37 +268,71 @@ class ResourceService:
                 view_title = view_config.title
 
         return CallViewResult(
-            view_dto, resource_model.id, view_config, view_title, view.get_type(), style
+            cached_view.view_dto,
+            resource_model.id,
+            view_config,
+            view_title,
+            cached_view.view_type,
+            style,
         )
 
     @classmethod
     def call_view_from_view_config(cls, view_config_id: str) -> CallViewResult:
         view_config = ViewConfigService.get_by_id(view_config_id)
 
-        resource: Resource = view_config.resource_model.get_resource()
-
-        view_runner: ViewRunner = ViewRunner(
-            resource, view_config.view_name, view_config.get_config_values()
+        view_runner, cached_view = cls._call_view_with_cache(
+            view_config.resource_model, view_config.view_name, view_config.get_config_values()
         )
 
-        view = view_runner.generate_view()
-
-        # call the view to dict
-        view_dto = view_runner.call_view_to_dto()
-
         # Update view config last call date
         view_config.last_modified_at = DateHelper.now_utc()
         view_config.save()
 
         return CallViewResult(
-            view_dto,
+            cached_view.view_dto,
             view_config.resource_model.id,
             view_config,
             view_config.title,
-            view.get_type(),
+            cached_view.view_type,
             view_runner.get_metadata_style(),
         )
 
+    @classmethod
+    def _call_view_with_cache(
+        cls,
+        resource_model: ResourceModel,
+        view_name: str,
+        config_values: ConfigParamsDict,
+    ) -> tuple[ViewRunner, CachedViewResult]:
+        """Call the view on the resource or retrieve the result from the ViewResultCache.
+        The resource RFields are lazy loaded so the resource data is not loaded on cache hit.
+        """
+        resource: Resource = resource_model.get_resource()
+
+        view_runner: ViewRunner = ViewRunner(resource, view_name, config_values)
+
+        cache_key = ViewResultCache.build_key(
+            resource_model, view_runner.get_view_method_name(), view_runner.config_params
+        )
+        cached_view = ViewResultCache.get(cache_key)
+        if cached_view is not None:
+            return view_runner, cached_view
+
+        view = view_runner.generate_view()
+
+        # call the view to dict
+        view_dto = view_runner.call_view_to_dto()
+
+        cached_view = CachedViewResult(
+            view_dto=view_dto,
+            title=view.get_title(),
+            view_type=view.get_type(),
+            is_favorite=view.is_favorite(),
+            style=view.get_style(),
+        )
+        ViewResultCache.set(cache_key, cached_view)
+        return view_runner, cached_view
+
     ############################# SEARCH ###########################
 
     @classmethod
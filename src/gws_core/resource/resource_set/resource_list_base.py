@@ -101,9 +101,8 @@ class ResourceListBase(Resource):
     ) -> list[ResourceModel]:
         from ..resource_model import ResourceModel  # noqa: PLC0415
 
-        new_children_resources: list[ResourceModel] = []
-
         new_resources: dict[str, Resource] = {}
+        resources_to_save: list[Resource] = []
         for resource in self.get_resources_as_set():
 
             if resource.__is_reference__:
@@ -123,16 +122,19 @@ class ResourceListBase(Resource):
 
                 new_resources[resource.uid] = resource
             else:
-                # create and save the resource model from the resource
-                resource_model = ResourceModel.save_from_resource(
-                    resource,
-                    origin=resource_origin,
-                    scenario=scenario,
-                    task_model=task_model,
-                    port_name=port_name,
-                )
-                new_resources[resource.uid] = resource_model.get_resource()
-                new_children_resources.append(resource_model)
+                resources_to_save.append(resource)
+
+        # create and save the resource models from the resources, with multi-row inserts
+        new_children_resources: list[ResourceModel] = ResourceModel.save_all_from_resources(
+            resources_to_save,
+            origin=resource_origin,
+            scenario=scenario,
+            task_model=task_model,
+            port_name=port_name,
+        )
+        for resource, resource_model in zip(resources_to_save, new_children_resources):
+            new_resources[resource.uid] = resource_model.get_resource()
+
         self.__set_r_field__(new_resources)
         return new_children_resources
 
@@ -1,17 +1,21 @@
 import os
-from json import dump
+from io import BufferedReader, RawIOBase
+from json import dumps
+from threading import Thread
+from typing import BinaryIO
 
 from gws_core.core.model.model_dto import BaseModelDTO
 from gws_core.core.utils.compress.tar_compress import TarCompress
 from gws_core.core.utils.settings import Settings
 from gws_core.external_lab.external_lab_api_service import ExternalLabApiService
 from gws_core.external_lab.external_lab_dto import ExternalLabWithUserInfo
+from gws_core.impl.file.file_helper import FileHelper
 from gws_core.impl.file.fs_node_model import FSNodeModel
 from gws_core.resource.kv_store import KVStore
 from gws_core.resource.resource import Resource
 from gws_core.resource.resource_dto import ResourceModelExportDTO
 from gws_core.resource.resource_set.resource_list_base import ResourceListBase
-from gws_core.tag.entity_tag_list import EntityTagList
+from gws_core.tag.entity_tag import EntityTag
 from gws_core.tag.tag_dto import TagDTO
 from gws_core.tag.tag_entity_type import TagEntityType
 from gws_core.user.user import User
@@ -48,26 +52,36 @@ class ResourceExportPackage(BaseModelDTO):
 
 
 class ResourceZipper:
-    """Class to generate a zip file containing everythinga needed to recreate a resource"""
+    """Class to generate a zip file containing everythinga needed to recreate a resource
+
+    The resources are added first (only their metadata is read), then the tar is written with
+    the kv stores and the fs nodes of the resources, either in a temp file (close_zip) or as
+    a stream (write_tar, open_tar_stream) so it can be sent without creating the tar on disk.
+    """
 
     ZIP_FILE_NAME = "resource.tar"
     INFO_JSON_FILE_NAME = "info.json"
     COMPRESS_EXTENSION = "tar"
 
-    temp_dir: str
+    # size of the buffer of the stream returned by open_tar_stream
+    STREAM_BUFFER_SIZE = 1024 * 1024
 
-    zip: TarCompress
+    temp_dir: str | None = None
 
     resource_info: ResourceExportPackage
 
     shared_by: User
 
+    # kv store dirs and fs nodes to add in the tar, list of (path, name in the tar)
+    _kvstore_dirs: list[tuple[str, str]]
+    _fs_nodes: list[tuple[str, str]]
+
     EXPORT_VERSION = 2
 
     def __init__(self, shared_by: User):
         self.shared_by = shared_by
-        self.temp_dir = Settings.get_instance().make_temp_dir()
-        self.zip = TarCompress(self.get_zip_file_path())
+        self._kvstore_dirs = []
+        self._fs_nodes = []
         self.resource_info = ResourceExportPackage(
             zip_version=self.EXPORT_VERSION,
             resource=None,
@@ -82,53 +96,170 @@ class ResourceZipper:
 
     def add_resource_model(self, resource_id: str, parent_resource_id: str | None = None) -> None:
         resource_model: ResourceModel = ResourceModel.get_by_id_and_check(resource_id)
+        self._add_resource_models([resource_model], parent_resource_id)
+
+    def _add_resource_models(
+        self, resource_models: list[ResourceModel], parent_resource_id: str | None
+    ) -> None:
+        """Add the resources and their children recursively. Only the metadata of the resources
+        is read, the tags of the resources are retrieved with one query and only the resource lists
+        are instantiated (to retrieve the ids of their children).
+        """
+        resource_tags: dict[str, list[TagDTO]] = {
+            resource_model.id: [] for resource_model in resource_models
+        }
+        for entity_tag in EntityTag.find_by_entities(
+            TagEntityType.RESOURCE, list(resource_tags.keys())
+        ):
+            resource_tags[entity_tag.entity_id].append(entity_tag.to_simple_tag().to_dto())
+
+        for resource_model in resource_models:
+            resource_model.check_content_is_available()
+
+            resource_zip = ResourceExportDTO(
+                resource_model_export=resource_model.to_export_dto(),
+                data=resource_model.data,
+                tags=resource_tags[resource_model.id],
+            )
 
-        resource_tags = EntityTagList.find_by_entity(TagEntityType.RESOURCE, resource_id)
-        tags_dict = [tag.to_simple_tag().to_dto() for tag in resource_tags.get_tags()]
+            # add the kvstore folder in the zip and name this folder kvstore
+            kvstore: KVStore = resource_model.get_kv_store()
+            if kvstore is not None:
+                self._kvstore_dirs.append(
+                    (kvstore.full_file_dir, resource_zip.get_kvstore_dir_name())
+                )
+                resource_zip.has_kvstore = True
+
+            # add the fs_node
+            fs_node_model: FSNodeModel = resource_model.fs_node_model
+            if fs_node_model is not None:
+                self._fs_nodes.append((fs_node_model.path, resource_zip.get_fs_node_name()))
+
+            # add the resource info
+            if parent_resource_id is None:
+                self.resource_info.resource = resource_zip
+            else:
+                self.resource_info.children_resources.append(resource_zip)
+
+            # if the resource is a ResourceListBase, add all the children to the zip recursively
+            resource_type = resource_model.get_resource_type()
+            if resource_type is not None and issubclass(resource_type, ResourceListBase):
+                resource: ResourceListBase = resource_model.get_resource()
+                self._add_resource_models(
+                    self._get_resource_models(list(resource.get_resource_model_ids())),
+                    resource_model.id,
+                )
+
+    def _get_resource_models(self, resource_ids: list[str]) -> list[ResourceModel]:
+        resource_models: list[ResourceModel] = list(
+            ResourceModel.select().where(ResourceModel.id.in_(resource_ids))
+        )
 
-        resource_model_export = resource_model.to_export_dto()
+        if len(resource_models) != len(resource_ids):
+            # raise the not found error of the missing resource
+            found_ids = {resource_model.id for resource_model in resource_models}
+            for resource_id in resource_ids:
+                if resource_id not in found_ids:
+                    ResourceModel.get_by_id_and_check(resource_id)
 
-        resource_zip = ResourceExportDTO(
-            resource_model_export=resource_model_export,
-            data=resource_model.data,
-            tags=tags_dict,
-        )
+        return resource_models
 
-        # add the kvstore
-        kvstore: KVStore = resource_model.get_kv_store()
-        if kvstore is not None:
-            # add the kvstore folder in the zip and name this folder kvstore
-            self.zip.add_dir(kvstore.full_file_dir, dir_name=resource_zip.get_kvstore_dir_name())
-            resource_zip.has_kvstore = True
-
-        # add the fs_node
-        fs_node_model: FSNodeModel = resource_model.fs_node_model
-        if fs_node_model is not None:
-            self.zip.add_fs_node(fs_node_model.path, fs_node_name=resource_zip.get_fs_node_name())
-
-        # add the resource info
-        if parent_resource_id is None:
-            self.resource_info.resource = resource_zip
-        else:
-            self.resource_info.children_resources.append(resource_zip)
-
-        # if the resource is a ResourceListBase, add all the children to the zip recursively
-        resource: Resource = resource_model.get_resource()
-        if isinstance(resource, ResourceListBase):
-            for child_id in resource.get_resource_model_ids():
-                self.add_resource_model(child_id, resource_id)
+    def write_tar(self, fileobj: BinaryIO) -> None:
+        """Write the tar containing the added resources to the file object. The tar is written
+        as a stream, the file object doesn't need to be seekable (pipe, socket...).
 
-    def get_zip_file_path(self):
-        return os.path.join(self.temp_dir, self.ZIP_FILE_NAME)
+        :param fileobj: binary file object to write the tar to
+        :type fileobj: BinaryIO
+        """
+        self._write_tar(TarCompress(fileobj=fileobj))
 
-    def close_zip(self) -> str:
-        # add the info.json file
-        info_json = os.path.join(self.temp_dir, self.INFO_JSON_FILE_NAME)
-        with open(info_json, "w", encoding="UTF-8") as file:
-            dump(self.resource_info.to_json_dict(), file)
+    def open_tar_stream(self) -> BinaryIO:
+        """Return a readable stream of the tar containing the added resources. The tar is written
+        in a thread while the stream is read, so it is never stored on disk. Only the files are
+        read in the thread, the resources must be added before calling this method.
+
+        The stream must be read until the end (an exception is raised if the tar could not
+        be written) and closed.
 
-        self.zip.add_file(info_json, file_name=self.INFO_JSON_FILE_NAME)
+        :return: the readable binary stream of the tar
+        :rtype: BinaryIO
+        """
+        return BufferedReader(ResourceTarStream(self), self.STREAM_BUFFER_SIZE)
 
-        self.zip.close()
+    def get_estimated_size(self) -> int:
+        """Return the size of the files to add in the tar, without the tar headers"""
+        paths = [path for path, _ in [*self._kvstore_dirs, *self._fs_nodes]]
+        return sum(FileHelper.get_size(path) for path in paths)
 
-        return self.get_zip_file_path()
+    def get_zip_file_path(self):
+        if self.temp_dir is None:
+            self.temp_dir = Settings.get_instance().make_temp_dir()
+        return os.path.join(self.temp_dir, self.ZIP_FILE_NAME)
+
+    def close_zip(self) -> str:
+        """Write the tar containing the added resources in a temp file and return its path"""
+        zip_file_path = self.get_zip_file_path()
+        self._write_tar(TarCompress(zip_file_path))
+        return zip_file_path
+
+    def _write_tar(self, tar: TarCompress) -> None:
+        try:
+            for dir_path, dir_name in self._kvstore_dirs:
+                tar.add_dir(dir_path, dir_name=dir_name)
+
+            for fs_node_path, fs_node_name in self._fs_nodes:
+                tar.add_fs_node(fs_node_path, fs_node_name=fs_node_name)
+
+            # add the info.json file
+            tar.add_bytes(
+                dumps(self.resource_info.to_json_dict()).encode("UTF-8"), self.INFO_JSON_FILE_NAME
+            )
+        finally:
+            tar.close()
+
+
+class ResourceTarStream(RawIOBase):
+    """Readable stream of the tar of a ResourceZipper, the tar is written in a
+    thread to a pipe and read from the other end of the pipe.
+    """
+
+    _reader: BinaryIO
+    _thread: Thread
+    _error: BaseException | None = None
+
+    def __init__(self, resource_zipper: ResourceZipper) -> None:
+        super().__init__()
+        read_fd, write_fd = os.pipe()
+        self._reader = open(read_fd, "rb", buffering=0)
+        self._thread = Thread(
+            target=self._write_tar, args=(resource_zipper, write_fd), daemon=True
+        )
+        self._thread.start()
+
+    def _write_tar(self, resource_zipper: ResourceZipper, write_fd: int) -> None:
+        try:
+            with open(write_fd, "wb") as writer:
+                resource_zipper.write_tar(writer)
+        except BaseException as err:  # pylint: disable=broad-exception-caught
+            self._error = err
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = self._reader.readinto(buffer)
+        if size == 0:
+            # end of the tar, check that it was completely written
+            self._thread.join()
+            if self._error is not None:
+                raise Exception(
+                    f"Error while writing the resource tar: {self._error}"
+                ) from self._error
+        return size
+
+    def close(self) -> None:
+        if not self.closed:
+            # close the reader first so the writer stops if the stream was not read until the end
+            self._reader.close()
+            self._thread.join()
+        super().close()
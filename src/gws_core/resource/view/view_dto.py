@@ -58,3 +58,12 @@ class ViewTypeDTO(BaseModelDTO):
     type: ViewType
     human_name: str | None
     style: TypingStyle
+
+
+class ViewResultCacheStatsDTO(BaseModelDTO):
+    nb_entries: int
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
@@ -0,0 +1,167 @@
+import hashlib
+import json
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from pydantic_core import PydanticSerializationError
+
+from gws_core.config.config_params import ConfigParams
+from gws_core.model.typing_style import TypingStyle
+from gws_core.resource.view.view_dto import ViewDTO, ViewResultCacheStatsDTO
+from gws_core.resource.view.view_types import ViewType
+
+if TYPE_CHECKING:
+    from gws_core.resource.resource_model import ResourceModel
+
+
+# Key of a cached view: resource model id, view method name, config hash, view version
+ViewResultCacheKey = tuple[str, str, str, str]
+
+
+class CachedViewResult:
+    """Result of a view call stored in the ViewResultCache.
+    The view_dto is shared between the calls, it must not be modified.
+    """
+
+    view_dto: ViewDTO
+    title: str | None
+    view_type: ViewType
+    is_favorite: bool
+    style: TypingStyle | None
+    size: int
+
+    def __init__(
+        self,
+        view_dto: ViewDTO,
+        title: str | None,
+        view_type: ViewType,
+        is_favorite: bool,
+        style: TypingStyle | None,
+        size: int = 0,
+    ) -> None:
+        self.view_dto = view_dto
+        self.title = title
+        self.view_type = view_type
+        self.is_favorite = is_favorite
+        self.style = style
+        self.size = size
+
+
+class ViewResultCache:
+    """In memory LRU cache of the views called on resource models.
+
+    The key contains the resource model id, the view method, the hash of the complete
+    view config (with default values) and a view version built from the resource type, the brick version
+    and the last modification date of the resource model. So any update of the resource model
+    makes the previous entries unreachable (they are evicted by the LRU). The entries of a resource
+    are also removed when its content is deleted or when it is archived.
+
+    The cache is bounded by a size budget, the size of an entry is the size of the json view.
+    """
+
+    # Max total size of the cached views in bytes
+    MAX_SIZE: int = 200 * 1024 * 1024
+    # Max size of a single view in bytes, bigger views are not cached
+    MAX_ENTRY_SIZE: int = 20 * 1024 * 1024
+
+    # Views that are not cached because their content depends on the context of the call
+    # (running app, token in url...)
+    NOT_CACHED_VIEW_TYPES: set[ViewType] = {ViewType.APP, ViewType.IFRAME, ViewType.AUDIO}
+
+    _entries: OrderedDict[ViewResultCacheKey, CachedViewResult] = OrderedDict()
+    _current_size: int = 0
+    _hits: int = 0
+    _misses: int = 0
+    _evictions: int = 0
+
+    _lock: Lock = Lock()
+
+    @classmethod
+    def build_key(
+        cls, resource_model: "ResourceModel", view_method_name: str, config_params: ConfigParams
+    ) -> ViewResultCacheKey:
+        config_json = json.dumps(dict(config_params), sort_keys=True, default=str)
+        config_hash = hashlib.sha256(config_json.encode("utf-8")).hexdigest()
+
+        last_modified_at = (
+            resource_model.last_modified_at.isoformat() if resource_model.last_modified_at else ""
+        )
+        view_version = (
+            f"{resource_model.resource_typing_name}:{resource_model.brick_version}:{last_modified_at}"
+        )
+
+        return (resource_model.id, view_method_name, config_hash, view_version)
+
+    @classmethod
+    def get(cls, key: ViewResultCacheKey) -> CachedViewResult | None:
+        with cls._lock:
+            result = cls._entries.get(key)
+            if result is None:
+                cls._misses += 1
+                return None
+
+            # mark the entry as recently used
+            cls._entries.move_to_end(key)
+            cls._hits += 1
+            return result
+
+    @classmethod
+    def set(cls, key: ViewResultCacheKey, result: CachedViewResult) -> None:
+        if result.view_type in cls.NOT_CACHED_VIEW_TYPES:
+            return
+
+        try:
+            result.size = len(result.view_dto.model_dump_json())
+        except PydanticSerializationError:
+            # the view can't be serialized to compute its size, don't cache it
+            return
+
+        if result.size > cls.MAX_ENTRY_SIZE:
+            return
+
+        with cls._lock:
+            cls._remove_entry(key)
+            cls._entries[key] = result
+            cls._current_size += result.size
+
+            # evict the least recently used entries
+            while cls._current_size > cls.MAX_SIZE and cls._entries:
+                oldest_key = next(iter(cls._entries))
+                cls._remove_entry(oldest_key)
+                cls._evictions += 1
+
+    @classmethod
+    def invalidate_resource(cls, resource_model_id: str) -> None:
+        """Remove all the cached views of a resource model"""
+        with cls._lock:
+            keys = [key for key in cls._entries if key[0] == resource_model_id]
+            for key in keys:
+                cls._remove_entry(key)
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._entries.clear()
+            cls._current_size = 0
+            cls._hits = 0
+            cls._misses = 0
+            cls._evictions = 0
+
+    @classmethod
+    def get_stats(cls) -> ViewResultCacheStatsDTO:
+        with cls._lock:
+            return ViewResultCacheStatsDTO(
+                nb_entries=len(cls._entries),
+                size=cls._current_size,
+                max_size=cls.MAX_SIZE,
+                hits=cls._hits,
+                misses=cls._misses,
+                evictions=cls._evictions,
+            )
+
+    @classmethod
+    def _remove_entry(cls, key: ViewResultCacheKey) -> None:
+        result = cls._entries.pop(key, None)
+        if result is not None:
+            cls._current_size -= result.size
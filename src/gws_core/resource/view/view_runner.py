@@ -91,6 +91,9 @@ class ViewRunner:
 
         return config
 
+    def get_view_method_name(self) -> str:
+        return self._get_and_check_view_meta().method_name
+
     def get_metadata_style(self) -> TypingStyle | None:
         """Return the style defined in the view metadata (@view decorator)
         it can be null
@@ -30,7 +30,6 @@ class ViewConfigService:
         return ViewConfig.get_by_id_and_check(id_)
 
     @classmethod
-    @GwsCoreDbManager.transaction()
     def save_view_config(
         cls,
         resource_model: ResourceModel,
@@ -40,6 +39,31 @@ class ViewConfigService:
         is_favorite: bool = False,
         view_style: TypingStyle | None = None,
     ) -> ViewConfig:
+        return cls.save_view_config_from_info(
+            resource_model=resource_model,
+            view_name=view_name,
+            config=config,
+            title=view.get_title(),
+            view_type=view.get_type(),
+            is_favorite=is_favorite or view.is_favorite(),
+            view_style=view_style,
+        )
+
+    @classmethod
+    @GwsCoreDbManager.transaction()
+    def save_view_config_from_info(
+        cls,
+        resource_model: ResourceModel,
+        view_name: str,
+        config: Config,
+        title: str | None,
+        view_type: ViewType,
+        is_favorite: bool = False,
+        view_style: TypingStyle | None = None,
+    ) -> ViewConfig:
+        """Save the view config from the information of the view, use it when the View object
+        is not available (when the view result comes from the cache)
+        """
         view_meta_data = ViewHelper.get_and_check_view_meta(
             resource_model.get_and_check_resource_type(), view_name
         )
@@ -47,11 +71,11 @@ class ViewConfigService:
         view_config: ViewConfig = ViewConfig(
             resource_model=resource_model,
             scenario=resource_model.scenario,
-            title=view.get_title() or resource_model.name,
+            title=title or resource_model.name,
             view_name=view_meta_data.method_name,
-            view_type=view.get_type(),
+            view_type=view_type,
             config_values={},
-            is_favorite=is_favorite or view.is_favorite(),
+            is_favorite=is_favorite,
             config=config,
             style=view_style,
         )
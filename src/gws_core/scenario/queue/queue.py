@@ -1,6 +1,6 @@
 from typing import Optional, Union
 
-from peewee import ForeignKeyField, ModelSelect
+from peewee import ForeignKeyField, IntegerField, ModelSelect
 
 from gws_core.core.db.gws_core_db_manager import GwsCoreDbManager
 from gws_core.core.exception.exceptions import BadRequestException
@@ -21,16 +21,19 @@ class Job(Model):
     :type user: `gws.user.User`
     :property scenario: The scenario to add to the job
     :type scenario: `gws.scenario.Scenario`
+    :property priority: The jobs with the highest priority are run first
+    :type priority: `int`
     """
 
     user: User = ForeignKeyField(User, null=False, backref="+")
     scenario: Scenario = ForeignKeyField(Scenario, null=False, backref="+", unique=True)
+    priority: int = IntegerField(null=False, default=0)
 
     @classmethod
     @GwsCoreDbManager.transaction(
         nested_transaction=True
     )  # use nested to prevent transaction block in queue tick (from parent call)
-    def add_job(cls, user: User, scenario: Scenario) -> "Job":
+    def add_job(cls, user: User, scenario: Scenario, priority: int = 0) -> "Job":
         """Validate and add a job to the queue."""
         if cls.scenario_in_queue(scenario.id):
             raise BadRequestException("The scenario already is in the queue")
@@ -39,7 +42,7 @@ class Job(Model):
             raise BadRequestException("The maximum number of jobs is reached")
 
         scenario.mark_as_in_queue()
-        job = Job(user=user, scenario=scenario)
+        job = Job(user=user, scenario=scenario, priority=priority)
         job.save()
 
         return job
@@ -66,14 +69,38 @@ class Job(Model):
             cls.delete_by_id(job.id)
         return job
 
+    @classmethod
+    def pop_next(cls, running_count_by_user: dict[str, int]) -> Optional["Job"]:
+        """Pop the next job to run: the job with the highest priority, then the job
+        of the user with the fewest running scenarios (fair share), then the oldest job.
+
+        :param running_count_by_user: number of running scenarios of each user id
+        :type running_count_by_user: dict[str, int]
+        """
+        jobs = cls.get_all_jobs()
+        if not jobs:
+            return None
+
+        # the queue is short (MAX_QUEUE_LENGTH), the jobs are sorted in memory
+        job = min(
+            jobs,
+            key=lambda job_: (
+                -job_.priority,
+                running_count_by_user.get(job_.user_id, 0),
+                job_.created_at,
+            ),
+        )
+        cls.delete_by_id(job.id)
+        return job
+
     @classmethod
     def get_all_jobs(cls) -> list["Job"]:
-        """Get all jobs in the queue ordered by creation time."""
+        """Get all jobs in the queue ordered by priority and creation time."""
         return list(cls._get_jobs_in_order())
 
     @classmethod
     def _get_jobs_in_order(cls) -> ModelSelect:
-        return Job.select().order_by(cls.created_at.asc())
+        return Job.select().order_by(cls.priority.desc(), cls.created_at.asc())
 
     @classmethod
     def queue_length(cls) -> int:
@@ -97,6 +124,7 @@ class Job(Model):
             last_modified_at=self.last_modified_at,
             user=self.user.to_dto(),
             scenario=self.scenario.to_dto(),
+            priority=self.priority,
         )
 
     class Meta:
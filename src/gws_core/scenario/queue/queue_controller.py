@@ -1,7 +1,7 @@
 from fastapi import Depends
 
 from gws_core.core_controller import core_app
-from gws_core.scenario.queue.queue_dto import JobDTO
+from gws_core.scenario.queue.queue_dto import JobDTO, QueueMetricsDTO
 from gws_core.scenario.queue.queue_service import QueueService
 from gws_core.scenario.scenario_dto import ScenarioDTO
 from gws_core.user.authorization_service import AuthorizationService
@@ -17,6 +17,17 @@ def get_the_scenario_queue(_=Depends(AuthorizationService.check_user_access_toke
     return [job.to_dto() for job in queue_job]
 
 
+@core_app.get("/queue/metrics", tags=["Queue"], summary="Get the metrics of the queue")
+def get_queue_metrics(
+    _=Depends(AuthorizationService.check_user_access_token),
+) -> QueueMetricsDTO:
+    """
+    Retrieve the wait time and throughput metrics of the queue
+    """
+
+    return QueueService.get_queue_metrics()
+
+
 @core_app.delete("/queue/scenario/{id}", tags=["Queue"], summary="Get the queue of scenarios")
 def remove_scenario_from_queue(
     id: str, _=Depends(AuthorizationService.check_user_access_token)
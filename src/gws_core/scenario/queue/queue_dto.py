@@ -1,4 +1,4 @@
-from gws_core.core.model.model_dto import ModelDTO
+from gws_core.core.model.model_dto import BaseModelDTO, ModelDTO
 from gws_core.scenario.scenario_dto import ScenarioDTO
 from gws_core.user.user_dto import UserDTO
 
@@ -6,3 +6,20 @@ from gws_core.user.user_dto import UserDTO
 class JobDTO(ModelDTO):
     user: UserDTO
     scenario: ScenarioDTO
+    priority: int = 0
+
+
+class QueueMetricsDTO(BaseModelDTO):
+    """Metrics of the scenario queue since the start of the lab.
+    The wait times are computed on the last started jobs.
+    """
+
+    max_running_scenarios: int
+    running_scenarios: int
+    queue_length: int
+    started_jobs: int
+    finished_jobs: int
+    average_wait_seconds: float | None
+    max_wait_seconds: float | None
+    # number of jobs that finished in the last hour
+    finished_jobs_last_hour: int
@@ -1,57 +1,110 @@
 import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 
 from gws_core.core.model.sys_proc import SysProc
+from gws_core.core.utils.date_helper import DateHelper
 from gws_core.core.utils.logger import Logger
+from gws_core.core.utils.settings import Settings
+from gws_core.lab.monitor.monitor import Monitor
 from gws_core.scenario.queue.queue import Job
+from gws_core.scenario.queue.queue_dto import QueueMetricsDTO
 from gws_core.scenario.scenario import Scenario
 from gws_core.scenario.scenario_run_service import ScenarioRunService
 from gws_core.user.current_user_service import AuthenticateUser
 
 TICK_INTERVAL_SECONDS = 60  # 60 sec
 
+# number of started jobs kept to compute the wait time metrics
+METRICS_WINDOW_SIZE = 1000
+
+
+@dataclass
+class _RunningJob:
+    """Scenario started by the queue runner"""
+
+    user_id: str
+    started_at: datetime
+
 
 class QueueRunner:
-    """Manages the queue tick loop and subprocess lifecycle.
+    """Manages the queue loop and subprocess lifecycle.
 
-    Only initialized in the main process. Responsible for polling the queue,
-    popping jobs, and spawning CLI sub-processes to execute scenarios.
+    Only initialized in the main process. Responsible for popping jobs and spawning CLI
+    sub-processes to execute scenarios.
+
+    Up to Settings.get_queue_max_running_scenarios() scenarios run at the same time. While a
+    scenario is running, another job is only started if the cpu and ram usage of the machine
+    are below the configured budgets. The usage is read from the last Monitor sample saved by
+    the monitor tick, and only from a sample taken after the last started job, so the load of
+    this job is included. The next job is the one with the highest priority, then the one of
+    the user with the fewest running scenarios.
+
+    The loop runs in a thread that wakes up when a job is added, when a scenario sub-process
+    ends or at least every tick interval. At most one job is started per wake up.
     """
 
     tick_is_running: bool = False
     _is_running: bool = False
 
+    _wake_event: threading.Event = threading.Event()
+    _loop_thread: threading.Thread | None = None
+
+    # scenarios started by the runner, by scenario id
+    _running_jobs: dict[str, _RunningJob] = {}
+    _last_job_started_at: datetime | None = None
+    _lock: threading.Lock = threading.Lock()
+
+    # metrics
+    _started_jobs_count: int = 0
+    _finished_jobs_count: int = 0
+    _wait_seconds: deque[float] = deque(maxlen=METRICS_WINDOW_SIZE)
+    _finished_dates: deque[datetime] = deque(maxlen=METRICS_WINDOW_SIZE)
+
     @classmethod
     def init(cls, tick_interval: int = TICK_INTERVAL_SECONDS, daemon: bool = False) -> None:
-        """Start the queue tick loop. Only call from main process."""
+        """Start the queue loop. Only call from main process."""
+        if cls._loop_thread is not None and cls._loop_thread.is_alive():
+            if cls._is_running:
+                return
+            # the previous loop is still stopping
+            cls._loop_thread.join()
+
         cls._is_running = True
-        cls._queue_tick(tick_interval, daemon)
+        cls._wake_event.clear()
+        cls._loop_thread = threading.Thread(
+            target=cls._queue_loop, args=(tick_interval,), daemon=daemon
+        )
+        cls._loop_thread.start()
 
     @classmethod
     def deinit(cls) -> None:
-        """Stop the queue tick loop."""
+        """Stop the queue loop."""
         cls._is_running = False
+        cls._wake_event.set()
 
     @classmethod
-    def _queue_tick(cls, tick_interval: int, daemon: bool) -> None:
-        """Recursive timer-based tick."""
-        if not cls._is_running:
-            return
-        try:
-            cls._tick()
-        finally:
-            thread = threading.Timer(tick_interval, cls._queue_tick, [tick_interval, daemon])
-            thread.daemon = daemon
-            thread.start()
+    def _queue_loop(cls, tick_interval: int) -> None:
+        while cls._is_running:
+            try:
+                cls._tick()
+            except Exception as err:
+                Logger.error(f"Error during the queue tick: {err}")
+                Logger.log_exception_stack_trace(err)
+
+            cls._wake_event.wait(tick_interval)
+            cls._wake_event.clear()
 
     @classmethod
     def try_run_next(cls) -> None:
-        """Trigger an immediate tick if the runner is active.
+        """Wake up the queue loop if the runner is active.
 
         Called after a job is added to avoid waiting for the next scheduled tick.
         No-op in sub-processes where the runner is not running.
         """
         if cls._is_running:
-            cls._tick()
+            cls._wake_event.set()
 
     @classmethod
     def _tick(cls) -> None:
@@ -69,16 +122,48 @@ class QueueRunner:
 
     @classmethod
     def _check_and_run_queue(cls) -> None:
-        """Pop first job and spawn CLI subprocess if no scenario is running."""
+        """Start the next job of the queue if there is a free slot and enough resources.
+        If the job can't be started, the next one is tried."""
         Logger.debug("Checking scenario queue ...")
-        if Scenario.count_running_scenarios() > 0:
-            Logger.debug("The lab is busy! Retry later")
-            return
+        while cls._is_running and cls._can_start_scenario():
+            job = Job.pop_next(cls._get_running_count_by_user())
+            if not job:
+                return
 
-        job = Job.pop_first()
-        if not job:
-            return
+            if cls._run_job(job):
+                return
+
+    @classmethod
+    def _can_start_scenario(cls) -> bool:
+        running_count = Scenario.count_running_scenarios()
+        if running_count == 0:
+            return True
+
+        if running_count >= Settings.get_queue_max_running_scenarios():
+            Logger.debug("The lab is busy! Retry later")
+            return False
+
+        # the live cpu reading is not used as its interval is shared with the monitor tick
+        monitor = Monitor.get_last_or_none()
+        if monitor is None or DateHelper.now_utc() - monitor.created_at > timedelta(
+            seconds=2 * Settings.get_monitor_tick_interval_log()
+        ):
+            Logger.debug("No recent monitor sample to check the resources, retry later")
+            return False
+        if cls._last_job_started_at is not None and monitor.created_at <= cls._last_job_started_at:
+            Logger.debug("No monitor sample since the last started scenario, retry later")
+            return False
+        if monitor.cpu_percent > Settings.get_queue_max_cpu_percent():
+            Logger.debug(f"The cpu usage is {monitor.cpu_percent}%, retry later")
+            return False
+        if monitor.ram_usage_percent > Settings.get_queue_max_ram_percent():
+            Logger.debug(f"The ram usage is {monitor.ram_usage_percent}%, retry later")
+            return False
+        return True
 
+    @classmethod
+    def _run_job(cls, job: Job) -> bool:
+        """Start the scenario of the job, return False if the scenario could not be started"""
         scenario: Scenario = job.scenario
 
         Logger.debug(f"Scenario {scenario.id}, is_running = {scenario.is_running}")
@@ -86,16 +171,64 @@ class QueueRunner:
         try:
             with AuthenticateUser(job.user):
                 sproc = ScenarioRunService.create_cli_for_scenario(scenario=scenario, user=job.user)
-
-            if sproc:
-                thread = threading.Thread(target=cls._wait_scenario_finish, args=(sproc,))
-                thread.start()
         except Exception as err:
+            # the scenario is marked as error, continue with the next jobs
             Logger.error(f"An error occured while runnig the scenario. Error: {err}.")
-            raise err
+            return False
+
+        now = DateHelper.now_utc()
+        with cls._lock:
+            cls._last_job_started_at = now
+            cls._running_jobs[scenario.id] = _RunningJob(user_id=job.user_id, started_at=now)
+            cls._started_jobs_count += 1
+            cls._wait_seconds.append((now - job.created_at).total_seconds())
+
+        if sproc:
+            thread = threading.Thread(
+                target=cls._wait_scenario_finish, args=(sproc, scenario.id), daemon=True
+            )
+            thread.start()
+        return True
 
     @classmethod
-    def _wait_scenario_finish(cls, proc: SysProc) -> None:
-        """Wait for a scenario subprocess to finish, then force a tick."""
+    def _wait_scenario_finish(cls, proc: SysProc, scenario_id: str) -> None:
+        """Wait for a scenario subprocess to finish, then wake up the queue loop."""
         proc.wait()
-        cls._tick()
+        with cls._lock:
+            cls._running_jobs.pop(scenario_id, None)
+            cls._finished_jobs_count += 1
+            cls._finished_dates.append(DateHelper.now_utc())
+        cls.try_run_next()
+
+    @classmethod
+    def _get_running_count_by_user(cls) -> dict[str, int]:
+        with cls._lock:
+            running_count_by_user: dict[str, int] = {}
+            for running_job in cls._running_jobs.values():
+                running_count_by_user[running_job.user_id] = (
+                    running_count_by_user.get(running_job.user_id, 0) + 1
+                )
+            return running_count_by_user
+
+    @classmethod
+    def get_metrics(cls) -> QueueMetricsDTO:
+        """Get the wait time and throughput metrics of the queue since the start of the lab"""
+        last_hour = DateHelper.now_utc() - timedelta(hours=1)
+        with cls._lock:
+            wait_seconds = list(cls._wait_seconds)
+            finished_jobs_last_hour = len(
+                [date for date in cls._finished_dates if date > last_hour]
+            )
+            started_jobs = cls._started_jobs_count
+            finished_jobs = cls._finished_jobs_count
+
+        return QueueMetricsDTO(
+            max_running_scenarios=Settings.get_queue_max_running_scenarios(),
+            running_scenarios=Scenario.count_running_scenarios(),
+            queue_length=Job.queue_length(),
+            started_jobs=started_jobs,
+            finished_jobs=finished_jobs,
+            average_wait_seconds=sum(wait_seconds) / len(wait_seconds) if wait_seconds else None,
+            max_wait_seconds=max(wait_seconds) if wait_seconds else None,
+            finished_jobs_last_hour=finished_jobs_last_hour,
+        )
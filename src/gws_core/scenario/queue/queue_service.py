@@ -1,9 +1,15 @@
-from gws_core.core.exception.exceptions import BadRequestException, NotFoundException
+from gws_core.core.exception.exceptions import (
+    BadRequestException,
+    ForbiddenException,
+    NotFoundException,
+)
 from gws_core.entity_navigator.entity_navigator_service import EntityNavigatorService
 from gws_core.scenario.queue.queue import Job
+from gws_core.scenario.queue.queue_dto import QueueMetricsDTO
 from gws_core.scenario.queue.queue_runner import QueueRunner
 from gws_core.scenario.scenario import Scenario
 from gws_core.user.current_user_service import CurrentUserService
+from gws_core.user.user_group import UserGroup
 
 
 class QueueService:
@@ -13,18 +19,36 @@ class QueueService:
     No process awareness, no tick loop, no threading.
     """
 
+    MIN_PRIORITY = -10
+    MAX_PRIORITY = 10
+
     @classmethod
-    def add_scenario_to_queue(cls, scenario_id: str) -> Scenario:
+    def add_scenario_to_queue(cls, scenario_id: str, priority: int = 0) -> Scenario:
         """Validate and add scenario to queue.
 
         :param scenario_id: The scenario id to add to the queue
         :type scenario_id: str
+        :param priority: The jobs with the highest priority are run first, between MIN_PRIORITY
+                         and MAX_PRIORITY. Only the admins can set a positive priority,
+                         defaults to 0
+        :type priority: int, optional
         :raises NotFoundException: If scenario not found
         :raises BadRequestException: If scenario is already running or in queue
+        :raises ForbiddenException: If a user that is not admin sets a positive priority
         :return: The scenario
         :rtype: Scenario
         """
 
+        if priority < cls.MIN_PRIORITY or priority > cls.MAX_PRIORITY:
+            raise BadRequestException(
+                f"The priority must be between {cls.MIN_PRIORITY} and {cls.MAX_PRIORITY}"
+            )
+
+        user = CurrentUserService.get_and_check_current_user()
+        # a positive priority runs the job before the jobs of the other users
+        if priority > 0 and not user.has_access(UserGroup.ADMIN):
+            raise ForbiddenException("Only the admins can raise the priority of a scenario")
+
         scenario = Scenario.get_by_id(scenario_id)
         if not scenario:
             raise NotFoundException(detail=f"Scenario '{scenario_id}' is not found")
@@ -45,8 +69,7 @@ class QueueService:
         # reset the processes that are in error
         EntityNavigatorService.reset_error_processes_of_protocol(scenario.protocol_model)
 
-        user = CurrentUserService.get_and_check_current_user()
-        Job.add_job(user=user, scenario=scenario)
+        Job.add_job(user=user, scenario=scenario, priority=priority)
 
         # Try to run immediately instead of waiting for the next tick
         QueueRunner.try_run_next()
@@ -67,3 +90,8 @@ class QueueService:
     def scenario_is_in_queue(cls, scenario_id: str) -> bool:
         """Check if scenario is in queue."""
         return Job.scenario_in_queue(scenario_id)
+
+    @classmethod
+    def get_queue_metrics(cls) -> QueueMetricsDTO:
+        """Get the wait time and throughput metrics of the queue."""
+        return QueueRunner.get_metrics()
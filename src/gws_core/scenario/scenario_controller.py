@@ -1,4 +1,4 @@
-from fastapi import Depends
+from fastapi import Depends, Query
 
 from gws_core.config.config_params import ConfigParamsDict
 from gws_core.config.param.param_types import ParamSpecDTO
@@ -214,15 +214,19 @@ def sync_with_space(
 
 @core_app.post("/scenario/{id_}/start", tags=["Scenario"], summary="Start a scenario")
 def start_an_scenario(
-    id_: str, _=Depends(AuthorizationService.check_user_access_token)
+    id_: str,
+    priority: int = Query(0, ge=QueueService.MIN_PRIORITY, le=QueueService.MAX_PRIORITY),
+    _=Depends(AuthorizationService.check_user_access_token),
 ) -> ScenarioDTO:
     """
     Start a scenario
 
     - **flow**: the flow object
+    - **priority**: the jobs of the queue with the highest priority are run first,
+    between -10 and 10. Only the admins can set a positive priority
     """
 
-    return QueueService.add_scenario_to_queue(scenario_id=id_).to_dto()
+    return QueueService.add_scenario_to_queue(scenario_id=id_, priority=priority).to_dto()
 
 
 @core_app.post("/scenario/{id_}/stop", tags=["Scenario"], summary="Stop a scenario")
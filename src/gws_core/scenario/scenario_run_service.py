@@ -9,6 +9,9 @@ from gws_core.process.process_exception import ProcessRunException
 from gws_core.process.process_model import ProcessModel
 from gws_core.process.process_types import ProcessErrorInfo, ProcessStatus
 from gws_core.protocol.protocol_model import ProtocolModel
+from gws_core.resource.resource_handoff_cache import ResourceHandoffCache
+from gws_core.scenario.worker.scenario_worker_dto import ScenarioWorkerRunRequest
+from gws_core.scenario.worker.scenario_worker_pool import ScenarioWorkerPool
 from gws_core.space.mail_service import MailService
 from gws_core.space.space_dto import SendScenarioFinishMailData
 from gws_core.task.task_model import TaskModel
@@ -109,6 +112,9 @@ class ScenarioRunService:
 
             cls._send_scenario_finished_mail(scenario)
             raise exception from err
+        finally:
+            # free the resources kept in memory during the run
+            ResourceHandoffCache.clear()
 
     @classmethod
     def run_scenario_process_from_cli(
@@ -183,6 +189,8 @@ class ScenarioRunService:
 
             process_model.mark_as_error_and_parent(exception)
             raise exception from err
+        finally:
+            ResourceHandoffCache.clear()
 
     @classmethod
     def _check_scenario_before_start(cls, scenario: Scenario) -> None:
@@ -276,6 +284,30 @@ class ScenarioRunService:
 
         cls._check_disk_space_before_run(scenario)
 
+        # run the scenario in a process forked by a warm worker if one is ready
+        worker_run = ScenarioWorkerPool.fork_run(
+            ScenarioWorkerRunRequest(
+                scenario_id=scenario.id,
+                user_id=user.id,
+                log_level=Logger.level,
+                protocol_model_id=process_model.parent_protocol_id if process_model else None,
+                process_instance_name=process_model.instance_name if process_model else None,
+            )
+        )
+        if worker_run is not None:
+            try:
+                sproc = SysProc.from_pid(worker_run.pid)
+                cls._mark_as_waiting_for_cli_process(scenario, sproc, process_model)
+            except BaseException:
+                # the forked process exits without running the scenario
+                worker_run.close()
+                raise
+            worker_run.start()
+            Logger.info(
+                f"Scenario {scenario.id} run in process {sproc.pid} forked by a scenario worker"
+            )
+            return sproc
+
         settings = Settings.get_instance()
 
         gws_core_brick = settings.get_brick("gws_core")
@@ -318,12 +350,7 @@ class ScenarioRunService:
 
         sproc = SysProc.popen(cmd, stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
 
-        # Mark that a process is created for the scenario, but it is not started yet
-        scenario.mark_as_waiting_for_cli_process(sproc.pid)
-
-        if process_model:
-            # Mark also the process as waiting for cli process
-            process_model.mark_as_waiting_for_cli_process()
+        cls._mark_as_waiting_for_cli_process(scenario, sproc, process_model)
 
         Logger.info(f"Scenario process run_through_cli {str(cmd)}")
         Logger.info(
@@ -332,6 +359,17 @@ class ScenarioRunService:
         )
         return sproc
 
+    @classmethod
+    def _mark_as_waiting_for_cli_process(
+        cls, scenario: Scenario, sproc: SysProc, process_model: ProcessModel | None
+    ) -> None:
+        # Mark that a process is created for the scenario, but it is not started yet
+        scenario.mark_as_waiting_for_cli_process(sproc.pid)
+
+        if process_model:
+            # Mark also the process as waiting for cli process
+            process_model.mark_as_waiting_for_cli_process()
+
     @classmethod
     def _check_disk_space_before_run(cls, scenario: Scenario) -> None:
         # check if there is enough disk space
@@ -0,0 +1,170 @@
+import logging
+import os
+import signal
+import socket
+from typing import BinaryIO
+
+import psutil
+
+from gws_core.core.db.db_manager_service import DbManagerService
+from gws_core.core.utils.logger import LogContext, Logger
+from gws_core.core.utils.settings import Settings
+from gws_core.scenario.scenario_run_service import ScenarioRunService
+from gws_core.scenario.worker.scenario_worker_dto import (
+    SCENARIO_WORKER_START_MESSAGE,
+    ScenarioWorkerRunRequest,
+    ScenarioWorkerRunResponse,
+)
+from gws_core.user.current_user_service import AuthenticateUser
+from gws_core.user.user import User
+
+
+class ScenarioWorker:
+    """Warm process (zygote) started by the ScenarioWorkerPool of the main process.
+
+    The worker imports the bricks and loads the typings once, then waits for run requests
+    on a unix socket. For each request it forks a process that connects to the DB and runs the
+    scenario, the pid of the forked process is returned to the main process.
+    The worker does not connect to the DB itself so the forked processes do not share a
+    connection.
+
+    The worker stops after max_runs runs, when its memory is above max_memory or when the
+    main process stops.
+    """
+
+    # seconds between two checks of the main process while waiting for a request
+    ACCEPT_TIMEOUT = 1
+
+    # max seconds to wait for the request and for the start message of the main process
+    MESSAGE_TIMEOUT = 60
+
+    socket_path: str
+    parent_pid: int
+    max_runs: int
+    max_memory: int
+
+    run_count: int
+
+    def __init__(self, socket_path: str, parent_pid: int, max_runs: int, max_memory: int) -> None:
+        """
+        :param socket_path: path of the unix socket to listen to
+        :type socket_path: str
+        :param parent_pid: pid of the main process, the worker stops when it stops
+        :type parent_pid: int
+        :param max_runs: number of runs after which the worker stops
+        :type max_runs: int
+        :param max_memory: memory (bytes) of the worker above which it stops
+        :type max_memory: int
+        """
+        self.socket_path = socket_path
+        self.parent_pid = parent_pid
+        self.max_runs = max_runs
+        self.max_memory = max_memory
+        self.run_count = 0
+
+    def serve(self) -> None:
+        # the forked processes are not waited by the worker, let the system reap them
+        signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(self.socket_path)
+        server.listen()
+        server.settimeout(self.ACCEPT_TIMEOUT)
+        Logger.info(f"Scenario worker {os.getpid()} ready on '{self.socket_path}'")
+
+        try:
+            while not self._must_recycle():
+                if os.getppid() != self.parent_pid:
+                    Logger.info(f"Scenario worker {os.getpid()} stopped, the lab is stopped")
+                    break
+
+                try:
+                    connection, _ = server.accept()
+                except socket.timeout:
+                    continue
+
+                with connection:
+                    try:
+                        self._handle_connection(server, connection)
+                    except Exception as err:
+                        Logger.error(f"Error in scenario worker {os.getpid()}: {err}")
+                        Logger.log_exception_stack_trace(err)
+        finally:
+            server.close()
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+
+    def _handle_connection(self, server: socket.socket, connection: socket.socket) -> None:
+        connection.settimeout(self.MESSAGE_TIMEOUT)
+        reader = connection.makefile("rb")
+        request = ScenarioWorkerRunRequest.from_json_str(self._read_line(reader))
+
+        pid = os.fork()
+        if pid == 0:
+            self._run_in_forked_process(server, connection, reader, request)
+
+        self.run_count += 1
+        response = ScenarioWorkerRunResponse(pid=pid, recycle=self._must_recycle())
+        connection.sendall((response.to_json_str() + "\n").encode())
+
+    def _run_in_forked_process(
+        self,
+        server: socket.socket,
+        connection: socket.socket,
+        reader: BinaryIO,
+        request: ScenarioWorkerRunRequest,
+    ) -> None:
+        """Run the scenario in the forked process, the process exits at the end"""
+        exit_code = 0
+        try:
+            # restore the default behavior so the tasks can wait their sub processes
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            server.close()
+
+            # wait for the main process to mark the scenario as run by this process
+            start_message = self._read_line(reader)
+            connection.close()
+            if start_message == SCENARIO_WORKER_START_MESSAGE:
+                self._run_scenario(request)
+        except BaseException as err:
+            exit_code = 1
+            Logger.error(f"Error while running the scenario {request.scenario_id}: {err}")
+            Logger.log_exception_stack_trace(err)
+        finally:
+            logging.shutdown()
+            # exit without running the cleanup of the worker
+            os._exit(exit_code)
+
+    def _run_scenario(self, request: ScenarioWorkerRunRequest) -> None:
+        """Same as the run-scenario and run-process commands of the CLI, the bricks are
+        already loaded
+        """
+        Logger.build_main_logger(
+            log_dir=Settings.get_instance().get_log_dir(),
+            level=Logger.check_log_level(request.log_level),
+            context=LogContext.SCENARIO,
+            context_id=request.scenario_id,
+        )
+        DbManagerService.init_all_db(full_init=False)
+
+        user: User = User.get_by_id_and_check(request.user_id)
+        with AuthenticateUser(user):
+            if request.protocol_model_id and request.process_instance_name:
+                ScenarioRunService.run_scenario_process_from_cli(
+                    request.scenario_id,
+                    request.protocol_model_id,
+                    request.process_instance_name,
+                )
+            else:
+                ScenarioRunService.run_scenario_in_cli(request.scenario_id)
+
+    def _must_recycle(self) -> bool:
+        if self.run_count >= self.max_runs:
+            return True
+        return psutil.Process().memory_info().rss > self.max_memory
+
+    def _read_line(self, reader: BinaryIO) -> str:
+        return reader.readline().decode().strip()
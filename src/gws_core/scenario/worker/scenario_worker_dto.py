@@ -0,0 +1,22 @@
+from gws_core.core.model.model_dto import BaseModelDTO
+
+# message sent to the forked process once the scenario is marked as run by its pid
+SCENARIO_WORKER_START_MESSAGE = "start"
+
+
+class ScenarioWorkerRunRequest(BaseModelDTO):
+    """Request sent to a scenario worker to run a scenario or a process of a scenario"""
+
+    scenario_id: str
+    user_id: str
+    log_level: str
+    protocol_model_id: str | None = None
+    process_instance_name: str | None = None
+
+
+class ScenarioWorkerRunResponse(BaseModelDTO):
+    """Response of the scenario worker, the run is done in the process with this pid"""
+
+    pid: int
+    # if true, the worker stops after this run and must be replaced
+    recycle: bool = False
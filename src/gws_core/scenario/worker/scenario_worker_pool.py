@@ -0,0 +1,188 @@
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+
+from gws_core.core.model.sys_proc import SysProc
+from gws_core.core.utils.logger import Logger
+from gws_core.core.utils.settings import Settings
+from gws_core.scenario.worker.scenario_worker_dto import (
+    SCENARIO_WORKER_START_MESSAGE,
+    ScenarioWorkerRunRequest,
+    ScenarioWorkerRunResponse,
+)
+
+
+class _ScenarioWorkerProcess:
+    """Worker process started by the pool"""
+
+    socket_path: str
+    sproc: SysProc
+
+    def __init__(self, socket_path: str, sproc: SysProc) -> None:
+        self.socket_path = socket_path
+        self.sproc = sproc
+
+    def is_alive(self) -> bool:
+        # poll also reaps the worker if it exited
+        return self.sproc.get_process().poll() is None
+
+    def is_ready(self) -> bool:
+        return self.is_alive() and os.path.exists(self.socket_path)
+
+
+class ScenarioWorkerRun:
+    """Scenario run in a process forked by a worker. The process waits for the start
+    (once the scenario is marked as run by this pid) and exits if the run is closed before.
+    """
+
+    pid: int
+    _connection: socket.socket
+
+    def __init__(self, pid: int, connection: socket.socket) -> None:
+        self.pid = pid
+        self._connection = connection
+
+    def start(self) -> None:
+        try:
+            self._connection.sendall((SCENARIO_WORKER_START_MESSAGE + "\n").encode())
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class ScenarioWorkerPool:
+    """Pool of warm worker processes (zygotes) that run the scenarios in a forked process
+    instead of starting a new CLI process (interpreter start, brick imports and typings load)
+    for each run. See ScenarioWorker.
+
+    Only initialized in the main process and only if the GWS_SCENARIO_WORKER_POOL env variable
+    is set. When no worker is ready, the scenario is run with a new CLI process.
+    """
+
+    # max seconds to wait for the response of a worker
+    RESPONSE_TIMEOUT = 10
+
+    _workers: list[_ScenarioWorkerProcess] = []
+    _socket_dir: str | None = None
+    _next_index: int = 0
+    _started_workers_count: int = 0
+    _lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def init(cls) -> None:
+        """Start the workers. Only call from main process."""
+        with cls._lock:
+            if cls._socket_dir is not None:
+                return
+            cls._socket_dir = tempfile.mkdtemp(prefix="gws_scenario_worker_")
+            for _ in range(Settings.get_scenario_worker_pool_size()):
+                cls._workers.append(cls._start_worker())
+
+    @classmethod
+    def deinit(cls) -> None:
+        """Stop the workers, the running scenarios are not stopped."""
+        with cls._lock:
+            for worker in cls._workers:
+                if worker.is_alive():
+                    worker.sproc.kill()
+            cls._workers = []
+            if cls._socket_dir is not None:
+                shutil.rmtree(cls._socket_dir, ignore_errors=True)
+                cls._socket_dir = None
+
+    @classmethod
+    def is_running(cls) -> bool:
+        return cls._socket_dir is not None
+
+    @classmethod
+    def fork_run(cls, request: ScenarioWorkerRunRequest) -> ScenarioWorkerRun | None:
+        """Run the scenario in a process forked by a ready worker.
+        The returned run must be started once the scenario is marked as run by its pid.
+
+        :return: the run, None if no worker is ready
+        :rtype: ScenarioWorkerRun | None
+        """
+        with cls._lock:
+            if cls._socket_dir is None:
+                return None
+
+            for _ in range(len(cls._workers)):
+                index = cls._next_index % len(cls._workers)
+                cls._next_index += 1
+                worker = cls._workers[index]
+
+                if not worker.is_alive():
+                    # the worker was recycled or crashed
+                    cls._workers[index] = cls._start_worker()
+                    continue
+
+                if not worker.is_ready():
+                    continue
+
+                try:
+                    connection, response = cls._send_request(worker, request)
+                except Exception as err:
+                    Logger.error(f"Error while sending the scenario to the worker: {err}")
+                    continue
+
+                if response.recycle:
+                    # the worker stops after this run, replace it
+                    cls._workers[index] = cls._start_worker()
+                return ScenarioWorkerRun(response.pid, connection)
+
+        Logger.info("No scenario worker is ready, running the scenario in a new process")
+        return None
+
+    @classmethod
+    def _send_request(
+        cls, worker: _ScenarioWorkerProcess, request: ScenarioWorkerRunRequest
+    ) -> tuple[socket.socket, ScenarioWorkerRunResponse]:
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            connection.settimeout(cls.RESPONSE_TIMEOUT)
+            connection.connect(worker.socket_path)
+            connection.sendall((request.to_json_str() + "\n").encode())
+            line = connection.makefile("rb").readline().decode().strip()
+            if not line:
+                raise Exception("The worker closed the connection")
+            return connection, ScenarioWorkerRunResponse.from_json_str(line)
+        except BaseException:
+            connection.close()
+            raise
+
+    @classmethod
+    def _start_worker(cls) -> _ScenarioWorkerProcess:
+        settings = Settings.get_instance()
+        gws_core_brick = settings.get_brick("gws_core")
+        if not gws_core_brick:
+            raise Exception("gws_core brick not found")
+
+        cls._started_workers_count += 1
+        socket_path = os.path.join(cls._socket_dir, f"worker_{cls._started_workers_count}.sock")
+
+        options: list[str] = [
+            "--socket-path",
+            socket_path,
+            "--parent-pid",
+            str(os.getpid()),
+        ]
+        if settings.is_test:
+            options.append("--test")
+
+        cmd = [
+            "python3",
+            os.path.join(gws_core_brick.path, "gws_cli", "gws_cli", "main_cli.py"),
+            "--log-level",
+            Logger.level,
+            "server",
+            "scenario-worker",
+        ] + options
+
+        Logger.info(f"Starting scenario worker {str(cmd)}")
+        sproc = SysProc.popen(cmd, stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
+        return _ScenarioWorkerProcess(socket_path, sproc)
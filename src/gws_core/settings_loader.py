@@ -9,6 +9,7 @@ from gws_core.brick.brick_dto import BrickInfo
 from gws_core.brick.brick_settings import BrickSettings
 from gws_core.core.utils.logger import Logger
 from gws_core.core.utils.settings_dto import ModuleInfo
+from gws_core.core.utils.startup_profiler import StartupProfiler
 
 from .brick.brick_service import BrickService
 from .core.utils.settings import Settings
@@ -49,15 +50,18 @@ class SettingsLoader:
         self.settings = Settings.init()
         self.settings.set_main_settings_file_path(self.main_settings_file_path)
         self.settings.set_data("is_test", self.is_test)
-        self._init()
+        with StartupProfiler.step("Load brick settings"):
+            self._init()
 
-        self.settings.set_pip_freeze(self.pip_freeze().split())
+        with StartupProfiler.step("Pip freeze"):
+            self.settings.set_pip_freeze(self.pip_freeze().split())
         # save the settings
         self.settings.save()
 
         # //!\\ Ensure that all bricks' modules are loaded on Application startup
         # Is important to be able to traverse all Bricks/Model/Object inheritors
-        BrickService.import_all_bricks_in_python()
+        with StartupProfiler.step("Import bricks"):
+            BrickService.import_all_bricks_in_python()
 
     def _init(self):
         # read settings file
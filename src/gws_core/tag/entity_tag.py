@@ -153,6 +153,33 @@ class EntityTag(Model):
         label: str | None = None,
         is_community_tag: bool = False,
     ) -> "EntityTag":
+        entity_tag = cls.build_entity_tag(
+            key=key,
+            value=value,
+            is_propagable=is_propagable,
+            origins=origins,
+            value_format=value_format,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            label=label,
+            is_community_tag=is_community_tag,
+        )
+        return entity_tag.save()
+
+    @classmethod
+    def build_entity_tag(
+        cls,
+        key: str,
+        value: TagValueType,
+        is_propagable: bool,
+        origins: TagOrigins,
+        value_format: TagValueFormat,
+        entity_id: str,
+        entity_type: TagEntityType,
+        label: str | None = None,
+        is_community_tag: bool = False,
+    ) -> "EntityTag":
+        """Create the entity tag without saving it"""
         if not origins or origins.is_empty():
             raise ValueError("The tag origin must be defined to save it")
 
@@ -167,7 +194,7 @@ class EntityTag(Model):
         )
         entity_tag.set_value(value)
         entity_tag.set_origins(origins)
-        return entity_tag.save()
+        return entity_tag
 
     @classmethod
     def delete_by_entity(cls, entity_id: str, entity_type: TagEntityType) -> None:
@@ -106,11 +106,33 @@ class EntityTagList:
             else:
                 return existing_tag
 
+        new_tag = self._build_tag(tag, {}, {})
+        return new_tag.save()
+
+    def _build_tag(
+        self,
+        tag: Tag,
+        tag_key_models: dict[str, TagKeyModel],
+        tag_value_models: dict[tuple[str, str], TagValueModel],
+    ) -> EntityTag:
+        """Build the entity tag (not saved) and add it to the list. Create the tag key
+        and tag value if they don't exist.
+
+        :param tag: tag to add
+        :type tag: Tag
+        :param tag_key_models: cache of the tag key models, the key is the tag key
+        :type tag_key_models: dict[str, TagKeyModel]
+        :param tag_value_models: cache of the tag value models, the key is the tag key and the value
+        :type tag_value_models: dict[tuple[str, str], TagValueModel]
+        :return: the new entity tag
+        :rtype: EntityTag
+        """
         if not tag.origin_is_defined() and self._default_origin is not None:
             tag.origins.add_origin(self._default_origin)
 
-        tag_key_model = TagKeyModel.select().where(TagKeyModel.key == tag.key).first()
-        tag_value_model = TagValueModel.get_tag_value_model(tag.key, tag.value)
+        tag_key_model = tag_key_models.get(tag.key)
+        if tag_key_model is None:
+            tag_key_model = TagKeyModel.select().where(TagKeyModel.key == tag.key).first()
 
         if tag_key_model is None:
             tag_key_model = TagKeyModel.create_tag_key_model(
@@ -119,6 +141,12 @@ class EntityTagList:
                 value_format=tag.get_value_format(),
                 is_community_tag=tag.is_community_tag_key,
             )
+        tag_key_models[tag.key] = tag_key_model
+
+        value_key = (tag.key, Tag.convert_value_to_str(tag.value))
+        tag_value_model = tag_value_models.get(value_key)
+        if tag_value_model is None:
+            tag_value_model = TagValueModel.get_tag_value_model(tag.key, tag.value)
 
         if tag_value_model is None:
             tag_value_model = TagValueModel.create_tag_value(
@@ -127,8 +155,9 @@ class EntityTagList:
                 additional_info=tag.additional_info,
                 is_community_tag_value=tag.is_community_tag_value,
             )
+        tag_value_models[value_key] = tag_value_model
 
-        new_tag = EntityTag.create_entity_tag(
+        new_tag = EntityTag.build_entity_tag(
             key=tag_key_model.key,
             value=tag_value_model.tag_value,
             is_propagable=tag.is_propagable,
@@ -254,6 +283,57 @@ class EntityTagList:
             default_origin,
         )
 
+    @classmethod
+    @GwsCoreDbManager.transaction()
+    def add_tags_to_new_entities(
+        cls,
+        entity_type: TagEntityType,
+        tags_by_entity: dict[str, list[Tag]],
+        default_origin: TagOrigin | None = None,
+    ) -> dict[str, "EntityTagList"]:
+        """Add tags to entities that were just created (entities without tags).
+        The tag keys and tag values are retrieved or created once for all the entities and
+        the entity tags are inserted with multi-row inserts.
+
+        :param entity_type: type of the entities
+        :type entity_type: TagEntityType
+        :param tags_by_entity: tags to add, the key is the entity id
+        :type tags_by_entity: dict[str, list[Tag]]
+        :param default_origin: origin of the tags without origin, defaults to None
+        :type default_origin: TagOrigin | None, optional
+        :return: the tag list of each entity, the key is the entity id
+        :rtype: dict[str, EntityTagList]
+        """
+        tag_keys = {tag.key for tags in tags_by_entity.values() for tag in tags}
+        tag_key_models: dict[str, TagKeyModel] = {}
+        if tag_keys:
+            query = TagKeyModel.select().where(TagKeyModel.key.in_(list(tag_keys)))
+            tag_key_models = {tag_key_model.key: tag_key_model for tag_key_model in query}
+        tag_value_models: dict[tuple[str, str], TagValueModel] = {}
+
+        entity_tag_lists: dict[str, EntityTagList] = {}
+        new_tags: list[EntityTag] = []
+        for entity_id, tags in tags_by_entity.items():
+            entity_tag_list = EntityTagList(entity_type, entity_id, default_origin=default_origin)
+
+            for tag in tags:
+                existing_tag = entity_tag_list.get_tag(tag)
+                if existing_tag is not None:
+                    if entity_tag_list.support_multiple_origins():
+                        # the tag is not saved yet, merge it in memory
+                        origins = existing_tag.get_origins()
+                        origins.merge_origins(tag.origins)
+                        existing_tag.set_origins(origins)
+                        existing_tag.is_propagable = existing_tag.is_propagable or tag.is_propagable
+                    continue
+
+                new_tags.append(entity_tag_list._build_tag(tag, tag_key_models, tag_value_models))
+
+            entity_tag_lists[entity_id] = entity_tag_list
+
+        EntityTag.insert_all(new_tags)
+        return entity_tag_lists
+
     @classmethod
     def delete_by_entity(cls, entity_type: TagEntityType, entity_id: str) -> None:
         EntityTag.delete_by_entity(entity_id, entity_type)
@@ -1,6 +1,7 @@
 
 from peewee import BooleanField, CharField, CompositeKey, ForeignKeyField, ModelSelect
 
+from ..core.db.gws_core_db_manager import GwsCoreDbManager
 from ..core.model.base_model import BaseModel
 from ..protocol.protocol_model import ProtocolModel
 from ..resource.resource_model import ResourceModel
@@ -113,6 +114,46 @@ class TaskInputModel(BaseModel):
         self.save()
         return self
 
+    @classmethod
+    @GwsCoreDbManager.transaction()
+    def insert_all_if_not_exists(
+        cls, task_input_models: list["TaskInputModel"]
+    ) -> list["TaskInputModel"]:
+        """Insert the task input models that don't already exist (based on composite key task_model + port_name)
+        with one select and one multi-row insert instead of a select and an insert per model.
+
+        :return: the inserted task input models
+        :rtype: list[TaskInputModel]
+        """
+        if not task_input_models:
+            return []
+
+        task_model_ids = {model.task_model.id for model in task_input_models}
+        existing_keys = {
+            (task_input.task_model_id, task_input.port_name)
+            for task_input in TaskInputModel.select(
+                TaskInputModel.task_model, TaskInputModel.port_name
+            ).where(TaskInputModel.task_model.in_(list(task_model_ids)))
+        }
+
+        new_task_inputs: list[TaskInputModel] = []
+        for model in task_input_models:
+            key = (model.task_model.id, model.port_name)
+            if key in existing_keys:
+                continue
+            existing_keys.add(key)
+            new_task_inputs.append(model)
+
+        if new_task_inputs:
+            fields = cls._meta.sorted_fields
+            rows = [
+                tuple(model.__data__.get(field.name) for field in fields)
+                for model in new_task_inputs
+            ]
+            cls.insert_many(rows, fields=fields).execute()
+
+        return new_task_inputs
+
     class Meta:
         table_name = "gws_task_inputs"
         is_table = True
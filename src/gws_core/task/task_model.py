@@ -1,3 +1,4 @@
+from contextlib import AbstractContextManager, nullcontext
 from traceback import format_exc
 from typing import Any
 
@@ -7,7 +8,10 @@ from gws_core.config.config import Config
 from gws_core.config.config_params import ConfigParamsDict
 from gws_core.core.db.gws_core_db_manager import GwsCoreDbManager
 from gws_core.core.utils.date_helper import DateHelper
+from gws_core.core.utils.settings import Settings
 from gws_core.process.process import Process
+from gws_core.process_run_stat.process_resource_profiler import ProcessResourceProfiler
+from gws_core.process_run_stat.process_run_stat_dto import ProcessResourceUsageDTO
 from gws_core.resource.resource_dto import ResourceOrigin
 from gws_core.resource.resource_set.resource_list_base import ResourceListBase
 from gws_core.tag.entity_tag_list import EntityTagList
@@ -27,6 +31,7 @@ from ..process.process_exception import CheckBeforeTaskStopException, ProcessRun
 from ..process.process_model import ProcessModel
 from ..process.process_types import ProcessStatus
 from ..resource.resource import Resource
+from ..resource.resource_handoff_cache import ResourceHandoffCache
 from ..resource.resource_model import ResourceModel
 from ..resource.resource_r_field import ResourceRField
 from ..task.task_io import TaskOutputs
@@ -58,6 +63,10 @@ class TaskModel(ProcessModel):
 
     # cache to store the list of tags of all inputs
     _input_resource_tags: list[Tag] | None = None
+    # cache to store the list of tags of the scenario
+    _scenario_tags: list[Tag] | None = None
+    # measure of the resources used by the run, only if the profiling is enabled
+    _resource_profiler: ProcessResourceProfiler | None = None
 
     def set_process_type(self, process_type: type[Process]) -> None:
         """Method used when creating a new task model, it init the input and output from task specs
@@ -140,10 +149,23 @@ class TaskModel(ProcessModel):
         """
         Run the task and save its state in the database.
         """
+        self._resource_profiler = None
+        if Settings.is_process_resource_profiling_enabled():
+            self._resource_profiler = ProcessResourceProfiler()
+            self._resource_profiler.start()
 
+        try:
+            self._run_task_model()
+        finally:
+            # stop the profiling if the run failed before the run stat was saved
+            if self._resource_profiler is not None:
+                self._resource_profiler.stop()
+
+    def _run_task_model(self) -> None:
         # build the task tester
         params: ConfigParamsDict = self.config.get_and_check_values()
-        inputs: dict[str, Resource] = self.inputs.get_resources(new_instance=True)
+        with self._profile_step(ProcessResourceProfiler.INPUT_LOADING_STEP):
+            inputs: dict[str, Resource] = self.inputs.get_resources(new_instance=True)
 
         # Reset runtime flags on input resources before passing them to the task
         for resource in inputs.values():
@@ -211,6 +233,7 @@ class TaskModel(ProcessModel):
         """
         from .task_input_model import TaskInputModel
 
+        input_resources: list[TaskInputModel] = []
         for port_name, port in self.inputs.ports.items():
             resource_model: ResourceModel = port.get_resource_model()
 
@@ -232,7 +255,9 @@ class TaskModel(ProcessModel):
             input_resource.protocol_model = parent
             input_resource.port_name = port_name
             input_resource.is_interface = parent.port_is_interface(self.instance_name, port_name)
-            input_resource.save_if_not_exists()
+            input_resources.append(input_resource)
+
+        TaskInputModel.insert_all_if_not_exists(input_resources)
 
     def _run_task(self, task_runner: TaskRunner) -> None:
         """
@@ -241,7 +266,8 @@ class TaskModel(ProcessModel):
 
         try:
             # Run the task task
-            task_runner.run()
+            with self._profile_step(ProcessResourceProfiler.RUN_STEP):
+                task_runner.run()
 
         except InvalidOutputsException as err:
             # Save the valid resources
@@ -257,7 +283,19 @@ class TaskModel(ProcessModel):
             raise ProcessRunException.from_exception(process_model=self, exception=err) from err
 
         # If success, save the outputs
-        self._save_outputs(task_runner.get_outputs())
+        with self._profile_step(ProcessResourceProfiler.OUTPUT_SAVING_STEP):
+            self._save_outputs(task_runner.get_outputs())
+
+    def _profile_step(self, step: str) -> AbstractContextManager:
+        """Measure the duration of a step of the run if the profiling is enabled"""
+        if self._resource_profiler is None:
+            return nullcontext()
+        return self._resource_profiler.step(step)
+
+    def _get_resource_usage(self) -> ProcessResourceUsageDTO | None:
+        if self._resource_profiler is None:
+            return None
+        return self._resource_profiler.stop()
 
     def _save_outputs(self, task_outputs: TaskOutputs) -> None:
         for key, resource in task_outputs.items():
@@ -286,6 +324,8 @@ class TaskModel(ProcessModel):
             else:
                 port: Port = self.outputs.get_port(key)
                 resource_model = self._save_output_resource(resource, port.name)
+                # keep the saved resource in memory so the next tasks don't reload it
+                ResourceHandoffCache.add_resource(resource_model.id, resource)
 
             # save the resource model into the output's port (even if it's None)
             port = self.outputs.get_port(key)
@@ -394,10 +434,13 @@ class TaskModel(ProcessModel):
 
     def _get_scenario_tags(self) -> list[Tag]:
         """Return all the tags of the scenario"""
-        entity_tags = EntityTagList.find_by_entity(TagEntityType.SCENARIO, self.scenario.id)
-        return entity_tags.build_tags_propagated(
-            TagOriginType.SCENARIO_PROPAGATED, self.scenario.id
-        )
+        if self._scenario_tags is None:
+            entity_tags = EntityTagList.find_by_entity(TagEntityType.SCENARIO, self.scenario.id)
+            self._scenario_tags = entity_tags.build_tags_propagated(
+                TagOriginType.SCENARIO_PROPAGATED, self.scenario.id
+            )
+
+        return self._scenario_tags
 
     ################################# CONFIG #################################
 
@@ -0,0 +1,58 @@
+import os
+import tempfile
+import time
+from multiprocessing import Process
+from unittest import TestCase
+
+from gws_core.core.utils.file_lock import FileLock
+
+
+def _hold_lock(lock_path: str, ready_path: str, release_path: str) -> None:
+    with FileLock(lock_path):
+        with open(ready_path, "w", encoding="utf-8"):
+            pass
+        while not os.path.exists(release_path):
+            time.sleep(0.01)
+
+
+# test_file_lock
+class TestFileLock(TestCase):
+    def test_lock(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            lock_path = os.path.join(temp_dir, "locks", "test.lock")
+
+            lock = FileLock(lock_path)
+            self.assertTrue(lock.acquire(blocking=False))
+            self.assertTrue(lock.is_acquired())
+
+            # the lock is also exclusive in the same process
+            other_lock = FileLock(lock_path)
+            self.assertFalse(other_lock.acquire(blocking=False))
+
+            lock.release()
+            self.assertFalse(lock.is_acquired())
+            self.assertTrue(other_lock.acquire(blocking=False))
+            other_lock.release()
+
+    def test_lock_between_processes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            lock_path = os.path.join(temp_dir, "test.lock")
+            ready_path = os.path.join(temp_dir, "ready")
+            release_path = os.path.join(temp_dir, "release")
+
+            process = Process(target=_hold_lock, args=(lock_path, ready_path, release_path))
+            process.start()
+            try:
+                while not os.path.exists(ready_path):
+                    time.sleep(0.01)
+
+                lock = FileLock(lock_path)
+                self.assertFalse(lock.acquire(blocking=False))
+
+                # the lock is acquired once the other process releases it
+                with open(release_path, "w", encoding="utf-8"):
+                    pass
+                self.assertTrue(lock.acquire())
+                lock.release()
+            finally:
+                process.join(10)
@@ -0,0 +1,29 @@
+from unittest import TestCase
+
+import numpy as np
+
+from gws_core.core.utils.numeric_helper import NumericHelper
+
+
+# test_numeric_helper
+class TestNumericHelper(TestCase):
+    def test_lttb_downsample_indexes(self):
+        x = np.arange(1000)
+        y = np.zeros(1000)
+        # peaks that must be kept
+        y[250] = 100
+        y[700] = -50
+
+        indexes = NumericHelper.lttb_downsample_indexes(x, y, 20)
+        self.assertEqual(len(indexes), 20)
+        self.assertEqual(indexes[0], 0)
+        self.assertEqual(indexes[-1], 999)
+        self.assertTrue(np.all(np.diff(indexes) > 0))
+        self.assertIn(250, indexes)
+        self.assertIn(700, indexes)
+
+        # nothing to downsample
+        self.assertEqual(
+            NumericHelper.lttb_downsample_indexes(x[:10], y[:10], 20).tolist(), list(range(10))
+        )
+        self.assertEqual(NumericHelper.lttb_downsample_indexes(x, y, 2).tolist(), [0, 999])
@@ -0,0 +1,67 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from gws_core.impl.file.file import File
+from gws_core.impl.file.file_helper import FileHelper
+from gws_core.impl.file.file_metadata_cache import FileMetadata, FileMetadataCache
+
+
+# test_file_metadata_cache
+class TestFileMetadataCache(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        FileMetadataCache.clear()
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+        FileMetadataCache.clear()
+
+    def _read_lines(self, file_path: str, from_line: int, to_line: int) -> str:
+        with open(file_path, encoding="utf-8") as file:
+            return "".join(file.readlines()[from_line:to_line])
+
+    def test_read_part_with_line_index(self):
+        file_path = os.path.join(self.tmp_dir.name, "lines.txt")
+        with open(file_path, "w", encoding="utf-8", newline="") as file:
+            for i in range(5500):
+                file.write(f"line é {i}" + ("\r\n" if i % 3 else "\n"))
+
+        file = File(file_path)
+        for from_line in [0, 999, 1000, 1001, 4321, 5490, 6000]:
+            self.assertEqual(
+                file.read_part(from_line, from_line + 20),
+                self._read_lines(file_path, from_line, from_line + 20),
+            )
+
+        metadata = FileMetadataCache.get_metadata(file_path)
+        self.assertEqual(metadata.get_line_offset(file_path, 4321)[1], 4000)
+
+        # the file is modified, the index is rebuilt
+        with open(file_path, "a", encoding="utf-8") as text_file:
+            text_file.write("new line\n" * 2000)
+        self.assertIsNot(FileMetadataCache.get_metadata(file_path), metadata)
+        self.assertEqual(file.read_part(7000, 7002), "new line\nnew line\n")
+
+    def test_read_part_with_carriage_return(self):
+        # the lines ending with '\r' only are lines in text mode, the line index is not used
+        file_path = os.path.join(self.tmp_dir.name, "cr.txt")
+        with open(file_path, "w", encoding="utf-8", newline="") as file:
+            for i in range(FileMetadata.LINE_INDEX_STEP * 3):
+                file.write(f"line {i}\r")
+
+        file = File(file_path)
+        self.assertEqual(file.read_part(2500, 2502), "line 2500\nline 2501\n")
+        metadata = FileMetadataCache.get_metadata(file_path)
+        self.assertEqual(metadata.get_line_offset(file_path, 2500), (0, 0))
+
+    def test_detect_encoding_sample(self):
+        file_path = os.path.join(self.tmp_dir.name, "encoding.txt")
+        with open(file_path, "w", encoding="utf-8") as file:
+            file.write("ascii line\n" * (FileHelper.ENCODING_DETECTION_SAMPLE_SIZE // 10))
+            file.write("é\n")
+
+        # the sample only contains ascii, utf-8 is used to read the rest of the file
+        self.assertEqual(FileHelper.detect_file_encoding(file_path), "utf_8")
+        self.assertTrue(FileMetadataCache.get_metadata(file_path).encoding_detected)
+        self.assertTrue(File(file_path).read().endswith("é\n"))
@@ -0,0 +1,179 @@
+import os
+import sqlite3
+import tempfile
+from unittest import TestCase
+
+from gws_core import ViewTester, ViewType
+from gws_core.config.config_params import ConfigParams
+from gws_core.core.exception.exceptions.bad_request_exception import BadRequestException
+from gws_core.impl.sqlite.sqlite_connection_pool import SqliteConnectionPool
+from gws_core.impl.sqlite.sqlite_resource import SqliteResource
+from gws_core.impl.sqlite.sqlite_table_view import SqliteTableView
+
+
+# test_sqlite_resource
+class TestSqliteResource(TestCase):
+    temp_dir: tempfile.TemporaryDirectory
+    sqlite_path: str
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.sqlite_path = os.path.join(self.temp_dir.name, "test.db")
+
+        conn = sqlite3.connect(self.sqlite_path)
+        conn.execute('CREATE TABLE person (id INTEGER, name TEXT, age REAL, "my col" TEXT)')
+        conn.executemany(
+            "INSERT INTO person VALUES (?, ?, ?, ?)",
+            [(i, f"name_{i}", None if i % 10 == 0 else float(i % 7), "x") for i in range(100)],
+        )
+        conn.execute("CREATE TABLE other (value INTEGER)")
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        SqliteConnectionPool.clear()
+        self.temp_dir.cleanup()
+
+    def test_select(self):
+        resource = SqliteResource(self.sqlite_path)
+        self.assertEqual(resource.get_table_names(), ["person", "other"])
+
+        table = resource.select_table("person")
+        self.assertEqual(table.nb_rows, 100)
+        self.assertEqual(table.nb_columns, 4)
+
+    def test_table_view_pagination(self):
+        vw = SqliteTableView(self.sqlite_path, table_name="person")
+        view_dto = ViewTester(view=vw).to_dto(
+            dict(
+                from_row=11, number_of_rows_per_page=5, from_column=2, number_of_columns_per_page=2
+            )
+        )
+        self.assertEqual(view_dto.type, ViewType.TABLE)
+
+        self.assertEqual(view_dto.data["total_number_of_rows"], 100)
+        self.assertEqual(view_dto.data["total_number_of_columns"], 4)
+        self.assertEqual(view_dto.data["from_row"], 11)
+        self.assertEqual(view_dto.data["from_column"], 2)
+        self.assertEqual([column["name"] for column in view_dto.data["columns"]], ["name", "age"])
+        self.assertEqual(
+            [row["name"] for row in view_dto.data["rows"]], ["10", "11", "12", "13", "14"]
+        )
+        self.assertEqual(
+            view_dto.data["table"],
+            [
+                ["name_10", ""],
+                ["name_11", 4.0],
+                ["name_12", 5.0],
+                ["name_13", 6.0],
+                ["name_14", 0.0],
+            ],
+        )
+
+        # from_row after the last row is clamped to the last row
+        view_dto = ViewTester(view=vw).to_dto(
+            dict(
+                from_row=500, number_of_rows_per_page=5, from_column=4, number_of_columns_per_page=2
+            )
+        )
+        self.assertEqual(view_dto.data["from_row"], 100)
+        self.assertEqual(view_dto.data["table"], [["x"]])
+
+    def test_table_view_sort(self):
+        vw = SqliteTableView(self.sqlite_path, table_name="person")
+        view_dto = ViewTester(view=vw).to_dto(
+            dict(
+                from_row=1,
+                number_of_rows_per_page=100,
+                sort_column="age",
+                sort_direction="Descending",
+            )
+        )
+        ages = [row[2] for row in view_dto.data["table"]]
+        self.assertEqual(ages[0], 6.0)
+        # the null values are at the end
+        self.assertEqual(ages[-10:], [""] * 10)
+        self.assertEqual(ages[:-10], sorted(ages[:-10], reverse=True))
+        self.assertEqual(view_dto.data["sort"], {"column": "age", "direction": "Descending"})
+
+        with self.assertRaises(BadRequestException):
+            ViewTester(view=vw).to_dto(dict(sort_column="unknown"))
+
+    def test_table_view_sort_pages(self):
+        # many rows have the same age, the pages must not repeat or skip rows
+        for vw in [
+            SqliteTableView(self.sqlite_path, table_name="person"),
+            SqliteTableView(self.sqlite_path, query="SELECT * FROM person"),
+        ]:
+            ids = []
+            for from_row in range(1, 101, 7):
+                view_dto = ViewTester(view=vw).to_dto(
+                    dict(from_row=from_row, number_of_rows_per_page=7, sort_column="age")
+                )
+                ids += [row[0] for row in view_dto.data["table"]]
+
+            self.assertEqual(sorted(ids), list(range(100)))
+            # the rows with the same age keep the order of the table
+            expected_ids = sorted(
+                range(100), key=lambda i: (i % 10 == 0, i % 7 if i % 10 else 0, i)
+            )
+            self.assertEqual(ids, expected_ids)
+
+    def test_query_view(self):
+        vw = SqliteTableView(
+            self.sqlite_path, query='SELECT id, "my col" FROM person WHERE id >= 50;'
+        )
+        view_dto = ViewTester(view=vw).to_dto(dict(from_row=1, number_of_rows_per_page=3))
+        self.assertEqual(view_dto.data["total_number_of_rows"], 50)
+        self.assertEqual(view_dto.data["table"], [[50, "x"], [51, "x"], [52, "x"]])
+
+        # empty result
+        vw = SqliteTableView(self.sqlite_path, query="SELECT * FROM other")
+        view_dto = ViewTester(view=vw).to_dto()
+        self.assertEqual(view_dto.data["total_number_of_rows"], 0)
+        self.assertEqual(view_dto.data["table"], [])
+
+        # query ending with a comment
+        vw = SqliteTableView(self.sqlite_path, query="SELECT id FROM person -- all the persons")
+        view_dto = ViewTester(view=vw).to_dto()
+        self.assertEqual(view_dto.data["total_number_of_rows"], 100)
+
+    def test_execute_select_view(self):
+        self.assertTrue(SqliteTableView.is_select_query("SELECT * FROM person"))
+        self.assertTrue(SqliteTableView.is_select_query("-- comment\n with t AS (SELECT 1) SELECT"))
+        self.assertTrue(SqliteTableView.is_select_query("/* comment */ VALUES (1)"))
+        self.assertFalse(SqliteTableView.is_select_query("PRAGMA table_info(person)"))
+        self.assertFalse(SqliteTableView.is_select_query(""))
+
+        resource = SqliteResource(self.sqlite_path)
+        view = resource.execute_select_view(ConfigParams({"query": "SELECT * FROM person"}))
+        self.assertIsInstance(view, SqliteTableView)
+
+        # PRAGMA statements can't be used as sub query, they are not pushed down to SQLite
+        view = resource.execute_select_view(ConfigParams({"query": "PRAGMA table_info(person)"}))
+        self.assertNotIsInstance(view, SqliteTableView)
+        view_dto = ViewTester(view=view).to_dto()
+        self.assertEqual(view_dto.data["total_number_of_rows"], 4)
+
+    def test_connection_pool(self):
+        with SqliteConnectionPool.connection(self.sqlite_path) as connection:
+            pass
+
+        # the connection is reused
+        with SqliteConnectionPool.connection(self.sqlite_path) as other_connection:
+            self.assertIs(other_connection, connection)
+
+            # the connections are read-only
+            with self.assertRaises(sqlite3.OperationalError):
+                other_connection.execute("DELETE FROM person")
+
+        # the connections are discarded when the file is modified
+        conn = sqlite3.connect(self.sqlite_path)
+        conn.execute("INSERT INTO other VALUES (1)")
+        conn.commit()
+        conn.close()
+        os.utime(self.sqlite_path, ns=(0, 0))
+
+        with SqliteConnectionPool.connection(self.sqlite_path) as new_connection:
+            self.assertIsNot(new_connection, connection)
+            self.assertEqual(new_connection.execute("SELECT COUNT(*) FROM other").fetchone()[0], 1)
@@ -0,0 +1,145 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from gws_core.core.utils.date_helper import DateHelper
+from gws_core.core.utils.logger import LogContext
+from gws_core.lab.log.log import LogCompleteInfo
+from gws_core.lab.log.log_dto import LogInfo
+from gws_core.lab.log.log_file_index import LogFileIndex, LogFileIndexCache
+
+LOG_CONTENT = """{"level": "INFO", "timestamp": "2022-12-01T08:24:46.905469+00:00", "message": "Day 1", "context": "MAIN", "request_id": "request_1"}
+INFO - 2022-12-01 09:26:46.906581 - first - log day 1
+{"level": "INFO", "timestamp": "2022-12-01T09:30:46.947581+00:00", "message": "second", "context": "SCENARIO", "context_id": "1234567890"}
+{"level":"ERROR","timestamp":"2022-12-01T10:00:00.100000Z","message":"third","context":"MAIN","request_id":"request_2"}
+{"level": "INFO", "timestamp": "2022-12-01T10:00:00.100500+00:00", "message": "fourth", "context": "MAIN", "request_id": "request_1"}
+"""
+
+
+# test_log_file_index
+class TestLogFileIndex(TestCase):
+    def setUp(self) -> None:
+        LogFileIndexCache.clear()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.log_file_path = os.path.join(self.tmp_dir.name, "log.2022-12-01")
+        with open(self.log_file_path, "w", encoding="UTF-8") as f:
+            f.write(LOG_CONTENT)
+
+    def tearDown(self) -> None:
+        LogFileIndexCache.clear()
+        self.tmp_dir.cleanup()
+
+    def _get_log_complete_info(self) -> LogCompleteInfo:
+        return LogCompleteInfo(LogInfo(name="log.2022-12-01", file_size=0), self.log_file_path)
+
+    def _get_messages(self, start: str, end: str, **kwargs) -> list[str]:
+        lines = self._get_log_complete_info().get_log_lines_by_time(
+            DateHelper.from_iso_str(start), DateHelper.from_iso_str(end), **kwargs
+        )
+        return [line.message for line in lines]
+
+    def test_get_log_lines_by_time(self):
+        self.assertEqual(
+            self._get_messages("2022-12-01T00:00:00+00:00", "2022-12-01T23:59:59+00:00"),
+            ["Day 1", "first - log day 1", "second", "third", "fourth"],
+        )
+        self.assertEqual(
+            self._get_messages("2022-12-01T09:30:00+00:00", "2022-12-01T09:31:00+00:00"),
+            ["second"],
+        )
+        self.assertEqual(
+            self._get_messages("2022-12-01T11:00:00+00:00", "2022-12-01T23:59:59+00:00"), []
+        )
+
+        # filter by context
+        self.assertEqual(
+            self._get_messages(
+                "2022-12-01T00:00:00+00:00",
+                "2022-12-01T23:59:59+00:00",
+                context=LogContext.SCENARIO,
+                context_id="1234567890",
+            ),
+            ["second"],
+        )
+
+        # the lines with the same date without microseconds are added after the limit
+        self.assertEqual(
+            self._get_messages(
+                "2022-12-01T09:00:00+00:00", "2022-12-01T23:59:59+00:00", nb_of_lines=2
+            ),
+            ["first - log day 1", "second"],
+        )
+        self.assertEqual(
+            self._get_messages(
+                "2022-12-01T10:00:00+00:00", "2022-12-01T23:59:59+00:00", nb_of_lines=1
+            ),
+            ["third", "fourth"],
+        )
+
+    def test_get_log_lines_by_request_id(self):
+        log_complete_info = self._get_log_complete_info()
+        lines = log_complete_info.get_log_lines_by_request_id("request_1")
+        self.assertEqual([line.message for line in lines], ["Day 1", "fourth"])
+        self.assertTrue(log_complete_info.contains_request_id("request_2"))
+        self.assertFalse(log_complete_info.contains_request_id("request_3"))
+
+    def test_incremental_update(self):
+        self._get_messages("2022-12-01T00:00:00+00:00", "2022-12-01T23:59:59+00:00")
+
+        # append a line and a line being written (not complete)
+        with open(self.log_file_path, "a", encoding="UTF-8") as f:
+            f.write(
+                '{"level": "INFO", "timestamp": "2022-12-01T12:00:00.000000+00:00", '
+                '"message": "fifth", "context": "MAIN", "request_id": "request_1"}\n'
+                '{"level": "INFO", "timestamp": "2022-12-01T13:00'
+            )
+
+        self.assertEqual(
+            self._get_messages("2022-12-01T11:00:00+00:00", "2022-12-01T23:59:59+00:00"),
+            ["fifth"],
+        )
+        lines = self._get_log_complete_info().get_log_lines_by_request_id("request_1")
+        self.assertEqual([line.message for line in lines], ["Day 1", "fourth", "fifth"])
+
+        # complete the line
+        with open(self.log_file_path, "a", encoding="UTF-8") as f:
+            f.write(':00.000000+00:00", "message": "sixth", "context": "MAIN"}\n')
+        self.assertEqual(
+            self._get_messages("2022-12-01T11:00:00+00:00", "2022-12-01T23:59:59+00:00"),
+            ["fifth", "sixth"],
+        )
+
+    def test_sidecar(self):
+        index = LogFileIndexCache.get_index(self.log_file_path)
+        self.assertTrue(os.path.exists(index.sidecar_path))
+
+        # a new index loads the sidecar without scanning the file
+        loaded_index = LogFileIndex(self.log_file_path)
+        self.assertEqual(loaded_index._scanned_offset, os.path.getsize(self.log_file_path))
+        self.assertEqual(loaded_index._buckets, index._buckets)
+        self.assertEqual(loaded_index._request_offsets, index._request_offsets)
+
+        # a partially written update is ignored
+        with open(index.sidecar_path, "a", encoding="utf-8") as sidecar:
+            sidecar.write("B\t1\t0\t10\nR\trequest_1\t")
+        loaded_index = LogFileIndex(self.log_file_path)
+        self.assertEqual(loaded_index._buckets, index._buckets)
+
+    def test_file_replaced(self):
+        self._get_messages("2022-12-01T00:00:00+00:00", "2022-12-01T23:59:59+00:00")
+
+        # the file is replaced by a new file (rotation)
+        os.remove(self.log_file_path)
+        with open(self.log_file_path, "w", encoding="UTF-8") as f:
+            f.write(
+                '{"level": "INFO", "timestamp": "2022-12-01T15:00:00.000000+00:00", '
+                '"message": "new file", "context": "MAIN"}\n'
+            )
+
+        self.assertEqual(
+            self._get_messages("2022-12-01T00:00:00+00:00", "2022-12-01T23:59:59+00:00"),
+            ["new file"],
+        )
+        self.assertEqual(
+            self._get_log_complete_info().get_log_lines_by_request_id("request_1"), []
+        )
@@ -1,7 +1,8 @@
 import random
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 from gws_core.lab.monitor.monitor import Monitor
+from gws_core.lab.monitor.monitor_rollup import MonitorRollup
 from gws_core.lab.monitor.monitor_service import MonitorService
 from gws_core.test.base_test_case import BaseTestCase
 
@@ -80,3 +81,54 @@ class TestMonitor(BaseTestCase):
         self.assertIsNotNone(monitor_between_date.cpu_figure)
         self.assertIsNotNone(monitor_between_date.network_figure)
         self.assertIsNotNone(monitor_between_date.gpu_figure)
+
+    def test_rollups(self):
+        now = datetime(2024, 1, 1, 12, 30, 0, tzinfo=timezone.utc)
+
+        # 4 monitors per minute during 3 minutes
+        for i in range(12):
+            Monitor(
+                cpu_count=2,
+                cpu_percent=i,
+                disk_total=100,
+                disk_usage_used=50,
+                disk_usage_free=50,
+                disk_usage_percent=50,
+                net_io_bytes_sent=0,
+                net_io_bytes_recv=0,
+                swap_memory_total=0,
+                swap_memory_used=0,
+                swap_memory_free=0,
+                swap_memory_percent=0,
+                data={"all_cpu_percent": [i, 2 * i]},
+                created_at=now - timedelta(minutes=3) + timedelta(seconds=15 * i),
+            ).save()
+
+        MonitorService.update_rollups(now + timedelta(seconds=30))
+
+        rollups: list[MonitorRollup] = list(
+            MonitorRollup.select()
+            .where(MonitorRollup.resolution == 60)
+            .order_by(MonitorRollup.bucket_start)
+        )
+        self.assertEqual(len(rollups), 3)
+        self.assertEqual(rollups[0].sample_count, 4)
+        self.assertEqual(rollups[0].cpu_percent, 1.5)
+        self.assertEqual(rollups[0].disk_usage_percent, 50)
+        self.assertEqual(rollups[2].data["all_cpu_percent"], [9.5, 19])
+        # the hour is not complete
+        self.assertEqual(MonitorRollup.select().where(MonitorRollup.resolution == 3600).count(), 0)
+
+        # only the new complete buckets are added
+        MonitorService.update_rollups(now + timedelta(hours=1))
+        self.assertEqual(MonitorRollup.select().where(MonitorRollup.resolution == 60).count(), 3)
+        hour_rollup: MonitorRollup = MonitorRollup.get(MonitorRollup.resolution == 3600)
+        self.assertEqual(hour_rollup.sample_count, 12)
+        self.assertEqual(hour_rollup.cpu_percent, 5.5)
+
+        # the rollups are used when the monitors are deleted
+        Monitor.delete().execute()
+        df = MonitorService.get_monitor_data_frame_between_dates(
+            now - timedelta(days=1), now + timedelta(hours=1)
+        )
+        self.assertEqual(len(df), 3)
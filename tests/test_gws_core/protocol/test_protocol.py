@@ -1,3 +1,6 @@
+import random
+from unittest.mock import patch
+
 from gws_core import (
     BaseTestCase,
     ProtocolModel,
@@ -8,6 +11,8 @@ from gws_core import (
     TaskModel,
 )
 from gws_core.impl.robot.robot_resource import Robot, RobotFood
+from gws_core.impl.robot.robot_tasks import RobotMove
+from gws_core.process.process_factory import ProcessFactory
 from gws_core.process.process_model import ProcessModel
 from gws_core.process.process_types import ProcessStatus
 from gws_core.scenario.scenario_run_service import ScenarioRunService
@@ -41,6 +46,27 @@ class TestProtocol(BaseTestCase):
         self.assertEqual(len(scenario.get_task_models()), 7)
         self.assertEqual(scenario.status, ScenarioStatus.SUCCESS)
 
+    def test_protocol_parallel_run(self):
+        """Run the nested protocol with the independent tasks run in parallel"""
+        super_proto: ProtocolModel = ProtocolService.create_protocol_model_from_type(
+            TestNestedProtocol
+        )
+        scenario: Scenario = ScenarioService.create_scenario_from_protocol_model(
+            protocol_model=super_proto
+        )
+
+        with patch.dict("os.environ", {"PROTOCOL_MAX_PARALLEL_PROCESSES": "4"}):
+            scenario = ScenarioRunService.run_scenario(scenario=scenario)
+
+        self.assertEqual(scenario.status, ScenarioStatus.SUCCESS)
+        for task_model in scenario.get_task_models():
+            self.assertEqual(task_model.status, ProcessStatus.SUCCESS)
+
+        # the outputs of the sub protocol must be propagated to the next processes
+        super_proto = ProtocolModel.get_by_id_and_check(super_proto.id)
+        for process in super_proto.processes.values():
+            self.assertTrue(process.is_success)
+
     def test_advanced_protocol(self):
         query = ProtocolModel.select()
         count = len(query)
@@ -143,6 +169,37 @@ class TestProtocol(BaseTestCase):
         self.assertEqual(len(error_processes), 1)
         self.assertEqual(error_processes[0], p2)
 
+    def test_run_queue(self):
+        """Test the ready queue scheduling on a binary tree of tasks added in a random order"""
+        node_count = 100
+        protocol_model: ProtocolModel = ProcessFactory.create_protocol_empty()
+
+        names = [f"task_{i}" for i in range(node_count)]
+        random.Random(0).shuffle(names)
+        for name in names:
+            task_model: TaskModel = ProcessFactory.create_task_model_from_type(RobotMove)
+            protocol_model.add_process_model(task_model, instance_name=name)
+
+        for i in range(1, node_count):
+            protocol_model.add_connector(f"task_{(i - 1) // 2}", "robot", f"task_{i}", "robot")
+
+        remaining_previous, ready_processes = protocol_model._init_run_queue()
+        self.assertEqual(list(ready_processes), ["task_0"])
+
+        run_order: list[str] = []
+        while ready_processes:
+            process = protocol_model.processes[ready_processes.popleft()]
+            process.status = ProcessStatus.SUCCESS
+            run_order.append(process.instance_name)
+            protocol_model._add_next_ready_processes(process, remaining_previous, ready_processes)
+
+        # all the tasks are scheduled once, each task after its parent
+        self.assertEqual(sorted(run_order), sorted(names))
+        for i in range(1, node_count):
+            self.assertLess(
+                run_order.index(f"task_{(i - 1) // 2}"), run_order.index(f"task_{i}")
+            )
+
     def _check_process_set(
         self, processes: set[ProcessModel], expected_processes: set[str]
     ) -> None:
@@ -1,3 +1,5 @@
+import os
+import tempfile
 from unittest import TestCase
 
 from gws_core import KVStore
@@ -77,24 +79,68 @@ class TestKVStore(TestCase):
         test_lock["city"] = "Tokyo"
         test_lock["name"] = "Elon"
 
-        test_lock.lock("test_lock_2")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            lock_copy_path = os.path.join(temp_dir, "test_lock_2")
+            test_lock.lock(lock_copy_path)
 
-        self.assertEqual(test_lock["city"], "Tokyo")
-        # Test that the read did not create a copy of the file
-        self.assertFalse(FileHelper.exists_on_os(KVStore.get_full_file_path("test_lock_2")))
+            self.assertEqual(test_lock["city"], "Tokyo")
+            # Test that the read did not create a copy of the file
+            self.assertFalse(FileHelper.exists_on_os(lock_copy_path))
 
-        # Update the kvstore, it should create a new file
-        test_lock["city"] = "London"
-        # check that the file was created
-        self.assertTrue(FileHelper.exists_on_os(KVStore.get_full_file_path("test_lock_2")))
-        self.assertEqual(test_lock["city"], "London")
+            # Update the kvstore, it should create a new file
+            test_lock["city"] = "London"
+            # check that the file was created
+            self.assertTrue(FileHelper.exists_on_os(lock_copy_path))
+            self.assertEqual(test_lock["city"], "London")
 
-        # Check that the first store was not updated
-        first_store = KVStore.from_filename("test_lock")
-        self.assertEqual(first_store["city"], "Tokyo")
+            # Check that the first store was not updated
+            first_store = KVStore.from_filename("test_lock")
+            self.assertEqual(first_store["city"], "Tokyo")
 
     def test_generate_new_file(self):
         kv_store = KVStore.from_filename("test_generate_new_file")
 
         path = kv_store.generate_new_file()
         FileHelper.exists_on_os(path)
+
+    def test_session(self):
+        kv_store = KVStore.from_filename("test_session")
+        kv_store["city"] = "Tokyo"
+
+        with kv_store.session():
+            kv_store["name"] = "Elon"
+            kv_store["age"] = 50
+            del kv_store["city"]
+
+            # buffered values are readable during the session
+            self.assertEqual(kv_store["name"], "Elon")
+            self.assertFalse("city" in kv_store)
+            self.assertEqual(kv_store.get("city"), None)
+            self.assertEqual(len(kv_store), 2)
+
+        other_store = KVStore.from_filename("test_session")
+        self.assertEqual(other_store["name"], "Elon")
+        self.assertEqual(other_store["age"], 50)
+        self.assertFalse("city" in other_store)
+        self.assertEqual(sorted(other_store), ["age", "name"])
+        self.assertEqual(dict(other_store.items()), {"name": "Elon", "age": 50})
+
+    def test_session_many_fields(self):
+        """Test that the session mode and the default mode store the same values"""
+        fields = {f"field_{i}": {"values": list(range(10)), "name": f"field_{i}"} for i in range(200)}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            default_store = KVStore(os.path.join(temp_dir, "default", KVStore.FILE_NAME))
+            for key, value in fields.items():
+                default_store[key] = value
+
+            session_store = KVStore(os.path.join(temp_dir, "session", KVStore.FILE_NAME))
+            with session_store.session():
+                for key, value in fields.items():
+                    session_store[key] = value
+
+            with session_store.session():
+                self.assertEqual(sorted(session_store), sorted(fields))
+                for key, value in fields.items():
+                    self.assertEqual(session_store[key], value)
+            self.assertEqual(dict(session_store.items()), dict(default_store.items()))
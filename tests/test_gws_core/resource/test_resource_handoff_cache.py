@@ -0,0 +1,108 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from pandas import DataFrame
+
+from gws_core.impl.table.table import Table
+from gws_core.resource.kv_store import KVStore
+from gws_core.resource.resource_factory import ResourceFactory
+from gws_core.resource.resource_handoff_cache import ResourceHandoffCache
+
+
+# test_resource_handoff_cache
+class TestResourceHandoffCache(TestCase):
+    def setUp(self) -> None:
+        ResourceHandoffCache.clear()
+
+    def tearDown(self) -> None:
+        ResourceHandoffCache.MAX_SIZE = 1024 * 1024 * 1024
+        ResourceHandoffCache._enabled = True
+        ResourceHandoffCache.clear()
+
+    def _create_saved_table(self) -> Table:
+        table = Table(DataFrame({"A": [1, 2, 3], "B": ["a", "b", "c"]}))
+        table.add_row_tag_by_index(0, "key", "value")
+        # load all the fields like the save does
+        for key in table.__get_resource_r_fields__():
+            getattr(table, key)
+        return table
+
+    def test_handoff(self):
+        table = self._create_saved_table()
+        ResourceHandoffCache.add_resource("resource_1", table)
+
+        self.assertTrue(ResourceHandoffCache.has_field("resource_1", "_data"))
+        self.assertFalse(ResourceHandoffCache.has_field("resource_2", "_data"))
+        self.assertFalse(ResourceHandoffCache.has_field(None, "_data"))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # empty kv store, the values must come from the cache
+            kv_store = KVStore(os.path.join(tmp_dir, KVStore.FILE_NAME))
+            new_table: Table = ResourceFactory.create_resource(
+                Table, kv_store=kv_store, data={}, resource_model_id="resource_1"
+            )
+
+            self.assertTrue(new_table.get_data().equals(table.get_data()))
+            self.assertEqual(new_table.get_row_tags(), table.get_row_tags())
+            self.assertEqual(new_table.nb_rows, 3)
+
+            # modifying the loaded resource doesn't modify the cached version
+            new_table.get_data().iloc[0, 0] = 100
+            new_table.add_row_tag_by_index(1, "other", "tag")
+
+            other_table: Table = ResourceFactory.create_resource(
+                Table, kv_store=kv_store, data={}, resource_model_id="resource_1"
+            )
+            self.assertEqual(other_table.get_data().iloc[0, 0], 1)
+            self.assertEqual(other_table.get_row_tags(), table.get_row_tags())
+
+        ResourceHandoffCache.invalidate_resource("resource_1")
+        self.assertFalse(ResourceHandoffCache.has_field("resource_1", "_data"))
+        self.assertEqual(ResourceHandoffCache.get_current_size(), 0)
+
+    def test_eviction(self):
+        table = self._create_saved_table()
+        ResourceHandoffCache.add_resource("resource_1", table)
+        entry_size = ResourceHandoffCache.get_current_size()
+        self.assertGreater(entry_size, 0)
+
+        # only 2 resources fit in the cache
+        ResourceHandoffCache.MAX_SIZE = entry_size * 2
+        ResourceHandoffCache.add_resource("resource_2", table)
+        ResourceHandoffCache.add_resource("resource_3", table)
+
+        self.assertFalse(ResourceHandoffCache.has_field("resource_1", "_data"))
+        self.assertTrue(ResourceHandoffCache.has_field("resource_2", "_data"))
+        self.assertTrue(ResourceHandoffCache.has_field("resource_3", "_data"))
+        self.assertEqual(ResourceHandoffCache.get_current_size(), entry_size * 2)
+
+    def test_not_loaded_resource(self):
+        """A resource with fields not loaded is not cached"""
+        table = Table(DataFrame({"A": [1, 2, 3]}))
+        delattr(table, "_data")
+        ResourceHandoffCache.add_resource("resource_1", table)
+        self.assertFalse(ResourceHandoffCache.has_field("resource_1", "_data"))
+
+    def test_snapshot_on_add(self):
+        """The resource modified after its save doesn't modify the cached version"""
+        table = self._create_saved_table()
+        ResourceHandoffCache.add_resource("resource_1", table)
+
+        # the task keeps modifying the data of its output in place
+        table._data.iloc[0, 0] = 100
+        table.add_row_tag_by_index(1, "other", "tag")
+
+        data = ResourceHandoffCache.get_field_value("resource_1", "_data")
+        self.assertEqual(data.iloc[0, 0], 1)
+
+    def test_disable(self):
+        table = self._create_saved_table()
+        ResourceHandoffCache.add_resource("resource_1", table)
+
+        ResourceHandoffCache.disable()
+        self.assertFalse(ResourceHandoffCache.has_field("resource_1", "_data"))
+
+        ResourceHandoffCache.add_resource("resource_2", table)
+        self.assertFalse(ResourceHandoffCache.has_field("resource_2", "_data"))
+        self.assertEqual(ResourceHandoffCache.get_current_size(), 0)
@@ -28,6 +28,9 @@ from gws_core.resource.resource_set.resource_set import ResourceSet
 from gws_core.resource.resource_set.resource_set_exporter import ResourceSetExporter
 from gws_core.resource.resource_set.resource_set_tasks import ResourceStacker
 from gws_core.scenario.scenario_proxy import ScenarioProxy
+from gws_core.tag.entity_tag_list import EntityTagList
+from gws_core.tag.tag import Tag
+from gws_core.tag.tag_entity_type import TagEntityType
 from gws_core.task.task_runner import TaskRunner
 from gws_core.test.base_test_case import BaseTestCase
 from pandas import DataFrame
@@ -133,6 +136,51 @@ class TestResourceSet(BaseTestCase):
         scenario.get_model().reset()
         self.assertEqual(ResourceModel.select().count(), resource_count)
 
+    def test_save_resource_set_children(self):
+        """Test the multi-row insert of the children of a resource set"""
+        temp_dir = Settings.get_instance().make_temp_dir()
+        resource_set: ResourceSet = ResourceSet()
+        for i in range(3):
+            file_path = FileHelper.create_empty_file_if_not_exist(
+                os.path.join(temp_dir, f"file_{i}.txt")
+            )
+            file = File(file_path)
+            file.tags.add_tag(Tag("file_key", f"value_{i}"))
+            file.tags.add_tag(Tag("common_key", "common"))
+            resource_set.add_resource(file, unique_name=f"file_{i}")
+
+        robot = Robot.empty()
+        robot.tags.add_tag(Tag("common_key", "common"))
+        resource_set.add_resource(robot, unique_name="robot")
+
+        resource_set_model = ResourceModel.save_from_resource(
+            resource_set, origin=ResourceOrigin.UPLOADED
+        )
+
+        children: list[ResourceModel] = list(
+            ResourceModel.select().where(
+                ResourceModel.parent_resource_id == resource_set_model.id
+            )
+        )
+        self.assertEqual(len(children), 4)
+
+        for child in children:
+            entity_tags = EntityTagList.find_by_entity(TagEntityType.RESOURCE, child.id)
+            self.assertTrue(entity_tags.has_tag(Tag("common_key", "common")))
+
+            if child.fs_node_model is None:
+                # robot
+                self.assertEqual(len(entity_tags.get_tags()), 1)
+            else:
+                self.assertTrue(os.path.exists(child.fs_node_model.path))
+                self.assertEqual(len(entity_tags.get_tags()), 2)
+
+        # check the reload of the resource set
+        resource_set = resource_set_model.get_resource()
+        file_1: File = resource_set.get_resource("file_1")
+        self.assertTrue(file_1.exists())
+        self.assertEqual(len(resource_set.get_resources()), 4)
+
     def test_resource_set_exporter(self):
         settings = Settings.get_instance()
 
@@ -1,13 +1,21 @@
+import os
+import shutil
 from typing import cast
 
+from gws_core.core.utils.settings import Settings
 from gws_core.impl.file.file import File
 from gws_core.impl.table.table import Table
+from gws_core.resource.id_mapper import IdMapper
 from gws_core.resource.resource_dto import ResourceOrigin
+from gws_core.resource.resource_loader import ResourceLoader
 from gws_core.resource.resource_model import ResourceModel
 from gws_core.resource.resource_set.resource_set import ResourceSet
+from gws_core.resource.resource_zipper import ResourceZipper
 from gws_core.resource.task.resource_zipper_task import ResourceUnZipper, ResourceZipperTask
+from gws_core.share.shared_dto import ShareEntityCreateMode
 from gws_core.task.task_runner import TaskRunner
 from gws_core.test.base_test_case import BaseTestCase
+from gws_core.user.current_user_service import CurrentUserService
 from pandas import DataFrame
 
 
@@ -93,3 +101,33 @@ class TestResourceZipperLoader(BaseTestCase):
         self.assertEqual(loaded_table_2.nb_rows, 3)
         self.assertEqual(list(loaded_table_2.column_names), ["y"])
         self.assertEqual(loaded_table_2.get_column_data("y"), [30, 40, 50])
+
+    def test_stream_and_load_resource_set(self):
+        """Test streaming the tar of a ResourceSet with files and loading it back."""
+        resource_set = ResourceSet()
+        temp_dir = Settings.make_temp_dir()
+        for i in range(3):
+            file_path = os.path.join(temp_dir, f"file_{i}.txt")
+            with open(file_path, "w", encoding="utf-8") as file:
+                file.write(f"content {i}")
+            resource_set.add_resource(File(file_path), unique_name=f"file_{i}")
+        resource_model = ResourceModel.save_from_resource(resource_set, ResourceOrigin.UPLOADED)
+
+        resource_zipper = ResourceZipper(CurrentUserService.get_and_check_current_user())
+        resource_zipper.add_resource_model(resource_model.id)
+        self.assertEqual(len(resource_zipper.resource_info.children_resources), 3)
+
+        # write the stream to a file like a download
+        tar_path = os.path.join(Settings.make_temp_dir(), "resource.tar")
+        with resource_zipper.open_tar_stream() as tar_stream, open(tar_path, "wb") as tar_file:
+            shutil.copyfileobj(tar_stream, tar_file)
+
+        resource_loader = ResourceLoader.from_compress_file(
+            tar_path, IdMapper(ShareEntityCreateMode.NEW_ID)
+        )
+        loaded_set: ResourceSet = cast(ResourceSet, resource_loader.load_resource())
+        self.assertIsInstance(loaded_set, ResourceSet)
+        self.assertEqual(len(loaded_set.get_resources()), 3)
+        loaded_file: File = cast(File, loaded_set.get_resource("file_1"))
+        self.assertEqual(loaded_file.read(), "content 1")
+        resource_loader.delete_resource_folder()
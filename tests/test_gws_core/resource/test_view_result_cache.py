@@ -0,0 +1,65 @@
+from unittest import TestCase
+
+from gws_core.resource.view.view_dto import ViewDTO
+from gws_core.resource.view.view_result_cache import CachedViewResult, ViewResultCache
+from gws_core.resource.view.view_types import ViewType
+
+
+# test_view_result_cache
+class TestViewResultCache(TestCase):
+    def setUp(self) -> None:
+        ViewResultCache.clear()
+
+    def tearDown(self) -> None:
+        ViewResultCache.MAX_SIZE = 200 * 1024 * 1024
+        ViewResultCache.clear()
+
+    def _create_result(self, view_type: ViewType = ViewType.JSON) -> CachedViewResult:
+        view_dto = ViewDTO(type=view_type, title="Title", technical_info=[], data={"a": "b" * 100})
+        return CachedViewResult(view_dto, "Title", view_type, False, None)
+
+    def test_cache(self):
+        key_1 = ("resource_1", "view_as_json", "hash", "v1")
+        key_2 = ("resource_1", "view_as_json", "other_hash", "v1")
+        key_3 = ("resource_2", "view_as_json", "hash", "v1")
+
+        self.assertIsNone(ViewResultCache.get(key_1))
+        ViewResultCache.set(key_1, self._create_result())
+        ViewResultCache.set(key_2, self._create_result())
+        ViewResultCache.set(key_3, self._create_result())
+
+        self.assertIsNotNone(ViewResultCache.get(key_1))
+        stats = ViewResultCache.get_stats()
+        self.assertEqual(stats.nb_entries, 3)
+        self.assertEqual(stats.hits, 1)
+        self.assertEqual(stats.misses, 1)
+
+        # invalidate all the views of a resource
+        ViewResultCache.invalidate_resource("resource_1")
+        self.assertIsNone(ViewResultCache.get(key_1))
+        self.assertIsNone(ViewResultCache.get(key_2))
+        self.assertIsNotNone(ViewResultCache.get(key_3))
+
+        # app views are not cached
+        ViewResultCache.set(key_1, self._create_result(ViewType.APP))
+        self.assertIsNone(ViewResultCache.get(key_1))
+
+    def test_lru_eviction(self):
+        entry_size = len(self._create_result().view_dto.model_dump_json())
+        ViewResultCache.MAX_SIZE = entry_size * 2
+
+        key_1 = ("resource_1", "view", "hash", "v1")
+        key_2 = ("resource_2", "view", "hash", "v1")
+        key_3 = ("resource_3", "view", "hash", "v1")
+        ViewResultCache.set(key_1, self._create_result())
+        ViewResultCache.set(key_2, self._create_result())
+
+        # use the first entry so the second one is the least recently used
+        ViewResultCache.get(key_1)
+        ViewResultCache.set(key_3, self._create_result())
+
+        self.assertIsNotNone(ViewResultCache.get(key_1))
+        self.assertIsNone(ViewResultCache.get(key_2))
+        self.assertIsNotNone(ViewResultCache.get(key_3))
+        self.assertEqual(ViewResultCache.get_stats().evictions, 1)
+        self.assertEqual(ViewResultCache.get_stats().size, entry_size * 2)
@@ -0,0 +1,196 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from gws_core.impl.s3.local_s3_server_service import LocalS3ServerService
+from gws_core.impl.s3.s3_stream_helper import S3StreamHelper
+
+
+# test_local_s3_object_index
+class TestLocalS3ObjectIndex(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.service = LocalS3ServerService("test-index-bucket", self.tmp_dir.name)
+
+    def tearDown(self) -> None:
+        index_path = self.service._object_index.index_path
+        for file_path in [index_path, f"{index_path}.lock"]:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+        self.tmp_dir.cleanup()
+
+    def _list_all(self, **kwargs) -> tuple[list[str], list[str]]:
+        """List all the pages and return the keys and common prefixes"""
+        keys: list[str] = []
+        common_prefixes: list[str] = []
+        continuation_token = None
+        while True:
+            result = self.service.list_objects(
+                max_keys=2, continuation_token=continuation_token, **kwargs
+            )
+            self.assertLessEqual(result["KeyCount"], 2)
+            keys += [content["Key"] for content in result["Contents"]]
+            common_prefixes += [prefix["Prefix"] for prefix in result["CommonPrefixes"]]
+            if not result["IsTruncated"]:
+                return keys, common_prefixes
+            continuation_token = result["NextContinuationToken"]
+
+    def test_list_objects(self):
+        keys = ["a.txt", "b/1.txt", "b/2.txt", "b/c/3.txt", "ba.txt", "d/4.txt", "e.txt"]
+        for key in keys:
+            asyncio.run(
+                self.service.upload_object(key, S3StreamHelper.bytes_to_stream(key.encode()))
+            )
+
+        result = self.service.list_objects()
+        self.assertEqual([content["Key"] for content in result["Contents"]], keys)
+        self.assertEqual(
+            result["Contents"][0]["ETag"], f'"{hashlib.md5(b"a.txt").hexdigest()}"'
+        )
+        self.assertEqual(result["Contents"][0]["Size"], 5)
+
+        # paginated deep listing
+        self.assertEqual(self._list_all(), (keys, []))
+        self.assertEqual(
+            self._list_all(prefix="b"), (["b/1.txt", "b/2.txt", "b/c/3.txt", "ba.txt"], [])
+        )
+
+        # paginated listing with delimiter, the common prefixes count in the page
+        self.assertEqual(
+            self._list_all(delimiter="/"), (["a.txt", "ba.txt", "e.txt"], ["b/", "d/"])
+        )
+        self.assertEqual(
+            self._list_all(prefix="b/", delimiter="/"), (["b/1.txt", "b/2.txt"], ["b/c/"])
+        )
+
+        # a start key equal to the prefix is not skipped as a common prefix
+        result = self.service.list_objects(prefix="b/", delimiter="/", start_after="b/")
+        self.assertEqual([content["Key"] for content in result["Contents"]], keys[1:3])
+        self.assertEqual([prefix["Prefix"] for prefix in result["CommonPrefixes"]], ["b/c/"])
+
+        # the index is maintained on delete
+        self.service.delete_objects(["b/1.txt", "b/c/3.txt"])
+        self.service.delete_object("e.txt")
+        self.assertEqual(self._list_all(delimiter="/"), (["a.txt", "ba.txt"], ["b/", "d/"]))
+
+        # the index is rebuilt from the bucket directory if it doesn't exist
+        os.remove(self.service._object_index.index_path)
+        self.assertEqual(self._list_all(), (["a.txt", "b/2.txt", "ba.txt", "d/4.txt"], []))
+
+    def test_reconcile(self):
+        for key in ["a.txt", "b.txt"]:
+            asyncio.run(
+                self.service.upload_object(key, S3StreamHelper.bytes_to_stream(key.encode()))
+            )
+        self.assertEqual(self._list_all(), (["a.txt", "b.txt"], []))
+
+        # files added, modified and deleted without the S3 server
+        with open(os.path.join(self.tmp_dir.name, "c.txt"), "wb") as file:
+            file.write(b"new file")
+        with open(os.path.join(self.tmp_dir.name, "a.txt"), "wb") as file:
+            file.write(b"modified file")
+        os.remove(os.path.join(self.tmp_dir.name, "b.txt"))
+
+        object_index = self.service._object_index
+        self.assertEqual(object_index.reconcile(), 3)
+        self.assertEqual(self._list_all(), (["a.txt", "c.txt"], []))
+        self.assertEqual(
+            object_index.get_object("a.txt").etag, hashlib.md5(b"modified file").hexdigest()
+        )
+        self.assertEqual(object_index.reconcile(), 0)
+
+    def test_reconcile_in_background(self):
+        asyncio.run(self.service.upload_object("a.txt", S3StreamHelper.bytes_to_stream(b"a")))
+        self.assertEqual(self._list_all(), (["a.txt"], []))
+
+        with open(os.path.join(self.tmp_dir.name, "b.txt"), "wb") as file:
+            file.write(b"new file")
+
+        # the listing starts the reconciliation when it is due, without waiting for it
+        object_index = self.service._object_index
+        object_index._last_reconcile_times[object_index.index_path] -= (
+            object_index.RECONCILE_INTERVAL_SECONDS
+        )
+        self.service.list_objects()
+
+        for _ in range(50):
+            if object_index.index_path not in object_index._reconciling_index_paths:
+                break
+            time.sleep(0.1)
+        self.assertEqual(self._list_all(), (["a.txt", "b.txt"], []))
+
+    def test_concurrent_rebuild(self):
+        for i in range(20):
+            with open(os.path.join(self.tmp_dir.name, f"file_{i}.txt"), "wb") as file:
+                file.write(str(i).encode())
+
+        # the threads of the server rebuild the missing index at the same time
+        object_index = self.service._object_index
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            counts = list(executor.map(lambda _: object_index.rebuild(), range(4)))
+
+        self.assertEqual(counts, [20] * 4)
+        self.assertEqual(len(self._list_all()[0]), 20)
+        index_dir = os.path.dirname(object_index.index_path)
+        self.assertEqual([name for name in os.listdir(index_dir) if name.endswith(".tmp")], [])
+
+    def test_multipart_upload_etag(self):
+        upload_id = self.service.initiate_multipart_upload("big/file.bin")
+        part_etag = asyncio.run(
+            self.service.upload_part(
+                "big/file.bin", upload_id, 1, S3StreamHelper.bytes_to_stream(b"first part ")
+            )
+        )
+        self.assertEqual(part_etag, f'"{hashlib.md5(b"first part ").hexdigest()}"')
+        asyncio.run(
+            self.service.upload_part(
+                "big/file.bin", upload_id, 2, S3StreamHelper.bytes_to_stream(b"second part")
+            )
+        )
+        etag = self.service.complete_multipart_upload(
+            "big/file.bin", upload_id, [{"PartNumber": 2}, {"PartNumber": 1}]
+        )
+
+        # like S3, the ETag of a multipart object is the md5 of the parts md5
+        parts_md5 = hashlib.md5(b"first part ").digest() + hashlib.md5(b"second part").digest()
+        self.assertEqual(etag, f'"{hashlib.md5(parts_md5).hexdigest()}-2"')
+        with open(os.path.join(self.tmp_dir.name, "big", "file.bin"), "rb") as file:
+            self.assertEqual(file.read(), b"first part second part")
+        self.assertEqual(self.service.list_objects()["Contents"][0]["ETag"], etag)
+        self.assertEqual(self.service.head_object("big/file.bin")["ETag"], etag)
+
+    def test_upload_object_stream(self):
+        chunks = [os.urandom(100_000) for _ in range(5)]
+
+        async def stream():
+            for chunk in chunks:
+                yield chunk
+
+        result = asyncio.run(self.service.upload_object("stream.bin", stream()))
+
+        content = b"".join(chunks)
+        self.assertEqual(result["ETag"], f'"{hashlib.md5(content).hexdigest()}"')
+        with open(os.path.join(self.tmp_dir.name, "stream.bin"), "rb") as file:
+            self.assertEqual(file.read(), content)
+
+    def test_upload_object_error_keeps_object(self):
+        asyncio.run(self.service.upload_object("a.txt", S3StreamHelper.bytes_to_stream(b"old")))
+
+        async def broken_stream():
+            yield b"new content"
+            raise ConnectionError("Client disconnected")
+
+        with self.assertRaises(ConnectionError):
+            asyncio.run(self.service.upload_object("a.txt", broken_stream()))
+
+        # the existing object and its index entry are unchanged, the temp file is deleted
+        with open(os.path.join(self.tmp_dir.name, "a.txt"), "rb") as file:
+            self.assertEqual(file.read(), b"old")
+        self.assertEqual(
+            self.service.head_object("a.txt")["ETag"], f'"{hashlib.md5(b"old").hexdigest()}"'
+        )
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["a.txt"])
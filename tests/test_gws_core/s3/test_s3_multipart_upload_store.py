@@ -0,0 +1,72 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+from unittest import TestCase
+
+from gws_core.impl.s3.s3_multipart_upload_store import S3MultipartUploadStore
+from gws_core.impl.s3.s3_stream_helper import S3StreamHelper
+
+
+# test_s3_multipart_upload_store
+class TestS3MultipartUploadStore(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = S3MultipartUploadStore(os.path.join(self.tmp_dir.name, "multipart"))
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_parallel_parts(self):
+        key = "dir/object.bin"
+        upload_id = self.store.initiate_upload(key, {"last_modified": 10.0})
+        upload_info = self.store.get_upload_info(key, upload_id)
+        self.assertEqual(upload_info["metadata"]["last_modified"], 10.0)
+
+        parts = [os.urandom(200_000 + i) for i in range(8)]
+
+        async def upload_parts():
+            # the parts are uploaded concurrently in reverse order
+            return await asyncio.gather(
+                *[
+                    self.store.write_part(
+                        key, upload_id, part_number, S3StreamHelper.bytes_to_stream(part)
+                    )
+                    for part_number, part in reversed(list(enumerate(parts, start=1)))
+                ]
+            )
+
+        etags = asyncio.run(upload_parts())
+        self.assertEqual(etags[0], hashlib.md5(parts[-1]).hexdigest())
+
+        # upload the first part again, it replaces the previous one
+        parts[0] = b"new first part"
+        asyncio.run(
+            self.store.write_part(key, upload_id, 1, S3StreamHelper.bytes_to_stream(parts[0]))
+        )
+
+        destination_path = os.path.join(self.tmp_dir.name, "object.bin")
+        etag = self.store.concatenate_parts(
+            key, upload_id, [{"PartNumber": str(i)} for i in range(1, 9)], destination_path
+        )
+
+        with open(destination_path, "rb") as file:
+            self.assertEqual(file.read(), b"".join(parts))
+        parts_md5 = b"".join(hashlib.md5(part).digest() for part in parts)
+        self.assertEqual(etag, f"{hashlib.md5(parts_md5).hexdigest()}-8")
+
+        self.store.delete_upload(upload_id)
+        with self.assertRaises(ValueError):
+            self.store.get_upload_info(key, upload_id)
+
+    def test_invalid_upload(self):
+        upload_id = self.store.initiate_upload("key")
+
+        with self.assertRaises(ValueError):
+            self.store.get_upload_info("other_key", upload_id)
+        with self.assertRaises(ValueError):
+            self.store.get_upload_info("key", "../multipart")
+        with self.assertRaises(ValueError):
+            self.store.concatenate_parts(
+                "key", upload_id, [{"PartNumber": "1"}], os.path.join(self.tmp_dir.name, "object")
+            )
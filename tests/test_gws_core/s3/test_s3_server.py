@@ -4,6 +4,7 @@ from time import sleep
 
 import boto3
 import requests
+from boto3.s3.transfer import TransferConfig
 from gws_core.core.utils.settings import Settings
 from gws_core.credentials.credentials import Credentials
 from gws_core.credentials.credentials_service import CredentialsService
@@ -131,6 +132,25 @@ class TestS3Server(BaseTestCase):
         self.assertTrue(FileHelper.exists_on_os(file_path))
         self.assertTrue(FileHelper.get_size(file_path) > 0)
 
+        # test multipart upload, the resource is created on completion
+        big_file_path = os.path.join(destination_folder, "big.bin")
+        with open(big_file_path, "wb") as big_file:
+            big_file.write(os.urandom(12 * 1024 * 1024))
+        s3_client.upload_file(
+            big_file_path,
+            Bucket=DataHubS3ServerService.FOLDERS_BUCKET_NAME,
+            Key="big.bin",
+            ExtraArgs={"Tagging": f"{DataHubS3ServerService.FOLDER_TAG_NAME}={folder_id}"},
+            Config=TransferConfig(
+                multipart_threshold=5 * 1024 * 1024, multipart_chunksize=5 * 1024 * 1024
+            ),
+        )
+        datahub_service = DataHubS3ServerService(DataHubS3ServerService.FOLDERS_BUCKET_NAME)
+        big_resource = datahub_service._get_object("big.bin")
+        self.assertIsNotNone(big_resource)
+        self.assertEqual(big_resource.fs_node_model.size, 12 * 1024 * 1024)
+        s3_client.delete_object(Bucket=DataHubS3ServerService.FOLDERS_BUCKET_NAME, Key="big.bin")
+
         # test delete file
         s3_client.delete_object(Bucket=DataHubS3ServerService.FOLDERS_BUCKET_NAME, Key=key)
 
@@ -1,8 +1,12 @@
 import os
+import time
+from threading import Thread
+from typing import Literal
 from unittest import TestCase
 
 from gws_core.core.classes.observer.message_dispatcher import MessageDispatcher
 from gws_core.core.classes.observer.message_observer import BasicMessageObserver
+from gws_core.impl.file.file_helper import FileHelper
 from gws_core.impl.shell.base_env_shell import BaseEnvShell
 from gws_core.impl.shell.conda_shell_proxy import CondaShellProxy
 from gws_core.impl.shell.mamba_shell_proxy import MambaShellProxy
@@ -116,3 +120,62 @@ class TestEnvShellProxy(TestCase):
 
         finally:
             shell_proxy.uninstall_env()
+
+    def test_concurrent_install(self):
+        env_file = os.path.join(
+            os.path.dirname(os.path.realpath(__file__)), "penv", "env_jwt_pip.txt"
+        )
+        shell_proxies = [
+            _SlowInstallShellProxy(env_file, env_name="MyConcurrentTestEnvironment")
+            for _ in range(3)
+        ]
+        if shell_proxies[0].env_is_installed():
+            FileHelper.delete_dir(shell_proxies[0].get_env_dir_path())
+
+        _SlowInstallShellProxy.install_count = 0
+        results: list[bool] = []
+        threads = [
+            Thread(target=lambda proxy=proxy: results.append(proxy.install_env()))
+            for proxy in shell_proxies
+        ]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            # the env is installed once, the other installs wait and reuse it
+            self.assertEqual(_SlowInstallShellProxy.install_count, 1)
+            self.assertEqual(sorted(results), [False, False, True])
+            self.assertTrue(shell_proxies[1].env_is_installed())
+        finally:
+            FileHelper.delete_dir(shell_proxies[0].get_env_dir_path())
+
+
+class _SlowInstallShellProxy(BaseEnvShell):
+    """Fake env shell with a slow install that counts the installations"""
+
+    CONFIG_FILE_NAME = "env.txt"
+    install_count = 0
+
+    def _install_env(self) -> bool:
+        time.sleep(0.5)
+        _SlowInstallShellProxy.install_count += 1
+        return True
+
+    def _uninstall_env(self) -> bool:
+        FileHelper.delete_dir(self.get_env_dir_path())
+        return True
+
+    def format_command(self, user_cmd: list | str) -> list | str:
+        return user_cmd
+
+    def get_config_file_path(self) -> str:
+        return self.env_file_path
+
+    @classmethod
+    def get_env_type(cls) -> Literal["conda", "mamba", "pip"]:
+        return "pip"
+
+    def _list_packages(self) -> dict[str, str]:
+        return {}
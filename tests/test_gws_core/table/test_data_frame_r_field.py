@@ -0,0 +1,101 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+from pyarrow import Table
+from pyarrow.feather import write_feather
+
+from gws_core.impl.table.data_frame_r_field import DataFrameRField, DataFrameStorageFormat
+
+
+# test_data_frame_r_field
+class TestDataFrameRField(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_storage_formats(self):
+        dataframe = DataFrame(
+            {"A": [1, 2, 3], "B": ["a", None, "c"], "C": [1.5, np.nan, 3.2]},
+            index=["row_1", "row_2", "row_3"],
+        )
+
+        for storage_format in DataFrameStorageFormat:
+            r_field = DataFrameRField(storage_format)
+            file_path = os.path.join(self.tmp_dir.name, storage_format.value)
+            r_field.dump_to_file(dataframe, file_path)
+
+            self.assertEqual(DataFrameRField.detect_file_format(file_path), storage_format)
+            assert_frame_equal(r_field.load_from_file(file_path), dataframe)
+
+            # load only some columns, the index is kept
+            assert_frame_equal(
+                r_field.load_columns_from_file(file_path, ["C", "A"]), dataframe[["C", "A"]]
+            )
+
+            # load only some rows, in the order of the positions
+            assert_frame_equal(
+                r_field.load_rows_from_file(file_path, [2, 0], ["A"]), dataframe[["A"]].iloc[[2, 0]]
+            )
+
+            header, nb_rows = r_field.load_header_from_file(file_path)
+            assert_frame_equal(header, dataframe.iloc[0:0])
+            self.assertEqual(nb_rows, 3)
+
+    def test_object_nan_round_trip(self):
+        # the missing values of the object columns stay NaN like with pickle
+        dataframe = DataFrame(
+            {"A": ["a", np.nan, "c"], "B": [np.nan, np.nan, np.nan], "C": [1.0, np.nan, 2.0]},
+            index=["row_1", "row_2", "row_3"],
+        )
+        dataframe["B"] = dataframe["B"].astype(object)
+
+        for storage_format in DataFrameStorageFormat:
+            r_field = DataFrameRField(storage_format)
+            file_path = os.path.join(self.tmp_dir.name, storage_format.value)
+            r_field.dump_to_file(dataframe, file_path)
+            self.assertEqual(DataFrameRField.detect_file_format(file_path), storage_format)
+
+            loaded = r_field.load_from_file(file_path)
+            assert_frame_equal(loaded, dataframe)
+            self.assertIsInstance(loaded.loc["row_2", "A"], float)
+            self.assertIsInstance(loaded.loc["row_1", "B"], float)
+
+            rows = r_field.load_rows_from_file(file_path, [1], ["A"])
+            self.assertIsInstance(rows.iloc[0, 0], float)
+            self.assertIsInstance(r_field.load_column_from_file(file_path, "A")[1], float)
+
+    def test_compressed_feather(self):
+        # older files were stored in feather compressed with lz4
+        dataframe = DataFrame({"A": range(100_000), "B": ["a", "b"] * 50_000})
+        file_path = os.path.join(self.tmp_dir.name, "compressed")
+        arrow_table = Table.from_pandas(dataframe, preserve_index=True)
+        write_feather(arrow_table, file_path, compression="lz4", chunksize=30_000)
+
+        r_field = DataFrameRField()
+        header, nb_rows = r_field.load_header_from_file(file_path)
+        assert_frame_equal(header, dataframe.iloc[0:0])
+        self.assertEqual(nb_rows, 100_000)
+        assert_frame_equal(
+            r_field.load_columns_from_file(file_path, ["B"], 5, 8), dataframe[["B"]].iloc[5:8]
+        )
+
+    def test_fallback_and_pickle_compatibility(self):
+        # object columns that are not strings are not supported by the columnar format
+        dataframe = DataFrame({"A": [[1, 2], [3]], "B": [1, 2]})
+
+        r_field = DataFrameRField(DataFrameStorageFormat.FEATHER)
+        file_path = os.path.join(self.tmp_dir.name, "list")
+        r_field.dump_to_file(dataframe, file_path)
+        self.assertEqual(DataFrameRField.detect_file_format(file_path), DataFrameStorageFormat.PICKLE)
+        assert_frame_equal(r_field.load_from_file(file_path), dataframe)
+
+        # a file stored with pickle is read by a field configured with another format
+        file_path = os.path.join(self.tmp_dir.name, "pickle")
+        DataFrameRField(DataFrameStorageFormat.PICKLE).dump_to_file(dataframe, file_path)
+        assert_frame_equal(DataFrameRField().load_from_file(file_path), dataframe)
@@ -1,7 +1,8 @@
 from unittest import TestCase
 
-from gws_core import Table
+from gws_core import KVStore, Table
 from gws_core.core.utils.utils import Utils
+from gws_core.resource.resource_factory import ResourceFactory
 from pandas import DataFrame
 
 
@@ -44,6 +45,34 @@ class TestTable(TestCase):
         # there should be only two rows --> two tag
         self.assertEqual(sub_table.get_row_tags(), [{"a": "1"}, {"a": "2"}])
 
+    def test_get_data_view(self):
+        table = Table(DataFrame({"A": [1.0, 2.0, 3.0], "B": ["a", "b", "c"]}))
+
+        view = table.get_data_view()
+        self.assertTrue(view.equals(table.get_data()))
+
+        # the view can't be modified
+        with self.assertRaises(ValueError):
+            view.iloc[0, 0] = 10
+        with self.assertRaises(ValueError):
+            view.loc["0", "B"] = "z"
+        self.assertEqual(table.get_cell_value_at(0, 0), 1.0)
+
+        # the copy can be modified
+        data = table.get_data()
+        data.iloc[0, 0] = 10
+        self.assertEqual(table.get_cell_value_at(0, 0), 1.0)
+
+        # the table created from the view has its own data
+        sub_table = Table(view.iloc[0:2])
+        sub_table.set_cell_value_at(0, 0, 100)
+        self.assertEqual(sub_table.get_cell_value_at(0, 0), 100)
+        self.assertEqual(table.get_cell_value_at(0, 0), 1.0)
+
+        # the table can still be modified
+        table.set_cell_value_at(0, 0, 5)
+        self.assertEqual(table.get_cell_value_at(0, 0), 5)
+
     def test_table_select(self):
         row_tags = [
             {"lg": "EN", "c": "US", "user": "Vi"},
@@ -348,3 +377,35 @@ class TestTable(TestCase):
 
         self.assertEqual(table.row_names, ["r0", "r0_1"])
         self.assertEqual(table.column_names, ["A", "A_1", "1", "9e_a_SUPER"])
+
+    def test_lazy_data_loading(self):
+        table = Table(
+            data=DataFrame({"A": [1, 2, 3], "B": [4.0, 5.0, 6.0], "C": ["x", "y", "z"]}),
+            row_tags=[{"a": "1"}, {"a": "2"}, {"a": "3"}],
+        )
+
+        # store the table fields in a kv store like when the resource is saved
+        kv_store = KVStore.empty()
+        r_fields = Table.__get_resource_r_fields__()
+        with kv_store.session():
+            kv_store.set_file("_data", r_fields["_data"], table.get_data())
+            kv_store["_row_tags"] = r_fields["_row_tags"].serialize(table._row_tags)
+            kv_store["_column_tags"] = r_fields["_column_tags"].serialize(table._column_tags)
+
+        loaded_table: Table = ResourceFactory.create_resource(Table, kv_store=kv_store, data={})
+
+        # metadata and parts of the data are read without loading the full data
+        self.assertEqual(loaded_table.nb_rows, 3)
+        self.assertEqual(loaded_table.column_names, ["A", "B", "C"])
+        self.assertEqual(loaded_table.get_row_names(1, 3), ["1", "2"])
+        self.assertEqual(loaded_table.get_column_data("B"), [4.0, 5.0, 6.0])
+        self.assertTrue(
+            loaded_table.get_sub_data(["C", "A"], 1, 2).equals(DataFrame({"C": ["y"], "A": [2]}, index=["1"]))
+        )
+        self.assertEqual(loaded_table.get_rows_info(2, 3), [{"name": "2", "tags": {"a": "3"}}])
+        self.assertFalse("_data" in loaded_table.__dict__)
+
+        # full load
+        self.assertTrue(loaded_table.equals(table))
+        self.assertTrue("_data" in loaded_table.__dict__)
+        kv_store.remove()
@@ -28,3 +28,48 @@ class TestTableAxisTags(TestCase):
 
         tags.set_tags_at(1, {"AA": "AA"})
         self.assertEqual(tags.get_tags_at(1), {"AA": "AA"})
+
+    def test_get_indexes_by_tags(self):
+        tags = TableAxisTags(
+            [
+                {"gender": "M", "age": "10"},
+                {"gender": "F", "age": "10"},
+                {"gender": "M", "age": "20"},
+                {},
+            ]
+        )
+
+        self.assertEqual(tags.get_indexes_by_tags([{"gender": "M"}]), [0, 2])
+        # AND
+        self.assertEqual(tags.get_indexes_by_tags([{"gender": "M", "age": "10"}]), [0])
+        # OR
+        self.assertEqual(tags.get_indexes_by_tags([{"gender": "F"}, {"age": "20"}]), [1, 2])
+        self.assertEqual(tags.get_indexes_by_tags([{"gender": "unknown"}]), [])
+        self.assertEqual(tags.get_indexes_by_tags([{"unknown": "M"}]), [])
+        self.assertEqual(tags.get_indexes_by_tags([{}]), [])
+
+        # the index is updated when the tags are modified
+        tags.add_tag_at(3, "gender", "M")
+        self.assertEqual(tags.get_indexes_by_tags([{"gender": "M"}]), [0, 2, 3])
+        tags.set_tags_at(0, {"age": "10"})
+        self.assertEqual(tags.get_indexes_by_tags([{"gender": "M"}]), [2, 3])
+        tags.remove_tags_at(1)
+        self.assertEqual(tags.get_indexes_by_tags([{"gender": "M"}]), [1, 2])
+        tags.insert_new_empty_tags(0)
+        self.assertEqual(tags.get_indexes_by_tags([{"gender": "M"}]), [2, 3])
+        self.assertEqual(tags.get_tags_at(0), {})
+
+    def test_serialization(self):
+        tags = TableAxisTags([{"a": "b"}, {}, {"a": "c", "d": "e"}])
+
+        # the getters return copies
+        all_tags = tags.get_all_tags()
+        all_tags[0]["a"] = "modified"
+        self.assertEqual(tags.get_tags_at(0), {"a": "b"})
+
+        serialized = tags.serialize()
+        self.assertEqual(serialized, {"tags": [{"a": "b"}, {}, {"a": "c", "d": "e"}]})
+
+        deserialized = TableAxisTags.deserialize(serialized)
+        self.assertTrue(deserialized.equals(tags))
+        self.assertEqual(deserialized.size, 3)
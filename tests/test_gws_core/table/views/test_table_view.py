@@ -1,7 +1,12 @@
 from unittest import TestCase
 
+import numpy as np
+from pandas import DataFrame
+
 from gws_core import ViewTester, ViewType
 from gws_core.extra import TableView
+from gws_core.impl.table.helper.table_sort_helper import TableSortHelper
+from gws_core.impl.table.table import Table
 from gws_core.test.data_provider import DataProvider
 
 
@@ -33,3 +38,56 @@ class TestTableView(TestCase):
         )
         self.assertEqual(len(view_dto.data["rows"]), 3)
         self.assertEqual(len(view_dto.data["columns"]), 2)
+
+    def test_table_view_sort(self):
+        rng = np.random.default_rng(0)
+        values = rng.integers(0, 20, 500).astype(float)
+        values[::7] = np.nan
+        dataframe = DataFrame(
+            {"value": values, "other": np.arange(500)}, index=[f"row_{i}" for i in range(500)]
+        )
+        table = Table(dataframe)
+        table.add_row_tag_by_name("row_3", "key", "tag_3")
+
+        for direction in ["Ascending", "Descending"]:
+            expected = dataframe.sort_values(
+                by="value", ascending=direction == "Ascending", kind="stable"
+            )
+            for from_row in [1, 101, 451]:
+                tester = ViewTester(view=TableView(table))
+                view_dto = tester.to_dto(
+                    dict(
+                        from_row=from_row,
+                        number_of_rows_per_page=50,
+                        sort_column="value",
+                        sort_direction=direction,
+                    )
+                )
+                expected_page = expected.iloc[from_row - 1 : from_row + 49].fillna("")
+                self.assertEqual(
+                    view_dto.data["table"], expected_page.to_dict("split")["data"]
+                )
+                # the rows info are in the sorted order
+                self.assertEqual(
+                    [row["name"] for row in view_dto.data["rows"]], expected_page.index.tolist()
+                )
+                for row in view_dto.data["rows"]:
+                    self.assertEqual(row["tags"], {"key": "tag_3"} if row["name"] == "row_3" else {})
+
+    def test_top_k_sort(self):
+        rng = np.random.default_rng(0)
+        columns = [
+            DataFrame({"c": rng.integers(0, 10, 1000)})["c"],
+            DataFrame({"c": rng.integers(0, 10, 1000).astype(np.uint8)})["c"],
+            DataFrame({"c": rng.integers(0, 2, 1000).astype(bool)})["c"],
+            DataFrame({"c": np.where(rng.random(1000) < 0.2, np.nan, rng.integers(0, 10, 1000))})["c"],
+        ]
+        for column in columns:
+            for ascending in [True, False]:
+                expected = TableSortHelper.get_sort_positions(column, ascending)
+                top_k = TableSortHelper.get_top_k_positions(column, ascending, 100)
+                self.assertEqual(top_k.tolist(), expected[:100].tolist())
+
+        # less than k values that are not NaN, the partial sort is not supported
+        column = DataFrame({"c": [1.0, np.nan, np.nan, 2.0, np.nan]})["c"]
+        self.assertIsNone(TableSortHelper.get_top_k_positions(column, True, 3))
@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+import tempfile
+from time import sleep
+from unittest import TestCase
+
+from gws_core.process_run_stat.process_resource_profiler import ProcessResourceProfiler
+
+
+# test_process_resource_profiler
+class TestProcessResourceProfiler(TestCase):
+    def test_profile(self):
+        profiler = ProcessResourceProfiler()
+        profiler.start()
+
+        with profiler.step(ProcessResourceProfiler.INPUT_LOADING_STEP):
+            sleep(0.05)
+
+        with profiler.step(ProcessResourceProfiler.RUN_STEP):
+            # sub process that allocates 200MB
+            subprocess.run(
+                [sys.executable, "-c", "data = bytearray(200 * 1024 * 1024)"], check=True
+            )
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                with open(os.path.join(tmp_dir, "file"), "wb") as file:
+                    file.write(os.urandom(1024 * 1024))
+                    file.flush()
+                    os.fsync(file.fileno())
+
+        usage = profiler.stop()
+
+        self.assertGreaterEqual(usage.input_loading_time, 0.05)
+        self.assertGreater(usage.run_time, 0)
+        self.assertEqual(usage.output_saving_time, 0)
+        self.assertGreater(usage.peak_rss, 0)
+        self.assertGreaterEqual(usage.children_peak_rss, 200 * 1024 * 1024)
+        self.assertGreater(usage.children_cpu_user_time + usage.children_cpu_system_time, 0)
+        if usage.write_bytes is not None:
+            self.assertGreaterEqual(usage.write_bytes, 1024 * 1024)
+
+        # stop again returns the same result
+        self.assertIs(profiler.stop(), usage)
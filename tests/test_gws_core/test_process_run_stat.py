@@ -1,3 +1,10 @@
+import os
+from unittest.mock import patch
+
+from gws_core.process.process_service import ProcessService
+from gws_core.process_run_stat.process_run_resource_usage_model import (
+    ProcessRunResourceUsageModel,
+)
 from gws_core.process_run_stat.process_run_stat_model import ProcessRunStatModel
 from gws_core.protocol.protocol_model import ProtocolModel
 from gws_core.protocol.protocol_service import ProtocolService
@@ -21,3 +28,29 @@ class TestProcessRunStat(BaseTestCase):
 
         stats = ProcessRunStatModel.select()
         self.assertEqual(len(stats), 8)
+
+    def test_process_resource_usage(self):
+        proto: ProtocolModel = ProtocolService.create_protocol_model_from_type(TestSimpleProtocol)
+
+        scenario: Scenario = ScenarioService.create_scenario_from_protocol_model(
+            protocol_model=proto
+        )
+
+        with patch.dict(os.environ, {"GWS_PROCESS_RESOURCE_PROFILING": "true"}):
+            ScenarioRunService.run_scenario(scenario=scenario)
+
+        stats = list(ProcessRunStatModel.select())
+        usages = list(ProcessRunResourceUsageModel.select())
+        # all the tasks are profiled, not the protocols
+        self.assertGreater(len(usages), 0)
+        self.assertTrue({usage.run_stat_id for usage in usages} <= {stat.id for stat in stats})
+        for usage in usages:
+            self.assertGreater(usage.peak_rss, 0)
+            self.assertGreaterEqual(usage.run_time, 0)
+
+        usage_stats = ProcessService.get_resource_usage_stats()
+        self.assertEqual(
+            {stat.process_typing_name for stat in usage_stats},
+            {usage.process_typing_name for usage in usages},
+        )
+        self.assertEqual(sum(stat.run_count for stat in usage_stats), len(usages))
@@ -1,3 +1,5 @@
+import time
+
 from gws_core import MessageLevel, ProgressBar
 from gws_core.core.utils.date_helper import DateHelper
 from gws_core.test.base_test_case import BaseTestCase
@@ -40,14 +42,76 @@ class TestProgressBar(BaseTestCase):
         self.assertEqual(len(progress_bar_db.get_messages()), 3)
         self.assertTrue(progress_bar_db.is_finished)
 
+    def test_deferred_save(self):
+        progress_bar: ProgressBar = ProgressBar()
+        progress_bar.start()
+        # each progress bar has its own lock
+        self.assertIsNot(progress_bar._save_lock, ProgressBar()._save_lock)
+
+        # the save of this update is skipped as the progress bar was just saved
+        progress_bar.update_progress(50, "Half")
+        progress_bar_db: ProgressBar = ProgressBar.get_by_id_and_check(progress_bar.id)
+        self.assertEqual(progress_bar_db.current_value, 0)
+
+        # it is saved at the end of the interval, without other update
+        time.sleep(ProgressBar._SAVE_INTERVAL + 0.5)
+        progress_bar_db = ProgressBar.get_by_id_and_check(progress_bar.id)
+        self.assertEqual(progress_bar_db.current_value, 50)
+        self.assertEqual(progress_bar_db.get_last_message().text, "Half")
+
     def test_get_paginated(self):
         progress_bar: ProgressBar = ProgressBar()
-        progress_bar.data["messages"] = [
-            {"type": "SUCCESS", "text": "Hello1", "datetime": "2021-01-01T00:00:00"},
-            {"type": "SUCCESS", "text": "Hello2", "datetime": "2021-01-02T00:00:01"},
-            {"type": "SUCCESS", "text": "Hello3", "datetime": "2021-01-03T00:00:01"},
-            {"type": "SUCCESS", "text": "Hello4", "datetime": "2021-01-04T00:00:01"},
-        ]
+        progress_bar.start()
+        for i in range(30):
+            progress_bar.add_info_message(f"Hello{i}")
+
+        # only the last messages are kept in the progress bar row
+        progress_bar_db: ProgressBar = ProgressBar.get_by_id_and_check(progress_bar.id)
+        self.assertEqual(len(progress_bar_db.data["messages"]), ProgressBar._TAIL_SIZE)
+        self.assertEqual(progress_bar_db.get_last_message().text, "Hello29")
+        self.assertEqual(len(progress_bar_db.get_messages()), 30)
+
+        messages = progress_bar_db.get_messages_paginated(nb_of_messages=2)
+        self.assertEqual([message.text for message in messages], ["Hello29", "Hello28"])
+
+        messages = progress_bar_db.get_messages_paginated(
+            nb_of_messages=2, before_position=messages[-1].position
+        )
+        self.assertEqual([message.text for message in messages], ["Hello27", "Hello26"])
+
+        # new messages continue after the existing ones
+        progress_bar_db.add_info_message("Hello30")
+        self.assertEqual(progress_bar_db.get_messages()[-1].text, "Hello30")
+        self.assertEqual(progress_bar_db.get_messages()[-1].position, 30)
+
+        progress_bar_db.reset()
+        self.assertEqual(len(progress_bar_db.get_messages()), 0)
+
+    def test_messages_from_several_instances(self):
+        progress_bar: ProgressBar = ProgressBar()
+        progress_bar.start()
+        other_progress_bar: ProgressBar = ProgressBar.get_by_id_and_check(progress_bar.id)
+
+        # the positions are allocated from the message table, not per instance
+        progress_bar.add_info_message("Hello1")
+        other_progress_bar.add_info_message("Hello2")
+        progress_bar.add_info_message("Hello3")
+
+        messages = progress_bar.get_messages()
+        self.assertEqual([message.text for message in messages], ["Hello1", "Hello2", "Hello3"])
+        self.assertEqual([message.position for message in messages], [0, 1, 2])
+
+    def test_get_paginated_messages_in_data(self):
+        # progress bar saved before the message table, all the messages are in the data
+        progress_bar: ProgressBar = ProgressBar()
+        progress_bar.data = {
+            "messages": [
+                {"type": "SUCCESS", "text": "Hello1", "datetime": "2021-01-01T00:00:00"},
+                {"type": "SUCCESS", "text": "Hello2", "datetime": "2021-01-02T00:00:01"},
+                {"type": "SUCCESS", "text": "Hello3", "datetime": "2021-01-03T00:00:01"},
+                {"type": "SUCCESS", "text": "Hello4", "datetime": "2021-01-04T00:00:01"},
+            ]
+        }
 
         messages = progress_bar.get_messages_paginated(nb_of_messages=2, before_date=None)
         self.assertEqual(len(messages), 2)
@@ -59,3 +123,12 @@ class TestProgressBar(BaseTestCase):
         self.assertEqual(len(messages), 2)
         self.assertEqual(messages[0].text, "Hello2")
         self.assertEqual(messages[1].text, "Hello1")
+
+        # the messages are moved to the message table on the first new message
+        progress_bar.save()
+        progress_bar.add_info_message("Hello5")
+        self.assertEqual(
+            [message.text for message in progress_bar.get_messages()],
+            ["Hello1", "Hello2", "Hello3", "Hello4", "Hello5"],
+        )
+        self.assertEqual(progress_bar.data["message_count"], 5)
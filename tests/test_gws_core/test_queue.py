@@ -1,7 +1,9 @@
 import time
 
 from gws_core import (
+    BadRequestException,
     BaseTestCase,
+    ForbiddenException,
     Job,
     QueueRunner,
     QueueService,
@@ -12,6 +14,7 @@ from gws_core import (
 from gws_core.impl.robot.robot_protocol import RobotSimpleTravel
 from gws_core.impl.robot.robot_service import RobotService
 from gws_core.test.test_helper import TestHelper
+from gws_core.user.current_user_service import AuthenticateUser
 
 
 # test_queue
@@ -42,6 +45,53 @@ class TestQueue(BaseTestCase):
         scenario1 = scenario1.refresh()
         self.assertEqual(scenario1.status, ScenarioStatus.DRAFT)
 
+    def test_queue_priority(self):
+        other_user = TestHelper.get_test_user().save()
+
+        scenario1 = ScenarioService.create_scenario_from_protocol_type(RobotSimpleTravel)
+        scenario2 = ScenarioService.create_scenario_from_protocol_type(RobotSimpleTravel)
+        scenario3 = ScenarioService.create_scenario_from_protocol_type(RobotSimpleTravel)
+        scenario4 = ScenarioService.create_scenario_from_protocol_type(RobotSimpleTravel)
+
+        Job.add_job(user=TestHelper.user, scenario=scenario1)
+        Job.add_job(user=TestHelper.user, scenario=scenario2, priority=1)
+        # the creation dates are stored without milliseconds
+        time.sleep(1)
+        Job.add_job(user=TestHelper.user, scenario=scenario3)
+        time.sleep(1)
+        Job.add_job(user=other_user, scenario=scenario4)
+
+        self.assertEqual(
+            [job.scenario.id for job in Job.get_all_jobs()],
+            [scenario2.id, scenario1.id, scenario3.id, scenario4.id],
+        )
+
+        # the job with the highest priority is run first
+        self.assertEqual(Job.pop_next({}).scenario.id, scenario2.id)
+
+        # then the job of the user with the fewest running scenarios
+        running_count_by_user = {TestHelper.user.id: 1}
+        self.assertEqual(Job.pop_next(running_count_by_user).scenario.id, scenario4.id)
+
+        # then the oldest job
+        self.assertEqual(Job.pop_next(running_count_by_user).scenario.id, scenario1.id)
+        self.assertEqual(Job.pop_next(running_count_by_user).scenario.id, scenario3.id)
+        self.assertIsNone(Job.pop_next(running_count_by_user))
+
+    def test_queue_priority_access(self):
+        scenario = ScenarioService.create_scenario_from_protocol_type(RobotSimpleTravel)
+
+        with self.assertRaises(BadRequestException):
+            QueueService.add_scenario_to_queue(scenario.id, priority=QueueService.MAX_PRIORITY + 1)
+
+        # only the admins can raise the priority
+        other_user = TestHelper.get_test_user().save()
+        with AuthenticateUser(other_user):
+            with self.assertRaises(ForbiddenException):
+                QueueService.add_scenario_to_queue(scenario.id, priority=1)
+
+        self.assertFalse(QueueService.scenario_is_in_queue(scenario.id))
+
     def test_queue_run(self):
         # init the ticking, tick each second
         QueueRunner.init(tick_interval=3, daemon=True)
@@ -0,0 +1,64 @@
+from datetime import timedelta
+from unittest import TestCase
+from unittest.mock import patch
+
+from gws_core.core.utils.date_helper import DateHelper
+from gws_core.lab.monitor.monitor import Monitor
+from gws_core.scenario.queue.queue import Job
+from gws_core.scenario.queue.queue_runner import QueueRunner
+from gws_core.scenario.scenario import Scenario
+
+
+# test_queue_runner
+class TestQueueRunner(TestCase):
+    def setUp(self) -> None:
+        QueueRunner._last_job_started_at = None
+
+    def tearDown(self) -> None:
+        QueueRunner._last_job_started_at = None
+
+    def _can_start_scenario(self, running_count: int, monitor: Monitor | None) -> bool:
+        with (
+            patch.dict("os.environ", {"GWS_QUEUE_MAX_RUNNING_SCENARIOS": "4"}),
+            patch.object(Scenario, "count_running_scenarios", return_value=running_count),
+            patch.object(Monitor, "get_last_or_none", return_value=monitor),
+        ):
+            return QueueRunner._can_start_scenario()
+
+    def test_can_start_scenario(self):
+        monitor = Monitor(cpu_percent=10, ram_usage_percent=10, created_at=DateHelper.now_utc())
+
+        # the first scenario is started without checking the resources
+        self.assertTrue(self._can_start_scenario(0, None))
+        self.assertTrue(self._can_start_scenario(1, monitor))
+        self.assertFalse(self._can_start_scenario(4, monitor))
+
+        # no sample or an old sample
+        self.assertFalse(self._can_start_scenario(1, None))
+        monitor.created_at = DateHelper.now_utc() - timedelta(hours=1)
+        self.assertFalse(self._can_start_scenario(1, monitor))
+
+        # the sample must be taken after the last started job
+        monitor.created_at = DateHelper.now_utc()
+        QueueRunner._last_job_started_at = monitor.created_at
+        self.assertFalse(self._can_start_scenario(1, monitor))
+        QueueRunner._last_job_started_at = monitor.created_at - timedelta(seconds=5)
+        self.assertTrue(self._can_start_scenario(1, monitor))
+
+        monitor.cpu_percent = 95
+        self.assertFalse(self._can_start_scenario(1, monitor))
+
+    def test_start_one_job_per_wake_up(self):
+        jobs = [Job(), Job(), Job()]
+        run_results = [False, True, True]
+
+        with (
+            patch.object(QueueRunner, "_is_running", True),
+            patch.object(QueueRunner, "_can_start_scenario", return_value=True),
+            patch.object(Job, "pop_next", side_effect=jobs),
+            patch.object(QueueRunner, "_run_job", side_effect=run_results) as run_job,
+        ):
+            QueueRunner._check_and_run_queue()
+
+        # the job that could not be started is skipped, then only one job is started
+        self.assertEqual([call.args[0] for call in run_job.call_args_list], jobs[:2])
@@ -0,0 +1,81 @@
+import os
+import tempfile
+import time
+from multiprocessing import Process
+from unittest import TestCase
+
+from gws_core.core.model.sys_proc import SysProc
+from gws_core.scenario.worker.scenario_worker import ScenarioWorker
+from gws_core.scenario.worker.scenario_worker_dto import ScenarioWorkerRunRequest
+from gws_core.scenario.worker.scenario_worker_pool import (
+    ScenarioWorkerPool,
+    ScenarioWorkerRun,
+    _ScenarioWorkerProcess,
+)
+
+
+class _FileScenarioWorker(ScenarioWorker):
+    """Worker that writes a file named with the scenario id instead of running it"""
+
+    output_dir: str
+
+    def __init__(self, output_dir: str, *args) -> None:
+        super().__init__(*args)
+        self.output_dir = output_dir
+
+    def _run_scenario(self, request: ScenarioWorkerRunRequest) -> None:
+        with open(os.path.join(self.output_dir, request.scenario_id), "w", encoding="utf-8") as f:
+            f.write(str(os.getpid()))
+
+
+def _serve(output_dir: str, socket_path: str, parent_pid: int) -> None:
+    _FileScenarioWorker(output_dir, socket_path, parent_pid, 2, 1024**3).serve()
+
+
+# test_scenario_worker
+class TestScenarioWorker(TestCase):
+    def test_fork_run(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            socket_path = os.path.join(temp_dir, "worker.sock")
+            process = Process(target=_serve, args=(temp_dir, socket_path, os.getpid()))
+            process.start()
+            try:
+                worker = _ScenarioWorkerProcess(socket_path, SysProc())
+                while not os.path.exists(socket_path):
+                    time.sleep(0.01)
+
+                # the scenario is run by the forked process once started
+                run = self._send_request(worker, "scenario_1")
+                self.assertNotEqual(run.pid, process.pid)
+                run.start()
+                SysProc.from_pid(run.pid).wait(10)
+                with open(os.path.join(temp_dir, "scenario_1"), encoding="utf-8") as f:
+                    self.assertEqual(f.read(), str(run.pid))
+
+                # the forked process exits without running the scenario if the run is closed
+                # before the start. The worker stops after 2 runs.
+                connection, response = ScenarioWorkerPool._send_request(
+                    worker,
+                    ScenarioWorkerRunRequest(
+                        scenario_id="scenario_2", user_id="user", log_level="INFO"
+                    ),
+                )
+                self.assertTrue(response.recycle)
+                ScenarioWorkerRun(response.pid, connection).close()
+                SysProc.from_pid(response.pid).wait(10)
+                self.assertFalse(os.path.exists(os.path.join(temp_dir, "scenario_2")))
+
+                process.join(10)
+                self.assertEqual(process.exitcode, 0)
+                self.assertFalse(os.path.exists(socket_path))
+            finally:
+                if process.is_alive():
+                    process.kill()
+
+    def _send_request(self, worker: _ScenarioWorkerProcess, scenario_id: str) -> ScenarioWorkerRun:
+        connection, response = ScenarioWorkerPool._send_request(
+            worker,
+            ScenarioWorkerRunRequest(scenario_id=scenario_id, user_id="user", log_level="INFO"),
+        )
+        self.assertFalse(response.recycle)
+        return ScenarioWorkerRun(response.pid, connection)
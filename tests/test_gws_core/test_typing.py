@@ -18,6 +18,7 @@ from gws_core.impl.robot.robot_resource import Robot
 from gws_core.impl.robot.robot_tasks import RobotCreate, RobotEat
 from gws_core.model.typing import Typing
 from gws_core.model.typing_deprecated import TypingDeprecated
+from gws_core.model.typing_manager import TypingManager
 from gws_core.model.typing_service import TypingService
 from gws_core.resource.resource_decorator import resource_decorator
 from gws_core.task.transformer.transformer import Transformer
@@ -236,3 +237,17 @@ class TestTyping(BaseTestCase):
         )
         self.assertEqual(len(typings), 1)
         self.assertEqual(typings[0].unique_name, "CreateSimpleRobot2Deprecated")
+
+    def test_save_object_types_in_db(self):
+        typing: Typing = TypingService.get_and_check_typing(SubFileTyping.get_typing_name())
+        count = Typing.select().count()
+
+        # simulate a modification of the typing in the code
+        Typing.update(human_name="Old name").where(Typing.id == typing.id).execute()
+
+        TypingManager.save_object_types_in_db()
+
+        # the typings are updated with the same ids, no typing is created
+        self.assertEqual(Typing.select().count(), count)
+        typing_db: Typing = Typing.get_by_id_and_check(typing.id)
+        self.assertEqual(typing_db.human_name, typing.human_name)